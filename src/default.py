@@ -2,7 +2,11 @@
 
 from modshell import ModuleRunner as module
 from resources.lib import provider
+from resources.lib import fetcher
+from resources.lib import listing
 
 
 # Instantiate and run YouTube provider
 module.run(provider.Provider())
+fetcher.report()
+listing.report()
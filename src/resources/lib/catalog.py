@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import re
+import json
+import time
+import sqlite3
+import commons
+import fetcher
+import storage
+from requests.exceptions import RequestException
+
+
+API = "https://www.googleapis.com/youtube/v3"
+SYNC = 900
+MAX_PAGES = 20
+BATCH = 50
+
+SCHEMA = [
+	"CREATE TABLE IF NOT EXISTS channels (id TEXT PRIMARY KEY, title TEXT, thumb TEXT, uploads TEXT, latest TEXT, synced REAL)",
+	"CREATE TABLE IF NOT EXISTS playlists (id TEXT PRIMARY KEY, synced REAL)",
+	"CREATE TABLE IF NOT EXISTS videos (id TEXT PRIMARY KEY, channel TEXT, title TEXT, thumb TEXT, date TEXT, duration INTEGER, views INTEGER)",
+	"CREATE TABLE IF NOT EXISTS entries (playlist TEXT, position INTEGER, video TEXT, PRIMARY KEY (playlist, position))",
+	"CREATE INDEX IF NOT EXISTS videos_channel_date ON videos (channel, date DESC)",
+	"CREATE INDEX IF NOT EXISTS videos_date ON videos (date DESC)"
+]
+
+
+def getseconds(duration):
+	"""
+	Converts an ISO 8601 duration (as it is provided by Google API, e.g. PT1H2M3S) in seconds
+	:param duration: ISO 8601 duration
+	:return: number of seconds or None if the value can not be parsed
+	"""
+	match = re.match(r'^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$', duration or "")
+	if match is None:
+		return None
+	days, hours, minutes, seconds = [int(value) if value else 0 for value in match.groups()]
+	return ((days * 24 + hours) * 60 + minutes) * 60 + seconds
+
+
+def _getthumb(snippet):
+	thumbnails = snippet.get('thumbnails') or {}
+	for name in ('standard', 'high', 'medium', 'default'):
+		if thumbnails.get(name) is not None:
+			return thumbnails[name]['url']
+	return None
+
+
+def _getjson(url):
+	response = fetcher.get(url)
+	if response is not None and response.status_code == 200:
+		return json.loads(response.text)
+	return None
+
+
+class Catalog:
+	"""
+	Local catalog (SQLite) of channels, playlists and videos. Channels are synchronized incrementally
+	through their uploads playlist (only items newer than the last known one are requested) and new
+	videos are enriched with duration and views in batches, so listings are served by local queries
+	"""
+	def __init__(self, apikey):
+		self._apikey = apikey
+		self._path = storage.getpath("catalog.db")
+		conn = self._open()
+		try:
+			conn.execute("PRAGMA journal_mode=WAL")
+			for statement in SCHEMA:
+				conn.execute(statement)
+			conn.commit()
+		finally:
+			conn.close()
+
+	def _open(self):
+		return sqlite3.connect(self._path, timeout=10)
+
+	def _api(self, resource, **params):
+		query = "&".join("%s=%s" %(name, value) for name, value in sorted(params.items()))
+		return _getjson("%s/%s?%s&key=%s" %(API, resource, query, self._apikey))
+
+	def _enrich(self, conn, videos):
+		"""
+		Stores new videos together with their duration and views, requested in batches of maximum 50 ids
+		:param conn: catalog connection
+		:param videos: list of video dictionaries (id, channel, title, thumb, date)
+		"""
+		details = {}
+		for index in range(0, len(videos), BATCH):
+			data = self._api("videos", part="contentDetails,statistics", maxResults=BATCH, id=",".join(video['id'] for video in videos[index:index + BATCH]))
+			for item in (data or {}).get('items', []):
+				views = item.get('statistics', {}).get('viewCount')
+				details[item['id']] = (getseconds(item.get('contentDetails', {}).get('duration')), int(views) if views is not None else None)
+		for video in videos:
+			duration, views = details.get(video['id'], (None, None))
+			conn.execute("INSERT OR REPLACE INTO videos (id, channel, title, thumb, date, duration, views) VALUES (?, ?, ?, ?, ?, ?, ?)",
+					(video['id'], video['channel'], video['title'], video['thumb'], video['date'], duration, views))
+
+	def _items(self, playlist, latest=None, pages=MAX_PAGES):
+		"""
+		Reads playlist items through Google API, newest first for uploads playlists
+		:param playlist: playlist id
+		:param latest: publishing date of the newest known item; reading stops when it is reached
+		:param pages: maximum number of API pages
+		:return: list of video dictionaries (id, channel, title, thumb, date) or None if a page could not be read
+		"""
+		result = []
+		token = ""
+		while token is not None and pages > 0:
+			params = {'part': "snippet,contentDetails", 'maxResults': BATCH, 'playlistId': playlist}
+			if token:
+				params['pageToken'] = token
+			data = self._api("playlistItems", **params)
+			if data is None:
+				return None
+			token = data.get('nextPageToken')
+			pages -= 1
+			for item in data.get('items', []):
+				snippet = item['snippet']
+				date = item.get('contentDetails', {}).get('videoPublishedAt') or snippet.get('publishedAt')
+				if latest is not None and date is not None and date <= latest:
+					return result
+				if snippet.get('resourceId', {}).get('kind') == 'youtube#video':
+					result.append({'id': snippet['resourceId']['videoId'], 'channel': snippet.get('videoOwnerChannelId', snippet.get('channelId')),
+							'title': snippet['title'], 'thumb': _getthumb(snippet), 'date': date})
+		return result
+
+	def sync_channel(self, channel):
+		"""
+		Synchronizes a channel when the last synchronization is older than the sync interval
+		:param channel: channel id
+		"""
+		conn = self._open()
+		try:
+			row = conn.execute("SELECT uploads, latest, synced FROM channels WHERE id = ?", (channel,)).fetchone()
+			if row is not None and row[2] is not None and time.time() - row[2] < SYNC:
+				return
+			if row is None or row[0] is None:
+				data = self._api("channels", part="snippet,contentDetails", id=channel)
+				if not data or not data.get('items'):
+					return
+				item = data['items'][0]
+				uploads = item['contentDetails']['relatedPlaylists']['uploads']
+				conn.execute("INSERT OR REPLACE INTO channels (id, title, thumb, uploads, latest, synced) VALUES (?, ?, ?, ?, NULL, NULL)",
+						(channel, item['snippet']['title'], _getthumb(item['snippet']), uploads))
+				latest = None
+			else:
+				uploads, latest = row[0], row[1]
+			videos = self._items(uploads, latest)
+			if videos is None:
+				# the watermark is kept, so the next synchronization reads again the missing items
+				conn.commit()
+				return
+			for video in videos:
+				video['channel'] = channel
+			ids = set(video['id'] for video in videos)
+			known = set(id for (id,) in conn.execute("SELECT id FROM videos WHERE channel = ? AND duration IS NOT NULL", (channel,)))
+			# videos stored without details (their enrichment failed) are enriched again, one batch per synchronization
+			retry = [dict(zip(('id', 'channel', 'title', 'thumb', 'date'), row)) for row in conn.execute(
+					"SELECT id, channel, title, thumb, date FROM videos WHERE channel = ? AND duration IS NULL ORDER BY date DESC LIMIT ?", (channel, BATCH))]
+			self._enrich(conn, [video for video in videos if video['id'] not in known] + [video for video in retry if video['id'] not in ids])
+			dates = [video['date'] for video in videos if video['date'] is not None]
+			if dates:
+				latest = max(dates + ([latest] if latest else []))
+			conn.execute("UPDATE channels SET latest = ?, synced = ? WHERE id = ?", (latest, time.time(), channel))
+			conn.commit()
+		except RequestException as err:
+			commons.error("Error synchronizing channel %s: %s" %(channel, str(err)))
+		finally:
+			conn.close()
+
+	def sync_playlist(self, playlist):
+		"""
+		Synchronizes a playlist when the last synchronization is older than the sync interval. Playlist
+		entries are read again (their order can change) but only videos without details are enriched
+		:param playlist: playlist id
+		"""
+		conn = self._open()
+		try:
+			row = conn.execute("SELECT synced FROM playlists WHERE id = ?", (playlist,)).fetchone()
+			if row is not None and row[0] is not None and time.time() - row[0] < SYNC:
+				return
+			videos = self._items(playlist)
+			if videos is None:
+				# entries are replaced only after a complete reading
+				return
+			if not videos and row is None:
+				return
+			ids = [video['id'] for video in videos]
+			known = set()
+			for index in range(0, len(ids), 500):
+				chunk = ids[index:index + 500]
+				known.update(id for (id,) in conn.execute("SELECT id FROM videos WHERE id IN (%s) AND duration IS NOT NULL" %",".join("?" * len(chunk)), chunk))
+			self._enrich(conn, [video for video in videos if video['id'] not in known])
+			conn.execute("DELETE FROM entries WHERE playlist = ?", (playlist,))
+			conn.executemany("INSERT INTO entries (playlist, position, video) VALUES (?, ?, ?)", [(playlist, index, id) for index, id in enumerate(ids)])
+			conn.execute("INSERT OR REPLACE INTO playlists (id, synced) VALUES (?, ?)", (playlist, time.time()))
+			conn.commit()
+		except RequestException as err:
+			commons.error("Error synchronizing playlist %s: %s" %(playlist, str(err)))
+		finally:
+			conn.close()
+
+	def _page(self, query, count, args, start, size):
+		conn = self._open()
+		try:
+			total = conn.execute(count, args).fetchone()[0]
+			rows = conn.execute(query + " LIMIT ? OFFSET ?", args + (size, start)).fetchall()
+		finally:
+			conn.close()
+		result = []
+		for row in rows:
+			video = {'id': row[0], 'type': "video", 'url': 'https://www.youtube.com/watch?v=%s' %row[0], 'title': row[1], 'thumb': row[2]}
+			if row[3] is not None:
+				video['date'] = row[3]
+			if row[4] is not None:
+				video['duration'] = row[4]
+			if row[5] is not None:
+				video['views'] = row[5]
+			result.append(video)
+		return result, total
+
+	def get_channel_videos(self, channel, start, size):
+		"""
+		Reads a page of channel videos from the local catalog, newest first
+		:param channel: channel id
+		:param start: index of the first video
+		:param size: page size
+		:return: tuple with the list of video dictionary objects and the total number of channel videos
+		"""
+		return self._page("SELECT id, title, thumb, date, duration, views FROM videos WHERE channel = ? ORDER BY date DESC",
+				"SELECT COUNT(*) FROM videos WHERE channel = ?", (channel,), start, size)
+
+	def get_playlist_videos(self, playlist, start, size):
+		"""
+		Reads a page of playlist videos from the local catalog, in playlist order
+		:param playlist: playlist id
+		:param start: index of the first video
+		:param size: page size
+		:return: tuple with the list of video dictionary objects and the total number of playlist videos
+		"""
+		return self._page("SELECT v.id, v.title, v.thumb, v.date, v.duration, v.views FROM entries e JOIN videos v ON v.id = e.video WHERE e.playlist = ? ORDER BY e.position",
+				"SELECT COUNT(*) FROM entries e JOIN videos v ON v.id = e.video WHERE e.playlist = ?", (playlist,), start, size)
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import json
+import socket
+import threading
+import resolution
+
+try:
+	from SocketServer import ThreadingMixIn, TCPServer, StreamRequestHandler
+except ImportError:
+	from socketserver import ThreadingMixIn, TCPServer, StreamRequestHandler
+
+
+HOST = "127.0.0.1"
+PORT = 9231
+TIMEOUT = 60
+
+
+class EngineException(Exception):
+	"""
+	Raised by the client side when the extraction engine is not reachable
+	"""
+	pass
+
+
+class EngineError(Exception):
+	"""
+	Raised by the client side when the extraction engine reports a processing error
+	"""
+	pass
+
+
+class Engine:
+	"""
+	Long-lived extraction engine that keeps YouTube_DL instances warm (extractors loaded,
+	URL opener built and signature functions cached) between plugin invocations
+	"""
+	def __init__(self, logger=None, size=2, workers=2):
+		self._logger = logger
+		self._size = size
+		self._lock = threading.Lock()
+		self._pool = {}
+		self._workers = workers
+		self._threads = []
+		self._jobs = []
+		self._running = {}
+		self._condition = threading.Condition()
+
+	def _key(self, args):
+		return json.dumps(args, sort_keys=True)
+
+	def _acquire(self, args):
+		key = self._key(args)
+		with self._lock:
+			idle = self._pool.setdefault(key, [])
+			if idle:
+				return key, idle.pop()
+		import youtube_dl
+		_args = dict(args)
+		if self._logger is not None:
+			_args['logger'] = self._logger
+		return key, youtube_dl.YoutubeDL(_args)
+
+	def _release(self, key, ydl):
+		with self._lock:
+			idle = self._pool.setdefault(key, [])
+			if len(idle) < self._size:
+				idle.append(ydl)
+
+	def warmup(self, args):
+		"""
+		Builds an engine instance for the given arguments and loads YouTube extractor in advance
+		:param args: YouTube_DL arguments
+		"""
+		key, ydl = self._acquire(args)
+		ydl.get_info_extractor('Youtube')
+		self._release(key, ydl)
+
+	def extract(self, url, args):
+		"""
+		Runs YouTube_DL extraction using a pooled instance created for the same arguments. If the same
+		video is just resolved in background the result of that resolution is awaited and returned
+		:param url: video reference on Youtube website
+		:param args: YouTube_DL arguments (serializable values only)
+		:return: YouTube_DL info dictionary
+		"""
+		with self._condition:
+			event = self._running.get(self._key([url, args]))
+		if event is not None and event.wait(TIMEOUT):
+			cache = resolution.getcache()
+			video = cache.get(cache.getkey(url, args.get('format')))
+			if video is not None:
+				return video
+		return self._extract(url, args)
+
+	def _extract(self, url, args):
+		key, ydl = self._acquire(args)
+		try:
+			return ydl.extract_info(url, download=False)
+		finally:
+			self._release(key, ydl)
+
+	def prefetch(self, urls, args):
+		"""
+		Schedules background resolution of a list of videos; pending jobs of a previous listing are dropped
+		:param urls: list of video references on Youtube website
+		:param args: YouTube_DL arguments (serializable values only)
+		"""
+		with self._condition:
+			self._jobs = [(url, args) for url in urls]
+			while len(self._threads) < self._workers:
+				thread = threading.Thread(target=self._work)
+				thread.daemon = True
+				thread.start()
+				self._threads.append(thread)
+			self._condition.notify_all()
+
+	def _work(self):
+		while True:
+			with self._condition:
+				while not self._jobs:
+					self._condition.wait()
+				url, args = self._jobs.pop(0)
+				running = self._key([url, args])
+				if running in self._running:
+					continue
+				event = self._running[running] = threading.Event()
+			try:
+				self._resolve(url, args)
+			except Exception as ex:
+				if self._logger is not None:
+					self._logger.warning("Error resolving video %s in background: %s" %(url, str(ex)))
+			finally:
+				with self._condition:
+					del self._running[running]
+				event.set()
+
+	def _resolve(self, url, args):
+		cache = resolution.getcache()
+		key = cache.getkey(url, args.get('format'))
+		if cache.get(key) is None:
+			result = self._extract(url, args)
+			cache.put(key, result['entries'][0] if 'entries' in result else result)
+
+
+class EngineHandler(StreamRequestHandler):
+	"""
+	Handles one JSON request per line: {"method": "...", "params": {...}}
+	"""
+	def handle(self):
+		line = self.rfile.readline()
+		if not line:
+			return
+		try:
+			request = json.loads(line.decode('utf-8'))
+			method = request.get('method')
+			params = request.get('params') or {}
+			if method == "ping":
+				response = {'result': True}
+			elif method == "extract":
+				response = {'result': self.server.engine.extract(params['url'], params.get('args') or {})}
+			elif method == "prefetch":
+				self.server.engine.prefetch(params['urls'], params.get('args') or {})
+				response = {'result': True}
+			else:
+				response = {'error': "Unknown method: %s" %method}
+		except Exception as ex:
+			response = {'error': str(ex)}
+		self.wfile.write((json.dumps(response, default=str) + "\n").encode('utf-8'))
+
+
+class EngineServer(ThreadingMixIn, TCPServer):
+	"""
+	Local (loopback only) JSON server exposing the extraction engine to plugin invocations
+	"""
+	daemon_threads = True
+	allow_reuse_address = True
+
+	def __init__(self, engine, port=PORT):
+		TCPServer.__init__(self, (HOST, port), EngineHandler)
+		self.engine = engine
+		self._thread = None
+
+	def start(self):
+		self._thread = threading.Thread(target=self.serve_forever)
+		self._thread.daemon = True
+		self._thread.start()
+
+	def stop(self):
+		self.shutdown()
+		self.server_close()
+
+
+def call(method, params=None, port=PORT, timeout=TIMEOUT):
+	"""
+	Sends a request to the extraction engine and returns the result
+	:param method: engine method name
+	:param params: method parameters defined as dictionary
+	:param port: engine local port
+	:param timeout: socket timeout in seconds
+	:return: result value returned by the engine
+	"""
+	try:
+		conn = socket.create_connection((HOST, port), timeout)
+	except socket.error as err:
+		raise EngineException("Engine is not running: %s" %str(err))
+	try:
+		conn.sendall((json.dumps({'method': method, 'params': params or {}}) + "\n").encode('utf-8'))
+		stream = conn.makefile('rb')
+		line = stream.readline()
+		stream.close()
+	except socket.error as err:
+		raise EngineException("Engine communication failed: %s" %str(err))
+	finally:
+		conn.close()
+	if not line:
+		raise EngineException("Engine closed the connection")
+	response = json.loads(line.decode('utf-8'))
+	if response.get('error') is not None:
+		raise EngineError(response['error'])
+	return response.get('result')
+
+
+def extract(url, args, port=PORT):
+	"""
+	Asks the extraction engine to resolve a video reference
+	:param url: video reference on Youtube website
+	:param args: YouTube_DL arguments; non-serializable values (like logger) are not sent
+	:param port: engine local port
+	:return: YouTube_DL info dictionary
+	"""
+	_args = dict((k, v) for k, v in args.items() if k != 'logger')
+	return call("extract", {'url': url, 'args': _args}, port=port)
+
+
+def prefetch(urls, args, port=PORT):
+	"""
+	Asks the extraction engine to resolve in background a list of video references
+	:param urls: list of video references on Youtube website
+	:param args: YouTube_DL arguments; non-serializable values (like logger) are not sent
+	:param port: engine local port
+	"""
+	_args = dict((k, v) for k, v in args.items() if k != 'logger')
+	call("prefetch", {'urls': urls, 'args': _args}, port=port, timeout=5)
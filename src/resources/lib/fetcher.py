@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import time
+import threading
+import commons
+import requests
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
+from requests.packages.urllib3.connection import HTTPConnection, HTTPSConnection
+from requests.packages.urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+POOL_HOSTS = 10
+POOL_SIZE = 4
+RETRIES = 3
+BACKOFF = 0.5
+TIMEOUT = (5, 15)
+HEADERS = {'Accept-Encoding': 'gzip, deflate', 'Connection': 'keep-alive'}
+
+
+class Statistics:
+	"""
+	Thread-safe counters describing HTTP traffic of the shared session
+	"""
+	def __init__(self):
+		self._lock = threading.Lock()
+		self.requests = 0
+		self.bytes = 0
+		self.connections = 0
+		self.handshake = 0.0
+
+	def request(self, size):
+		with self._lock:
+			self.requests += 1
+			self.bytes += size
+
+	def connect(self, duration):
+		with self._lock:
+			self.connections += 1
+			self.handshake += duration
+
+	def get(self):
+		with self._lock:
+			return {'requests': self.requests, 'bytes': self.bytes, 'connections': self.connections, 'handshake': self.handshake}
+
+
+_stats = Statistics()
+_session = None
+_lock = threading.Lock()
+
+
+class _TimedHTTPConnection(HTTPConnection):
+	def connect(self):
+		start = time.time()
+		HTTPConnection.connect(self)
+		_stats.connect(time.time() - start)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+	def connect(self):
+		start = time.time()
+		HTTPSConnection.connect(self)
+		_stats.connect(time.time() - start)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+	ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+	ConnectionCls = _TimedHTTPSConnection
+
+
+class PooledAdapter(HTTPAdapter):
+	"""
+	HTTP adapter keeping a bounded number of keep-alive connections per host and measuring
+	the time spent to establish new connections (TCP + TLS handshake)
+	"""
+	def __init__(self):
+		retry = Retry(total=RETRIES, backoff_factor=BACKOFF, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+		HTTPAdapter.__init__(self, pool_connections=POOL_HOSTS, pool_maxsize=POOL_SIZE, max_retries=retry, pool_block=True)
+
+	def init_poolmanager(self, *args, **kwargs):
+		HTTPAdapter.init_poolmanager(self, *args, **kwargs)
+		self.poolmanager.pool_classes_by_scheme = {'http': _TimedHTTPConnectionPool, 'https': _TimedHTTPSConnectionPool}
+
+
+def session():
+	"""
+	Returns the HTTP session shared by all data operations of the current process
+	:return: requests session object
+	"""
+	global _session
+	with _lock:
+		if _session is None:
+			_session = requests.Session()
+			_session.headers.update(HEADERS)
+			adapter = PooledAdapter()
+			_session.mount("https://", adapter)
+			_session.mount("http://", adapter)
+	return _session
+
+
+def get(url, params=None, timeout=TIMEOUT):
+	"""
+	Executes a GET request through the shared session
+	:param url: resource URL
+	:param params: optional query parameters defined as dictionary
+	:param timeout: connect and read timeout (tuple) or a single value in seconds
+	:return: requests response object
+	"""
+	response = session().get(url, params=params, timeout=timeout)
+	_stats.request(_received(response))
+	return response
+
+
+def _received(response):
+	"""
+	Counts the bytes received for a response, as transferred (compressed) and not as decoded
+	:param response: requests response object
+	:return: number of bytes
+	"""
+	content = response.content
+	try:
+		return response.raw.tell()
+	except (AttributeError, TypeError, ValueError):
+		length = response.headers.get('Content-Length')
+		return int(length) if length and length.isdigit() else len(content)
+
+
+def head(url, headers=None, timeout=TIMEOUT):
+	"""
+	Executes a HEAD request through the shared session (redirects are followed)
+	:param url: resource URL
+	:param headers: optional request headers defined as dictionary
+	:param timeout: connect and read timeout (tuple) or a single value in seconds
+	:return: requests response object
+	"""
+	response = session().head(url, headers=headers, timeout=timeout, allow_redirects=True)
+	_stats.request(0)
+	return response
+
+
+def stats():
+	"""
+	Returns HTTP traffic counters: number of requests, received (compressed) bytes, opened connections and total handshake time
+	:return: dictionary of counters
+	"""
+	return _stats.get()
+
+
+def report():
+	"""
+	Writes HTTP traffic counters in the debug log
+	"""
+	data = stats()
+	if data['requests'] > 0:
+		commons.debug("HTTP statistics: %d requests, %d bytes, %d connections, %.3fs handshake time" %(data['requests'], data['bytes'], data['connections'], data['handshake']))
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import json
+import time
+import threading
+import commons
+import storage
+
+
+SIZE = 500
+MAX_AGE = 7 * 24 * 3600
+TTL = {'trending': 3600, 'channels': 24 * 3600, 'channel': 3600, 'playlist': 6 * 3600, 'search': 3600}
+
+_lock = threading.Lock()
+_stats = {'hits': 0, 'stale': 0, 'misses': 0, 'refreshes': 0}
+
+
+def _count(name):
+	with _lock:
+		_stats[name] += 1
+
+
+class ListingCache(storage.Storage):
+	"""
+	Persistent cache of listing results with per-category time to live and stale-while-revalidate
+	semantics: an expired entry is still returned immediately once, being marked as stale, and the
+	next request for it refreshes it (plugin invocations are too short-lived for background refreshes)
+	"""
+	def __init__(self, size=SIZE):
+		storage.Storage.__init__(self, "listing.db", "listings", size)
+
+	def getkey(self, context, category, args):
+		settings = context.getSettings()
+		data = [category, args, settings.getPageSize(), settings.getString("youtube.region"),
+				settings.getBool("youtube.use_key", False)]
+		if category == "channels":
+			count = settings.getInt("source.count", 0)
+			data.append([settings.getString("source.url%d" %index, "") for index in range(1, count + 1)])
+		return json.dumps(data, sort_keys=True)
+
+	def get(self, context, category, function, *args):
+		"""
+		Returns the listing produced by a wrapper function, from cache when it is possible
+		:param context: modshell provider context
+		:param category: listing category; it defines the time to live of the cached result
+		:param function: wrapper function called with context and the other arguments
+		:param args: wrapper function arguments (context excluded)
+		:return: wrapper function result
+		"""
+		key = self.getkey(context, category, args)
+		entry = storage.Storage.get(self, key)
+		now = time.time()
+		if entry is not None and now - entry['time'] <= MAX_AGE:
+			if now - entry['time'] <= TTL.get(category, 3600):
+				_count('hits')
+				return entry['data']
+			if not entry.get('stale'):
+				_count('stale')
+				entry['stale'] = True
+				self.set(key, entry)
+				return entry['data']
+			data = self._refresh(key, context, function, args)
+			if not self._isvalid(data):
+				# the stale listing is better than nothing
+				return entry['data']
+			_count('refreshes')
+			return data
+		_count('misses')
+		return self._refresh(key, context, function, args)
+
+	def _isvalid(self, data):
+		# empty results usually come from connection errors
+		return data and (not isinstance(data, tuple) or data[0])
+
+	def _refresh(self, key, context, function, args):
+		data = function(context, *args)
+		# empty results are not stored
+		if self._isvalid(data):
+			self.set(key, {'time': time.time(), 'data': data})
+		return data
+
+
+def stats():
+	"""
+	Returns listing cache counters: fresh hits, stale hits, misses and refreshes
+	:return: dictionary of counters
+	"""
+	with _lock:
+		return dict(_stats)
+
+
+def report():
+	"""
+	Writes listing cache counters in the debug log
+	"""
+	data = stats()
+	if sum(data.values()) > 0:
+		commons.debug("Listing cache statistics: %d hits, %d stale hits, %d misses, %d refreshes" %(data['hits'], data['stale'], data['misses'], data['refreshes']))
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import json
+import commons
+import fetcher
+import catalog
+import storage
+import parallel
+from requests.exceptions import RequestException
+
+
+SIZE = 5000
+TTL = 24 * 3600
+BATCH = 50
+
+
+class MetadataCache(storage.Storage):
+	"""
+	Persistent cache of video details (duration, views) requested through Google API, per video id
+	"""
+	def __init__(self, size=SIZE):
+		storage.Storage.__init__(self, "metadata.db", "videos", size)
+
+
+def _request(apikey, ids):
+	"""
+	Requests details for maximum 50 videos in one API call
+	:param apikey: Google API key
+	:param ids: list of video ids
+	:return: dictionary of video details (duration in seconds, views) per video id
+	"""
+	result = {}
+	try:
+		url = "https://www.googleapis.com/youtube/v3/videos?part=contentDetails,statistics&maxResults=%d&id=%s&key=%s" %(BATCH, ",".join(ids), apikey)
+		response = fetcher.get(url)
+		if response is not None and response.status_code == 200:
+			for item in json.loads(response.text).get('items', []):
+				details = {}
+				duration = catalog.getseconds(item.get('contentDetails', {}).get('duration'))
+				if duration is not None:
+					details['duration'] = duration
+				if item.get('statistics', {}).get('viewCount') is not None:
+					details['views'] = int(item['statistics']['viewCount'])
+				result[item['id']] = details
+	except RequestException as err:
+		commons.error("Error connecting to API video details: %s" %str(err))
+	return result
+
+
+def enrich(apikey, videos):
+	"""
+	Adds duration and views to the video records that don't have them. Details are taken from cache or
+	requested through Google API in batches of maximum 50 ids, batches being executed concurrently
+	:param apikey: Google API key
+	:param videos: list of dictionary objects (only items of type video are enriched)
+	:return: the same list of dictionary objects
+	"""
+	cache = MetadataCache()
+	missing = []
+	details = {}
+	for video in videos:
+		if video.get("type", "video") == "video" and video.get("duration") is None and video["id"] not in details:
+			data = cache.get(video["id"])
+			if data is not None:
+				details[video["id"]] = data
+			elif video["id"] not in missing:
+				missing.append(video["id"])
+	batches = [missing[index:index + BATCH] for index in range(0, len(missing), BATCH)]
+	for data in parallel.pmap(lambda ids: _request(apikey, ids), batches):
+		for vid, value in (data or {}).items():
+			cache.set(vid, value, TTL)
+			details[vid] = value
+	for video in videos:
+		if video.get("type", "video") == "video" and details.get(video["id"]):
+			video.update(details[video["id"]])
+	return videos
+
+
+def get(vid):
+	"""
+	Returns cached details of a video
+	:param vid: video id
+	:return: dictionary of video details or None if the video is not cached
+	"""
+	return MetadataCache().get(vid)
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import re
+import sys
+import json
+
+try:
+	from HTMLParser import HTMLParser
+	_unescape = HTMLParser().unescape
+except ImportError:
+	from html import unescape as _unescape
+
+
+MARKERS = ('var ytInitialData = ', 'window["ytInitialData"] = ', 'ytInitialData = ')
+VIDEO_RENDERERS = ('videoRenderer', 'gridVideoRenderer', 'compactVideoRenderer', 'playlistVideoRenderer')
+CHANNEL_RENDERERS = ('channelRenderer', 'gridChannelRenderer')
+PLAYLIST_RENDERERS = ('playlistRenderer', 'gridPlaylistRenderer', 'compactPlaylistRenderer')
+LEGACY_LINK = re.compile(r'<a\s[^>]*class="[^"]*yt-uix-tile-link[^"]*"[^>]*>')
+LEGACY_ATTR = re.compile(r'(href|title)="([^"]*)"')
+LEGACY_CHANNEL = re.compile(r'data-channel-external-id="([^"]+)"')
+LEGACY_TITLE = re.compile(r'<meta\s+(?:property|name)="og:title"\s+content="([^"]*)"')
+LEGACY_TIME = re.compile(r'class="video-time"[^>]*>\s*([^<]+?)\s*<')
+LEGACY_DURATION = re.compile(r'class="accessible-description"[^>]*>[^<]*Duration:\s*([\d:]+)')
+LEGACY_META = re.compile(r'class="yt-lockup-meta-info"[^>]*>\s*<li>([^<]*)</li>\s*<li>([^<]*)</li>')
+
+
+
+class _Node(dict):
+	"""
+	Decoded JSON object keeping its members in document order, plain dictionaries having no order before Python 3.7
+	"""
+	__slots__ = ('pairs',)
+
+	def __init__(self, pairs):
+		dict.__init__(self, pairs)
+		self.pairs = pairs
+
+	def items(self):
+		return self.pairs
+
+
+_decoder = json.JSONDecoder(object_pairs_hook=_Node) if sys.version_info < (3, 7) else json.JSONDecoder()
+
+
+def getdata(html):
+	"""
+	Locates and decodes the initial data (JSON) embedded in a YouTube page. The document is scanned
+	only up to the marker and the JSON value is decoded in place, without copying the page content
+	:param html: page content
+	:return: decoded initial data or None if the page doesn't embed it
+	"""
+	for marker in MARKERS:
+		index = html.find(marker)
+		if index >= 0:
+			try:
+				return _decoder.raw_decode(html, index + len(marker))[0]
+			except ValueError:
+				pass
+	return None
+
+
+def _text(node):
+	if not isinstance(node, dict):
+		return None
+	if node.get('simpleText') is not None:
+		return node['simpleText']
+	if node.get('runs') is not None:
+		return "".join(run.get('text', "") for run in node['runs'])
+	return None
+
+
+def _thumb(node):
+	if isinstance(node, dict) and node.get('thumbnails'):
+		url = node['thumbnails'][-1].get('url')
+		if url is not None and url.startswith("//"):
+			url = "https:" + url
+		return url
+	return None
+
+
+def _record(name, node):
+	record = None
+	if name in VIDEO_RENDERERS and node.get('videoId') is not None:
+		record = {'type': "video", 'id': node['videoId'], 'url': 'https://www.youtube.com/watch?v=%s' %node['videoId']}
+		record['time'] = _text(node.get('lengthText')) or ""
+		date = _text(node.get('publishedTimeText'))
+		if date is not None:
+			record['date'] = date
+		views = _text(node.get('viewCountText')) or _text(node.get('shortViewCountText'))
+		if views is not None:
+			record['views'] = views.split(" ")[0]
+	elif name in CHANNEL_RENDERERS and node.get('channelId') is not None:
+		record = {'type': "channel", 'id': node['channelId'], 'url': 'https://www.youtube.com/channel/%s' %node['channelId']}
+	elif name in PLAYLIST_RENDERERS and node.get('playlistId') is not None:
+		record = {'type': "playlist", 'id': node['playlistId'], 'url': 'https://www.youtube.com/playlist?list=%s' %node['playlistId']}
+	if record is not None:
+		record['title'] = _text(node.get('title')) or ""
+		thumb = _thumb(node.get('thumbnail'))
+		if thumb is None and node.get('thumbnails'):
+			thumb = _thumb(node['thumbnails'][0])
+		if thumb is None and record['type'] == "video":
+			thumb = 'https://i.ytimg.com/vi/%s/hqdefault.jpg' %record['id']
+		record['thumb'] = thumb
+	return record
+
+
+def _walk(data):
+	# iterative depth-first walk in document order; renderers are not descended into
+	stack = [data]
+	while stack:
+		node = stack.pop()
+		if isinstance(node, dict):
+			children = []
+			for name, value in node.items():
+				if name in VIDEO_RENDERERS or name in CHANNEL_RENDERERS or name in PLAYLIST_RENDERERS:
+					record = _record(name, value)
+					if record is not None:
+						yield record
+				elif isinstance(value, (dict, list)):
+					children.append(value)
+			stack.extend(reversed(children))
+		elif isinstance(node, list):
+			stack.extend(reversed(node))
+
+
+def _legacy(html):
+	# single forward scan over the title links of classic (server rendered) markup; the details of an
+	# item are read between its title link and the neighbour ones (the duration badge precedes the title)
+	links = list(LEGACY_LINK.finditer(html))
+	for index, match in enumerate(links):
+		before = html[links[index - 1].end() if index > 0 else 0:match.start()]
+		after = html[match.end():links[index + 1].start() if index + 1 < len(links) else len(html)]
+		attrs = dict(LEGACY_ATTR.findall(match.group(0)))
+		href = _unescape(attrs.get('href', ""))
+		record = None
+		if href.startswith("/watch") and "v=" in href and "list=" not in href:
+			vid = re.search(r'[?&]v=([^&]+)', href).group(1)
+			record = {'type': "video", 'id': vid, 'thumb': 'https://i.ytimg.com/vi/%s/hqdefault.jpg' %vid}
+			time = LEGACY_TIME.findall(before)
+			if time:
+				record['time'] = time[-1]
+			else:
+				duration = LEGACY_DURATION.search(after)
+				record['time'] = duration.group(1) if duration is not None else ""
+			meta = LEGACY_META.search(after)
+			if meta is not None:
+				record['date'] = _unescape(meta.group(1)).strip()
+				record['views'] = _unescape(meta.group(2)).strip().split(" ")[0]
+		elif href.startswith("/channel/"):
+			record = {'type': "channel", 'id': href.split("/")[2], 'thumb': None}
+		elif href.startswith("/user/"):
+			# user channels are identified by the channel id of their subscription button
+			channel = LEGACY_CHANNEL.search(after) or LEGACY_CHANNEL.search(html)
+			if channel is not None:
+				record = {'type': "channel", 'id': channel.group(1), 'thumb': None}
+		elif "list=" in href:
+			record = {'type': "playlist", 'id': re.search(r'[?&]list=([^&]+)', href).group(1), 'thumb': None}
+		if record is not None:
+			record['url'] = 'https://www.youtube.com%s' %href
+			record['title'] = _unescape(attrs.get('title', "")).strip()
+			yield record
+
+
+def records(html, types=None):
+	"""
+	Yields normalized records (video, channel and playlist) found in a YouTube page, in page order
+	and without duplicates. Both embedded initial data and classic markup are supported
+	:param html: page content (trending, channel videos, playlist or search results)
+	:param types: optional list of record types to be returned (video, channel, playlist)
+	:return: generator of dictionary objects with type, id, url, title, thumb and (for videos) time, date and views
+	"""
+	data = getdata(html)
+	source = _walk(data) if data is not None else _legacy(html)
+	found = set()
+	for record in source:
+		if (types is None or record['type'] in types) and (record['type'], record['id']) not in found:
+			found.add((record['type'], record['id']))
+			yield record
+
+
+def channel(html):
+	"""
+	Reads channel identification details from a channel page
+	:param html: channel page content
+	:return: dictionary with channel id and title or None if they are not found
+	"""
+	data = getdata(html)
+	if data is not None:
+		metadata = data.get('metadata', {}).get('channelMetadataRenderer')
+		if metadata is not None and metadata.get('externalId') is not None:
+			return {'id': metadata['externalId'], 'title': metadata.get('title', "")}
+		return None
+	match = LEGACY_CHANNEL.search(html)
+	title = LEGACY_TITLE.search(html)
+	if match is not None and title is not None:
+		return {'id': match.group(1), 'title': _unescape(title.group(1))}
+	return None
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import threading
+import commons
+
+try:
+	from Queue import Queue, Empty
+except ImportError:
+	from queue import Queue, Empty
+
+
+WORKERS = 4
+
+
+def pmap(function, items, workers=WORKERS):
+	"""
+	Applies a function over a list of items using a bounded number of worker threads
+	:param function: callable receiving one item
+	:param items: list of input items
+	:param workers: maximum number of concurrent workers
+	:return: list of results in the same order as the input items (None for failed items)
+	"""
+	items = list(items)
+	result = [None] * len(items)
+	queue = Queue()
+	for index, item in enumerate(items):
+		queue.put((index, item))
+
+	def _worker():
+		while True:
+			try:
+				index, item = queue.get_nowait()
+			except Empty:
+				return
+			try:
+				result[index] = function(item)
+			except Exception as ex:
+				commons.error("Error running parallel task: %s" %str(ex))
+
+	count = min(workers, len(items))
+	if count <= 1:
+		_worker()
+	else:
+		threads = [threading.Thread(target=_worker) for _ in range(count)]
+		for thread in threads:
+			thread.daemon = True
+			thread.start()
+		for thread in threads:
+			thread.join()
+	return result
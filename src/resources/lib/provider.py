@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 
 import wrapper
+import listing
 import modshell
-from modshell.utils.FunctionCache import FunctionCache
 from modshell.items.DirectoryItem import DirectoryItem
 from modshell.items.NextPageItem import NextPageItem
 from modshell.items.SearchItem import SearchItem
@@ -13,6 +13,12 @@ class Provider(modshell.AbstractProvider):
 
 	def __init__(self):
 		modshell.AbstractProvider.__init__(self)
+		self._listings = None
+
+	def getListingCache(self):
+		if self._listings is None:
+			self._listings = listing.ListingCache()
+		return self._listings
 
 	def getAlternativeFanart(self, context):
 		return self.getFanart(context)
@@ -22,7 +28,6 @@ class Provider(modshell.AbstractProvider):
 
 	def onRoot(self, context, re_match):
 		result = []
-		context.getFunctionCache().clear()
 		item = DirectoryItem(name=context.localize(30001), uri=context.createUri(['category', 'trending']), image=context.createResourcePath('media', 'trending.png'), fanart=self.getFanart(context))
 		result.append(item)
 		if context.getSettings().getInt("source.count", 0) > 0:
@@ -35,21 +40,21 @@ class Provider(modshell.AbstractProvider):
 	def onSearch(self, search_text, context, re_match):
 		result = []
 		context.setContentType('videos')
-		jsondata = context.getFunctionCache().get(FunctionCache.ONE_HOUR, wrapper.get_search, context, search_text)
 		page = int(context.getParam('page', 1))
-		start = (page - 1) * context.getSettings().getPageSize()
-		end = min(start + context.getSettings().getPageSize(), len(jsondata))
-		for video in jsondata[start:end]:
+		jsondata, total = self.getListingCache().get(context, 'search', wrapper.get_search, search_text, page)
+		for video in jsondata:
 			item = None
 			if video["type"] == "video":
 				item = VideoItem(video["title"], context.createUri(['play'], {'video_id': video["id"]}), image=video["thumb"], fanart=video["thumb"])
+				if video.get("duration") is not None:
+					item.setDurationFromSeconds(video["duration"])
 			elif video["type"] == "channel":
 				item = DirectoryItem(name=video["title"], uri=context.createUri(['channel'], {'channel_id': video['id']}), image=context.createResourcePath('media', 'channel.png'), fanart=video["thumb"])
 			elif video["type"] == "playlist":
 				item = DirectoryItem(name=video["title"], uri=context.createUri(['playlist'], {'playlist_id': video['id']}), image=context.createResourcePath('media', 'playlist.png'), fanart=video["thumb"])
 			if video is not None:
 				result.append(item)
-		if end < len(jsondata):
+		if page * context.getSettings().getPageSize() < total:
 			item = NextPageItem(context, page, fanart=self.getFanart(context))
 			result.append(item)
 		return result
@@ -57,22 +62,23 @@ class Provider(modshell.AbstractProvider):
 	@modshell.RegisterProviderPath('^/category/trending/$')
 	def _category_trending(self, context, re_match):
 		result = []
-		jsondata = context.getFunctionCache().get(FunctionCache.ONE_HOUR, wrapper.get_trending, context)
 		page = int(context.getParam('page', 1))
-		start = (page - 1) * context.getSettings().getPageSize()
-		end = min(start + context.getSettings().getPageSize(), len(jsondata))
-		for video in jsondata[start:end]:
+		jsondata, total = self.getListingCache().get(context, 'trending', wrapper.get_trending, page)
+		for video in jsondata:
 			item = VideoItem(video["title"], context.createUri(['play'], {'video_id': video["id"]}), image=video["thumb"], fanart=video["thumb"])
+			if video.get("duration") is not None:
+				item.setDurationFromSeconds(video["duration"])
 			result.append(item)
-		if end < len(jsondata):
+		if page * context.getSettings().getPageSize() < total:
 			item = NextPageItem(context, page, fanart=self.getFanart(context))
 			result.append(item)
+		wrapper.prefetch(context, jsondata)
 		return result
 
 	@modshell.RegisterProviderPath('^/category/channels/$')
 	def _category_channels(self, context, re_match):
 		result = []
-		jsondata = context.getFunctionCache().get(FunctionCache.ONE_HOUR, wrapper.get_channels, context)
+		jsondata = self.getListingCache().get(context, 'channels', wrapper.get_channels)
 		page = int(context.getParam('page', 1))
 		start = (page - 1) * context.getSettings().getPageSize()
 		end = min(start + context.getSettings().getPageSize(), len(jsondata))
@@ -89,8 +95,12 @@ class Provider(modshell.AbstractProvider):
 		vid = context.getParam('video_id')
 		video = wrapper.get_video(context, vid)
 		item = VideoItem(video["title"], video["url"], video["thumbnail"])
-		item.setDurationFromSeconds(video["duration"])
-		item.setPlot(video["description"])
+		duration = video.get("duration")
+		if duration is None:
+			duration = (wrapper.get_metadata(vid) or {}).get("duration")
+		if duration is not None:
+			item.setDurationFromSeconds(duration)
+		item.setPlot(video.get("description", ""))
 		item.setMediatype('video')
 		item.setGenre('Live Stream')
 		return item
@@ -99,30 +109,32 @@ class Provider(modshell.AbstractProvider):
 	def _channel_videos(self, context, re_match):
 		result = []
 		cid = context.getParam('channel_id')
-		jsondata = context.getFunctionCache().get(FunctionCache.ONE_HOUR, wrapper.get_channel_videos, context, cid)
 		page = int(context.getParam('page', 1))
-		start = (page - 1) * context.getSettings().getPageSize()
-		end = min(start + context.getSettings().getPageSize(), len(jsondata))
-		for video in jsondata[start:end]:
+		jsondata, total = self.getListingCache().get(context, 'channel', wrapper.get_channel_videos, cid, page)
+		for video in jsondata:
 			item = VideoItem(video["title"], context.createUri(['play'], {'video_id': video["id"]}), image=video["thumb"], fanart=video["thumb"])
+			if video.get("duration") is not None:
+				item.setDurationFromSeconds(video["duration"])
 			result.append(item)
-		if end < len(jsondata):
+		if page * context.getSettings().getPageSize() < total:
 			item = NextPageItem(context, page, fanart=self.getFanart(context))
 			result.append(item)
+		wrapper.prefetch(context, jsondata)
 		return result
 
 	@modshell.RegisterProviderPath('^/playlist/$')
 	def _playlist_videos(self, context, re_match):
 		result = []
 		pid = context.getParam('playlist_id')
-		jsondata = context.getFunctionCache().get(FunctionCache.ONE_HOUR, wrapper.get_playlist_videos, context, pid)
 		page = int(context.getParam('page', 1))
-		start = (page - 1) * context.getSettings().getPageSize()
-		end = min(start + context.getSettings().getPageSize(), len(jsondata))
-		for video in jsondata[start:end]:
+		jsondata, total = self.getListingCache().get(context, 'playlist', wrapper.get_playlist_videos, pid, page)
+		for video in jsondata:
 			item = VideoItem(video["title"], context.createUri(['play'], {'video_id': video["id"]}), image=video["thumb"], fanart=video["thumb"])
+			if video.get("duration") is not None:
+				item.setDurationFromSeconds(video["duration"])
 			result.append(item)
-		if end < len(jsondata):
+		if page * context.getSettings().getPageSize() < total:
 			item = NextPageItem(context, page, fanart=self.getFanart(context))
 			result.append(item)
+		wrapper.prefetch(context, jsondata)
 		return result
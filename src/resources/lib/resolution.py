@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import re
+import time
+import storage
+from urlparse import parse_qs, urlparse
+
+
+SIZE = 200
+MARGIN = 300
+DEFAULT_TTL = 1800
+CHECK_TTL = 600
+FIELDS = ('id', 'title', 'url', 'thumbnail', 'duration', 'description', 'ext', 'format_id', 'http_headers')
+
+
+def getexpiry(url):
+	"""
+	Detects the expiry time of a stream URL (googlevideo URLs carry it as 'expire' query parameter or path segment)
+	:param url: stream URL
+	:return: expiry timestamp or None if the URL doesn't define it
+	"""
+	if url is None:
+		return None
+	value = parse_qs(urlparse(url).query).get('expire')
+	if value:
+		value = value[0]
+	else:
+		match = re.search(r'/expire/(\d+)', url)
+		value = match.group(1) if match else None
+	try:
+		return float(value) if value is not None else None
+	except ValueError:
+		return None
+
+
+_cache = None
+
+
+def getcache():
+	"""
+	Returns the resolution cache of the current process
+	:return: ResolutionCache object
+	"""
+	global _cache
+	if _cache is None:
+		_cache = ResolutionCache()
+	return _cache
+
+
+class ResolutionCache(storage.Storage):
+	"""
+	Persistent cache of resolved playback details (selected format URL, headers and metadata) per
+	video reference and quality setting. Entries expire together with the stream URL they hold
+	"""
+	def __init__(self, size=SIZE):
+		storage.Storage.__init__(self, "resolution.db", "streams", size)
+
+	def ischecked(self, video):
+		"""
+		Tells if the stream of a cached video was found playable lately, so it doesn't need to be checked again
+		:param video: cached video dictionary
+		:return: True if the stream was resolved or checked in the last CHECK_TTL seconds
+		"""
+		return time.time() - video.get('checked', 0) < CHECK_TTL
+
+	def getkey(self, video, quality):
+		return "%s|%s" %(video, quality)
+
+	def put(self, key, video):
+		"""
+		Stores the relevant details of a resolved video, its stream being known as playable now
+		:param key: cache key (see getkey method)
+		:param video: YouTube_DL info dictionary
+		"""
+		data = dict((k, video[k]) for k in FIELDS if video.get(k) is not None)
+		data['checked'] = time.time()
+		expiry = getexpiry(data.get('url'))
+		if expiry is not None:
+			ttl = expiry - time.time() - MARGIN
+		else:
+			ttl = DEFAULT_TTL
+		if ttl > 0:
+			self.set(key, data, ttl)
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import os
+import json
+import time
+import sqlite3
+import xbmc
+import xbmcaddon
+
+
+def getpath(name):
+	"""
+	Returns the absolute path of a file stored in the add-on profile (data) directory
+	:param name: file name
+	:return: file path (the profile directory is created if it doesn't exist)
+	"""
+	path = xbmc.translatePath(xbmcaddon.Addon().getAddonInfo('profile'))
+	if not isinstance(path, type("")):
+		path = path.decode('utf-8')
+	if not os.path.exists(path):
+		os.makedirs(path)
+	return os.path.join(path, name)
+
+
+class Storage:
+	"""
+	Persistent key/value storage (SQLite) with per-entry expiry time and size-bounded LRU eviction.
+	Values are serialized as JSON and each operation uses its own connection, so the storage can be
+	shared by plugin invocations and service threads
+	"""
+	def __init__(self, filename, table, size=200):
+		self._path = getpath(filename)
+		self._table = table
+		self._size = size
+		conn = self._open()
+		try:
+			conn.execute("PRAGMA journal_mode=WAL")
+			conn.execute("CREATE TABLE IF NOT EXISTS %s (key TEXT PRIMARY KEY, value TEXT, expires REAL, accessed REAL)" %self._table)
+			conn.execute("CREATE INDEX IF NOT EXISTS %s_accessed ON %s (accessed)" %(self._table, self._table))
+			conn.commit()
+		finally:
+			conn.close()
+
+	def _open(self):
+		return sqlite3.connect(self._path, timeout=10)
+
+	def get(self, key):
+		"""
+		Reads a stored value
+		:param key: entry key
+		:return: stored value or None if the entry doesn't exist or it is expired
+		"""
+		conn = self._open()
+		try:
+			row = conn.execute("SELECT value, expires FROM %s WHERE key = ?" %self._table, (key,)).fetchone()
+			if row is None:
+				return None
+			if row[1] is not None and row[1] < time.time():
+				conn.execute("DELETE FROM %s WHERE key = ?" %self._table, (key,))
+				conn.commit()
+				return None
+			conn.execute("UPDATE %s SET accessed = ? WHERE key = ?" %self._table, (time.time(), key))
+			conn.commit()
+			return json.loads(row[0])
+		finally:
+			conn.close()
+
+	def set(self, key, value, ttl=None):
+		"""
+		Stores a value and evicts the least recently used entries over the size limit
+		:param key: entry key
+		:param value: JSON serializable value
+		:param ttl: time to live in seconds (None for entries without expiry)
+		"""
+		now = time.time()
+		expires = now + ttl if ttl is not None else None
+		conn = self._open()
+		try:
+			conn.execute("INSERT OR REPLACE INTO %s (key, value, expires, accessed) VALUES (?, ?, ?, ?)" %self._table, (key, json.dumps(value, separators=(',', ':')), expires, now))
+			conn.execute("DELETE FROM %s WHERE key IN (SELECT key FROM %s ORDER BY accessed DESC LIMIT -1 OFFSET ?)" %(self._table, self._table), (self._size,))
+			conn.commit()
+		finally:
+			conn.close()
+
+	def remove(self, key):
+		"""
+		Removes a stored value
+		:param key: entry key
+		"""
+		conn = self._open()
+		try:
+			conn.execute("DELETE FROM %s WHERE key = ?" %self._table, (key,))
+			conn.commit()
+		finally:
+			conn.close()
+
+	def clear(self):
+		"""
+		Removes all stored values
+		"""
+		conn = self._open()
+		try:
+			conn.execute("DELETE FROM %s" %self._table)
+			conn.commit()
+		finally:
+			conn.close()
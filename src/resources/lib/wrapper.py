@@ -3,12 +3,26 @@
 from __future__ import unicode_literals
 
 import json
+import engine
+import hashlib
+import storage
+import catalog
 import commons
-import requests
-import youtube_dl
-from bs4 import BeautifulSoup
+import fetcher
+import parallel
+import pagedata
+import metadata
+import resolution
 from urlparse import parse_qs, urlparse
-from requests.exceptions import ConnectionError
+from requests.exceptions import RequestException
+from exceptions import YouTubeException
+from modshell.utils.FunctionCache import FunctionCache
+
+
+API_PAGE = 50
+TOKENS_TTL = 3600
+
+_tokens = None
 
 
 class Logger:
@@ -41,6 +55,18 @@ def _get_key(context):
 		return None
 
 
+def getdefaults(quality="best", nocheckcertificate=True):
+	"""
+	Static YouTube_DL arguments, shared by plugin invocations and the extraction engine warmup
+	:param quality: video quality (YouTube_DL format) configured in the plugin
+	:param nocheckcertificate: certificate check option configured in the plugin
+	:return: dictionary with YouTube_DL arguments
+	"""
+	return {'quiet': True, 'no_warnings': True, 'prefer_insecure': True,
+			'format': quality, 'nocheckcertificate': nocheckcertificate,
+			'cache_backend': "sqlite", 'youtube_concurrent_requests': 4, 'info_cache': True}
+
+
 def _getargs(context, args=None):
 	"""
 	Read and collect YouTube_DL arguments for data operations
@@ -48,9 +74,8 @@ def _getargs(context, args=None):
 	:param args: context arguments defined as dictionary
 	:return: the complete dictionary with arguments needed for YouTube_DL data operations (static and also from plugin configuration)
 	"""
-	_args = {'quiet': True, 'no_warnings': True, 'prefer_insecure': True,
-			'format': context.getSettings().getString("youtube.video_quality", "best"),
-			'nocheckcertificate': context.getSettings().getBool("youtube.nocheck_certificate", True)}
+	_args = getdefaults(context.getSettings().getString("youtube.video_quality", "best"),
+			context.getSettings().getBool("youtube.nocheck_certificate", True))
 	if args is not None and isinstance(args, dict):
 		_args.update(args)
 	_args['logger'] = Logger()
@@ -113,41 +138,104 @@ def get_video(context, url, args=None):
 	:return: None or the complete URL to the specified video
 	"""
 	_args = _getargs(context, args)
-	ydl = youtube_dl.YoutubeDL(_args)
-	result = ydl.extract_info(url, download=False)
+	cache = resolution.getcache()
+	key = cache.getkey(url, _args.get('format'))
+	video = cache.get(key)
+	if video is not None:
+		if cache.ischecked(video):
+			return video
+		if _isplayable(video):
+			cache.put(key, video)
+			return video
+		cache.remove(key)
+	result = None
+	if context.getSettings().getBool("engine.enabled", True):
+		try:
+			result = engine.extract(url, _args, port=context.getSettings().getInt("engine.port", engine.PORT))
+		except engine.EngineException as err:
+			commons.debug("Extraction engine is not available, running in-process extraction: %s" %str(err))
+		except engine.EngineError as err:
+			raise YouTubeException(str(err))
+	if result is None:
+		import youtube_dl
+		ydl = youtube_dl.YoutubeDL(_args)
+		result = ydl.extract_info(url, download=False)
 	if 'entries' in result:
 		video = result['entries'][0]
 	else:
 		video = result
+	cache.put(key, video)
 	return video
 
 
-def get_trending(context):
+def get_metadata(vid):
+	"""
+	Returns video details (duration, views) collected for listings, without any extraction
+	:param vid: video id
+	:return: dictionary of video details or None if they are not known
+	"""
+	return metadata.get(vid)
+
+
+def prefetch(context, videos):
 	"""
-	Get the list of most popular (trending) videos
+	Asks the extraction engine to resolve in background the playback details of the first listed videos,
+	so a later play action finds them in the resolution cache
 	:param context: modshell provider context
-	:return: list of video dictionary objects providing many properties for identification and also for playing
+	:param videos: list of video dictionary objects, as they are displayed
+	"""
+	count = context.getSettings().getInt("engine.prefetch", 0)
+	if count > 0 and context.getSettings().getBool("engine.enabled", True):
+		urls = [video["id"] for video in videos if video.get("type", "video") == "video"][:count]
+		if urls:
+			try:
+				engine.prefetch(urls, _getargs(context), port=context.getSettings().getInt("engine.port", engine.PORT))
+			except (engine.EngineException, engine.EngineError) as err:
+				commons.debug("Videos can not be resolved in advance: %s" %str(err))
+
+
+def _isplayable(video):
+	"""
+	Checks if the stream URL of a cached video is still accepted by the media server
+	:param video: cached video dictionary
+	:return: False if the server denies the stream (expired or invalidated URL), otherwise True
+	"""
+	try:
+		response = fetcher.head(video['url'], headers=video.get('http_headers'))
+		return response.status_code not in (403, 404, 410)
+	except RequestException as err:
+		commons.debug("Error checking cached video stream: %s" %str(err))
+		return True
+
+
+def get_trending(context, page=1):
+	"""
+	Get one page of most popular (trending) videos
+	:param context: modshell provider context
+	:param page: page number (page size is defined in plugin configuration)
+	:return: tuple with the list of video dictionary objects of the requested page and the total number of videos
 	"""
 	key = _get_key(context)
 	region = context.getSettings().getString("youtube.region")
 	if key is None:
-		return _get_trending_html(region)
+		return _get_datawindow_html(context, page, _get_trending_html, region)
 	else:
-		return _get_trending_api(key, region)
+		return _get_enriched_api(key, _get_trending_api(context, key, region, page))
 
 
-def get_search(context, query):
+def get_search(context, query, page=1):
 	"""
 	Search videos using query strings
 	:param context: modshell provider context
 	:param query: string keywords used to search video references
-	:return: list of video dictionary objects providing many properties for identification and also for playing
+	:param page: page number (page size is defined in plugin configuration)
+	:return: tuple with the list of video dictionary objects of the requested page and the total number of results
 	"""
 	key = _get_key(context)
 	if key is None:
-		return _get_search_html(query)
+		return _get_datawindow_html(context, page, _get_search_html, query)
 	else:
-		return _get_search_api(key, query)
+		return _get_enriched_api(key, _get_search_api(context, key, query, page))
 
 
 def get_channels(context):
@@ -173,330 +261,377 @@ def get_channels(context):
 		return _get_channels_api(key, sources)
 
 
-def get_channel_videos(context, channel):
+def get_channel_videos(context, channel, page=1):
 	"""
-	Returns the list of video objects related to a specific channel (channel id)
+	Returns one page of video objects related to a specific channel (channel id)
 	:param context: modshell provider context
 	:param channel: channel identifier
-	:return: list of video dictionary objects providing many properties for identification and also for playing
+	:param page: page number (page size is defined in plugin configuration)
+	:return: tuple with the list of video dictionary objects of the requested page and the total number of videos
 	"""
 	key = _get_key(context)
 	if key is None:
-		return _get_channel_videos_html(channel)
+		return _get_datawindow_html(context, page, _get_channel_videos_html, channel)
 	else:
-		return _get_channel_videos_api(key, channel)
+		return _get_channel_videos_api(context, key, channel, page)
 
 
-def get_playlist_videos(context, playlist):
+def get_playlist_videos(context, playlist, page=1):
 	"""
-	Returns the list of video objects related to a specific playlist (playlist id)
+	Returns one page of video objects related to a specific playlist (playlist id)
 	:param context: modshell provider context
-	:param channel: playlist identifier
-	:return: list of video dictionary objects providing many properties for identification and also for playing
+	:param playlist: playlist identifier
+	:param page: page number (page size is defined in plugin configuration)
+	:return: tuple with the list of video dictionary objects of the requested page and the total number of videos
 	"""
 	key = _get_key(context)
 	if key is None:
-		return _get_playlist_videos_html(playlist)
+		return _get_datawindow_html(context, page, _get_playlist_videos_html, playlist)
 	else:
-		return _get_playlist_videos_api(key, playlist)
+		return _get_playlist_videos_api(context, key, playlist, page)
 
 
 def _get_trending_html(locale='US'):
 	"""
 	Get the list of most popular (trending) videos using HTML website content
-	:param context: modshell provider context
+	:param locale: region code
 	:return: list of video dictionary objects providing many properties for identification and also for playing
 	"""
-	result = []
-	try:
-		response = requests.get("https://www.youtube.com/feed/trending?gl=%s" %locale)
-		if response is not None and response.status_code == 200:
-			formatter = BeautifulSoup(response.text, "html.parser")
-			listing = formatter.find_all(attrs={"class": "expanded-shelf-content-item"})
-			for item in listing:
-				video = dict()
-				try:
-					data = item.find(attrs={"class": ["yt-thumb", "video-thumb"]}).find(attrs={"class": "yt-thumb-simple"}).find("img")
-					if data.get("data-thumb") is not None:
-						video["thumb"] = data["data-thumb"]
-					else:
-						video["thumb"] = data["src"]
-					data = item.find(attrs={"class": "yt-lockup-title"}).find("a")
-					video["id"] = _getvid(data["href"])[0]
-					video["url"] = 'https://www.youtube.com%s' %data["href"]
-					video["title"] = data.text
-					data = data.select("span.accessible-description")
-					if len(data) != 0:
-						video["time"] = data[0].text
-					else:
-						video["time"] = ""
-					data = item.find(attrs={"class": "yt-lockup-meta-info"})
-					if data and len(data.contents) > 1:
-						video["date"] = data.contents[0].string
-						video["views"] = data.contents[1].string.split(" ")[0]
-					result.append(video)
-				except BaseException as ex:
-					commons.warn("Error extracting video from trending list: %s" %str(ex))
-	except ConnectionError as err:
-		commons.error("Error connecting to trending video list: %s" %str(err))
-	return result
+	return _get_datalist_html("https://www.youtube.com/feed/trending?gl=%s" %locale, ["video"], "trending video list")
 
 
-def _get_trending_api(apikey, locale='US'):
+def _get_trending_api(context, apikey, locale='US', page=1):
 	"""
-	Get the list of most popular (trending) videos using the content provided through Google API
+	Get one page of most popular (trending) videos using the content provided through Google API
 	:param context: modshell provider context
-	:return: list of video dictionary objects providing many properties for identification and also for playing
+	:return: tuple with the list of video dictionary objects of the requested page and the total number of videos
 	"""
-	url = "https://www.googleapis.com/youtube/v3/videos?part=snippet&chart=mostPopular&regionCode=%s&maxResults=50&key=%s" %(locale, apikey)
-	return _get_datalist_api(url)
+	url = "https://www.googleapis.com/youtube/v3/videos?part=snippet,contentDetails,statistics&chart=mostPopular&regionCode=%s&key=%s" %(locale, apikey)
+	return _get_datawindow_api(context, page, url)
 
 
 def _get_channels_html(sources):
 	"""
 	Get list of dictionary channels (user and standard) in order to display them and to list the content.
-	Channel details are collected from HTML website content
+	Channel details are collected from HTML website content, all sources being resolved concurrently
 	:param sources: list of dictionary channels that contain only basic details for identification
 	:return: list of improved dictionary channels that contain details for displaying and querying
 	"""
 	result = []
 	if sources is not None and isinstance(sources, list):
-		for item in sources:
-			url = "https://www.youtube.com/%s/%s/videos" %(item['type'], item['id'])
-			channel = dict()
-			try:
-				response = requests.get(url)
-				if response is not None and response.status_code == 200:
-					formatter = BeautifulSoup(response.text, "html.parser")
-					data = formatter.find(attrs={"class": "qualified-channel-title-text"}).find("a")
-					channel['title'] = data.text
-					channel['id'] = item['id']
-					if item['type'] == "user":
-						data = formatter.find(attrs={"class": "channel-header-subscription-button-container"}).find("button")
-						channel['id'] = data["data-channel-external-id"]
-					result.append(channel)
-			except BaseException as ex:
-				commons.warn("Error preparing channel dictionary: %s" %str(ex))
+		result = [channel for channel in parallel.pmap(_get_channel_html, sources) if channel is not None]
 	return result
 
 
+def _get_channel_html(item):
+	"""
+	Get dictionary channel (user or standard) from HTML website content
+	:param item: dictionary channel that contains only basic details for identification
+	:return: improved dictionary channel or None if the channel could not be resolved
+	"""
+	url = "https://www.youtube.com/%s/%s/videos" %(item['type'], item['id'])
+	channel = None
+	try:
+		response = fetcher.get(url)
+		if response is not None and response.status_code == 200:
+			channel = pagedata.channel(response.text)
+			if channel is not None and item['type'] == "channel":
+				channel['id'] = item['id']
+	except BaseException as ex:
+		commons.warn("Error preparing channel dictionary: %s" %str(ex))
+		channel = None
+	return channel
+
+
 def _get_channels_api(apikey, sources):
 	"""
 	Get list of dictionary channels (user and standard) in order to display them and to list the content.
-	Channel details are collected through Google API
+	Channel details are collected through Google API: channel ids are requested in batches of maximum 50 ids
+	and user names (which are resolved one by one by the API) are requested concurrently
 	:param sources: list of dictionary channels that contain only basic details for identification
-	:return: list of improved dictionary channels that contain details for displaying and querying
+	:return: list of improved dictionary channels that contain details for displaying and querying (configured order)
 	"""
 	result = []
 	if sources is not None and isinstance(sources, list):
 		users = []
 		channels = []
 		for item in sources:
-			if item['type'] == "user":
+			if item['type'] == "user" and item['id'] not in users:
 				users.append(item['id'])
-			elif item['type'] == "channel":
+			elif item['type'] == "channel" and item['id'] not in channels:
 				channels.append(item['id'])
-		if len(users) > 0:
-			data = ','.join(users)
-			url = "https://www.googleapis.com/youtube/v3/channels?part=snippet&forUsername=%s&key=%s" %(data, apikey)
-			result = _get_datalist_api(url)
-		if len(users) > 0:
-			data = ','.join(channels)
-			url = "https://www.googleapis.com/youtube/v3/channels?part=snippet&id=%s&key=%s" %(data, apikey)
-			result = result + _get_datalist_api(url)
+		tasks = []
+		for index in range(0, len(channels), 50):
+			url = "https://www.googleapis.com/youtube/v3/channels?part=snippet&maxResults=50&id=%s&key=%s" %(','.join(channels[index:index + 50]), apikey)
+			tasks.append(("channel", None, url))
+		for user in users:
+			url = "https://www.googleapis.com/youtube/v3/channels?part=snippet&forUsername=%s&key=%s" %(user, apikey)
+			tasks.append(("user", user, url))
+		found = {}
+		for task, data in zip(tasks, parallel.pmap(lambda task: _get_datalist_api(task[2]), tasks)):
+			if not data:
+				continue
+			if task[0] == "user":
+				found[("user", task[1])] = data[0]
+			else:
+				for channel in data:
+					found[("channel", channel['id'])] = channel
+		for item in sources:
+			channel = found.get((item['type'], item['id']))
+			if channel is not None and channel not in result:
+				result.append(channel)
 	return result
 
 
 def _get_channel_videos_html(channel):
-	result = []
-	url = "https://www.youtube.com/channel/%s/videos" %channel
-	try:
-		response = requests.get(url)
-		if response is not None and response.status_code == 200:
-			formatter = BeautifulSoup(response.text, "html.parser")
-			listing = formatter.find_all(attrs={"class": "channels-content-item"})
-			for item in listing:
-				video = dict()
-				try:
-					data = item.find(attrs={"class": "yt-thumb-clip"}).find("img")
-					if data.get("data-thumb") is not None:
-						video["thumb"] = data["data-thumb"]
-					else:
-						video["thumb"] = data["src"]
-					data = item.find(attrs={"class": "yt-lockup-title"}).find("a")
-					video["id"] = _getvid(data["href"])[0]
-					video["url"] = 'https://www.youtube.com%s' %data["href"]
-					video["title"] = data.text
-					result.append(video)
-				except BaseException as ex:
-					commons.warn("Error extracting video from channel list: %s" %str(ex))
-	except ConnectionError as err:
-		commons.error("Error connecting to channel video list: %s" %str(err))
-	return result
+	return _get_datalist_html("https://www.youtube.com/channel/%s/videos" %channel, ["video"], "channel video list")
 
 
-def _get_channel_videos_api(apikey, channel):
+def _get_channel_videos_api(context, apikey, channel, page=1):
 	"""
-	Get the list of most popular (trending) videos using the content provided through Google API
+	Get one page of channel videos from the local catalog, synchronized incrementally through Google API
 	:param context: modshell provider context
-	:return: list of video dictionary objects providing many properties for identification and also for playing
+	:return: tuple with the list of video dictionary objects of the requested page and the total number of videos
 	"""
-	url = "https://www.googleapis.com/youtube/v3/search?part=snippet&maxResults=50&channelId=%s&key=%s" %(channel, apikey)
-	return _get_datalist_api(url)
+	size = context.getSettings().getPageSize()
+	data = catalog.Catalog(apikey)
+	data.sync_channel(channel)
+	return data.get_channel_videos(channel, (page - 1) * size, size)
 
 
 def _get_playlist_videos_html(playlist):
-	result = []
-	url = "https://www.youtube.com/playlist?list=%s" %playlist
-	try:
-		response = requests.get(url)
-		if response is not None and response.status_code == 200:
-			formatter = BeautifulSoup(response.text, "html.parser")
-			listing = formatter.find_all(attrs={"class": "pl-video"})
-			for item in listing:
-				video = dict()
-				try:
-					data = item.find(attrs={"class": "yt-thumb-clip"}).find("img")
-					if data.get("data-thumb") is not None:
-						video["thumb"] = data["data-thumb"]
-					else:
-						video["thumb"] = data["src"]
-					data = item.find(attrs={"class": "pl-video-title"}).find("a")
-					video["id"] = _getvid(data["href"])[0]
-					video["url"] = 'https://www.youtube.com%s' %data["href"]
-					video["title"] = data.text.strip()
-					result.append(video)
-				except BaseException as ex:
-					commons.warn("Error extracting video from playlist: %s" %str(ex))
-	except ConnectionError as err:
-		commons.error("Error connecting to playlist video list: %s" %str(err))
-	return result
+	return _get_datalist_html("https://www.youtube.com/playlist?list=%s" %playlist, ["video"], "playlist video list")
 
 
-def _get_playlist_videos_api(apikey, playlist):
-	url = "https://www.googleapis.com/youtube/v3/playlistItems?part=snippet&maxResults=50&playlistId=%s&key=%s" %(playlist, apikey)
-	return _get_datalist_api(url)
+def _get_playlist_videos_api(context, apikey, playlist, page=1):
+	size = context.getSettings().getPageSize()
+	data = catalog.Catalog(apikey)
+	data.sync_playlist(playlist)
+	return data.get_playlist_videos(playlist, (page - 1) * size, size)
 
 
 def _get_search_html(query):
+	query = str(query).strip().replace(' ', '+')
+	return _get_datalist_html("https://www.youtube.com/results?search_query=%s" %query, None, "search video list")
+
+
+def _get_datalist_html(url, types, description):
+	"""
+	Get the list of items published in a YouTube page
+	:param url: page URL
+	:param types: list of item types to be collected (video, channel, playlist) or None for all of them
+	:param description: list description used for logging
+	:return: list of dictionary objects providing many properties for identification and also for playing
+	"""
 	result = []
 	try:
-		query = str(query).strip().replace(' ', '+')
-		response = requests.get("https://www.youtube.com/results?search_query=%s" %query)
+		response = fetcher.get(url)
 		if response is not None and response.status_code == 200:
-			formatter = BeautifulSoup(response.text, "html.parser")
-			listing = formatter.find_all(attrs={"class": "yt-lockup"})
-			for item in listing:
-				video = dict()
-				try:
-					data = item.find(attrs={"class": "video-thumb"}).find("img")
-					if data.get("data-thumb") is not None:
-						video["thumb"] = data["data-thumb"]
-					else:
-						video["thumb"] = data["src"]
-					data = item.find(attrs={"class": "yt-lockup-title"}).find("a")
-					video["title"] = data.text.strip()
-					video["url"] = 'https://www.youtube.com%s' %data["href"]
-					if data["href"].startswith("/watch") and data["href"].find("list=") < 0:
-						tmpobj = _getvid(data["href"])
-						video["type"] = tmpobj[1]
-						video["id"] = tmpobj[0]
-					elif data["href"].startswith("/user") or data["href"].startswith("/channel"):
-						tmpobj = _getcid(data["href"])
-						video["type"] = tmpobj[1]
-						video["id"] = tmpobj[0]
-					elif data["href"].startswith("/playlist") or data["href"].find("list=") >= 0:
-						tmpobj = _getpid(data["href"])
-						video["type"] = tmpobj[1]
-						video["id"] = tmpobj[0]
-					data = item.find(attrs={"class": "video-time"})
-					if data:
-						video["time"] = data.text
-					if video.get('type') is not None and video['type'] == "user":
-						data = formatter.find(attrs={"class": "yt-uix-subscription-button"})
-						video['id'] = data["data-channel-external-id"]
-						video["type"] = "channel"
-					result.append(video)
-				except BaseException as ex:
-					commons.warn("Error extracting video from search list: %s" %str(ex))
-	except ConnectionError as err:
-		commons.error("Error connecting to search video list: %s" %str(err))
+			result = list(pagedata.records(response.text, types))
+	except RequestException as err:
+		commons.error("Error connecting to %s: %s" %(description, str(err)))
+	except BaseException as ex:
+		commons.warn("Error extracting items from %s: %s" %(description, str(ex)))
 	return result
 
 
-def _get_search_api(apikey, query):
+def _get_search_api(context, apikey, query, page=1):
 	query = str(query).strip().replace(' ', '+')
-	url = "https://www.googleapis.com/youtube/v3/search?part=snippet&maxResults=50&order=relevance&key=%s&q=%s" %(apikey, query)
-	return _get_datalist_api(url)
+	url = "https://www.googleapis.com/youtube/v3/search?part=snippet&order=relevance&key=%s&q=%s" %(apikey, query)
+	return _get_datawindow_api(context, page, url)
+
+
+def _get_enriched_api(apikey, data):
+	"""
+	Completes the videos of a listing page with duration and views
+	:param apikey: Google API key
+	:param data: tuple with the list of dictionary objects and the total number of items
+	:return: the same tuple, video dictionary objects being enriched
+	"""
+	metadata.enrich(apikey, data[0])
+	return data
+
+
+def _get_datawindow_html(context, page, function, *args):
+	"""
+	Get one page of items from a complete list collected from HTML website content
+	:param context: modshell provider context
+	:param page: page number (page size is defined in plugin configuration)
+	:param function: HTML data function returning the complete list of items
+	:param args: data function arguments
+	:return: tuple with the list of items of the requested page and the total number of items
+	"""
+	data = context.getFunctionCache().get(FunctionCache.ONE_HOUR, function, *args)
+	start = (page - 1) * context.getSettings().getPageSize()
+	end = start + context.getSettings().getPageSize()
+	return data[start:end], len(data)
+
+
+def _get_tokens():
+	"""
+	Returns the storage of API page tokens, shared by the plugin invocations
+	:return: storage object keyed by API listing and page index
+	"""
+	global _tokens
+	if _tokens is None:
+		_tokens = storage.Storage("listing.db", "tokens", 1000)
+	return _tokens
+
+
+def _get_datawindow_api(context, page, base):
+	"""
+	Get one page of items through Google API. API pages have the same size as plugin pages (at most 50
+	items, otherwise a plugin page is covered by several whole API pages), so only the API pages of the
+	requested page are downloaded; the tokens of the pages are stored, so page N+1 resumes without
+	downloading again pages 1..N. Items are not stored here, listings being cached by the provider
+	:param context: modshell provider context
+	:param page: page number (page size is defined in plugin configuration)
+	:param base: API URL without paging parameters
+	:return: tuple with the list of items of the requested page and the total number of items
+	"""
+	size = context.getSettings().getPageSize()
+	apisize = min(size, API_PAGE)
+	url = "%s&maxResults=%d" %(base, apisize)
+	start = (page - 1) * size
+	first = start // apisize
+	last = (start + size - 1) // apisize
+	tokens = _get_tokens()
+	# the API key is part of the URL, so it is stored only hashed
+	prefix = hashlib.sha1(url.encode('utf-8')).hexdigest()
+	index = first
+	token = "" if index == 0 else tokens.get("%s:%d" %(prefix, index))
+	while token is None:
+		index -= 1
+		token = "" if index == 0 else tokens.get("%s:%d" %(prefix, index))
+	items = []
+	total = 0
+	while index <= last:
+		data, token, total = _get_datapage_api(url, token)
+		if data is None:
+			# failed pages are not kept, the next request tries again
+			return [], 0
+		if token is not None:
+			tokens.set("%s:%d" %(prefix, index + 1), token, TOKENS_TTL)
+		if index >= first:
+			items += data
+		index += 1
+		if token is None:
+			break
+	if index <= first:
+		return [], total
+	if token is None:
+		total = first * apisize + len(items)
+	offset = start - first * apisize
+	items = items[offset:offset + size]
+	if token is not None:
+		total = max(total, start + len(items) + 1)
+	return items, total
 
 
 def _get_datalist_api(base):
+	"""
+	Get the complete list of items through Google API, walking through maximum 21 pages
+	:param base: API URL without paging token
+	:return: list of dictionary objects
+	"""
+	result = []
+	pageno = 0
+	token = ""
+	while token is not None and pageno <= 20:
+		items, token = _get_datapage_api(base, token)[0:2]
+		if items is None:
+			break
+		result += items
+		pageno += 1
+	return result
+
+
+def _get_datapage_api(base, token=""):
+	"""
+	Get one page of items through Google API
+	:param base: API URL without paging token
+	:param token: page token or empty string for the first page
+	:return: tuple with the list of items (None if the page could not be downloaded), the token of the next page (None for the last page) and the total number of results
+	"""
 	result = []
+	nexttoken = None
+	total = 0
 	try:
-		pageno = 0
-		token = ""
-		while token is not None and pageno <= 20:
-			if token is not None and token != "":
-				url = "%s&pageToken=%s" %(base,token)
-			else:
-				url = base
-			response = requests.get(url)
-			if response is not None and response.status_code == 200:
-				data = json.loads(response.text)
-				if data.get('nextPageToken') is not None:
-					token = data['nextPageToken']
-					pageno += 1
-				else:
-					token = None
-				if data.get('items') is not None:
-					for item in data['items']:
-						video = dict()
-						try:
-							if item['kind'] == "youtube#video":
-								video["id"] = item['id']
-								video["type"] = "video"
-								video["url"] = 'https://www.youtube.com/watch?v=%s' %video["id"]
-							elif item['kind'] == "youtube#searchResult":
-								if item['id']['kind'] == 'youtube#video':
-									video["id"] = item['id']['videoId']
-									video["type"] = "video"
-									video["url"] = 'https://www.youtube.com/watch?v=%s' %video["id"]
-								elif item['id']['kind'] == 'youtube#channel':
-									video["id"] = item['id']['channelId']
-									video["type"] = "channel"
-									video["url"] = 'https://www.youtube.com/channel/%s' %video["id"]
-								elif item['id']['kind'] == 'youtube#playlist':
-									video["id"] = item['id']['playlistId']
-									video["type"] = "playlist"
-									video["url"] = 'https://www.youtube.com/playlist?list=%s' %video["id"]
-							elif item['kind'] == "youtube#channel":
-								video["id"] = item['id']
-								video["type"] = "channel"
-								video["url"] = 'https://www.youtube.com/channel/%s' %video["id"]
-							snippet = item["snippet"]
-							video["title"] = snippet['title']
-							if item['kind'] == "youtube#playlistItem" and snippet.get('resourceId') is not None:
-								if snippet['resourceId']['kind'] == 'youtube#video':
-									video["id"] = snippet['resourceId']['videoId']
-									video["type"] = "video"
-									video["url"] = 'https://www.youtube.com/watch?v=%s' %video["id"]
-							if snippet.get('thumbnails') is not None:
-								thumbnails = snippet['thumbnails']
-								if thumbnails.get('standard') is not None:
-									video["thumb"] = thumbnails['standard']['url']
-								elif thumbnails.get('high') is not None:
-									video["thumb"] = thumbnails['high']['url']
-								elif thumbnails.get('medium') is not None:
-									video["thumb"] = thumbnails['medium']['url']
-								elif thumbnails.get('default') is not None:
-									video["thumb"] = thumbnails['default']['url']
-							if snippet.get('publishedAt') is not None:
-								video["date"] = snippet['publishedAt']
-							result.append(video)
-						except BaseException as ex:
-							commons.warn("Error extracting video from API list: %s" %str(ex))
-			else:
-				token = None
-	except ConnectionError as err:
+		if token is not None and token != "":
+			url = "%s&pageToken=%s" %(base,token)
+		else:
+			url = base
+		response = fetcher.get(url)
+		if response is not None and response.status_code == 200:
+			data = json.loads(response.text)
+			if data.get('nextPageToken') is not None:
+				nexttoken = data['nextPageToken']
+			if data.get('pageInfo') is not None:
+				total = data['pageInfo'].get('totalResults', 0)
+			if data.get('items') is not None:
+				for item in data['items']:
+					try:
+						result.append(_get_dataitem_api(item))
+					except BaseException as ex:
+						commons.warn("Error extracting video from API list: %s" %str(ex))
+		else:
+			commons.error("Error reading API video list: HTTP %s" %(response.status_code if response is not None else None))
+			return None, None, 0
+	except RequestException as err:
 		commons.error("Error connecting to API video list: %s" %str(err))
-	return result
+		return None, None, 0
+	return result, nexttoken, max(total, len(result))
+
+
+def _get_dataitem_api(item):
+	"""
+	Transforms an item provided by Google API into a dictionary object
+	:param item: API item (video, search result, channel or playlist item)
+	:return: dictionary object providing properties for identification and also for playing
+	"""
+	video = dict()
+	if item['kind'] == "youtube#video":
+		video["id"] = item['id']
+		video["type"] = "video"
+		video["url"] = 'https://www.youtube.com/watch?v=%s' %video["id"]
+	elif item['kind'] == "youtube#searchResult":
+		if item['id']['kind'] == 'youtube#video':
+			video["id"] = item['id']['videoId']
+			video["type"] = "video"
+			video["url"] = 'https://www.youtube.com/watch?v=%s' %video["id"]
+		elif item['id']['kind'] == 'youtube#channel':
+			video["id"] = item['id']['channelId']
+			video["type"] = "channel"
+			video["url"] = 'https://www.youtube.com/channel/%s' %video["id"]
+		elif item['id']['kind'] == 'youtube#playlist':
+			video["id"] = item['id']['playlistId']
+			video["type"] = "playlist"
+			video["url"] = 'https://www.youtube.com/playlist?list=%s' %video["id"]
+	elif item['kind'] == "youtube#channel":
+		video["id"] = item['id']
+		video["type"] = "channel"
+		video["url"] = 'https://www.youtube.com/channel/%s' %video["id"]
+	snippet = item["snippet"]
+	video["title"] = snippet['title']
+	if item['kind'] == "youtube#playlistItem" and snippet.get('resourceId') is not None:
+		if snippet['resourceId']['kind'] == 'youtube#video':
+			video["id"] = snippet['resourceId']['videoId']
+			video["type"] = "video"
+			video["url"] = 'https://www.youtube.com/watch?v=%s' %video["id"]
+	if snippet.get('thumbnails') is not None:
+		thumbnails = snippet['thumbnails']
+		if thumbnails.get('standard') is not None:
+			video["thumb"] = thumbnails['standard']['url']
+		elif thumbnails.get('high') is not None:
+			video["thumb"] = thumbnails['high']['url']
+		elif thumbnails.get('medium') is not None:
+			video["thumb"] = thumbnails['medium']['url']
+		elif thumbnails.get('default') is not None:
+			video["thumb"] = thumbnails['default']['url']
+	if snippet.get('publishedAt') is not None:
+		video["date"] = snippet['publishedAt']
+	if item.get('contentDetails', {}).get('duration') is not None:
+		video["duration"] = catalog.getseconds(item['contentDetails']['duration'])
+	if item.get('statistics', {}).get('viewCount') is not None:
+		video["views"] = int(item['statistics']['viewCount'])
+	return video
@@ -21,6 +21,7 @@ import shutil
 import subprocess
 import socket
 import sys
+import threading
 import time
 import tokenize
 import traceback
@@ -62,9 +63,9 @@ from .utils import (
     GeoRestrictedError,
     int_or_none,
     ISO3166Utils,
-    locked_file,
     make_HTTPS_handler,
     MaxDownloadsReached,
+    ordered_concurrent_map,
     orderedSet,
     PagedList,
     parse_filesize,
@@ -93,8 +94,10 @@ from .utils import (
     YoutubeDLCookieProcessor,
     YoutubeDLHandler,
 )
-from .cache import Cache
+from .archive import open_download_archive
+from .cache import Cache, InfoCache
 from .extractor import get_info_extractor, gen_extractor_classes, _LAZY_LOADER
+from .extractor.dispatch import ExtractorIndex
 from .extractor.openload import PhantomJSwrapper
 from .downloader import get_suitable_downloader
 from .downloader.rtmp import rtmpdump_version
@@ -192,6 +195,15 @@ class YoutubeDL(object):
     skip_download:     Skip the actual download of the video file
     cachedir:          Location of the cache files in the filesystem.
                        False to disable filesystem cache.
+    cache_backend:     Storage of the cache: 'file' (one JSON file per
+                       entry, default), 'sqlite' (single database with
+                       expiry and eviction) or 'memory' (not persisted).
+    cache_size:        Maximum number of entries of the sqlite cache
+                       backend (default 1000).
+    info_cache:        Reuse the results of previous extractions of the same
+                       URLs, while not expired (see InfoCache).
+    info_cache_refresh: Extract again and store the results in the info
+                       cache instead of reusing them.
     noplaylist:        Download single video instead of a playlist if in doubt.
     age_limit:         An integer representing the user's age in years.
                        Unsuitable videos for the given age are skipped.
@@ -207,6 +219,12 @@ class YoutubeDL(object):
     download_archive:  File name of a file where all downloads are recorded.
                        Videos already present in the file are not downloaded
                        again.
+    concurrent_extractions: Number of playlist entries extracted concurrently
+                       (default 1). Entries are still processed and
+                       downloaded one after another, in order.
+    download_archive_index: Index of the download archive ids: 'memory'
+                       (default, loaded at first use) or 'sqlite' (kept in
+                       a database next to the archive, for large archives).
     cookiefile:        File name where cookies should be read from and dumped to.
     nocheckcertificate:Do not verify SSL certificates
     prefer_insecure:   Use HTTP instead of HTTPS to retrieve information.
@@ -304,7 +322,7 @@ class YoutubeDL(object):
     nopart, updatetime, buffersize, ratelimit, min_filesize, max_filesize, test,
     noresizebuffer, retries, continuedl, noprogress, consoletitle,
     xattr_set_filesize, external_downloader_args, hls_use_mpegts,
-    http_chunk_size.
+    http_chunk_size, http_connections, progress_interval.
 
     The following options are used by the post processors:
     prefer_ffmpeg:     If False, use avconv instead of ffmpeg if both are available,
@@ -319,6 +337,12 @@ class YoutubeDL(object):
                         data will be downloaded and processed by extractor.
                         You can reduce network I/O by disabling it if you don't
                         care about DASH.
+    youtube_concurrent_requests: Number of get_video_info and DASH manifest
+                        requests issued concurrently while extracting a video
+                        (default 1, i.e. one after another).
+    youtube_page_read_ahead: Number of "load more" pages of YouTube playlists,
+                        channels, feeds and searches downloaded ahead while
+                        the previous pages are processed (default 0).
     """
 
     _NUMERIC_FIELDS = set((
@@ -334,6 +358,7 @@ class YoutubeDL(object):
 
     params = None
     _ies = []
+    _ies_index = None
     _pps = []
     _download_retcode = None
     _num_downloads = None
@@ -344,6 +369,7 @@ class YoutubeDL(object):
         if params is None:
             params = {}
         self._ies = []
+        self._ies_index = None
         self._ies_instances = {}
         self._pps = []
         self._progress_hooks = []
@@ -357,6 +383,10 @@ class YoutubeDL(object):
         }
         self.params.update(params)
         self.cache = Cache(self)
+        self.info_cache = InfoCache(self)
+        self._download_archive = None
+        self._ies_lock = threading.Lock()
+        self._extraction_slots = {}
 
         def check_deprecated(param, option, suggestion):
             if self.params.get(param) is not None:
@@ -452,6 +482,8 @@ class YoutubeDL(object):
     def add_info_extractor(self, ie):
         """Add an InfoExtractor object to the end of the list."""
         self._ies.append(ie)
+        if self._ies_index is not None:
+            self._ies_index.add(ie)
         if not isinstance(ie, type):
             self._ies_instances[ie.ie_key()] = ie
             ie.set_downloader(self)
@@ -464,10 +496,22 @@ class YoutubeDL(object):
         """
         ie = self._ies_instances.get(ie_key)
         if ie is None:
-            ie = get_info_extractor(ie_key)()
-            self.add_info_extractor(ie)
+            with self._ies_lock:
+                ie = self._ies_instances.get(ie_key)
+                if ie is None:
+                    ie = get_info_extractor(ie_key)()
+                    self.add_info_extractor(ie)
         return ie
 
+    def _get_ies_candidates(self, url):
+        """
+        Return the registered extractors that may be suitable for url, in
+        registration order. The index is built on first use.
+        """
+        if self._ies_index is None:
+            self._ies_index = ExtractorIndex(self._ies)
+        return self._ies_index.candidates(url)
+
     def add_default_info_extractors(self):
         """
         Add the InfoExtractors returned by gen_extractors to the end of the list
@@ -781,7 +825,7 @@ class YoutubeDL(object):
         if ie_key:
             ies = [self.get_info_extractor(ie_key)]
         else:
-            ies = self._ies
+            ies = self._get_ies_candidates(url)
 
         for ie in ies:
             if not ie.suitable(url):
@@ -792,21 +836,15 @@ class YoutubeDL(object):
                 self.report_warning('The program functionality for this site has been marked as broken, '
                                     'and will probably not work.')
 
+            return self.__extract_info(url, ie, download, extra_info, process)
+        else:
+            self.report_error('no suitable InfoExtractor for URL %s' % url)
+
+    def __handle_extraction_exceptions(func):
+        # Errors are reported and None is returned, unless they must stop the run
+        def wrapper(self, *args, **kwargs):
             try:
-                ie_result = ie.extract(url)
-                if ie_result is None:  # Finished already (backwards compatibility; listformats and friends should be moved here)
-                    break
-                if isinstance(ie_result, list):
-                    # Backwards compatibility: old IE result format
-                    ie_result = {
-                        '_type': 'compat_list',
-                        'entries': ie_result,
-                    }
-                self.add_default_extra_info(ie_result, ie, url)
-                if process:
-                    return self.process_ie_result(ie_result, download, extra_info)
-                else:
-                    return ie_result
+                return func(self, *args, **kwargs)
             except GeoRestrictedError as e:
                 msg = e.msg
                 if e.countries:
@@ -814,20 +852,104 @@ class YoutubeDL(object):
                         map(ISO3166Utils.short2full, e.countries))
                 msg += '\nYou might want to use a VPN or a proxy server (with --proxy) to workaround.'
                 self.report_error(msg)
-                break
             except ExtractorError as e:  # An error we somewhat expected
                 self.report_error(compat_str(e), e.format_traceback())
-                break
             except MaxDownloadsReached:
                 raise
             except Exception as e:
                 if self.params.get('ignoreerrors', False):
                     self.report_error(error_to_compat_str(e), tb=encode_compat_str(traceback.format_exc()))
-                    break
                 else:
                     raise
+        return wrapper
+
+    @__handle_extraction_exceptions
+    def __extract_info(self, url, ie, download, extra_info, process):
+        ie_result = self.info_cache.load(ie, url)
+        if ie_result is None:
+            slot = self._extraction_slot(ie)
+            if slot is None:
+                ie_result = ie.extract(url)
+            else:
+                with slot:
+                    ie_result = ie.extract(url)
+            if ie_result is None:  # Finished already (backwards compatibility; listformats and friends should be moved here)
+                return
+            if isinstance(ie_result, list):
+                # Backwards compatibility: old IE result format
+                ie_result = {
+                    '_type': 'compat_list',
+                    'entries': ie_result,
+                }
+            self.info_cache.store(ie, url, ie_result)
+        self.add_default_extra_info(ie_result, ie, url)
+        if process:
+            return self.process_ie_result(ie_result, download, extra_info)
         else:
-            self.report_error('no suitable InfoExtractor for URL %s' % url)
+            return ie_result
+
+    @__handle_extraction_exceptions
+    def __process_extracted(self, ie_result, download, extra_info):
+        return self.process_ie_result(ie_result, download, extra_info)
+
+    def _extraction_slot(self, ie):
+        """
+        Return the semaphore bounding the concurrent extractions of ie, or
+        None when extractions do not run concurrently.
+        """
+        limit = self.params.get('concurrent_extractions') or 1
+        if ie._CONCURRENT_EXTRACTIONS:
+            limit = min(limit, ie._CONCURRENT_EXTRACTIONS)
+        if limit <= 1:
+            return None
+        with self._ies_lock:
+            slot = self._extraction_slots.get(ie.ie_key())
+            if slot is None:
+                slot = self._extraction_slots[ie.ie_key()] = threading.BoundedSemaphore(limit)
+        return slot
+
+    def _prefetch_entry(self, entry):
+        """
+        Extract, without processing it, the URL a playlist entry refers to.
+        Return a (result, ) tuple, result being None if extraction failed,
+        or None if the entry is not extracted ahead.
+        """
+        result_type = entry.get('_type', 'video')
+        if result_type not in ('url', 'url_transparent') or self.params.get('extract_flat', False):
+            return None
+        if self._match_entry(entry, incomplete=True) is not None:
+            return None
+        return (self.extract_info(
+            sanitize_url(entry['url']), ie_key=entry.get('ie_key'),
+            download=False, process=False), )
+
+    def __process_prefetched(self, entry, info, download, extra_info):
+        if entry.get('_type') == 'url':
+            # as extract_info would process it
+            return self.__process_extracted(info, download, extra_info)
+        return self.process_ie_result(
+            self._merge_url_transparent(entry, info), download=download, extra_info=extra_info)
+
+    @staticmethod
+    def _merge_url_transparent(ie_result, info):
+        """Return info overridden by the metadata of the url_transparent ie_result"""
+        force_properties = dict(
+            (k, v) for k, v in ie_result.items() if v is not None)
+        for f in ('_type', 'url', 'id', 'extractor', 'extractor_key', 'ie_key'):
+            if f in force_properties:
+                del force_properties[f]
+        new_result = info.copy()
+        new_result.update(force_properties)
+
+        # Extracted info may not be a video result (i.e.
+        # info.get('_type', 'video') != video) but rather an url or
+        # url_transparent. In such cases outer metadata (from ie_result)
+        # should be propagated to inner one (info). For this to happen
+        # _type of info should be overridden with url_transparent. This
+        # fixes issue from https://github.com/ytdl-org/youtube-dl/pull/11163.
+        if new_result.get('_type') == 'url':
+            new_result['_type'] = 'url_transparent'
+        return new_result
 
     def add_default_extra_info(self, ie_result, ie, url):
         self.add_extra_info(ie_result, {
@@ -879,23 +1001,7 @@ class YoutubeDL(object):
             if not info:
                 return info
 
-            force_properties = dict(
-                (k, v) for k, v in ie_result.items() if v is not None)
-            for f in ('_type', 'url', 'id', 'extractor', 'extractor_key', 'ie_key'):
-                if f in force_properties:
-                    del force_properties[f]
-            new_result = info.copy()
-            new_result.update(force_properties)
-
-            # Extracted info may not be a video result (i.e.
-            # info.get('_type', 'video') != video) but rather an url or
-            # url_transparent. In such cases outer metadata (from ie_result)
-            # should be propagated to inner one (info). For this to happen
-            # _type of info should be overridden with url_transparent. This
-            # fixes issue from https://github.com/ytdl-org/youtube-dl/pull/11163.
-            if new_result.get('_type') == 'url':
-                new_result['_type'] = 'url_transparent'
-
+            new_result = self._merge_url_transparent(ie_result, info)
             return self.process_ie_result(
                 new_result, download=download, extra_info=extra_info)
         elif result_type in ('playlist', 'multi_video'):
@@ -976,13 +1082,23 @@ class YoutubeDL(object):
                 random.shuffle(entries)
 
             x_forwarded_for = ie_result.get('__x_forwarded_for_ip')
+            if x_forwarded_for:
+                # This __x_forwarded_for_ip thing is a bit ugly but requires
+                # minimal changes; set before the entries are extracted ahead
+                for entry in entries:
+                    entry['__x_forwarded_for_ip'] = x_forwarded_for
+
+            # Entries referring to other URLs may be extracted ahead by worker
+            # threads; they are still processed (and downloaded) here, in order
+            concurrent_extractions = self.params.get('concurrent_extractions') or 1
+            if concurrent_extractions > 1:
+                prefetched = ordered_concurrent_map(self._prefetch_entry, entries, concurrent_extractions)
+            else:
+                prefetched = itertools.repeat(None)
 
             for i, entry in enumerate(entries, 1):
+                prefetched_info = next(prefetched)
                 self.to_screen('[download] Downloading video %s of %s' % (i, n_entries))
-                # This __x_forwarded_for_ip thing is a bit ugly but requires
-                # minimal changes
-                if x_forwarded_for:
-                    entry['__x_forwarded_for_ip'] = x_forwarded_for
                 extra = {
                     'n_entries': n_entries,
                     'playlist': playlist,
@@ -1002,9 +1118,15 @@ class YoutubeDL(object):
                     self.to_screen('[download] ' + reason)
                     continue
 
-                entry_result = self.process_ie_result(entry,
-                                                      download=download,
-                                                      extra_info=extra)
+                if prefetched_info is None:
+                    entry_result = self.process_ie_result(entry,
+                                                          download=download,
+                                                          extra_info=extra)
+                elif prefetched_info[0] is None:
+                    entry_result = None  # extraction failed, already reported
+                else:
+                    entry_result = self.__process_prefetched(
+                        entry, prefetched_info[0], download, extra)
                 playlist_results.append(entry_result)
             ie_result['entries'] = playlist_results
             self.to_screen('[download] Finished downloading playlist: %s' % playlist)
@@ -2084,7 +2206,7 @@ class YoutubeDL(object):
             if not url:
                 return
             # Try to find matching extractor for the URL and take its ie_key
-            for ie in self._ies:
+            for ie in self._get_ies_candidates(url):
                 if ie.suitable(url):
                     extractor = ie.ie_key()
                     break
@@ -2092,33 +2214,34 @@ class YoutubeDL(object):
                 return
         return extractor.lower() + ' ' + video_id
 
-    def in_download_archive(self, info_dict):
+    def _get_download_archive(self):
+        """Return the index of the download archive, loaded on first use"""
         fn = self.params.get('download_archive')
         if fn is None:
+            return None
+        if self._download_archive is None or self._download_archive.filename != fn:
+            self._download_archive = open_download_archive(
+                fn, self.params.get('download_archive_index') or 'memory')
+        return self._download_archive
+
+    def in_download_archive(self, info_dict):
+        archive = self._get_download_archive()
+        if archive is None:
             return False
 
         vid_id = self._make_archive_id(info_dict)
         if not vid_id:
             return False  # Incomplete video information
 
-        try:
-            with locked_file(fn, 'r', encoding='utf-8') as archive_file:
-                for line in archive_file:
-                    if line.strip() == vid_id:
-                        return True
-        except IOError as ioe:
-            if ioe.errno != errno.ENOENT:
-                raise
-        return False
+        return vid_id in archive
 
     def record_download_archive(self, info_dict):
-        fn = self.params.get('download_archive')
-        if fn is None:
+        archive = self._get_download_archive()
+        if archive is None:
             return
         vid_id = self._make_archive_id(info_dict)
         assert vid_id
-        with locked_file(fn, 'a', encoding='utf-8') as archive_file:
-            archive_file.write(vid_id + '\n')
+        archive.add(vid_id)
 
     @staticmethod
     def format_resolution(format, default='unknown'):
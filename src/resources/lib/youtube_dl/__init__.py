@@ -193,6 +193,11 @@ def _real_main(argv=None):
         if numeric_buffersize is None:
             parser.error('invalid buffer size specified')
         opts.buffersize = numeric_buffersize
+    if opts.fragment_buffer_size is not None:
+        numeric_fragment_buffer_size = FileDownloader.parse_bytes(opts.fragment_buffer_size)
+        if numeric_fragment_buffer_size is None:
+            parser.error('invalid fragment buffer size specified')
+        opts.fragment_buffer_size = numeric_fragment_buffer_size
     if opts.http_chunk_size is not None:
         numeric_chunksize = FileDownloader.parse_bytes(opts.http_chunk_size)
         if not numeric_chunksize:
@@ -351,9 +356,13 @@ def _real_main(argv=None):
         'fragment_retries': opts.fragment_retries,
         'skip_unavailable_fragments': opts.skip_unavailable_fragments,
         'keep_fragments': opts.keep_fragments,
+        'concurrent_fragments': opts.concurrent_fragments,
+        'fragment_buffer_size': opts.fragment_buffer_size,
         'buffersize': opts.buffersize,
         'noresizebuffer': opts.noresizebuffer,
         'http_chunk_size': opts.http_chunk_size,
+        'http_connections': opts.http_connections,
+        'progress_interval': opts.progress_interval,
         'continuedl': opts.continue_dl,
         'noprogress': opts.noprogress,
         'progress_with_newline': opts.progress_with_newline,
@@ -392,9 +401,15 @@ def _real_main(argv=None):
         'max_views': opts.max_views,
         'daterange': date,
         'cachedir': opts.cachedir,
+        'cache_backend': opts.cache_backend,
+        'cache_size': opts.cache_size,
+        'info_cache': opts.info_cache,
+        'info_cache_refresh': opts.info_cache_refresh,
         'youtube_print_sig_code': opts.youtube_print_sig_code,
         'age_limit': opts.age_limit,
         'download_archive': download_archive_fn,
+        'download_archive_index': opts.download_archive_index,
+        'concurrent_extractions': opts.concurrent_extractions,
         'cookiefile': opts.cookiefile,
         'nocheckcertificate': opts.no_check_certificate,
         'prefer_insecure': opts.prefer_insecure,
@@ -406,6 +421,8 @@ def _real_main(argv=None):
         'include_ads': opts.include_ads,
         'default_search': opts.default_search,
         'youtube_include_dash_manifest': opts.youtube_include_dash_manifest,
+        'youtube_concurrent_requests': opts.youtube_concurrent_requests,
+        'youtube_page_read_ahead': opts.youtube_page_read_ahead,
         'encoding': opts.encoding,
         'extract_flat': opts.extract_flat,
         'mark_watched': opts.mark_watched,
@@ -0,0 +1,138 @@
+from __future__ import unicode_literals
+
+import errno
+import os
+import threading
+
+try:
+    import sqlite3
+except ImportError:  # Python built without sqlite3
+    sqlite3 = None
+
+from .utils import locked_file
+
+
+class DownloadArchive(object):
+    """Index of the ids recorded in a download archive file
+
+    The file (one "<extractor> <id>" line per download) remains the
+    reference: the index is loaded once, then only the lines appended since
+    the last lookup (e.g. by another process) are read, and the file is
+    loaded again if it was replaced or truncated.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._identity = None
+        # position after the last complete line, and the incomplete line after it
+        self._offset = 0
+        self._size = 0
+        self._partial = None
+
+    def _reset(self):
+        raise NotImplementedError('This method must be implemented by subclasses')
+
+    def _update(self, ids, identity, offset):
+        raise NotImplementedError('This method must be implemented by subclasses')
+
+    def _lookup(self, vid_id):
+        raise NotImplementedError('This method must be implemented by subclasses')
+
+    def _refresh(self):
+        try:
+            st = os.stat(self.filename)
+        except OSError as ose:
+            if ose.errno != errno.ENOENT:
+                raise
+            st = None
+        identity = (st.st_dev, st.st_ino) if st is not None else None
+        if identity != self._identity or st is not None and st.st_size < self._offset:
+            self._reset()
+            self._identity, self._offset, self._size, self._partial = identity, 0, 0, None
+        if st is None or st.st_size == self._size:
+            return
+        with locked_file(self.filename, 'rb') as archive_file:
+            archive_file.f.seek(self._offset)
+            data = archive_file.read()
+        # a line without end (e.g. being written) is read again next time
+        end = data.rfind(b'\n') + 1
+        ids = [line.strip() for line in data[:end].decode('utf-8').splitlines()]
+        self._offset += end
+        self._size = self._offset + len(data) - end
+        self._partial = data[end:].decode('utf-8', 'ignore').strip() or None
+        if end:
+            self._update([vid_id for vid_id in ids if vid_id], self._identity, self._offset)
+
+    def __contains__(self, vid_id):
+        with self._lock:
+            self._refresh()
+            return vid_id == self._partial or self._lookup(vid_id)
+
+    def add(self, vid_id):
+        with self._lock:
+            with locked_file(self.filename, 'a', encoding='utf-8') as archive_file:
+                archive_file.write(vid_id + '\n')
+            self._refresh()
+
+
+class MemoryDownloadArchive(DownloadArchive):
+    """Ids kept in a set"""
+
+    def __init__(self, filename):
+        super(MemoryDownloadArchive, self).__init__(filename)
+        self._ids = set()
+
+    def _reset(self):
+        self._ids = set()
+
+    def _update(self, ids, identity, offset):
+        self._ids.update(ids)
+
+    def _lookup(self, vid_id):
+        return vid_id in self._ids
+
+
+class SQLiteDownloadArchive(DownloadArchive):
+    """Ids kept in a SQLite database next to the archive (<archive>.sqlite)
+
+    The database persists with the position reached in the archive file, so
+    very large archives are not read again at every run.
+    """
+
+    _SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS ids (id TEXT PRIMARY KEY)',
+        'CREATE TABLE IF NOT EXISTS position (device INTEGER, inode INTEGER, offset INTEGER)',
+    )
+
+    def __init__(self, filename):
+        super(SQLiteDownloadArchive, self).__init__(filename)
+        self._conn = sqlite3.connect(filename + '.sqlite', timeout=10, check_same_thread=False)
+        with self._conn:
+            for statement in self._SCHEMA:
+                self._conn.execute(statement)
+            row = self._conn.execute('SELECT device, inode, offset FROM position').fetchone()
+        if row is not None:
+            self._identity, self._offset = (row[0], row[1]), row[2]
+
+    def _reset(self):
+        with self._conn:
+            self._conn.execute('DELETE FROM ids')
+            self._conn.execute('DELETE FROM position')
+
+    def _update(self, ids, identity, offset):
+        with self._conn:
+            self._conn.executemany('INSERT OR IGNORE INTO ids (id) VALUES (?)', ((vid_id, ) for vid_id in ids))
+            self._conn.execute('DELETE FROM position')
+            self._conn.execute(
+                'INSERT INTO position (device, inode, offset) VALUES (?, ?, ?)', identity + (offset, ))
+
+    def _lookup(self, vid_id):
+        return self._conn.execute('SELECT 1 FROM ids WHERE id = ?', (vid_id, )).fetchone() is not None
+
+
+def open_download_archive(filename, index='memory'):
+    """Return the DownloadArchive of filename, index being 'memory' or 'sqlite'"""
+    if index == 'sqlite' and sqlite3 is not None:
+        return SQLiteDownloadArchive(filename)
+    return MemoryDownloadArchive(filename)
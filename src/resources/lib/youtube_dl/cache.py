@@ -1,23 +1,249 @@
 from __future__ import unicode_literals
 
+import collections
 import errno
+import hashlib
 import io
 import json
 import os
 import re
 import shutil
+import threading
+import time
 import traceback
 
+try:
+    import sqlite3
+except ImportError:  # Python built without sqlite3
+    sqlite3 = None
+
 from .compat import compat_getenv
 from .utils import (
     expand_path,
     write_json_file,
 )
 
+_NAME_RE = re.compile(r'^[a-zA-Z0-9_.-]+$')
+
+
+def _copy(data):
+    # JSON values only: cheaper than copy.deepcopy
+    if isinstance(data, list):
+        return [_copy(item) if isinstance(item, (list, dict)) else item for item in data]
+    if isinstance(data, dict):
+        return dict((key, _copy(value) if isinstance(value, (list, dict)) else value) for key, value in data.items())
+    return data
+
+
+class CacheBackend(object):
+    """Storage of cache entries, identified by section and key.
+
+    load() returns a (data, expires) tuple or None when the entry is missing
+    or expired; expires is a timestamp or None for entries without TTL.
+    """
+
+    def load(self, section, key):
+        raise NotImplementedError('This method must be implemented by subclasses')
+
+    def store(self, section, key, data, expires=None):
+        raise NotImplementedError('This method must be implemented by subclasses')
+
+    def remove(self):
+        raise NotImplementedError('This method must be implemented by subclasses')
+
+
+class FileCacheBackend(CacheBackend):
+    """One JSON file per entry, in <root>/<section>/<key>.json
+
+    This is the historical layout; entries never expire.
+    """
+
+    def __init__(self, ydl, root_dir):
+        self._ydl = ydl
+        self._root_dir = root_dir
+
+    def _get_cache_fn(self, section, key, dtype='json'):
+        return os.path.join(self._root_dir, section, '%s.%s' % (key, dtype))
+
+    def store(self, section, key, data, expires=None):
+        fn = self._get_cache_fn(section, key)
+        try:
+            try:
+                os.makedirs(os.path.dirname(fn))
+            except OSError as ose:
+                if ose.errno != errno.EEXIST:
+                    raise
+            write_json_file(data, fn)
+        except Exception:
+            tb = traceback.format_exc()
+            self._ydl.report_warning(
+                'Writing cache to %r failed: %s' % (fn, tb))
+
+    def load(self, section, key):
+        cache_fn = self._get_cache_fn(section, key)
+        try:
+            try:
+                with io.open(cache_fn, 'r', encoding='utf-8') as cachef:
+                    return json.load(cachef), None
+            except ValueError:
+                try:
+                    file_size = os.path.getsize(cache_fn)
+                except (OSError, IOError) as oe:
+                    file_size = str(oe)
+                self._ydl.report_warning(
+                    'Cache retrieval from %s failed (%s)' % (cache_fn, file_size))
+        except IOError:
+            pass  # No cache available
+        return None
+
+    def remove(self):
+        if os.path.exists(self._root_dir):
+            shutil.rmtree(self._root_dir)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """All entries in a single SQLite database (<root>/cache.sqlite)
+
+    The database is opened in WAL mode, with a connection per operation, so
+    it can be shared by concurrent processes. Expired entries are dropped and,
+    past the maximum number of entries, the least recently used are evicted.
+    """
+
+    FILENAME = 'cache.sqlite'
+    _SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS cache (section TEXT, key TEXT, data TEXT, '
+        'expires REAL, accessed REAL, PRIMARY KEY (section, key))',
+        'CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)',
+    )
+
+    def __init__(self, ydl, root_dir, size=1000):
+        self._ydl = ydl
+        self._root_dir = root_dir
+        self._path = os.path.join(root_dir, self.FILENAME)
+        self._size = size
+        self._ready = False
+
+    def _connect(self):
+        if not self._ready:
+            try:
+                os.makedirs(self._root_dir)
+            except OSError as ose:
+                if ose.errno != errno.EEXIST:
+                    raise
+        conn = sqlite3.connect(self._path, timeout=10)
+        if not self._ready:
+            conn.execute('PRAGMA journal_mode=WAL')
+            for statement in self._SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+            self._ready = True
+        return conn
+
+    def _execute(self, action, function):
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    return function(conn)
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError, ValueError) as err:
+            self._ydl.report_warning(
+                'Cache %s %s failed: %s' % (action, self._path, err))
+
+    def store(self, section, key, data, expires=None):
+        def _store(conn):
+            now = time.time()
+            conn.execute(
+                'INSERT OR REPLACE INTO cache (section, key, data, expires, accessed) VALUES (?, ?, ?, ?, ?)',
+                (section, key, json.dumps(data), expires, now))
+            conn.execute('DELETE FROM cache WHERE expires IS NOT NULL AND expires <= ?', (now, ))
+            conn.execute(
+                'DELETE FROM cache WHERE rowid IN (SELECT rowid FROM cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)',
+                (self._size, ))
+        self._execute('writing to', _store)
+
+    def load(self, section, key):
+        def _load(conn):
+            row = conn.execute(
+                'SELECT data, expires FROM cache WHERE section = ? AND key = ?', (section, key)).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if row[1] is not None and row[1] <= now:
+                conn.execute('DELETE FROM cache WHERE section = ? AND key = ?', (section, key))
+                return None
+            conn.execute('UPDATE cache SET accessed = ? WHERE section = ? AND key = ?', (now, section, key))
+            return json.loads(row[0]), row[1]
+        return self._execute('retrieval from', _load)
+
+    def remove(self):
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(self._path + suffix):
+                os.remove(self._path + suffix)
+        self._ready = False
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Entries kept in process memory, the least recently used being evicted
+    past the maximum size (in bytes of JSON) of the entries. Safe to share
+    between threads."""
+
+    def __init__(self, size=16 * 1024 * 1024):
+        self._size = size
+        self._used = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def store(self, section, key, data, expires=None):
+        size = len(json.dumps(data))
+        data = _copy(data)
+        with self._lock:
+            entry = self._entries.pop((section, key), None)
+            if entry is not None:
+                self._used -= entry[2]
+            if size > self._size:
+                return
+            self._entries[(section, key)] = (data, expires, size)
+            self._used += size
+            while self._used > self._size:
+                self._used -= self._entries.popitem(last=False)[1][2]
+
+    def load(self, section, key):
+        with self._lock:
+            entry = self._entries.pop((section, key), None)
+            if entry is None:
+                return None
+            if entry[1] is not None and entry[1] <= time.time():
+                self._used -= entry[2]
+                return None
+            self._entries[(section, key)] = entry
+        return _copy(entry[0]), entry[1]
+
+    def remove(self):
+        with self._lock:
+            self._entries.clear()
+            self._used = 0
+
 
 class Cache(object):
+    """Persistent cache of extractor data (e.g. YouTube signature functions)
+
+    The backend is chosen with the cache_backend parameter: 'file' (one JSON
+    file per entry, the default), 'sqlite' or 'memory' (not persisted). Loads
+    are served by an in-process memory tier after the first use.
+    """
+
+    BACKENDS = ('file', 'sqlite', 'memory')
+
+    # memory tiers shared by the YoutubeDL instances of the process, per backend location
+    _tiers = {}
+    _tiers_lock = threading.Lock()
+
     def __init__(self, ydl):
         self._ydl = ydl
+        self._backend = None
+        self._tier = None
 
     def _get_root_dir(self):
         res = self._ydl.params.get('cachedir')
@@ -26,35 +252,53 @@ class Cache(object):
             res = os.path.join(cache_root, 'youtube-dl')
         return expand_path(res)
 
+    def _validate(self, section, key):
+        assert _NAME_RE.match(section), 'invalid section %r' % section
+        assert _NAME_RE.match(key), 'invalid key %r' % key
+
     def _get_cache_fn(self, section, key, dtype):
-        assert re.match(r'^[a-zA-Z0-9_.-]+$', section), \
-            'invalid section %r' % section
-        assert re.match(r'^[a-zA-Z0-9_.-]+$', key), 'invalid key %r' % key
+        self._validate(section, key)
         return os.path.join(
             self._get_root_dir(), section, '%s.%s' % (key, dtype))
 
+    def _get_backend(self):
+        if self._backend is None:
+            name = self._ydl.params.get('cache_backend') or 'file'
+            if name not in self.BACKENDS:
+                self._ydl.report_warning('Unknown cache backend %r, using file' % name)
+                name = 'file'
+            if name == 'sqlite' and sqlite3 is None:
+                self._ydl.report_warning('sqlite3 is not available, using file cache backend')
+                name = 'file'
+            root_dir = self._get_root_dir()
+            with self._tiers_lock:
+                self._tier = self._tiers.setdefault((name, root_dir), MemoryCacheBackend())
+            if name == 'sqlite':
+                self._backend = SQLiteCacheBackend(
+                    self._ydl, root_dir, self._ydl.params.get('cache_size') or 1000)
+            elif name == 'memory':
+                self._backend = self._tier
+            else:
+                self._backend = FileCacheBackend(self._ydl, root_dir)
+        return self._backend
+
     @property
     def enabled(self):
         return self._ydl.params.get('cachedir') is not False
 
-    def store(self, section, key, data, dtype='json'):
+    def store(self, section, key, data, dtype='json', ttl=None):
+        """Store data; with ttl (seconds) the entry expires, except in the file backend"""
         assert dtype in ('json',)
 
         if not self.enabled:
             return
 
-        fn = self._get_cache_fn(section, key, dtype)
-        try:
-            try:
-                os.makedirs(os.path.dirname(fn))
-            except OSError as ose:
-                if ose.errno != errno.EEXIST:
-                    raise
-            write_json_file(data, fn)
-        except Exception:
-            tb = traceback.format_exc()
-            self._ydl.report_warning(
-                'Writing cache to %r failed: %s' % (fn, tb))
+        self._validate(section, key)
+        backend = self._get_backend()
+        expires = time.time() + ttl if ttl is not None else None
+        backend.store(section, key, data, expires)
+        if backend is not self._tier:
+            self._tier.store(section, key, data, expires)
 
     def load(self, section, key, dtype='json', default=None):
         assert dtype in ('json',)
@@ -62,22 +306,39 @@ class Cache(object):
         if not self.enabled:
             return default
 
-        cache_fn = self._get_cache_fn(section, key, dtype)
+        self._validate(section, key)
+        backend = self._get_backend()
+        entry = self._tier.load(section, key)
+        if entry is None and backend is not self._tier:
+            entry = backend.load(section, key)
+            if entry is not None:
+                self._tier.store(section, key, entry[0], entry[1])
+        return entry[0] if entry is not None else default
+
+    def pop_file_section(self, section):
+        """Remove a section of the historical file layout and return its
+        entries as a {key: data} dict, to migrate a section no longer used"""
+        if not self.enabled:
+            return {}
+
+        self._validate(section, 'x')
+        section_dir = os.path.join(self._get_root_dir(), section)
+        entries = {}
         try:
+            names = os.listdir(section_dir)
+        except OSError:
+            return entries
+        for name in names:
+            key, ext = os.path.splitext(name)
+            if ext != '.json' or not _NAME_RE.match(key):
+                continue
             try:
-                with io.open(cache_fn, 'r', encoding='utf-8') as cachef:
-                    return json.load(cachef)
-            except ValueError:
-                try:
-                    file_size = os.path.getsize(cache_fn)
-                except (OSError, IOError) as oe:
-                    file_size = str(oe)
-                self._ydl.report_warning(
-                    'Cache retrieval from %s failed (%s)' % (cache_fn, file_size))
-        except IOError:
-            pass  # No cache available
-
-        return default
+                with io.open(os.path.join(section_dir, name), 'r', encoding='utf-8') as cachef:
+                    entries[key] = json.load(cachef)
+            except (IOError, OSError, ValueError):
+                pass
+        shutil.rmtree(section_dir, ignore_errors=True)
+        return entries
 
     def remove(self):
         if not self.enabled:
@@ -90,7 +351,92 @@ class Cache(object):
 
         self._ydl.to_screen(
             'Removing cache dir %s .' % cachedir, skip_eol=True)
+        backend = self._get_backend()
+        self._tier.remove()
         if os.path.exists(cachedir):
             self._ydl.to_screen('.', skip_eol=True)
-            shutil.rmtree(cachedir)
+            backend.remove()
+            if os.path.exists(cachedir):
+                shutil.rmtree(cachedir)
         self._ydl.to_screen('.')
+
+
+class InfoCache(object):
+    """Cache of extraction results, between extract_info and process_ie_result
+
+    Entries are keyed on the extractor, the canonical id of the URL (see
+    InfoExtractor._info_cache_id) and the parameters affecting extraction,
+    and expire after the TTL of the extractor (InfoExtractor._INFO_CACHE_TTL).
+    They are kept in the cache of the YoutubeDL instance, hence bounded by
+    its backend (memory tier and sqlite). Enabled with the info_cache
+    parameter; with info_cache_refresh results are extracted again and stored.
+    """
+
+    SECTION = 'extract-info'
+    # parameters that change what extractors return, or where they are requested from
+    PARAMS = (
+        'youtube_include_dash_manifest', 'noplaylist', 'prefer_insecure',
+        'geo_bypass', 'geo_bypass_country', 'geo_bypass_ip_block',
+        'proxy', 'geo_verification_proxy', 'cn_verification_proxy', 'source_address',
+        'username', 'usenetrc', 'videopassword', 'ap_mso', 'ap_username',
+        'cookiefile', 'listsubtitles', 'writesubtitles', 'writeautomaticsub',
+        'allsubtitles', 'subtitleslangs',
+    )
+
+    def __init__(self, ydl):
+        self._ydl = ydl
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0}
+        self._stats_lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return bool(self._ydl.params.get('info_cache')) and self._ydl.cache.enabled
+
+    def _get_key(self, ie, url):
+        cache_id = ie._info_cache_id(url)
+        params = [self._ydl.params.get(param) for param in self.PARAMS]
+        digest = hashlib.sha1(json.dumps(
+            [ie.ie_key(), cache_id, params], sort_keys=True).encode('utf-8')).hexdigest()
+        return '%s_%s' % (ie.ie_key(), digest), cache_id
+
+    def _count(self, stat):
+        # extractions may run concurrently (see YoutubeDL._extraction_slot)
+        with self._stats_lock:
+            self.stats[stat] += 1
+            return dict(self.stats)
+
+    def _debug(self, message, ie, cache_id, stats):
+        if self._ydl.params.get('verbose'):
+            self._ydl.to_screen('[debug] Info cache %s for %s %s (%d hits, %d misses)' % (
+                message, ie.ie_key(), cache_id, stats['hits'], stats['misses']))
+
+    def load(self, ie, url):
+        """Return the cached result of ie for url, or None"""
+        if not self.enabled or not ie._INFO_CACHE_TTL:
+            return None
+        key, cache_id = self._get_key(ie, url)
+        entry = None
+        if not self._ydl.params.get('info_cache_refresh'):
+            entry = self._ydl.cache.load(self.SECTION, key)
+        # the file backend does not expire entries itself
+        if entry is not None and entry['expires'] > time.time():
+            self._debug('hit', ie, cache_id, self._count('hits'))
+            return entry['info']
+        self._debug('miss', ie, cache_id, self._count('misses'))
+        return None
+
+    def store(self, ie, url, ie_result):
+        if not self.enabled or not ie._INFO_CACHE_TTL:
+            return
+        # generated entries and paged lists are left to be consumed lazily
+        if not isinstance(ie_result.get('entries', []), list):
+            return
+        try:
+            info = json.loads(json.dumps(ie_result))
+        except (TypeError, ValueError):
+            return
+        key, cache_id = self._get_key(ie, url)
+        ttl = ie._INFO_CACHE_TTL
+        self._ydl.cache.store(
+            self.SECTION, key, {'expires': time.time() + ttl, 'info': info}, ttl=ttl)
+        self._count('stores')
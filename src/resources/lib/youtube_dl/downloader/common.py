@@ -51,6 +51,11 @@ class FileDownloader(object):
     http_chunk_size:    Size of a chunk for chunk-based HTTP downloading. May be
                         useful for bypassing bandwidth throttling imposed by
                         a webserver (experimental)
+    http_connections:   Number of connections downloading ranges of a file
+                        over HTTP at once, for servers limiting the speed
+                        of each connection
+    progress_interval:  Minimum number of seconds between the progress hooks
+                        of a download (default 0: a hook for every block)
 
     Subclasses of this one must re-define the real_download method.
     """
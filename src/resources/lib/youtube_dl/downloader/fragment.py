@@ -1,16 +1,22 @@
 from __future__ import division, unicode_literals
 
 import os
+import shutil
+import threading
 import time
 import json
 
 from .common import FileDownloader
 from .http import HttpFD
+from ..compat import compat_urllib_error
 from ..utils import (
+    DownloadError,
     error_to_compat_str,
     encodeFilename,
+    ordered_concurrent_map,
     sanitize_open,
     sanitized_Request,
+    write_json_file,
 )
 
 
@@ -19,6 +25,123 @@ class HttpQuietDownloader(HttpFD):
         pass
 
 
+class FragmentBuffer(object):
+    """
+    Stream a fragment is downloaded to, then appended from.
+
+    The content is kept in memory, in a buffer reused for the next fragments,
+    unless fragments are kept or the buffers would exceed the size of their
+    pool: it is then written to the fragment file.
+    """
+
+    def __init__(self, pool):
+        self._pool = pool
+        self._data = bytearray()
+        self._length = 0
+        self._file = None
+        self.filename = None
+        self.on_disk = False
+
+    @property
+    def capacity(self):
+        return len(self._data)
+
+    def open(self, filename, to_disk=False):
+        self._length = 0
+        self.filename = filename
+        self.on_disk = False
+        if to_disk:
+            self._spill()
+
+    def _spill(self):
+        self._file, self.filename = sanitize_open(self.filename, 'wb')
+        self._file.write(memoryview(self._data)[:self._length])
+        self.on_disk = True
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def write(self, data):
+        if not self.on_disk:
+            end = self._length + len(data)
+            if end <= len(self._data) or self._pool.reserve(self, end):
+                self._data[self._length:end] = data
+                self._length = end
+                return
+            self._spill()
+        self._file.write(data)
+
+    def seek(self, offset):
+        if self.on_disk:
+            self._file.seek(offset)
+        else:
+            self._length = min(offset, self._length)
+
+    def truncate(self):
+        if self.on_disk:
+            self._file.truncate()
+
+    def read(self):
+        """Return the content"""
+        if self.on_disk:
+            self._close_file()
+            with open(encodeFilename(self.filename), 'rb') as f:
+                return f.read()
+        return memoryview(self._data)[:self._length].tobytes()
+
+    def write_to(self, stream):
+        """Write the content to stream, without copying it first"""
+        if self.on_disk:
+            self._close_file()
+            with open(encodeFilename(self.filename), 'rb') as f:
+                shutil.copyfileobj(f, stream, 1024 * 1024)
+        else:
+            stream.write(memoryview(self._data)[:self._length])
+
+    def release(self):
+        """Remove the fragment file unless fragments are kept, and reuse the buffer"""
+        self._close_file()
+        if self.on_disk and not self._pool.keep_fragments:
+            os.remove(encodeFilename(self.filename))
+        self._pool.release(self)
+
+
+class FragmentBufferPool(object):
+    """FragmentBuffers of a download, holding at most max_size bytes in memory"""
+
+    def __init__(self, max_size, keep_fragments=False):
+        self.max_size = max_size
+        self.keep_fragments = keep_fragments
+        self._size = 0
+        self._free = []
+        self._lock = threading.Lock()
+
+    def acquire(self, filename):
+        with self._lock:
+            fragment_buffer = self._free.pop() if self._free else FragmentBuffer(self)
+        fragment_buffer.open(filename, self.keep_fragments)
+        return fragment_buffer
+
+    def reserve(self, fragment_buffer, size):
+        """Return whether the memory of fragment_buffer may grow to size bytes"""
+        with self._lock:
+            growth = size - fragment_buffer.capacity
+            if self._size + growth > self.max_size and self._free:
+                # give up the memory of the unused buffers first
+                self._size -= sum(b.capacity for b in self._free)
+                self._free = []
+            if self._size + growth > self.max_size:
+                return False
+            self._size += growth
+            return True
+
+    def release(self, fragment_buffer):
+        with self._lock:
+            self._free.append(fragment_buffer)
+
+
 class FragmentFD(FileDownloader):
     """
     A base file downloader class for fragmented media (e.g. f4m/m3u8 manifests).
@@ -31,6 +154,11 @@ class FragmentFD(FileDownloader):
                         Skip unavailable fragments (DASH and hlsnative only)
     keep_fragments:     Keep downloaded fragments on disk after downloading is
                         finished
+    concurrent_fragments: Number of fragments downloaded concurrently, still
+                        appended in order (DASH, hlsnative and ISM only)
+    fragment_buffer_size: Memory in bytes for the fragments being downloaded
+                        and appended, beyond which they are written to disk
+                        (default is 32M)
 
     For each incomplete fragment download youtube-dl keeps on disk a special
     bookkeeping file with download state and metadata (in future such files will
@@ -47,12 +175,21 @@ class FragmentFD(FileDownloader):
             current_fragment:
                 Dictionary with current (being downloaded) fragment data:
                 index:  0-based index of current fragment among all fragments
+                offset: Size of the incomplete download file before current
+                        fragment; data beyond it is discarded when resuming
             fragment_count:
                 Total count of fragments
 
+    The file is replaced atomically every _YTDL_CHECKPOINT_FRAGMENTS fragments
+    or _YTDL_CHECKPOINT_INTERVAL seconds, and when the download stops.
+
     This feature is experimental and file format may change in future.
     """
 
+    _FRAGMENT_BUFFER_SIZE = 32 * 1024 * 1024
+    _YTDL_CHECKPOINT_FRAGMENTS = 20
+    _YTDL_CHECKPOINT_INTERVAL = 5
+
     def report_retry_fragment(self, err, frag_index, count, retries):
         self.to_screen(
             '[download] Got server HTTP error: %s. Retrying fragment %d (attempt %d of %s)...'
@@ -77,48 +214,165 @@ class FragmentFD(FileDownloader):
         assert 'ytdl_corrupt' not in ctx
         stream, _ = sanitize_open(self.ytdl_filename(ctx['filename']), 'r')
         try:
-            ctx['fragment_index'] = json.loads(stream.read())['downloader']['current_fragment']['index']
+            current_fragment = json.loads(stream.read())['downloader']['current_fragment']
+            ctx['fragment_index'] = current_fragment['index']
+            # not recorded by former versions
+            ctx['fragment_offset'] = current_fragment.get('offset')
         except Exception:
             ctx['ytdl_corrupt'] = True
         finally:
             stream.close()
 
     def _write_ytdl_file(self, ctx):
-        frag_index_stream, _ = sanitize_open(self.ytdl_filename(ctx['filename']), 'w')
         downloader = {
             'current_fragment': {
                 'index': ctx['fragment_index'],
+                'offset': ctx['fragment_offset'],
             },
         }
         if ctx.get('fragment_count') is not None:
             downloader['fragment_count'] = ctx['fragment_count']
-        frag_index_stream.write(json.dumps({'downloader': downloader}))
-        frag_index_stream.close()
+        write_json_file({'downloader': downloader}, self.ytdl_filename(ctx['filename']))
+        ctx['ytdl_checkpoint'] = (ctx['fragment_index'], time.time())
+
+    def _checkpoint_ytdl_file(self, ctx, force=False):
+        """Write the .ytdl file if the policy (or force) requires it"""
+        last_index, last_time = ctx['ytdl_checkpoint']
+        if ctx['fragment_index'] == last_index:
+            return
+        if (not force and ctx['fragment_index'] - last_index < self._YTDL_CHECKPOINT_FRAGMENTS
+                and time.time() - last_time < self._YTDL_CHECKPOINT_INTERVAL):
+            return
+        # the appended fragments are in the file before the .ytdl file records them
+        ctx['dest_stream'].flush()
+        self._write_ytdl_file(ctx)
+
+    def _download_fragment_buffer(self, ctx, frag_index, frag_url, info_dict, headers=None):
+        """Download the fragment of 0-based frag_index, return the success and its FragmentBuffer"""
+        fragment_buffer = ctx['fragment_buffers'].acquire('%s-Frag%d' % (ctx['tmpfilename'], frag_index))
+        success = False
+        try:
+            success = ctx['dl'].download(fragment_buffer, {
+                'url': frag_url,
+                'http_headers': headers or info_dict.get('http_headers'),
+            })
+        finally:
+            if not success:
+                ctx['discard_frag_progress'](fragment_buffer)
+                fragment_buffer.release()
+        if not success:
+            return False, None
+        return True, fragment_buffer
+
+    def _read_fragment(self, ctx, fragment_buffer):
+        ctx['fragment_buffer'] = fragment_buffer
+        return fragment_buffer.read()
 
     def _download_fragment(self, ctx, frag_url, info_dict, headers=None):
-        fragment_filename = '%s-Frag%d' % (ctx['tmpfilename'], ctx['fragment_index'])
-        success = ctx['dl'].download(fragment_filename, {
-            'url': frag_url,
-            'http_headers': headers or info_dict.get('http_headers'),
-        })
+        success, fragment_buffer = self._download_fragment_buffer(
+            ctx, ctx['fragment_index'], frag_url, info_dict, headers)
         if not success:
             return False, None
-        down, frag_sanitized = sanitize_open(fragment_filename, 'rb')
-        ctx['fragment_filename_sanitized'] = frag_sanitized
-        frag_content = down.read()
-        down.close()
-        return True, frag_content
+        return True, self._read_fragment(ctx, fragment_buffer)
+
+    def download_and_append_fragments(self, ctx, fragments, info_dict, pack_func=None, skip_download_errors=False):
+        """
+        Download the fragments after ctx['fragment_index'] and append them
+        to the destination, in order.
+
+        fragments are dicts with the 1-based frag_index, the url, and
+        optionally the request headers and fatal (whether a fragment failing
+        after all its retries aborts the download, rather than being skipped).
+        With skip_download_errors, non fatal fragments are also skipped on
+        HttpFD errors. pack_func(fragment, content) returns the data to append.
+        With the concurrent_fragments option fragments are downloaded by that
+        many threads, at most twice that many fragments being held for
+        reassembly (in memory, up to the fragment_buffer_size option).
+        Once the download stops, the fragments not started yet are cancelled
+        and those being downloaded are discarded, without progress hooks.
+        Return False if the download failed.
+        """
+        fragment_retries = self.params.get('fragment_retries', 0)
+        ctx['fragments_cancelled'] = False
+
+        def download_fragment(fragment):
+            frag_index = fragment['frag_index']
+            count = 0
+            while count <= fragment_retries:
+                if ctx['fragments_cancelled']:
+                    return fragment, 'cancelled', None
+                try:
+                    success, fragment_buffer = self._download_fragment_buffer(
+                        ctx, frag_index - 1, fragment['url'], info_dict, fragment.get('headers'))
+                    return fragment, ('downloaded' if success else 'failed'), fragment_buffer
+                except compat_urllib_error.HTTPError as err:
+                    count += 1
+                    if count <= fragment_retries:
+                        self.report_retry_fragment(err, frag_index, count, fragment_retries)
+                except DownloadError as err:
+                    # Don't retry fragment if error occurred during HTTP downloading
+                    # itself since it has own retry settings
+                    if skip_download_errors and not fragment.get('fatal'):
+                        return fragment, 'skipped', None
+                    # raised when due, the fragments downloaded meanwhile being discarded
+                    return fragment, 'error', err
+            return fragment, 'skipped' if not fragment.get('fatal') else 'given up', None
+
+        pending = [fragment for fragment in fragments if fragment['frag_index'] > ctx['fragment_index']]
+        results = ordered_concurrent_map(
+            download_fragment, pending, self.params.get('concurrent_fragments') or 1)
+        try:
+            for fragment, status, fragment_buffer in results:
+                if status == 'error':
+                    raise fragment_buffer
+                if status == 'failed':
+                    return False
+                if status == 'given up':
+                    self.report_error('giving up after %s fragment retries' % fragment_retries)
+                    return False
+                if status == 'skipped':
+                    self.report_skip_fragment(fragment['frag_index'])
+                    continue
+                if pack_func is not None:
+                    frag_content = pack_func(fragment, self._read_fragment(ctx, fragment_buffer))
+                else:
+                    # appended straight from the buffer
+                    ctx['fragment_buffer'] = frag_content = fragment_buffer
+                ctx['fragment_index'] = fragment['frag_index'] - 1
+                self._append_fragment(ctx, frag_content)
+                # We only download the first fragment during the test
+                if self.params.get('test', False):
+                    break
+        finally:
+            # wait for the fragments being downloaded and release their buffers,
+            # removing the fragment files
+            ctx['fragments_cancelled'] = True
+            fragment_buffer = ctx.pop('fragment_buffer', None)
+            if fragment_buffer is not None:
+                fragment_buffer.release()
+            for fragment, status, fragment_buffer in results:
+                if status == 'downloaded':
+                    fragment_buffer.release()
+            if self.__do_ytdl_file(ctx):
+                self._checkpoint_ytdl_file(ctx, force=True)
+        return True
 
     def _append_fragment(self, ctx, frag_content):
         try:
-            ctx['dest_stream'].write(frag_content)
-            ctx['dest_stream'].flush()
+            if isinstance(frag_content, FragmentBuffer):
+                frag_content.write_to(ctx['dest_stream'])
+            else:
+                ctx['dest_stream'].write(frag_content)
         finally:
-            if self.__do_ytdl_file(ctx):
-                self._write_ytdl_file(ctx)
-            if not self.params.get('keep_fragments', False):
-                os.remove(encodeFilename(ctx['fragment_filename_sanitized']))
-            del ctx['fragment_filename_sanitized']
+            ctx.pop('fragment_buffer').release()
+        ctx['fragment_index'] += 1
+        if self.__do_ytdl_file(ctx):
+            # the end of the last complete fragment, the checkpoint forced when
+            # the download stops possibly following a partial write
+            ctx['fragment_offset'] = ctx['dest_stream'].tell()
+            self._checkpoint_ytdl_file(ctx)
+        else:
+            ctx['dest_stream'].flush()
 
     def _prepare_frag_download(self, ctx):
         if 'live' not in ctx:
@@ -143,6 +397,7 @@ class FragmentFD(FileDownloader):
                 'retries': self.params.get('retries', 0),
                 'nopart': self.params.get('nopart', False),
                 'test': self.params.get('test', False),
+                'progress_interval': self.params.get('progress_interval'),
             }
         )
         tmpfilename = self.temp_name(ctx['filename'])
@@ -158,31 +413,48 @@ class FragmentFD(FileDownloader):
         ctx.update({
             'tmpfilename': tmpfilename,
             'fragment_index': 0,
+            'fragment_offset': 0,
         })
 
         if self.__do_ytdl_file(ctx):
             if os.path.isfile(encodeFilename(self.ytdl_filename(ctx['filename']))):
                 self._read_ytdl_file(ctx)
                 is_corrupt = ctx.get('ytdl_corrupt') is True
-                is_inconsistent = ctx['fragment_index'] > 0 and resume_len == 0
+                fragment_offset = ctx.get('fragment_offset')
+                is_inconsistent = ctx['fragment_index'] > 0 and (
+                    resume_len == 0 if fragment_offset is None else resume_len < fragment_offset)
                 if is_corrupt or is_inconsistent:
                     message = (
                         '.ytdl file is corrupt' if is_corrupt else
                         'Inconsistent state of incomplete fragment download')
                     self.report_warning(
                         '%s. Restarting from the beginning...' % message)
-                    ctx['fragment_index'] = resume_len = 0
+                    ctx['fragment_index'] = ctx['fragment_offset'] = resume_len = 0
+                    open_mode = 'wb'
                     if 'ytdl_corrupt' in ctx:
                         del ctx['ytdl_corrupt']
                     self._write_ytdl_file(ctx)
+                elif fragment_offset is None:
+                    ctx['fragment_offset'] = resume_len
+                elif resume_len > fragment_offset:
+                    # Fragments appended after the last checkpoint are downloaded again
+                    with open(encodeFilename(tmpfilename), 'r+b') as tmp_stream:
+                        tmp_stream.truncate(fragment_offset)
+                    resume_len = fragment_offset
+                    self._write_ytdl_file(ctx)
             else:
                 self._write_ytdl_file(ctx)
                 assert ctx['fragment_index'] == 0
+            ctx['ytdl_checkpoint'] = (ctx['fragment_index'], time.time())
 
         dest_stream, tmpfilename = sanitize_open(tmpfilename, open_mode)
 
+        fragment_buffer_size = self.params.get('fragment_buffer_size')
         ctx.update({
             'dl': dl,
+            'fragment_buffers': FragmentBufferPool(
+                self._FRAGMENT_BUFFER_SIZE if fragment_buffer_size is None else fragment_buffer_size,
+                self.params.get('keep_fragments', False)),
             'dest_stream': dest_stream,
             'tmpfilename': tmpfilename,
             # Total complete fragments downloaded so far in bytes
@@ -206,43 +478,56 @@ class FragmentFD(FileDownloader):
         start = time.time()
         ctx.update({
             'started': start,
-            # Amount of fragment's bytes downloaded by the time of the previous
-            # frag progress hook invocation
-            'prev_frag_downloaded_bytes': 0,
+            # Amount of bytes downloaded by the time of the previous frag
+            # progress hook invocation, per fragment being downloaded
+            'prev_frag_downloaded_bytes': {},
         })
+        # fragments may be downloaded concurrently
+        lock = threading.Lock()
 
         def frag_progress_hook(s):
-            if s['status'] not in ('downloading', 'finished'):
+            if s['status'] not in ('downloading', 'finished') or ctx.get('fragments_cancelled'):
                 return
 
-            time_now = time.time()
-            state['elapsed'] = time_now - start
-            frag_total_bytes = s.get('total_bytes') or 0
-            if not ctx['live']:
-                estimated_size = (
-                    (ctx['complete_frags_downloaded_bytes'] + frag_total_bytes)
-                    / (state['fragment_index'] + 1) * total_frags)
-                state['total_bytes_estimate'] = estimated_size
-
-            if s['status'] == 'finished':
-                state['fragment_index'] += 1
-                ctx['fragment_index'] = state['fragment_index']
-                state['downloaded_bytes'] += frag_total_bytes - ctx['prev_frag_downloaded_bytes']
-                ctx['complete_frags_downloaded_bytes'] = state['downloaded_bytes']
-                ctx['prev_frag_downloaded_bytes'] = 0
-            else:
-                frag_downloaded_bytes = s['downloaded_bytes']
-                state['downloaded_bytes'] += frag_downloaded_bytes - ctx['prev_frag_downloaded_bytes']
+            with lock:
+                time_now = time.time()
+                state['elapsed'] = time_now - start
+                frag_total_bytes = s.get('total_bytes') or 0
                 if not ctx['live']:
-                    state['eta'] = self.calc_eta(
-                        start, time_now, estimated_size - resume_len,
-                        state['downloaded_bytes'] - resume_len)
-                state['speed'] = s.get('speed') or ctx.get('speed')
-                ctx['speed'] = state['speed']
-                ctx['prev_frag_downloaded_bytes'] = frag_downloaded_bytes
-            self._hook_progress(state)
+                    estimated_size = (
+                        (ctx['complete_frags_downloaded_bytes'] + frag_total_bytes)
+                        / (state['fragment_index'] + 1) * total_frags)
+                    state['total_bytes_estimate'] = estimated_size
+
+                prev_frag_downloaded_bytes = ctx['prev_frag_downloaded_bytes'].pop(s['filename'], 0)
+                if s['status'] == 'finished':
+                    state['fragment_index'] += 1
+                    state['downloaded_bytes'] += frag_total_bytes - prev_frag_downloaded_bytes
+                    ctx['complete_frags_downloaded_bytes'] = state['downloaded_bytes']
+                else:
+                    frag_downloaded_bytes = s['downloaded_bytes']
+                    state['downloaded_bytes'] += frag_downloaded_bytes - prev_frag_downloaded_bytes
+                    if not ctx['live']:
+                        state['eta'] = self.calc_eta(
+                            start, time_now, estimated_size - resume_len,
+                            state['downloaded_bytes'] - resume_len)
+                    if ctx['prev_frag_downloaded_bytes']:
+                        # other fragments are being downloaded
+                        state['speed'] = self.calc_speed(
+                            start, time_now, state['downloaded_bytes'] - resume_len)
+                    else:
+                        state['speed'] = s.get('speed') or ctx.get('speed')
+                    ctx['speed'] = state['speed']
+                    ctx['prev_frag_downloaded_bytes'][s['filename']] = frag_downloaded_bytes
+                self._hook_progress(state)
+
+        def discard_frag_progress(filename):
+            # the progress of a failed download, its buffer being reused by other fragments
+            with lock:
+                state['downloaded_bytes'] -= ctx['prev_frag_downloaded_bytes'].pop(filename, 0)
 
         ctx['dl'].add_progress_hook(frag_progress_hook)
+        ctx['discard_frag_progress'] = discard_frag_progress
 
         return start
 
@@ -1,8 +1,11 @@
 from __future__ import unicode_literals
 
+import binascii
 import errno
+import json
 import os
 import socket
+import threading
 import time
 import random
 import re
@@ -16,8 +19,10 @@ from ..utils import (
     ContentTooShortError,
     encodeFilename,
     int_or_none,
+    preallocate_file,
     sanitize_open,
     sanitized_Request,
+    write_json_file,
     write_xattr,
     XAttrMetadataError,
     XAttrUnavailableError,
@@ -25,6 +30,9 @@ from ..utils import (
 
 
 class HttpFD(FileDownloader):
+    _SEGMENT_BLOCK_SIZE = 256 * 1024
+    _SEGMENTS_CHECKPOINT_INTERVAL = 5
+
     def real_download(self, filename, info_dict):
         url = info_dict['url']
 
@@ -33,9 +41,13 @@ class HttpFD(FileDownloader):
             __setattr__ = dict.__setitem__
             __delattr__ = dict.__delitem__
 
+        # The destination may also be a stream (e.g. a fragment buffer of
+        # FragmentFD), written like stdout
+        to_stream = hasattr(filename, 'write')
+
         ctx = DownloadContext()
         ctx.filename = filename
-        ctx.tmpfilename = self.temp_name(filename)
+        ctx.tmpfilename = filename if to_stream else self.temp_name(filename)
         ctx.stream = None
 
         # Do not include the Accept-Encoding header
@@ -45,6 +57,15 @@ class HttpFD(FileDownloader):
             headers.update(add_headers)
 
         is_test = self.params.get('test', False)
+
+        # Downloads started over several connections resume that way
+        connections = self.params.get('http_connections') or 1
+        if not is_test and not to_stream and filename != '-' and (
+                connections > 1 or os.path.isfile(encodeFilename(self.ytdl_filename(filename)))):
+            result = self._download_segments(filename, info_dict, headers, connections)
+            if result is not None:
+                return result
+
         chunk_size = self._TEST_FILE_SIZE if is_test else (
             info_dict.get('downloader_options', {}).get('http_chunk_size')
             or self.params.get('http_chunk_size') or 0)
@@ -53,10 +74,14 @@ class HttpFD(FileDownloader):
         ctx.resume_len = 0
         ctx.data_len = None
         ctx.block_size = self.params.get('buffersize', 1024)
+        # Reused to receive all the blocks, if the response supports readinto
+        ctx.buffer = None
         ctx.start_time = time.time()
         ctx.chunk_size = None
+        progress_interval = self.params.get('progress_interval') or 0
+        resize_buffer = not self.params.get('noresizebuffer', False)
 
-        if self.params.get('continuedl', True):
+        if self.params.get('continuedl', True) and not to_stream:
             # Establish possible resume length
             if os.path.isfile(encodeFilename(ctx.tmpfilename)):
                 ctx.resume_len = os.path.getsize(
@@ -215,9 +240,32 @@ class HttpFD(FileDownloader):
             # measure time over whole while-loop, so slow_down() and best_block_size() work together properly
             now = None  # needed for slow_down() in the first loop run
             before = start  # start measuring
+            last_progress = 0
+            hooked_bytes = byte_counter
+
+            # Python 2 responses have no readinto: each block is then read into a new string
+            readinto = getattr(ctx.data, 'readinto', None)
+
+            def hook_progress(now):
+                speed = self.calc_speed(start, now, byte_counter - ctx.resume_len)
+                if ctx.data_len is None:
+                    eta = None
+                else:
+                    eta = self.calc_eta(start, now, ctx.data_len - ctx.resume_len, byte_counter - ctx.resume_len)
+
+                self._hook_progress({
+                    'status': 'downloading',
+                    'downloaded_bytes': byte_counter,
+                    'total_bytes': ctx.data_len,
+                    'tmpfilename': ctx.tmpfilename,
+                    'filename': ctx.filename,
+                    'eta': eta,
+                    'speed': speed,
+                    'elapsed': now - ctx.start_time,
+                })
 
             def retry(e):
-                to_stdout = ctx.tmpfilename == '-'
+                to_stdout = to_stream or ctx.tmpfilename == '-'
                 if not to_stdout:
                     ctx.stream.close()
                 ctx.stream = None
@@ -227,7 +275,13 @@ class HttpFD(FileDownloader):
             while True:
                 try:
                     # Download and write
-                    data_block = ctx.data.read(block_size if not is_test else min(block_size, data_len - byte_counter))
+                    read_size = block_size if not is_test else min(block_size, data_len - byte_counter)
+                    if readinto is not None:
+                        if ctx.buffer is None or len(ctx.buffer) < read_size:
+                            ctx.buffer = memoryview(bytearray(read_size))
+                        data_block = ctx.buffer[:readinto(ctx.buffer[:read_size])]
+                    else:
+                        data_block = ctx.data.read(read_size)
                 # socket.timeout is a subclass of socket.error but may not have
                 # errno set
                 except socket.timeout as e:
@@ -244,7 +298,13 @@ class HttpFD(FileDownloader):
                     break
 
                 # Open destination file just in time
-                if ctx.stream is None:
+                if ctx.stream is None and to_stream:
+                    ctx.stream = filename
+                    if ctx.open_mode == 'wb':
+                        # Start over, e.g. when the server can't resume
+                        ctx.stream.seek(0)
+                        ctx.stream.truncate()
+                elif ctx.stream is None:
                     try:
                         ctx.stream, ctx.tmpfilename = sanitize_open(
                             ctx.tmpfilename, ctx.open_mode)
@@ -255,6 +315,9 @@ class HttpFD(FileDownloader):
                         self.report_error('unable to open for writing: %s' % str(err))
                         return False
 
+                    if data_len is not None and ctx.tmpfilename != '-':
+                        preallocate_file(ctx.stream, data_len)
+
                     if self.params.get('xattr_set_filesize', False) and data_len is not None:
                         try:
                             write_xattr(ctx.tmpfilename, 'user.ytdl.filesize', str(data_len).encode('utf-8'))
@@ -276,32 +339,24 @@ class HttpFD(FileDownloader):
                 after = now
 
                 # Adjust block size
-                if not self.params.get('noresizebuffer', False):
+                if resize_buffer:
                     block_size = self.best_block_size(after - before, len(data_block))
 
                 before = after
 
-                # Progress message
-                speed = self.calc_speed(start, now, byte_counter - ctx.resume_len)
-                if ctx.data_len is None:
-                    eta = None
-                else:
-                    eta = self.calc_eta(start, time.time(), ctx.data_len - ctx.resume_len, byte_counter - ctx.resume_len)
-
-                self._hook_progress({
-                    'status': 'downloading',
-                    'downloaded_bytes': byte_counter,
-                    'total_bytes': ctx.data_len,
-                    'tmpfilename': ctx.tmpfilename,
-                    'filename': ctx.filename,
-                    'eta': eta,
-                    'speed': speed,
-                    'elapsed': now - ctx.start_time,
-                })
+                # Progress message, at most every progress_interval seconds
+                if now - last_progress >= progress_interval:
+                    last_progress = now
+                    hooked_bytes = byte_counter
+                    hook_progress(now)
 
                 if is_test and byte_counter == data_len:
                     break
 
+            # The last progress is reported even if too close to the previous one
+            if hooked_bytes != byte_counter:
+                hook_progress(time.time())
+
             if not is_test and ctx.chunk_size and ctx.data_len is not None and byte_counter < ctx.data_len:
                 ctx.resume_len = byte_counter
                 # ctx.block_size = block_size
@@ -311,7 +366,7 @@ class HttpFD(FileDownloader):
                 self.to_stderr('\n')
                 self.report_error('Did not get any data blocks')
                 return False
-            if ctx.tmpfilename != '-':
+            if not to_stream and ctx.tmpfilename != '-':
                 ctx.stream.close()
 
             if data_len is not None and byte_counter != data_len:
@@ -323,7 +378,7 @@ class HttpFD(FileDownloader):
             self.try_rename(ctx.tmpfilename, ctx.filename)
 
             # Update file modification time
-            if self.params.get('updatetime', True):
+            if self.params.get('updatetime', True) and not to_stream:
                 info_dict['filetime'] = self.try_utime(ctx.filename, ctx.data.info().get('last-modified', None))
 
             self._hook_progress({
@@ -352,3 +407,321 @@ class HttpFD(FileDownloader):
 
         self.report_error('giving up after %s retries' % retries)
         return False
+
+    def _download_segments(self, filename, info_dict, headers, connections):
+        """
+        Download ranges of the file over several connections at once, into
+        the preallocated temporary file.
+
+        The blocks of _SEGMENT_BLOCK_SIZE bytes written are recorded in the
+        .ytdl file, so an interrupted download resumes with the missing ones.
+        A connection done with its range takes over the second half of the
+        range expected to finish last. Return None if the server reports no
+        size or serves no ranges, for a download over one connection.
+        """
+        url = info_dict['url']
+        block_size = self._SEGMENT_BLOCK_SIZE
+        retries = self.params.get('retries', 0)
+        tmpfilename = self.temp_name(filename)
+        ytdl_filename = self.ytdl_filename(filename)
+
+        def open_range(start, end):
+            request = sanitized_Request(url, None, headers)
+            request.add_header('Range', 'bytes=%d-%d' % (start, end - 1))
+            data = self.ydl.urlopen(request)
+            content_range = re.search(r'bytes (\d+)-\d+/(\d+)', data.headers.get('Content-Range') or '')
+            if not content_range or int(content_range.group(1)) != start:
+                data.close()
+                return None, None
+            return data, int(content_range.group(2))
+
+        segments_state = None
+        continuedl = self.params.get('continuedl', True)
+        if continuedl and os.path.isfile(encodeFilename(ytdl_filename)):
+            try:
+                with open(encodeFilename(ytdl_filename)) as ytdl_file:
+                    segments_state = json.load(ytdl_file)['downloader']['http_segments']
+            except (IOError, OSError, ValueError, KeyError, TypeError):
+                pass
+        elif continuedl and os.path.isfile(encodeFilename(tmpfilename)):
+            # Started over one connection
+            return None
+
+        try:
+            probe, data_len = open_range(0, 1)
+        except (compat_urllib_error.URLError, socket.error):
+            if segments_state is not None:
+                raise
+            # Reported by the download over one connection
+            return None
+        if probe is None:
+            if segments_state is not None:
+                # The preallocated file would be taken for a complete one
+                self.report_error('unable to resume, the server does not serve ranges anymore')
+                return False
+            return None
+        last_modified = probe.info().get('last-modified', None)
+        probe.close()
+        block_count = (data_len + block_size - 1) // block_size
+        if block_count < 2 and segments_state is None:
+            return None
+
+        min_data_len = self.params.get('min_filesize')
+        max_data_len = self.params.get('max_filesize')
+        if min_data_len is not None and data_len < min_data_len:
+            self.to_screen('\r[download] File is smaller than min-filesize (%s bytes < %s bytes). Aborting.' % (data_len, min_data_len))
+            return False
+        if max_data_len is not None and data_len > max_data_len:
+            self.to_screen('\r[download] File is larger than max-filesize (%s bytes > %s bytes). Aborting.' % (data_len, max_data_len))
+            return False
+
+        blocks = None
+        if continuedl and os.path.isfile(encodeFilename(ytdl_filename)):
+            try:
+                if (segments_state['size'] == data_len and segments_state['block_size'] == block_size
+                        and os.path.getsize(encodeFilename(tmpfilename)) == data_len):
+                    blocks = bytearray(binascii.unhexlify(segments_state['blocks']))
+            except (IOError, OSError, ValueError, KeyError, TypeError):
+                pass
+            if blocks is None or len(blocks) != (block_count + 7) // 8:
+                self.report_warning(
+                    'Inconsistent state of incomplete segmented download. Restarting from the beginning...')
+                blocks = None
+
+        def write_ytdl_file():
+            write_json_file({'downloader': {'http_segments': {
+                'size': data_len,
+                'block_size': block_size,
+                # bitmap of the blocks written
+                'blocks': binascii.hexlify(bytes(blocks)).decode('ascii'),
+            }}}, ytdl_filename)
+
+        self.report_destination(filename)
+        if blocks is None:
+            blocks = bytearray((block_count + 7) // 8)
+            # Recorded first, so that the preallocated file is never taken for a complete one
+            write_ytdl_file()
+            tmp_stream, tmpfilename = sanitize_open(tmpfilename, 'wb')
+            with tmp_stream:
+                tmp_stream.truncate(data_len)
+                preallocate_file(tmp_stream, data_len)
+
+        def is_done(index):
+            return blocks[index >> 3] & (1 << (index & 7))
+
+        def mark_done(start, end):
+            # The blocks ending in ]start, end]
+            for index in range(start // block_size, (end - 1) // block_size + 1):
+                if start < min((index + 1) * block_size, data_len) <= end:
+                    blocks[index >> 3] |= 1 << (index & 7)
+
+        def split(segment):
+            # Give up the second half of the segment, from a block boundary
+            middle = (segment['pos'] + segment['end']) // 2 // block_size * block_size
+            if not segment['pos'] < middle < segment['end']:
+                return None
+            stolen = {'pos': middle, 'end': segment['end']}
+            segment['end'] = middle
+            return stolen
+
+        pending = []
+        index = 0
+        while index < block_count:
+            if is_done(index):
+                index += 1
+                continue
+            first = index
+            while index < block_count and not is_done(index):
+                index += 1
+            pending.append({'pos': first * block_size, 'end': min(index * block_size, data_len)})
+        while 0 < len(pending) < connections:
+            segment = split(max(pending, key=lambda s: s['end'] - s['pos']))
+            if segment is None:
+                break
+            pending.append(segment)
+        pending.sort(key=lambda s: s['pos'])
+
+        resume_len = data_len - sum(s['end'] - s['pos'] for s in pending)
+        if resume_len:
+            self.report_resuming_byte(resume_len)
+        start = time.time()
+        lock = threading.Lock()
+        active = []
+        progress_interval = self.params.get('progress_interval') or 0
+        state = {
+            'downloaded_bytes': resume_len,
+            'checkpoint': start,
+            'progress': 0,
+            'hooked_bytes': resume_len,
+            # the error stopping the download
+            'failed': None,
+        }
+
+        def time_left(segment):
+            now = time.time()
+            if now - segment['started'] < 1:
+                # Not measured yet, assumed as fast as the average connection
+                speed = self.calc_speed(start, now, state['downloaded_bytes'] - resume_len)
+                speed = speed and speed / len(active)
+            else:
+                speed = self.calc_speed(segment['started'], now, segment['pos'] - segment['first'])
+            return (segment['end'] - segment['pos']) / speed if speed else float('inf')
+
+        def next_segment():
+            with lock:
+                if state['failed']:
+                    return None
+                if pending:
+                    segment = pending.pop(0)
+                elif active:
+                    segment = split(max(active, key=time_left))
+                else:
+                    segment = None
+                if segment is not None:
+                    segment.update({'first': segment['pos'], 'started': time.time()})
+                    active.append(segment)
+                return segment
+
+        def hook_progress(now):
+            state['hooked_bytes'] = state['downloaded_bytes']
+            self._hook_progress({
+                'status': 'downloading',
+                'downloaded_bytes': state['downloaded_bytes'],
+                'total_bytes': data_len,
+                'tmpfilename': tmpfilename,
+                'filename': filename,
+                'eta': self.calc_eta(start, now, data_len - resume_len, state['downloaded_bytes'] - resume_len),
+                'speed': self.calc_speed(start, now, state['downloaded_bytes'] - resume_len),
+                'elapsed': now - start,
+            })
+
+        def download_segment(segment, stream):
+            read_size = self.params.get('buffersize', 1024)
+            # Reused to receive all the blocks of the connection, if the response supports readinto
+            buf = None
+            count = 0
+            while True:
+                with lock:
+                    pos, end = segment['pos'], segment['end']
+                    if pos >= end or state['failed']:
+                        return
+                try:
+                    data, _ = open_range(pos, end)
+                    if data is None:
+                        with lock:
+                            state['failed'] = state['failed'] or 'the server did not serve the requested range'
+                        return
+                    stream.seek(pos)
+                    before = time.time()
+                    readinto = getattr(data, 'readinto', None)
+                    while pos < end:
+                        size = min(read_size, end - pos)
+                        if readinto is not None:
+                            if buf is None or len(buf) < size:
+                                buf = memoryview(bytearray(size))
+                            data_block = buf[:readinto(buf[:size])]
+                        else:
+                            data_block = data.read(size)
+                        if not data_block:
+                            break
+                        stream.write(data_block)
+                        new_pos = pos + len(data_block)
+                        if new_pos // block_size > pos // block_size or new_pos == data_len:
+                            # Written before the blocks are recorded
+                            stream.flush()
+                        with lock:
+                            # The end may have been taken over meanwhile
+                            new_pos = min(new_pos, segment['end'])
+                            mark_done(pos, new_pos)
+                            state['downloaded_bytes'] += new_pos - pos
+                            segment['pos'] = pos = new_pos
+                            end = segment['end']
+                            now = time.time()
+                            if now - state['progress'] >= progress_interval:
+                                state['progress'] = now
+                                hook_progress(now)
+                            if now - state['checkpoint'] >= self._SEGMENTS_CHECKPOINT_INTERVAL:
+                                write_ytdl_file()
+                                state['checkpoint'] = now
+                            if state['failed']:
+                                return
+                        self.slow_down(start, now, state['downloaded_bytes'] - resume_len)
+                        if not self.params.get('noresizebuffer', False):
+                            read_size = self.best_block_size(now - before, len(data_block))
+                        before = now
+                    data.close()
+                    if pos >= end:
+                        continue
+                    error = ContentTooShortError(pos, end)
+                except compat_urllib_error.HTTPError as err:
+                    if err.code < 500 or err.code >= 600:
+                        raise
+                    error = err
+                except socket.timeout as err:
+                    error = err
+                except socket.error as err:
+                    if err.errno not in (errno.ECONNRESET, errno.ETIMEDOUT):
+                        raise
+                    error = err
+                count += 1
+                if count > retries:
+                    with lock:
+                        state['failed'] = state['failed'] or 'giving up after %s retries' % retries
+                    return
+                self.report_retry(error, count, retries)
+
+        def connection():
+            try:
+                with open(encodeFilename(tmpfilename), 'r+b') as stream:
+                    while True:
+                        segment = next_segment()
+                        if segment is None:
+                            break
+                        try:
+                            download_segment(segment, stream)
+                        finally:
+                            with lock:
+                                active.remove(segment)
+            except BaseException as e:
+                with lock:
+                    state['failed'] = state['failed'] or e
+
+        threads = [threading.Thread(target=connection) for _ in range(min(connections, len(pending)))]
+        if threads:
+            self.to_screen('[download] Downloading over %d connections' % len(threads))
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(1)
+        except KeyboardInterrupt:
+            with lock:
+                state['failed'] = state['failed'] or 'interrupted'
+                write_ytdl_file()
+            raise
+        write_ytdl_file()
+        if state['hooked_bytes'] != state['downloaded_bytes']:
+            # The last progress is reported even if too close to the previous one
+            hook_progress(time.time())
+
+        failed = state['failed']
+        if isinstance(failed, BaseException):
+            raise failed
+        if failed or not all(is_done(index) for index in range(block_count)):
+            self.report_error(failed or 'unable to download all the ranges')
+            return False
+
+        os.remove(encodeFilename(ytdl_filename))
+        self.try_rename(tmpfilename, filename)
+        if self.params.get('updatetime', True):
+            info_dict['filetime'] = self.try_utime(filename, last_modified)
+        self._hook_progress({
+            'downloaded_bytes': data_len,
+            'total_bytes': data_len,
+            'filename': filename,
+            'status': 'finished',
+            'elapsed': time.time() - start,
+        })
+        return True
@@ -381,6 +381,14 @@ class InfoExtractor(object):
     will be used by geo restriction bypass mechanism similarly
     to _GEO_COUNTRIES.
 
+    _CONCURRENT_EXTRACTIONS caps the number of extractions the extractor
+    runs at the same time when playlist entries are extracted concurrently
+    (concurrent_extractions parameter), None for no cap.
+
+    _INFO_CACHE_TTL is the time in seconds the results of the extractor are
+    kept in the info cache (see InfoCache), 0 for never. Results are keyed on
+    _info_cache_id(url), the URL itself unless overridden.
+
     Finally, the _WORKING attribute should be set to False for broken IEs
     in order to warn the users and skip the tests.
     """
@@ -391,6 +399,8 @@ class InfoExtractor(object):
     _GEO_BYPASS = True
     _GEO_COUNTRIES = None
     _GEO_IP_BLOCKS = None
+    _CONCURRENT_EXTRACTIONS = None
+    _INFO_CACHE_TTL = 600
     _WORKING = True
 
     def __init__(self, downloader=None):
@@ -410,6 +420,11 @@ class InfoExtractor(object):
             cls._VALID_URL_RE = re.compile(cls._VALID_URL)
         return cls._VALID_URL_RE.match(url) is not None
 
+    @classmethod
+    def _info_cache_id(cls, url):
+        """Return the identifier of the results for url in the info cache"""
+        return url
+
     @classmethod
     def _match_id(cls, url):
         if '_VALID_URL_RE' not in cls.__dict__:
@@ -0,0 +1,187 @@
+from __future__ import unicode_literals
+
+import inspect
+import re
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+from ..compat import (
+    compat_chr,
+    compat_str,
+)
+
+# Length of the literal fragments used as index keys
+GRAM = 4
+
+_ASCII_LOWER = dict((c, c + 32) for c in range(ord('A'), ord('Z') + 1))
+
+# suitable() overrides known to accept a subset of the URLs matched by a pattern:
+# exclusions of other extractors followed by the default check, and search keys
+_EXCLUDING_SUITABLE = re.compile(
+    r'^(?:@classmethod )?def suitable\(cls, url\): return \(?False if (?:(?!return).)+ '
+    r'else super\( ?(\w+), cls\)\.suitable\(url\)\)?$')
+_SEARCH_SUITABLE = re.compile(
+    r'^(?:@classmethod )?def suitable\(cls, url\): return re\.match\(cls\._make_valid_url\(\), url\) is not None$')
+
+# Process wide cache of the literal requirements derived from each extractor class
+_REQUIREMENTS = {}
+
+
+def _ascii_lower(s):
+    return s.translate(_ASCII_LOWER)
+
+
+def _op_name(op):
+    # opcodes are plain strings on Python 2 and named int constants on Python 3
+    return compat_str(op).upper()
+
+
+def _requirement(pattern):
+    """
+    Return a set of lowercase literal strings such that every string matched
+    by the parsed pattern contains at least one of them, or None when no such
+    set can be derived.
+    """
+    candidates = []
+    run = []
+
+    def flush():
+        if run:
+            candidates.append(frozenset([''.join(run)]))
+            del run[:]
+
+    for op, av in pattern:
+        name = _op_name(op)
+        if name == 'LITERAL' and av < 128:
+            run.append(compat_chr(av + 32 if 65 <= av <= 90 else av))
+            continue
+        flush()
+        if name == 'SUBPATTERN':
+            candidates.append(_requirement(av[-1]))
+        elif name == 'ATOMIC_GROUP':
+            candidates.append(_requirement(av))
+        elif name == 'BRANCH':
+            alternatives = [_requirement(branch) for branch in av[1]]
+            if all(alternatives):
+                candidates.append(frozenset().union(*alternatives))
+        elif name in ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT') and av[0] >= 1:
+            candidates.append(_requirement(av[2]))
+    flush()
+
+    # every element of a sequence is mandatory, so any single requirement is
+    # enough; pick the most selective one (host names first, then length)
+    best, best_score = None, None
+    for requirement in candidates:
+        if not requirement or min(len(s) for s in requirement) < GRAM:
+            continue
+        score = (
+            all('.' in s for s in requirement),
+            min(len(s) for s in requirement),
+            -len(requirement))
+        if best_score is None or score > best_score:
+            best, best_score = requirement, score
+    return best
+
+
+def _suitable_pattern(klass, mro):
+    """
+    Return a regular expression every URL accepted by suitable(), as resolved
+    on mro, has to match, or None if suitable() can not be analysed.
+    """
+    owner = next(k for k in mro if 'suitable' in k.__dict__)
+    rest = mro[mro.index(owner) + 1:]
+    if not any('suitable' in k.__dict__ for k in rest):
+        # the default implementation matches _VALID_URL
+        return getattr(klass, '_VALID_URL', None)
+    try:
+        source = ' '.join(inspect.getsource(owner.__dict__['suitable'].__func__).split())
+    except Exception:
+        return None
+    if _SEARCH_SUITABLE.match(source):
+        return klass._make_valid_url()
+    mobj = _EXCLUDING_SUITABLE.match(source)
+    names = [k.__name__ for k in mro]
+    if mobj is None or mobj.group(1) not in names:
+        return None
+    return _suitable_pattern(klass, mro[names.index(mobj.group(1)) + 1:])
+
+
+def url_requirement(ie):
+    """
+    Return the set of literal strings, one of which must occur in every URL
+    the extractor (class or instance) is suitable for, or None if the
+    extractor has to be tried for any URL.
+    """
+    klass = ie if isinstance(ie, type) else type(ie)
+    if klass not in _REQUIREMENTS:
+        requirement = None
+        try:
+            if '_URL_LITERALS' in klass.__dict__:
+                # precomputed by the lazy extractor registry
+                literals = klass._URL_LITERALS
+                requirement = frozenset(literals) if literals is not None else None
+            else:
+                pattern = _suitable_pattern(klass, klass.__mro__)
+                if isinstance(pattern, compat_str):
+                    requirement = _requirement(sre_parse.parse(pattern))
+        except Exception:
+            requirement = None
+        _REQUIREMENTS[klass] = requirement
+    return _REQUIREMENTS[klass]
+
+
+class ExtractorIndex(object):
+    """
+    Index of info extractors by the literal fragments of their _VALID_URL
+    (host names where possible), so that only the extractors able to match
+    a URL are tried. Candidates are returned in registration order, hence
+    the first suitable one is the same as with a linear scan of the list.
+    """
+
+    def __init__(self, ies=()):
+        self._ies = []
+        self._grams = {}
+        self._fallback = []
+        self._frequency = {}
+        ies = list(ies)
+        for ie in ies:
+            for s in url_requirement(ie) or ():
+                for gram in set(self._split(s)):
+                    self._frequency[gram] = self._frequency.get(gram, 0) + 1
+        for ie in ies:
+            self.add(ie)
+
+    def __len__(self):
+        return len(self._ies)
+
+    @staticmethod
+    def _split(s):
+        return [s[i:i + GRAM] for i in range(len(s) - GRAM + 1)]
+
+    def add(self, ie):
+        """Append an extractor (class or instance) to the index."""
+        position = len(self._ies)
+        self._ies.append(ie)
+        requirement = url_requirement(ie)
+        if requirement is None:
+            self._fallback.append(position)
+            return
+        for s in requirement:
+            # the rarest fragment of each literal is enough as a key
+            gram = min(self._split(s), key=lambda g: self._frequency.get(g, 0))
+            self._grams.setdefault(gram, []).append(position)
+
+    def candidates(self, url):
+        """Return the extractors that may be suitable for url, in order."""
+        try:
+            url.encode('ascii')
+        except (UnicodeError, AttributeError):
+            return list(self._ies)
+        url = _ascii_lower(compat_str(url))
+        positions = set(self._fallback)
+        for gram in set(self._split(url)):
+            positions.update(self._grams.get(gram, ()))
+        return [self._ies[position] for position in sorted(positions)]
@@ -0,0 +1,9686 @@
+# This file is generated by tools/make_lazy_extractors.py, do not edit it.
+# coding: utf-8
+from __future__ import unicode_literals
+
+import re
+
+from ..compat import (
+    compat_parse_qs,
+    compat_urllib_parse_urlparse,
+)
+from ..utils import (
+    int_or_none,
+)
+
+
+class LazyLoadExtractor(object):
+    _module = None
+    _WORKING = True
+    _AGE_LIMIT = 0
+    IE_DESC = None
+
+    @classmethod
+    def ie_key(cls):
+        return cls.__name__[:-2]
+
+    @classmethod
+    def suitable(cls, url):
+        """Receives a URL and returns True if suitable for this IE."""
+
+        # This does not use has/getattr intentionally - we want to know whether
+        # we have cached the regexp for *this* class, whereas getattr would also
+        # match the superclass
+        if '_VALID_URL_RE' not in cls.__dict__:
+            cls._VALID_URL_RE = re.compile(cls._VALID_URL)
+        return cls._VALID_URL_RE.match(url) is not None
+
+    @classmethod
+    def working(cls):
+        return cls._WORKING
+
+    @classmethod
+    def is_suitable(cls, age_limit):
+        return age_limit is None or cls._AGE_LIMIT <= age_limit
+
+    @classmethod
+    def real_class(cls):
+        mod = __import__(cls._module, fromlist=(cls.__name__,))
+        return getattr(mod, cls.__name__)
+
+    def __new__(cls, *args, **kwargs):
+        real_cls = cls.real_class()
+        instance = real_cls.__new__(real_cls)
+        instance.__init__(*args, **kwargs)
+        return instance
+
+
+class LazyLoadSearchExtractor(LazyLoadExtractor):
+    pass
+
+
+class ABCIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?abc\\.net\\.au/news/(?:[^/]+/){1,2}(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.abc'
+    IE_NAME = 'abc.net.au'
+    _URL_LITERALS = ('abc.net.au/news/',)
+
+
+class ABCIViewIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://iview\\.abc\\.net\\.au/(?:[^/]+/)*video/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.abc'
+    IE_NAME = 'abc.net.au:iview'
+    _URL_LITERALS = ('://iview.abc.net.au/',)
+
+
+class AbcNewsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://abcnews\\.go\\.com/(?:[^/]+/)+(?P<display_id>[0-9a-z-]+)/story\\?id=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.abcnews'
+    IE_NAME = 'abcnews'
+    _URL_LITERALS = ('://abcnews.go.com/',)
+
+
+class AMPIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.amp'
+    IE_NAME = 'AMP'
+    _URL_LITERALS = None
+
+
+class AbcNewsVideoIE(AMPIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            abcnews\\.go\\.com/\n                            (?:\n                                [^/]+/video/(?P<display_id>[0-9a-z-]+)-|\n                                video/embed\\?.*?\\bid=\n                            )|\n                            fivethirtyeight\\.abcnews\\.go\\.com/video/embed/\\d+/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.abcnews'
+    IE_NAME = 'abcnews:video'
+    _URL_LITERALS = ('abcnews.go.com/', 'fivethirtyeight.abcnews.go.com/video/embed/')
+
+
+class ABCOTVSIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:abc(?:7(?:news|ny|chicago)?|11|13|30)|6abc)\\.com(?:/[^/]+/(?P<display_id>[^/]+))?/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.abcotvs'
+    IE_NAME = 'abcotvs'
+    IE_DESC = 'ABC Owned Television Stations'
+    _URL_LITERALS = ('.com',)
+
+
+class ABCOTVSClipsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://clips\\.abcotvs\\.com/(?:[^/]+/)*video/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.abcotvs'
+    IE_NAME = 'abcotvs:clips'
+    _URL_LITERALS = ('://clips.abcotvs.com/',)
+
+
+class AcademicEarthCourseIE(LazyLoadExtractor):
+    _VALID_URL = '^https?://(?:www\\.)?academicearth\\.org/playlists/(?P<id>[^?#/]+)'
+    _module = 'youtube_dl.extractor.academicearth'
+    IE_NAME = 'AcademicEarth:Course'
+    _URL_LITERALS = ('academicearth.org/playlists/',)
+
+
+class ACastIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:(?:embed|www)\\.)?acast\\.com/|\n                            play\\.acast\\.com/s/\n                        )\n                        (?P<channel>[^/]+)/(?P<id>[^/#?]+)\n                    '
+    _module = 'youtube_dl.extractor.acast'
+    IE_NAME = 'acast'
+    _URL_LITERALS = ('acast.com/', 'play.acast.com/s/')
+
+
+class ACastChannelIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:www\\.)?acast\\.com/|\n                            play\\.acast\\.com/s/\n                        )\n                        (?P<id>[^/#?]+)\n                    '
+    _module = 'youtube_dl.extractor.acast'
+    IE_NAME = 'acast:channel'
+    _URL_LITERALS = ('acast.com/', 'play.acast.com/s/')
+
+    @classmethod
+    def suitable(cls, url):
+        return False if ACastIE.suitable(url) else super(ACastChannelIE, cls).suitable(url)
+
+
+class ADNIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?animedigitalnetwork\\.fr/video/[^/]+/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.adn'
+    IE_NAME = 'ADN'
+    IE_DESC = 'Anime Digital Network'
+    _URL_LITERALS = ('animedigitalnetwork.fr/video/',)
+
+
+class AdobeConnectIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://\\w+\\.adobeconnect\\.com/(?P<id>[\\w-]+)'
+    _module = 'youtube_dl.extractor.adobeconnect'
+    IE_NAME = 'AdobeConnect'
+    _URL_LITERALS = ('.adobeconnect.com/',)
+
+
+class AdobeTVBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.adobetv'
+    IE_NAME = 'AdobeTVBase'
+    _URL_LITERALS = None
+
+
+class AdobeTVIE(AdobeTVBaseIE):
+    _VALID_URL = 'https?://tv\\.adobe\\.com/(?:(?P<language>fr|de|es|jp)/)?watch/(?P<show_urlname>[^/]+)/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.adobetv'
+    IE_NAME = 'AdobeTV'
+    _URL_LITERALS = ('://tv.adobe.com/',)
+
+
+class AdobeTVPlaylistBaseIE(AdobeTVBaseIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.adobetv'
+    IE_NAME = 'AdobeTVPlaylistBase'
+    _URL_LITERALS = None
+
+
+class AdobeTVShowIE(AdobeTVPlaylistBaseIE):
+    _VALID_URL = 'https?://tv\\.adobe\\.com/(?:(?P<language>fr|de|es|jp)/)?show/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.adobetv'
+    IE_NAME = 'AdobeTVShow'
+    _URL_LITERALS = ('://tv.adobe.com/',)
+
+
+class AdobeTVChannelIE(AdobeTVPlaylistBaseIE):
+    _VALID_URL = 'https?://tv\\.adobe\\.com/(?:(?P<language>fr|de|es|jp)/)?channel/(?P<id>[^/]+)(?:/(?P<category_urlname>[^/]+))?'
+    _module = 'youtube_dl.extractor.adobetv'
+    IE_NAME = 'AdobeTVChannel'
+    _URL_LITERALS = ('://tv.adobe.com/',)
+
+
+class AdobeTVVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.tv\\.adobe\\.com/v/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.adobetv'
+    IE_NAME = 'AdobeTVVideo'
+    _URL_LITERALS = ('://video.tv.adobe.com/v/',)
+
+
+class AdobePassIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.adobepass'
+    IE_NAME = 'AdobePass'
+    _URL_LITERALS = None
+
+
+class TurnerBaseIE(AdobePassIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.turner'
+    IE_NAME = 'TurnerBase'
+    _URL_LITERALS = None
+
+
+class AdultSwimIE(TurnerBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?adultswim\\.com/videos/(?P<show_path>[^/?#]+)(?:/(?P<episode_path>[^/?#]+))?'
+    _module = 'youtube_dl.extractor.adultswim'
+    IE_NAME = 'AdultSwim'
+    _URL_LITERALS = ('adultswim.com/videos/',)
+
+
+class AfreecaTVIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:(?:live|afbbs|www)\\.)?afreeca(?:tv)?\\.com(?::\\d+)?\n                            (?:\n                                /app/(?:index|read_ucc_bbs)\\.cgi|\n                                /player/[Pp]layer\\.(?:swf|html)\n                            )\\?.*?\\bnTitleNo=|\n                            vod\\.afreecatv\\.com/PLAYER/STATION/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.afreecatv'
+    IE_NAME = 'afreecatv'
+    IE_DESC = 'afreecatv.com'
+    _URL_LITERALS = ('.com', 'vod.afreecatv.com/player/station/')
+
+
+class AirMozillaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://air\\.mozilla\\.org/(?P<id>[0-9a-z-]+)/?'
+    _module = 'youtube_dl.extractor.airmozilla'
+    IE_NAME = 'AirMozilla'
+    _URL_LITERALS = ('://air.mozilla.org/',)
+
+
+class AlJazeeraIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?aljazeera\\.com/(?:programmes|video)/.*?/(?P<id>[^/]+)\\.html'
+    _module = 'youtube_dl.extractor.aljazeera'
+    IE_NAME = 'AlJazeera'
+    _URL_LITERALS = ('aljazeera.com/',)
+
+
+class AlphaPornoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?alphaporno\\.com/videos/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.alphaporno'
+    IE_NAME = 'AlphaPorno'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('alphaporno.com/videos/',)
+
+
+class AmericasTestKitchenIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?americastestkitchen\\.com/(?:episode|videos)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.americastestkitchen'
+    IE_NAME = 'AmericasTestKitchen'
+    _URL_LITERALS = ('americastestkitchen.com/',)
+
+
+class AnimeOnDemandIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?anime-on-demand\\.de/anime/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.animeondemand'
+    IE_NAME = 'AnimeOnDemand'
+    _URL_LITERALS = ('anime-on-demand.de/anime/',)
+
+
+class AnvatoIE(LazyLoadExtractor):
+    _VALID_URL = 'anvato:(?P<access_key_or_mcp>[^:]+):(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.anvato'
+    IE_NAME = 'Anvato'
+    _URL_LITERALS = ('anvato:',)
+
+
+class AolIE(LazyLoadExtractor):
+    _VALID_URL = '(?:aol-video:|https?://(?:www\\.)?aol\\.(?:com|ca|co\\.uk|de|jp)/video/(?:[^/]+/)*)(?P<id>[0-9a-f]+)'
+    _module = 'youtube_dl.extractor.aol'
+    IE_NAME = 'aol.com'
+    _URL_LITERALS = ('aol-video:', 'aol.')
+
+
+class AllocineIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?allocine\\.fr/(?:article|video|film)/(?:fichearticle_gen_carticle=|player_gen_cmedia=|fichefilm_gen_cfilm=|video-)(?P<id>[0-9]+)(?:\\.html)?'
+    _module = 'youtube_dl.extractor.allocine'
+    IE_NAME = 'Allocine'
+    _URL_LITERALS = ('allocine.fr/',)
+
+
+class AliExpressLiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://live\\.aliexpress\\.com/live/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.aliexpress'
+    IE_NAME = 'AliExpressLive'
+    _URL_LITERALS = ('://live.aliexpress.com/live/',)
+
+
+class APAIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://[^/]+\\.apa\\.at/embed/(?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'youtube_dl.extractor.apa'
+    IE_NAME = 'APA'
+    _URL_LITERALS = ('.apa.at/embed/',)
+
+
+class AparatIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?aparat\\.com/(?:v/|video/video/embed/videohash/)(?P<id>[a-zA-Z0-9]+)'
+    _module = 'youtube_dl.extractor.aparat'
+    IE_NAME = 'Aparat'
+    _URL_LITERALS = ('aparat.com/v',)
+
+
+class AppleConnectIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://itunes\\.apple\\.com/\\w{0,2}/?post/idsa\\.(?P<id>[\\w-]+)'
+    _module = 'youtube_dl.extractor.appleconnect'
+    IE_NAME = 'AppleConnect'
+    _URL_LITERALS = ('://itunes.apple.com/',)
+
+
+class AppleTrailersIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.|movie)?trailers\\.apple\\.com/(?:trailers|ca)/(?P<company>[^/]+)/(?P<movie>[^/]+)'
+    _module = 'youtube_dl.extractor.appletrailers'
+    IE_NAME = 'appletrailers'
+    _URL_LITERALS = ('trailers.apple.com/',)
+
+
+class AppleTrailersSectionIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?trailers\\.apple\\.com/#section=(?P<id>justadded|exclusive|justhd|mostpopular|moviestudios)'
+    _module = 'youtube_dl.extractor.appletrailers'
+    IE_NAME = 'appletrailers:section'
+    _URL_LITERALS = ('trailers.apple.com/#section=',)
+
+
+class ArchiveOrgIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?archive\\.org/(?:details|embed)/(?P<id>[^/?#]+)(?:[?].*)?$'
+    _module = 'youtube_dl.extractor.archiveorg'
+    IE_NAME = 'archive.org'
+    IE_DESC = 'archive.org videos'
+    _URL_LITERALS = ('archive.org/',)
+
+
+class ArkenaIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                        https?://\n                            (?:\n                                video\\.arkena\\.com/play2/embed/player\\?|\n                                play\\.arkena\\.com/(?:config|embed)/avp/v\\d/player/media/(?P<id>[^/]+)/[^/]+/(?P<account_id>\\d+)\n                            )\n                        '
+    _module = 'youtube_dl.extractor.arkena'
+    IE_NAME = 'Arkena'
+    _URL_LITERALS = ('play.arkena.com/', 'video.arkena.com/play2/embed/player?')
+
+
+class ARDBetaMediathekIE(LazyLoadExtractor):
+    _VALID_URL = 'https://(?:beta|www)\\.ardmediathek\\.de/[^/]+/(?:player|live)/(?P<video_id>[a-zA-Z0-9]+)(?:/(?P<display_id>[^/?#]+))?'
+    _module = 'youtube_dl.extractor.ard'
+    IE_NAME = 'ARDBetaMediathek'
+    _URL_LITERALS = ('.ardmediathek.de/',)
+
+
+class ARDIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<mainurl>https?://(www\\.)?daserste\\.de/[^?#]+/videos/(?P<display_id>[^/?#]+)-(?P<id>[0-9]+))\\.html'
+    _module = 'youtube_dl.extractor.ard'
+    IE_NAME = 'ARD'
+    _URL_LITERALS = ('daserste.de/',)
+
+
+class ARDMediathekIE(LazyLoadExtractor):
+    _VALID_URL = '^https?://(?:(?:(?:www|classic)\\.)?ardmediathek\\.de|mediathek\\.(?:daserste|rbb-online)\\.de|one\\.ard\\.de)/(?:.*/)(?P<video_id>[0-9]+|[^0-9][^/\\?]+)[^/\\?]*(?:\\?.*)?'
+    _module = 'youtube_dl.extractor.ard'
+    IE_NAME = 'ARD:mediathek'
+    _URL_LITERALS = ('ardmediathek.de', 'mediathek.', 'one.ard.de')
+
+    @classmethod
+    def suitable(cls, url):
+        return False if ARDBetaMediathekIE.suitable(url) else super(ARDMediathekIE, cls).suitable(url)
+
+
+class ArteTVBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.arte'
+    IE_NAME = 'ArteTVBase'
+    _URL_LITERALS = None
+
+
+class ArteTVPlus7IE(ArteTVBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?arte\\.tv/(?P<lang>fr|de|en|es|it|pl)/videos/(?P<id>\\d{6}-\\d{3}-[AF])'
+    _module = 'youtube_dl.extractor.arte'
+    IE_NAME = 'arte.tv:+7'
+    _URL_LITERALS = ('arte.tv/',)
+
+
+class ArteTVEmbedIE(ArteTVPlus7IE):
+    _VALID_URL = '(?x)\n        https://www\\.arte\\.tv\n        /player/v3/index\\.php\\?json_url=\n        (?P<json_url>\n            https?://api\\.arte\\.tv/api/player/v1/config/\n            (?P<lang>[^/]+)/(?P<id>\\d{6}-\\d{3}-[AF])\n        )\n    '
+    _module = 'youtube_dl.extractor.arte'
+    IE_NAME = 'arte.tv:embed'
+    _URL_LITERALS = ('https://www.arte.tv/player/v3/index.php?json_url=',)
+
+
+class ArteTVPlaylistIE(ArteTVBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?arte\\.tv/(?P<lang>fr|de|en|es|it|pl)/videos/(?P<id>RC-\\d{6})'
+    _module = 'youtube_dl.extractor.arte'
+    IE_NAME = 'arte.tv:playlist'
+    _URL_LITERALS = ('arte.tv/',)
+
+
+class AsianCrushIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<host>(?:(?:asiancrush|yuyutv|midnightpulp)\\.com|cocoro\\.tv))/video/(?:[^/]+/)?0+(?P<id>\\d+)v\\b'
+    _module = 'youtube_dl.extractor.asiancrush'
+    IE_NAME = 'AsianCrush'
+    _URL_LITERALS = ('.com', 'cocoro.tv')
+
+
+class AsianCrushPlaylistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<host>(?:(?:asiancrush|yuyutv|midnightpulp)\\.com|cocoro\\.tv))/series/0+(?P<id>\\d+)s\\b'
+    _module = 'youtube_dl.extractor.asiancrush'
+    IE_NAME = 'AsianCrushPlaylist'
+    _URL_LITERALS = ('.com', 'cocoro.tv')
+
+
+class AtresPlayerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?atresplayer\\.com/[^/]+/[^/]+/[^/]+/[^/]+/(?P<display_id>.+?)_(?P<id>[0-9a-f]{24})'
+    _module = 'youtube_dl.extractor.atresplayer'
+    IE_NAME = 'AtresPlayer'
+    _URL_LITERALS = ('atresplayer.com/',)
+
+
+class ATTTechChannelIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://techchannel\\.att\\.com/play-video\\.cfm/([^/]+/)*(?P<id>.+)'
+    _module = 'youtube_dl.extractor.atttechchannel'
+    IE_NAME = 'ATTTechChannel'
+    _URL_LITERALS = ('://techchannel.att.com/play-video.cfm/',)
+
+
+class ATVAtIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?atv\\.at/(?:[^/]+/){2}(?P<id>[dv]\\d+)'
+    _module = 'youtube_dl.extractor.atvat'
+    IE_NAME = 'ATVAt'
+    _URL_LITERALS = ('atv.at/',)
+
+
+class AudiMediaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?audi-mediacenter\\.com/(?:en|de)/audimediatv/(?:video/)?(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.audimedia'
+    IE_NAME = 'AudiMedia'
+    _URL_LITERALS = ('audi-mediacenter.com/',)
+
+
+class AudioBoomIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?audioboom\\.com/(?:boos|posts)/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.audioboom'
+    IE_NAME = 'AudioBoom'
+    _URL_LITERALS = ('audioboom.com/',)
+
+
+class AudiomackIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?audiomack\\.com/song/(?P<id>[\\w/-]+)'
+    _module = 'youtube_dl.extractor.audiomack'
+    IE_NAME = 'audiomack'
+    _URL_LITERALS = ('audiomack.com/song/',)
+
+
+class AudiomackAlbumIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?audiomack\\.com/album/(?P<id>[\\w/-]+)'
+    _module = 'youtube_dl.extractor.audiomack'
+    IE_NAME = 'audiomack:album'
+    _URL_LITERALS = ('audiomack.com/album/',)
+
+
+class AWAANIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:awaan|dcndigital)\\.ae/(?:#/)?show/(?P<show_id>\\d+)/[^/]+(?:/(?P<video_id>\\d+)/(?P<season_id>\\d+))?'
+    _module = 'youtube_dl.extractor.awaan'
+    IE_NAME = 'AWAAN'
+    _URL_LITERALS = ('.ae/',)
+
+
+class AWAANBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.awaan'
+    IE_NAME = 'AWAANBase'
+    _URL_LITERALS = None
+
+
+class AWAANVideoIE(AWAANBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:awaan|dcndigital)\\.ae/(?:#/)?(?:video(?:/[^/]+)?|media|catchup/[^/]+/[^/]+)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.awaan'
+    IE_NAME = 'awaan:video'
+    _URL_LITERALS = ('.ae/',)
+
+
+class AWAANLiveIE(AWAANBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:awaan|dcndigital)\\.ae/(?:#/)?live/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.awaan'
+    IE_NAME = 'awaan:live'
+    _URL_LITERALS = ('.ae/',)
+
+
+class AWAANSeasonIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:awaan|dcndigital)\\.ae/(?:#/)?program/(?:(?P<show_id>\\d+)|season/(?P<season_id>\\d+))'
+    _module = 'youtube_dl.extractor.awaan'
+    IE_NAME = 'awaan:season'
+    _URL_LITERALS = ('.ae/',)
+
+
+class AZMedienIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?\n                        (?P<host>\n                            telezueri\\.ch|\n                            telebaern\\.tv|\n                            telem1\\.ch\n                        )/\n                        [^/]+/\n                        (?P<id>\n                            [^/]+-(?P<article_id>\\d+)\n                        )\n                        (?:\n                            \\#video=\n                            (?P<kaltura_id>\n                                [_0-9a-z]+\n                            )\n                        )?\n                    '
+    _module = 'youtube_dl.extractor.azmedien'
+    IE_NAME = 'AZMedien'
+    IE_DESC = 'AZ Medien videos'
+    _URL_LITERALS = ('baern.tv', 'm1.ch', 'zueri.ch')
+
+
+class BaiduVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://v\\.baidu\\.com/(?P<type>[a-z]+)/(?P<id>\\d+)\\.htm'
+    _module = 'youtube_dl.extractor.baidu'
+    IE_NAME = 'BaiduVideo'
+    IE_DESC = '百度视频'
+    _URL_LITERALS = ('://v.baidu.com/',)
+
+
+class BandcampIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://[^/]+\\.bandcamp\\.com/track/(?P<title>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.bandcamp'
+    IE_NAME = 'Bandcamp'
+    _URL_LITERALS = ('.bandcamp.com/track/',)
+
+
+class BandcampAlbumIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?P<subdomain>[^.]+)\\.)?bandcamp\\.com(?:/album/(?P<album_id>[^/?#&]+))?'
+    _module = 'youtube_dl.extractor.bandcamp'
+    IE_NAME = 'Bandcamp:album'
+    _URL_LITERALS = ('bandcamp.com',)
+
+    @classmethod
+    def suitable(cls, url):
+        return (False
+                if BandcampWeeklyIE.suitable(url) or BandcampIE.suitable(url)
+                else super(BandcampAlbumIE, cls).suitable(url))
+
+
+class BandcampWeeklyIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bandcamp\\.com/?\\?(?:.*?&)?show=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.bandcamp'
+    IE_NAME = 'Bandcamp:weekly'
+    _URL_LITERALS = ('bandcamp.com',)
+
+
+class BBCCoUkIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?bbc\\.co\\.uk/\n                        (?:\n                            programmes/(?!articles/)|\n                            iplayer(?:/[^/]+)?/(?:episode/|playlist/)|\n                            music/(?:clips|audiovideo/popular)[/#]|\n                            radio/player/|\n                            sounds/play/|\n                            events/[^/]+/play/[^/]+/\n                        )\n                        (?P<id>(?:[pbm][\\da-z]{7}|w[\\da-z]{7,14}))(?!/(?:episodes|broadcasts|clips))\n                    '
+    _module = 'youtube_dl.extractor.bbc'
+    IE_NAME = 'bbc.co.uk'
+    IE_DESC = 'BBC iPlayer'
+    _URL_LITERALS = ('bbc.co.uk/',)
+
+
+class BBCCoUkArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bbc\\.co\\.uk/programmes/articles/(?P<id>[a-zA-Z0-9]+)'
+    _module = 'youtube_dl.extractor.bbc'
+    IE_NAME = 'bbc.co.uk:article'
+    IE_DESC = 'BBC articles'
+    _URL_LITERALS = ('bbc.co.uk/programmes/articles/',)
+
+
+class BBCCoUkPlaylistBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.bbc'
+    IE_NAME = 'BBCCoUkPlaylistBase'
+    _URL_LITERALS = None
+
+
+class BBCCoUkIPlayerPlaylistIE(BBCCoUkPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?bbc\\.co\\.uk/iplayer/(?:episodes|group)/(?P<id>(?:[pbm][\\da-z]{7}|w[\\da-z]{7,14}))'
+    _module = 'youtube_dl.extractor.bbc'
+    IE_NAME = 'bbc.co.uk:iplayer:playlist'
+    _URL_LITERALS = ('bbc.co.uk/iplayer/',)
+
+
+class BBCCoUkPlaylistIE(BBCCoUkPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?bbc\\.co\\.uk/programmes/(?P<id>(?:[pbm][\\da-z]{7}|w[\\da-z]{7,14}))/(?:episodes|broadcasts|clips)'
+    _module = 'youtube_dl.extractor.bbc'
+    IE_NAME = 'bbc.co.uk:playlist'
+    _URL_LITERALS = ('bbc.co.uk/programmes/',)
+
+
+class BBCIE(BBCCoUkIE):
+    _VALID_URL = 'https?://(?:www\\.)?bbc\\.(?:com|co\\.uk)/(?:[^/]+/)+(?P<id>[^/#?]+)'
+    _module = 'youtube_dl.extractor.bbc'
+    IE_NAME = 'bbc'
+    IE_DESC = 'BBC'
+    _URL_LITERALS = None
+
+    @classmethod
+    def suitable(cls, url):
+        EXCLUDE_IE = (BBCCoUkIE, BBCCoUkArticleIE, BBCCoUkIPlayerPlaylistIE, BBCCoUkPlaylistIE)
+        return (False if any(ie.suitable(url) for ie in EXCLUDE_IE)
+                else super(BBCIE, cls).suitable(url))
+
+
+class BeamProBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.beampro'
+    IE_NAME = 'BeamProBase'
+    _URL_LITERALS = None
+
+
+class BeamProLiveIE(BeamProBaseIE):
+    _VALID_URL = 'https?://(?:\\w+\\.)?(?:beam\\.pro|mixer\\.com)/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.beampro'
+    IE_NAME = 'Mixer:live'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('beam.pro', 'mixer.com')
+
+    @classmethod
+    def suitable(cls, url):
+        return False if BeamProVodIE.suitable(url) else super(BeamProLiveIE, cls).suitable(url)
+
+
+class BeamProVodIE(BeamProBaseIE):
+    _VALID_URL = 'https?://(?:\\w+\\.)?(?:beam\\.pro|mixer\\.com)/[^/?#&]+\\?.*?\\bvod=(?P<id>[^?#&]+)'
+    _module = 'youtube_dl.extractor.beampro'
+    IE_NAME = 'Mixer:vod'
+    _AGE_LIMIT = 13
+    _URL_LITERALS = ('beam.pro', 'mixer.com')
+
+
+class BeegIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?beeg\\.(?:com|porn(?:/video)?)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.beeg'
+    IE_NAME = 'Beeg'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('beeg.',)
+
+
+class BehindKinkIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?behindkink\\.com/(?P<year>[0-9]{4})/(?P<month>[0-9]{2})/(?P<day>[0-9]{2})/(?P<id>[^/#?_]+)'
+    _module = 'youtube_dl.extractor.behindkink'
+    IE_NAME = 'BehindKink'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('behindkink.com/',)
+
+
+class BellMediaIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://(?:www\\.)?\n        (?P<domain>\n            (?:\n                ctv|\n                tsn|\n                bnn(?:bloomberg)?|\n                thecomedynetwork|\n                discovery|\n                discoveryvelocity|\n                sciencechannel|\n                investigationdiscovery|\n                animalplanet|\n                bravo|\n                mtv|\n                space|\n                etalk|\n                marilyn\n            )\\.ca|\n            much\\.com\n        )/.*?(?:\\bvid(?:eoid)?=|-vid|~|%7E|/(?:episode)?)(?P<id>[0-9]{6,})'
+    _module = 'youtube_dl.extractor.bellmedia'
+    IE_NAME = 'BellMedia'
+    _URL_LITERALS = ('http',)
+
+
+class BeatportIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.|pro\\.)?beatport\\.com/track/(?P<display_id>[^/]+)/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.beatport'
+    IE_NAME = 'Beatport'
+    _URL_LITERALS = ('beatport.com/track/',)
+
+
+class MTVServicesInfoExtractor(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.mtv'
+    IE_NAME = 'MTVServicesInfoExtract'
+    _URL_LITERALS = None
+
+
+class BetIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bet\\.com/(?:[^/]+/)+(?P<id>.+?)\\.html'
+    _module = 'youtube_dl.extractor.bet'
+    IE_NAME = 'Bet'
+    _URL_LITERALS = ('bet.com/',)
+
+
+class BFIPlayerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://player\\.bfi\\.org\\.uk/[^/]+/film/watch-(?P<id>[\\w-]+)-online'
+    _module = 'youtube_dl.extractor.bfi'
+    IE_NAME = 'bfi:player'
+    _URL_LITERALS = ('://player.bfi.org.uk/',)
+
+
+class BigflixIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bigflix\\.com/.+/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.bigflix'
+    IE_NAME = 'Bigflix'
+    _URL_LITERALS = ('bigflix.com/',)
+
+
+class BildIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bild\\.de/(?:[^/]+/)+(?P<display_id>[^/]+)-(?P<id>\\d+)(?:,auto=true)?\\.bild\\.html'
+    _module = 'youtube_dl.extractor.bild'
+    IE_NAME = 'Bild'
+    IE_DESC = 'Bild.de'
+    _URL_LITERALS = ('.bild.html',)
+
+
+class BiliBiliIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.|bangumi\\.|)bilibili\\.(?:tv|com)/(?:video/av|anime/(?P<anime_id>\\d+)/play#)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.bilibili'
+    IE_NAME = 'BiliBili'
+    _URL_LITERALS = ('bilibili.',)
+
+
+class BiliBiliBangumiIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://bangumi\\.bilibili\\.com/anime/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.bilibili'
+    IE_NAME = 'bangumi.bilibili.com'
+    IE_DESC = 'BiliBili番剧'
+    _URL_LITERALS = ('://bangumi.bilibili.com/anime/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if BiliBiliIE.suitable(url) else super(BiliBiliBangumiIE, cls).suitable(url)
+
+
+class BilibiliAudioBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.bilibili'
+    IE_NAME = 'BilibiliAudioBase'
+    _URL_LITERALS = None
+
+
+class BilibiliAudioIE(BilibiliAudioBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?bilibili\\.com/audio/au(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.bilibili'
+    IE_NAME = 'BilibiliAudio'
+    _URL_LITERALS = ('bilibili.com/audio/au',)
+
+
+class BilibiliAudioAlbumIE(BilibiliAudioBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?bilibili\\.com/audio/am(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.bilibili'
+    IE_NAME = 'BilibiliAudioAlbum'
+    _URL_LITERALS = ('bilibili.com/audio/am',)
+
+
+class BioBioChileTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:tv|www)\\.biobiochile\\.cl/(?:notas|noticias)/(?:[^/]+/)+(?P<id>[^/]+)\\.shtml'
+    _module = 'youtube_dl.extractor.biobiochiletv'
+    IE_NAME = 'BioBioChileTV'
+    _URL_LITERALS = ('.biobiochile.cl/not',)
+
+
+class BitChuteIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bitchute\\.com/(?:video|embed|torrent/[^/]+)/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.bitchute'
+    IE_NAME = 'BitChute'
+    _URL_LITERALS = ('bitchute.com/',)
+
+
+class BitChuteChannelIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bitchute\\.com/channel/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.bitchute'
+    IE_NAME = 'BitChuteChannel'
+    _URL_LITERALS = ('bitchute.com/channel/',)
+
+
+class BIQLEIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?biqle\\.(?:com|org|ru)/watch/(?P<id>-?\\d+_\\d+)'
+    _module = 'youtube_dl.extractor.biqle'
+    IE_NAME = 'BIQLE'
+    _URL_LITERALS = ('biqle.',)
+
+
+class BleacherReportIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bleacherreport\\.com/articles/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.bleacherreport'
+    IE_NAME = 'BleacherReport'
+    _URL_LITERALS = ('bleacherreport.com/articles/',)
+
+
+class BleacherReportCMSIE(AMPIE):
+    _VALID_URL = 'https?://(?:www\\.)?bleacherreport\\.com/video_embed\\?id=(?P<id>[0-9a-f-]{36}|\\d{5})'
+    _module = 'youtube_dl.extractor.bleacherreport'
+    IE_NAME = 'BleacherReportCMS'
+    _URL_LITERALS = ('bleacherreport.com/video_embed?id=',)
+
+
+class BlinkxIE(LazyLoadExtractor):
+    _VALID_URL = '(?:https?://(?:www\\.)blinkx\\.com/#?ce/|blinkx:)(?P<id>[^?]+)'
+    _module = 'youtube_dl.extractor.blinkx'
+    IE_NAME = 'blinkx'
+    _URL_LITERALS = ('://www.blinkx.com/', 'blinkx:')
+
+
+class BloombergIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bloomberg\\.com/(?:[^/]+/)*(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.bloomberg'
+    IE_NAME = 'Bloomberg'
+    _URL_LITERALS = ('bloomberg.com/',)
+
+
+class BokeCCBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.bokecc'
+    IE_NAME = 'BokeCCBase'
+    _URL_LITERALS = None
+
+
+class BokeCCIE(BokeCCBaseIE):
+    _VALID_URL = 'https?://union\\.bokecc\\.com/playvideo\\.bo\\?(?P<query>.*)'
+    _module = 'youtube_dl.extractor.bokecc'
+    IE_NAME = 'BokeCC'
+    _URL_LITERALS = ('://union.bokecc.com/playvideo.bo?',)
+
+
+class BostonGlobeIE(LazyLoadExtractor):
+    _VALID_URL = '(?i)https?://(?:www\\.)?bostonglobe\\.com/.*/(?P<id>[^/]+)/\\w+(?:\\.html)?'
+    _module = 'youtube_dl.extractor.bostonglobe'
+    IE_NAME = 'BostonGlobe'
+    _URL_LITERALS = ('bostonglobe.com/',)
+
+
+class BpbIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bpb\\.de/mediathek/(?P<id>[0-9]+)/'
+    _module = 'youtube_dl.extractor.bpb'
+    IE_NAME = 'Bpb'
+    IE_DESC = 'Bundeszentrale für politische Bildung'
+    _URL_LITERALS = ('bpb.de/mediathek/',)
+
+
+class BRIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<base_url>https?://(?:www\\.)?br(?:-klassik)?\\.de)/(?:[a-z0-9\\-_]+/)+(?P<id>[a-z0-9\\-_]+)\\.html'
+    _module = 'youtube_dl.extractor.br'
+    IE_NAME = 'BR'
+    IE_DESC = 'Bayerischer Rundfunk'
+    _URL_LITERALS = ('.html',)
+
+
+class BRMediathekIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?br\\.de/mediathek/video/[^/?&#]*?-(?P<id>av:[0-9a-f]{24})'
+    _module = 'youtube_dl.extractor.br'
+    IE_NAME = 'BRMediathek'
+    IE_DESC = 'Bayerischer Rundfunk Mediathek'
+    _URL_LITERALS = ('br.de/mediathek/video/',)
+
+
+class BravoTVIE(AdobePassIE):
+    _VALID_URL = 'https?://(?:www\\.)?bravotv\\.com/(?:[^/]+/)+(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.bravotv'
+    IE_NAME = 'BravoTV'
+    _URL_LITERALS = ('bravotv.com/',)
+
+
+class BreakIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?break\\.com/video/(?P<display_id>[^/]+?)(?:-(?P<id>\\d+))?(?:[/?#&]|$)'
+    _module = 'youtube_dl.extractor.breakcom'
+    IE_NAME = 'Break'
+    _URL_LITERALS = ('break.com/video/',)
+
+
+class BrightcoveLegacyIE(LazyLoadExtractor):
+    _VALID_URL = '(?:https?://.*brightcove\\.com/(services|viewer).*?\\?|brightcove:)(?P<query>.*)'
+    _module = 'youtube_dl.extractor.brightcove'
+    IE_NAME = 'brightcove:legacy'
+    _URL_LITERALS = ('brightcove.com/', 'brightcove:')
+
+
+class BrightcoveNewIE(AdobePassIE):
+    _VALID_URL = 'https?://players\\.brightcove\\.net/(?P<account_id>\\d+)/(?P<player_id>[^/]+)_(?P<embed>[^/]+)/index\\.html\\?.*(?P<content_type>video|playlist)Id=(?P<video_id>\\d+|ref:[^&]+)'
+    _module = 'youtube_dl.extractor.brightcove'
+    IE_NAME = 'brightcove:new'
+    _URL_LITERALS = ('://players.brightcove.net/',)
+
+
+class BusinessInsiderIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?businessinsider\\.(?:com|nl)/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.businessinsider'
+    IE_NAME = 'BusinessInsider'
+    _URL_LITERALS = ('businessinsider.',)
+
+
+class BuzzFeedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?buzzfeed\\.com/[^?#]*?/(?P<id>[^?#]+)'
+    _module = 'youtube_dl.extractor.buzzfeed'
+    IE_NAME = 'BuzzFeed'
+    _URL_LITERALS = ('buzzfeed.com/',)
+
+
+class BYUtvIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?byutv\\.org/(?:watch|player)/(?!event/)(?P<id>[0-9a-f-]+)(?:/(?P<display_id>[^/?#&]+))?'
+    _module = 'youtube_dl.extractor.byutv'
+    IE_NAME = 'BYUtv'
+    _URL_LITERALS = ('byutv.org/',)
+
+
+class C56IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|player)\\.)?56\\.com/(?:.+?/)?(?:v_|(?:play_album.+-))(?P<textid>.+?)\\.(?:html|swf)'
+    _module = 'youtube_dl.extractor.c56'
+    IE_NAME = '56.com'
+    _URL_LITERALS = ('56.com/',)
+
+
+class CamdemyIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?camdemy\\.com/media/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.camdemy'
+    IE_NAME = 'Camdemy'
+    _URL_LITERALS = ('camdemy.com/media/',)
+
+
+class CamdemyFolderIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?camdemy\\.com/folder/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.camdemy'
+    IE_NAME = 'CamdemyFolder'
+    _URL_LITERALS = ('camdemy.com/folder/',)
+
+
+class CamModelsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cammodels\\.com/cam/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.cammodels'
+    IE_NAME = 'CamModels'
+    _URL_LITERALS = ('cammodels.com/cam/',)
+
+
+class CamTubeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|api)\\.)?camtube\\.co/recordings?/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.camtube'
+    IE_NAME = 'CamTube'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('camtube.co/recording',)
+
+
+class CamWithHerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?camwithher\\.tv/view_video\\.php\\?.*\\bviewkey=(?P<id>\\w+)'
+    _module = 'youtube_dl.extractor.camwithher'
+    IE_NAME = 'CamWithHer'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('camwithher.tv/view_video.php?',)
+
+
+class CanalplusIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<site>mycanal|piwiplus)\\.fr/(?:[^/]+/)*(?P<display_id>[^?/]+)(?:\\.html\\?.*\\bvid=|/p/)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.canalplus'
+    IE_NAME = 'Canalplus'
+    IE_DESC = 'mycanal.fr and piwiplus.fr'
+    _URL_LITERALS = ('.fr/',)
+
+
+class Canalc2IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www\\.)?canalc2\\.tv/video/|archives-canalc2\\.u-strasbg\\.fr/video\\.asp\\?.*\\bidVideo=)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.canalc2'
+    IE_NAME = 'canalc2.tv'
+    _URL_LITERALS = ('archives-canalc2.u-strasbg.fr/video.asp?', 'canalc2.tv/video/')
+
+
+class CanvasIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://mediazone\\.vrt\\.be/api/v1/(?P<site_id>canvas|een|ketnet|vrt(?:video|nieuws)|sporza)/assets/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.canvas'
+    IE_NAME = 'Canvas'
+    _URL_LITERALS = ('://mediazone.vrt.be/api/v1/',)
+
+
+class CanvasEenIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<site_id>canvas|een)\\.be/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.canvas'
+    IE_NAME = 'CanvasEen'
+    IE_DESC = 'canvas.be and een.be'
+    _URL_LITERALS = ('.be/',)
+
+
+class GigyaBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.gigya'
+    IE_NAME = 'GigyaBase'
+    _URL_LITERALS = None
+
+
+class VrtNUIE(GigyaBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?vrt\\.be/(?P<site_id>vrtnu)/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.canvas'
+    IE_NAME = 'VrtNU'
+    IE_DESC = 'VrtNU.be'
+    _URL_LITERALS = ('vrt.be/',)
+
+
+class CarambaTVIE(LazyLoadExtractor):
+    _VALID_URL = '(?:carambatv:|https?://video1\\.carambatv\\.ru/v/)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.carambatv'
+    IE_NAME = 'CarambaTV'
+    _URL_LITERALS = ('://video1.carambatv.ru/v/', 'carambatv:')
+
+
+class CarambaTVPageIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://carambatv\\.ru/(?:[^/]+/)+(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.carambatv'
+    IE_NAME = 'CarambaTVPage'
+    _URL_LITERALS = ('://carambatv.ru/',)
+
+
+class CartoonNetworkIE(TurnerBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?cartoonnetwork\\.com/video/(?:[^/]+/)+(?P<id>[^/?#]+)-(?:clip|episode)\\.html'
+    _module = 'youtube_dl.extractor.cartoonnetwork'
+    IE_NAME = 'CartoonNetwork'
+    _URL_LITERALS = ('cartoonnetwork.com/video/',)
+
+
+class CBCIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cbc\\.ca/(?!player/)(?:[^/]+/)+(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.cbc'
+    IE_NAME = 'cbc.ca'
+    _URL_LITERALS = ('cbc.ca/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if CBCPlayerIE.suitable(url) else super(CBCIE, cls).suitable(url)
+
+
+class CBCPlayerIE(LazyLoadExtractor):
+    _VALID_URL = '(?:cbcplayer:|https?://(?:www\\.)?cbc\\.ca/(?:player/play/|i/caffeine/syndicate/\\?mediaId=))(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.cbc'
+    IE_NAME = 'cbc.ca:player'
+    _URL_LITERALS = ('cbc.ca/', 'cbcplayer:')
+
+
+class CBCWatchBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.cbc'
+    IE_NAME = 'CBCWatchBase'
+    _URL_LITERALS = None
+
+
+class CBCWatchVideoIE(CBCWatchBaseIE):
+    _VALID_URL = 'https?://api-cbc\\.cloud\\.clearleap\\.com/cloffice/client/web/play/?\\?.*?\\bcontentId=(?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'youtube_dl.extractor.cbc'
+    IE_NAME = 'cbc.ca:watch:video'
+    _URL_LITERALS = ('://api-cbc.cloud.clearleap.com/cloffice/client/web/play',)
+
+
+class CBCWatchIE(CBCWatchBaseIE):
+    _VALID_URL = 'https?://(?:gem|watch)\\.cbc\\.ca/(?:[^/]+/)+(?P<id>[0-9a-f-]+)'
+    _module = 'youtube_dl.extractor.cbc'
+    IE_NAME = 'cbc.ca:watch'
+    _URL_LITERALS = ('.cbc.ca/',)
+
+
+class CBCOlympicsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://olympics\\.cbc\\.ca/video/[^/]+/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.cbc'
+    IE_NAME = 'cbc.ca:olympics'
+    _URL_LITERALS = ('://olympics.cbc.ca/video/',)
+
+
+class CBSLocalIE(AnvatoIE):
+    _VALID_URL = 'https?://[a-z]+\\.cbslocal\\.com/(?:\\d+/\\d+/\\d+|video)/(?P<id>[0-9a-z-]+)'
+    _module = 'youtube_dl.extractor.cbslocal'
+    IE_NAME = 'CBSLocal'
+    _URL_LITERALS = ('.cbslocal.com/',)
+
+
+class CBSNewsLiveVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cbsnews\\.com/live/video/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.cbsnews'
+    IE_NAME = 'cbsnews:livevideo'
+    IE_DESC = 'CBS News Live Videos'
+    _URL_LITERALS = ('cbsnews.com/live/video/',)
+
+
+class CCCIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?media\\.ccc\\.de/v/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.ccc'
+    IE_NAME = 'media.ccc.de'
+    _URL_LITERALS = ('media.ccc.de/v/',)
+
+
+class CCCPlaylistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?media\\.ccc\\.de/c/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.ccc'
+    IE_NAME = 'media.ccc.de:lists'
+    _URL_LITERALS = ('media.ccc.de/c/',)
+
+
+class CCMAIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ccma\\.cat/(?:[^/]+/)*?(?P<type>video|audio)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.ccma'
+    IE_NAME = 'CCMA'
+    _URL_LITERALS = ('ccma.cat/',)
+
+
+class CCTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:[^/]+)\\.(?:cntv|cctv)\\.(?:com|cn)|(?:www\\.)?ncpa-classic\\.com)/(?:[^/]+/)*?(?P<id>[^/?#&]+?)(?:/index)?(?:\\.s?html|[?#&]|$)'
+    _module = 'youtube_dl.extractor.cctv'
+    IE_NAME = 'CCTV'
+    IE_DESC = '央视网'
+    _URL_LITERALS = ('http',)
+
+
+class CDAIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www\\.)?cda\\.pl/video|ebd\\.cda\\.pl/[0-9]+x[0-9]+)/(?P<id>[0-9a-z]+)'
+    _module = 'youtube_dl.extractor.cda'
+    IE_NAME = 'CDA'
+    _URL_LITERALS = ('cda.pl/video', 'ebd.cda.pl/')
+
+
+class CeskaTelevizeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ceskatelevize\\.cz/ivysilani/(?:[^/?#&]+/)*(?P<id>[^/#?]+)'
+    _module = 'youtube_dl.extractor.ceskatelevize'
+    IE_NAME = 'CeskaTelevize'
+    _URL_LITERALS = ('ceskatelevize.cz/ivysilani/',)
+
+
+class CeskaTelevizePoradyIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ceskatelevize\\.cz/porady/(?:[^/?#&]+/)*(?P<id>[^/#?]+)'
+    _module = 'youtube_dl.extractor.ceskatelevize'
+    IE_NAME = 'CeskaTelevizePorady'
+    _URL_LITERALS = ('ceskatelevize.cz/porady/',)
+
+
+class Channel9IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:channel9\\.msdn\\.com|s\\.ch9\\.ms)/(?P<contentpath>.+?)(?P<rss>/RSS)?/?(?:[?#&]|$)'
+    _module = 'youtube_dl.extractor.channel9'
+    IE_NAME = 'channel9'
+    IE_DESC = 'Channel 9'
+    _URL_LITERALS = ('channel9.msdn.com', 's.ch9.ms')
+
+
+class CharlieRoseIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?charlierose\\.com/(?:video|episode)(?:s|/player)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.charlierose'
+    IE_NAME = 'CharlieRose'
+    _URL_LITERALS = ('charlierose.com/',)
+
+
+class ChaturbateIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?chaturbate\\.com/(?:fullvideo/?\\?.*?\\bb=)?(?P<id>[^/?&#]+)'
+    _module = 'youtube_dl.extractor.chaturbate'
+    IE_NAME = 'Chaturbate'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('chaturbate.com/',)
+
+
+class ChilloutzoneIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?chilloutzone\\.net/video/(?P<id>[\\w|-]+)\\.html'
+    _module = 'youtube_dl.extractor.chilloutzone'
+    IE_NAME = 'Chilloutzone'
+    _URL_LITERALS = ('chilloutzone.net/video/',)
+
+
+class ChirbitIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?chirb\\.it/(?:(?:wp|pl)/|fb_chirbit_player\\.swf\\?key=)?(?P<id>[\\da-zA-Z]+)'
+    _module = 'youtube_dl.extractor.chirbit'
+    IE_NAME = 'chirbit'
+    _URL_LITERALS = ('chirb.it/',)
+
+
+class ChirbitProfileIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?chirbit\\.com/(?:rss/)?(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.chirbit'
+    IE_NAME = 'chirbit:profile'
+    _URL_LITERALS = ('chirbit.com/',)
+
+
+class CinchcastIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://player\\.cinchcast\\.com/.*?(?:assetId|show_id)=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.cinchcast'
+    IE_NAME = 'Cinchcast'
+    _URL_LITERALS = ('://player.cinchcast.com/',)
+
+
+class HBOBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.hbo'
+    IE_NAME = 'HBOBase'
+    _URL_LITERALS = None
+
+
+class CinemaxIE(HBOBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?cinemax\\.com/(?P<path>[^/]+/video/[0-9a-z-]+-(?P<id>\\d+))'
+    _module = 'youtube_dl.extractor.cinemax'
+    IE_NAME = 'Cinemax'
+    _URL_LITERALS = ('cinemax.com/',)
+
+
+class CiscoLiveBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.ciscolive'
+    IE_NAME = 'CiscoLiveBase'
+    _URL_LITERALS = None
+
+
+class CiscoLiveSessionIE(CiscoLiveBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?ciscolive(?:\\.cisco)?\\.com/[^#]*#/session/(?P<id>[^/?&]+)'
+    _module = 'youtube_dl.extractor.ciscolive'
+    IE_NAME = 'CiscoLiveSession'
+    _URL_LITERALS = ('.com/',)
+
+
+class CiscoLiveSearchIE(CiscoLiveBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?ciscolive(?:\\.cisco)?\\.com/(?:global/)?on-demand-library(?:\\.html|/)'
+    _module = 'youtube_dl.extractor.ciscolive'
+    IE_NAME = 'CiscoLiveSearch'
+    _URL_LITERALS = ('.com/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if CiscoLiveSessionIE.suitable(url) else super(CiscoLiveSearchIE, cls).suitable(url)
+
+
+class CJSWIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cjsw\\.com/program/(?P<program>[^/]+)/episode/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.cjsw'
+    IE_NAME = 'CJSW'
+    _URL_LITERALS = ('cjsw.com/program/',)
+
+
+class CliphunterIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://(?:www\\.)?cliphunter\\.com/w/\n        (?P<id>[0-9]+)/\n        (?P<seo>.+?)(?:$|[#\\?])\n    '
+    _module = 'youtube_dl.extractor.cliphunter'
+    IE_NAME = 'cliphunter'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('cliphunter.com/w/',)
+
+
+class ClippitIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?clippituser\\.tv/c/(?P<id>[a-z]+)'
+    _module = 'youtube_dl.extractor.clippit'
+    IE_NAME = 'Clippit'
+    _URL_LITERALS = ('clippituser.tv/c/',)
+
+
+class OnetBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.onet'
+    IE_NAME = 'OnetBase'
+    _URL_LITERALS = None
+
+
+class ClipRsIE(OnetBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?clip\\.rs/(?P<id>[^/]+)/\\d+'
+    _module = 'youtube_dl.extractor.cliprs'
+    IE_NAME = 'ClipRs'
+    _URL_LITERALS = ('clip.rs/',)
+
+
+class ClipsyndicateIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:chic|www)\\.clipsyndicate\\.com/video/play(list/\\d+)?/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.clipsyndicate'
+    IE_NAME = 'Clipsyndicate'
+    _URL_LITERALS = ('.clipsyndicate.com/video/play',)
+
+
+class CloserToTruthIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?closertotruth\\.com/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.closertotruth'
+    IE_NAME = 'CloserToTruth'
+    _URL_LITERALS = ('closertotruth.com/',)
+
+
+class CloudflareStreamIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:watch\\.)?(?:cloudflarestream\\.com|videodelivery\\.net)/|\n                            embed\\.(?:cloudflarestream\\.com|videodelivery\\.net)/embed/[^/]+\\.js\\?.*?\\bvideo=\n                        )\n                        (?P<id>[\\da-f]+)\n                    '
+    _module = 'youtube_dl.extractor.cloudflarestream'
+    IE_NAME = 'CloudflareStream'
+    _URL_LITERALS = ('cloudflarestream.com', 'videodelivery.net')
+
+
+class CloudyIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cloudy\\.ec/(?:v/|embed\\.php\\?.*?\\bid=)(?P<id>[A-Za-z0-9]+)'
+    _module = 'youtube_dl.extractor.cloudy'
+    IE_NAME = 'Cloudy'
+    _URL_LITERALS = ('cloudy.ec/',)
+
+
+class ClubicIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?clubic\\.com/video/(?:[^/]+/)*video.*-(?P<id>[0-9]+)\\.html'
+    _module = 'youtube_dl.extractor.clubic'
+    IE_NAME = 'Clubic'
+    _URL_LITERALS = ('clubic.com/video/',)
+
+
+class ClypIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?clyp\\.it/(?P<id>[a-z0-9]+)'
+    _module = 'youtube_dl.extractor.clyp'
+    IE_NAME = 'Clyp'
+    _URL_LITERALS = ('clyp.it/',)
+
+
+class CNBCIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.cnbc\\.com/gallery/\\?video=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.cnbc'
+    IE_NAME = 'CNBC'
+    _URL_LITERALS = ('://video.cnbc.com/gallery/?video=',)
+
+
+class CNBCVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cnbc\\.com/video/(?:[^/]+/)+(?P<id>[^./?#&]+)'
+    _module = 'youtube_dl.extractor.cnbc'
+    IE_NAME = 'CNBCVideo'
+    _URL_LITERALS = ('cnbc.com/video/',)
+
+
+class CNNIE(TurnerBaseIE):
+    _VALID_URL = '(?x)https?://(?:(?P<sub_domain>edition|www|money)\\.)?cnn\\.com/(?:video/(?:data/.+?|\\?)/)?videos?/\n        (?P<path>.+?/(?P<title>[^/]+?)(?:\\.(?:[a-z\\-]+)|(?=&)))'
+    _module = 'youtube_dl.extractor.cnn'
+    IE_NAME = 'CNN'
+    _URL_LITERALS = ('cnn.com/',)
+
+
+class CNNBlogsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://[^\\.]+\\.blogs\\.cnn\\.com/.+'
+    _module = 'youtube_dl.extractor.cnn'
+    IE_NAME = 'CNNBlogs'
+    _URL_LITERALS = ('.blogs.cnn.com/',)
+
+
+class CNNArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:edition|www)\\.)?cnn\\.com/(?!videos?/)'
+    _module = 'youtube_dl.extractor.cnn'
+    IE_NAME = 'CNNArticle'
+    _URL_LITERALS = ('cnn.com/',)
+
+
+class CoubIE(LazyLoadExtractor):
+    _VALID_URL = '(?:coub:|https?://(?:coub\\.com/(?:view|embed|coubs)/|c-cdn\\.coub\\.com/fb-player\\.swf\\?.*\\bcoub(?:ID|id)=))(?P<id>[\\da-z]+)'
+    _module = 'youtube_dl.extractor.coub'
+    IE_NAME = 'Coub'
+    _URL_LITERALS = ('-cdn.coub.com/fb-player.swf?', 'coub:', 'oub.com/')
+
+
+class ComedyCentralFullEpisodesIE(MTVServicesInfoExtractor):
+    _VALID_URL = '(?x)https?://(?:www\\.)?cc\\.com/\n        (?:full-episodes|shows(?=/[^/]+/full-episodes))\n        /(?P<id>[^?]+)'
+    _module = 'youtube_dl.extractor.comedycentral'
+    IE_NAME = 'ComedyCentralFullEpisodes'
+    _URL_LITERALS = ('cc.com/',)
+
+
+class ComedyCentralIE(MTVServicesInfoExtractor):
+    _VALID_URL = '(?x)https?://(?:www\\.)?cc\\.com/\n        (video-clips|episodes|cc-studios|video-collections|shows(?=/[^/]+/(?!full-episodes)))\n        /(?P<title>.*)'
+    _module = 'youtube_dl.extractor.comedycentral'
+    IE_NAME = 'ComedyCentral'
+    _URL_LITERALS = ('cc.com/',)
+
+
+class ComedyCentralShortnameIE(LazyLoadExtractor):
+    _VALID_URL = '^:(?P<id>tds|thedailyshow|theopposition)$'
+    _module = 'youtube_dl.extractor.comedycentral'
+    IE_NAME = 'ComedyCentralShortname'
+    _URL_LITERALS = None
+
+
+class ComedyCentralTVIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?comedycentral\\.tv/(?:staffeln|shows)/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.comedycentral'
+    IE_NAME = 'ComedyCentralTV'
+    _URL_LITERALS = ('comedycentral.tv/s',)
+
+
+class ToshIE(MTVServicesInfoExtractor):
+    _VALID_URL = '^https?://tosh\\.cc\\.com/video-(?:clips|collections)/[^/]+/(?P<videotitle>[^/?#]+)'
+    _module = 'youtube_dl.extractor.comedycentral'
+    IE_NAME = 'Tosh'
+    IE_DESC = 'Tosh.0'
+    _URL_LITERALS = ('://tosh.cc.com/video-c',)
+
+
+class CommonMistakesIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        (?:url|URL)$\n    '
+    _module = 'youtube_dl.extractor.commonmistakes'
+    IE_NAME = 'CommonMistakes'
+    IE_DESC = False
+    _URL_LITERALS = None
+
+
+class UnicodeBOMIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<bom>\ufeff)(?P<id>.*)$'
+    _module = 'youtube_dl.extractor.commonmistakes'
+    IE_NAME = 'UnicodeBOM'
+    IE_DESC = False
+    _URL_LITERALS = None
+
+
+class MmsIE(LazyLoadExtractor):
+    _VALID_URL = '(?i)mms://.+'
+    _module = 'youtube_dl.extractor.commonprotocols'
+    IE_NAME = 'Mms'
+    IE_DESC = False
+    _URL_LITERALS = ('mms://',)
+
+
+class RtmpIE(LazyLoadExtractor):
+    _VALID_URL = '(?i)rtmp[est]?://.+'
+    _module = 'youtube_dl.extractor.commonprotocols'
+    IE_NAME = 'Rtmp'
+    IE_DESC = False
+    _URL_LITERALS = ('rtmp',)
+
+
+class CondeNastIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://(?:video|www|player(?:-backend)?)\\.(?:allure|architecturaldigest|arstechnica|bonappetit|brides|cnevids|cntraveler|details|epicurious|glamour|golfdigest|gq|newyorker|self|teenvogue|vanityfair|vogue|wired|wmagazine)\\.com/\n        (?:\n            (?:\n                embed(?:js)?|\n                (?:script|inline)/video\n            )/(?P<id>[0-9a-f]{24})(?:/(?P<player_id>[0-9a-f]{24}))?(?:.+?\\btarget=(?P<target>[^&]+))?|\n            (?P<type>watch|series|video)/(?P<display_id>[^/?#]+)\n        )'
+    _module = 'youtube_dl.extractor.condenast'
+    IE_NAME = 'CondeNast'
+    IE_DESC = 'Condé Nast media group: Allure, Architectural Digest, Ars Technica, Bon Appétit, Brides, Condé Nast, Condé Nast Traveler, Details, Epicurious, GQ, Glamour, Golf Digest, SELF, Teen Vogue, The New Yorker, Vanity Fair, Vogue, W Magazine, WIRED'
+    _URL_LITERALS = ('.com/',)
+
+
+class CONtvIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?contv\\.com/details-movie/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.contv'
+    IE_NAME = 'CONtv'
+    _URL_LITERALS = ('contv.com/details-movie/',)
+
+
+class CrackedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cracked\\.com/video_(?P<id>\\d+)_[\\da-z-]+\\.html'
+    _module = 'youtube_dl.extractor.cracked'
+    IE_NAME = 'Cracked'
+    _URL_LITERALS = ('cracked.com/video_',)
+
+
+class CrackleIE(LazyLoadExtractor):
+    _VALID_URL = '(?:crackle:|https?://(?:(?:www|m)\\.)?(?:sony)?crackle\\.com/(?:playlist/\\d+/|(?:[^/]+/)+))(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.crackle'
+    IE_NAME = 'Crackle'
+    _AGE_LIMIT = 14
+    _URL_LITERALS = ('crackle.com/', 'crackle:')
+
+
+class CrooksAndLiarsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://embed\\.crooksandliars\\.com/(?:embed|v)/(?P<id>[A-Za-z0-9]+)'
+    _module = 'youtube_dl.extractor.crooksandliars'
+    IE_NAME = 'CrooksAndLiars'
+    _URL_LITERALS = ('://embed.crooksandliars.com/',)
+
+
+class CrunchyrollBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.crunchyroll'
+    IE_NAME = 'CrunchyrollBase'
+    _URL_LITERALS = None
+
+
+class CrunchyrollShowPlaylistIE(CrunchyrollBaseIE):
+    _VALID_URL = 'https?://(?:(?P<prefix>www|m)\\.)?(?P<url>crunchyroll\\.com/(?!(?:news|anime-news|library|forum|launchcalendar|lineup|store|comics|freetrial|login|media-\\d+))(?P<id>[\\w\\-]+))/?(?:\\?|$)'
+    _module = 'youtube_dl.extractor.crunchyroll'
+    IE_NAME = 'crunchyroll:playlist'
+    _URL_LITERALS = ('crunchyroll.com/',)
+
+
+class CSpanIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?c-span\\.org/video/\\?(?P<id>[0-9a-f]+)'
+    _module = 'youtube_dl.extractor.cspan'
+    IE_NAME = 'CSpan'
+    IE_DESC = 'C-SPAN'
+    _URL_LITERALS = ('c-span.org/video/?',)
+
+
+class CtsNewsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://news\\.cts\\.com\\.tw/[a-z]+/[a-z]+/\\d+/(?P<id>\\d+)\\.html'
+    _module = 'youtube_dl.extractor.ctsnews'
+    IE_NAME = 'CtsNews'
+    IE_DESC = '華視新聞'
+    _URL_LITERALS = ('://news.cts.com.tw/',)
+
+
+class CTVNewsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?ctvnews\\.ca/(?:video\\?(?:clip|playlist|bin)Id=|.*?)(?P<id>[0-9.]+)'
+    _module = 'youtube_dl.extractor.ctvnews'
+    IE_NAME = 'CTVNews'
+    _URL_LITERALS = ('ctvnews.ca/',)
+
+
+class CultureUnpluggedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cultureunplugged\\.com/documentary/watch-online/play/(?P<id>\\d+)(?:/(?P<display_id>[^/]+))?'
+    _module = 'youtube_dl.extractor.cultureunplugged'
+    IE_NAME = 'CultureUnplugged'
+    _URL_LITERALS = ('cultureunplugged.com/documentary/watch-online/play/',)
+
+
+class CuriosityStreamBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.curiositystream'
+    IE_NAME = 'CuriosityStreamBase'
+    _URL_LITERALS = None
+
+
+class CuriosityStreamIE(CuriosityStreamBaseIE):
+    _VALID_URL = 'https?://(?:app\\.)?curiositystream\\.com/video/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.curiositystream'
+    IE_NAME = 'curiositystream'
+    _URL_LITERALS = ('curiositystream.com/video/',)
+
+
+class CuriosityStreamCollectionIE(CuriosityStreamBaseIE):
+    _VALID_URL = 'https?://(?:app\\.)?curiositystream\\.com/(?:collection|series)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.curiositystream'
+    IE_NAME = 'curiositystream:collection'
+    _URL_LITERALS = ('curiositystream.com/',)
+
+
+class CWTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cw(?:tv(?:pr)?|seed)\\.com/(?:shows/)?(?:[^/]+/)+[^?]*\\?.*\\b(?:play|watch)=(?P<id>[a-z0-9]{8}-[a-z0-9]{4}-[a-z0-9]{4}-[a-z0-9]{4}-[a-z0-9]{12})'
+    _module = 'youtube_dl.extractor.cwtv'
+    IE_NAME = 'CWTV'
+    _URL_LITERALS = ('.com/',)
+
+
+class DailyMailIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dailymail\\.co\\.uk/(?:video/[^/]+/video-|embed/video/)(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.dailymail'
+    IE_NAME = 'DailyMail'
+    _URL_LITERALS = ('dailymail.co.uk/',)
+
+
+class DailymotionBaseInfoExtractor(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.dailymotion'
+    IE_NAME = 'DailymotionBaseInfoExtract'
+    _URL_LITERALS = None
+
+
+class DailymotionIE(DailymotionBaseInfoExtractor):
+    _VALID_URL = '(?ix)\n                    https?://\n                        (?:\n                            (?:(?:www|touch)\\.)?dailymotion\\.[a-z]{2,3}/(?:(?:(?:embed|swf|\\#)/)?video|swf)|\n                            (?:www\\.)?lequipe\\.fr/video\n                        )\n                        /(?P<id>[^/?_]+)(?:.+?\\bplaylist=(?P<playlist_id>x[0-9a-z]+))?\n                    '
+    _module = 'youtube_dl.extractor.dailymotion'
+    IE_NAME = 'dailymotion'
+    _URL_LITERALS = ('dailymotion.', 'lequipe.fr/video')
+
+
+class DailymotionPlaylistBaseIE(DailymotionBaseInfoExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.dailymotion'
+    IE_NAME = 'DailymotionPlaylistBase'
+    _URL_LITERALS = None
+
+
+class DailymotionPlaylistIE(DailymotionPlaylistBaseIE):
+    _VALID_URL = '(?:https?://)?(?:www\\.)?dailymotion\\.[a-z]{2,3}/playlist/(?P<id>x[0-9a-z]+)'
+    _module = 'youtube_dl.extractor.dailymotion'
+    IE_NAME = 'dailymotion:playlist'
+    _URL_LITERALS = ('dailymotion.',)
+
+
+class DailymotionUserIE(DailymotionPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?dailymotion\\.[a-z]{2,3}/(?!(?:embed|swf|#|video|playlist)/)(?:(?:old/)?user/)?(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.dailymotion'
+    IE_NAME = 'dailymotion:user'
+    _URL_LITERALS = ('dailymotion.',)
+
+
+class DaumBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.daum'
+    IE_NAME = 'DaumBase'
+    _URL_LITERALS = None
+
+
+class DaumIE(DaumBaseIE):
+    _VALID_URL = 'https?://(?:(?:m\\.)?tvpot\\.daum\\.net/v/|videofarm\\.daum\\.net/controller/player/VodPlayer\\.swf\\?vid=)(?P<id>[^?#&]+)'
+    _module = 'youtube_dl.extractor.daum'
+    IE_NAME = 'daum.net'
+    _URL_LITERALS = ('tvpot.daum.net/v/', 'videofarm.daum.net/controller/player/vodplayer.swf?vid=')
+
+
+class DaumClipIE(DaumBaseIE):
+    _VALID_URL = 'https?://(?:m\\.)?tvpot\\.daum\\.net/(?:clip/ClipView.(?:do|tv)|mypot/View.do)\\?.*?clipid=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.daum'
+    IE_NAME = 'daum.net:clip'
+    _URL_LITERALS = ('tvpot.daum.net/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if DaumPlaylistIE.suitable(url) or DaumUserIE.suitable(url) else super(DaumClipIE, cls).suitable(url)
+
+
+class DaumListIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.daum'
+    IE_NAME = 'DaumList'
+    _URL_LITERALS = None
+
+
+class DaumPlaylistIE(DaumListIE):
+    _VALID_URL = 'https?://(?:m\\.)?tvpot\\.daum\\.net/mypot/(?:View\\.do|Top\\.tv)\\?.*?playlistid=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.daum'
+    IE_NAME = 'daum.net:playlist'
+    _URL_LITERALS = ('tvpot.daum.net/mypot/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if DaumUserIE.suitable(url) else super(DaumPlaylistIE, cls).suitable(url)
+
+
+class DaumUserIE(DaumListIE):
+    _VALID_URL = 'https?://(?:m\\.)?tvpot\\.daum\\.net/mypot/(?:View|Top)\\.(?:do|tv)\\?.*?ownerid=(?P<id>[0-9a-zA-Z]+)'
+    _module = 'youtube_dl.extractor.daum'
+    IE_NAME = 'daum.net:user'
+    _URL_LITERALS = ('tvpot.daum.net/mypot/',)
+
+
+class DBTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dagbladet\\.no/video/(?:(?:embed|(?P<display_id>[^/]+))/)?(?P<id>[0-9A-Za-z_-]{11}|[a-zA-Z0-9]{8})'
+    _module = 'youtube_dl.extractor.dbtv'
+    IE_NAME = 'DBTV'
+    _URL_LITERALS = ('dagbladet.no/video/',)
+
+
+class DctpTvIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dctp\\.tv/(?:#/)?filme/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.dctp'
+    IE_NAME = 'DctpTv'
+    _URL_LITERALS = ('dctp.tv/',)
+
+
+class DeezerPlaylistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?deezer\\.com/playlist/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.deezer'
+    IE_NAME = 'DeezerPlaylist'
+    _URL_LITERALS = ('deezer.com/playlist/',)
+
+
+class DemocracynowIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?democracynow\\.org/(?P<id>[^\\?]*)'
+    _module = 'youtube_dl.extractor.democracynow'
+    IE_NAME = 'democracynow'
+    _URL_LITERALS = ('democracynow.org/',)
+
+
+class DFBIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://tv\\.dfb\\.de/video/(?P<display_id>[^/]+)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.dfb'
+    IE_NAME = 'tv.dfb.de'
+    _URL_LITERALS = ('://tv.dfb.de/video/',)
+
+
+class DHMIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dhm\\.de/filmarchiv/(?:[^/]+/)+(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.dhm'
+    IE_NAME = 'DHM'
+    IE_DESC = 'Filmarchiv - Deutsches Historisches Museum'
+    _URL_LITERALS = ('dhm.de/filmarchiv/',)
+
+
+class DiggIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?digg\\.com/video/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.digg'
+    IE_NAME = 'Digg'
+    _URL_LITERALS = ('digg.com/video/',)
+
+
+class DotsubIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dotsub\\.com/view/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.dotsub'
+    IE_NAME = 'Dotsub'
+    _URL_LITERALS = ('dotsub.com/view/',)
+
+
+class DouyuShowIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://v(?:mobile)?\\.douyu\\.com/show/(?P<id>[0-9a-zA-Z]+)'
+    _module = 'youtube_dl.extractor.douyutv'
+    IE_NAME = 'DouyuShow'
+    _URL_LITERALS = ('.douyu.com/show/',)
+
+
+class DouyuTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?douyu(?:tv)?\\.com/(?:[^/]+/)*(?P<id>[A-Za-z0-9]+)'
+    _module = 'youtube_dl.extractor.douyutv'
+    IE_NAME = 'DouyuTV'
+    IE_DESC = '斗鱼'
+    _URL_LITERALS = ('.com/',)
+
+
+class DPlayIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://\n        (?P<domain>\n            (?:www\\.)?(?P<host>dplay\\.(?P<country>dk|fi|jp|se|no))|\n            (?P<subdomain_country>es|it)\\.dplay\\.com\n        )/[^/]+/(?P<id>[^/]+/[^/?#]+)'
+    _module = 'youtube_dl.extractor.dplay'
+    IE_NAME = 'DPlay'
+    _URL_LITERALS = ('.dplay.com', 'dplay.')
+
+
+class DreiSatIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?3sat\\.de/mediathek/(?:(?:index|mediathek)\\.php)?\\?(?:(?:mode|display)=[^&]+&)*obj=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.dreisat'
+    IE_NAME = '3sat'
+    _URL_LITERALS = ('3sat.de/mediathek/',)
+
+
+class DRBonanzaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dr\\.dk/bonanza/[^/]+/\\d+/[^/]+/(?P<id>\\d+)/(?P<display_id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.drbonanza'
+    IE_NAME = 'DRBonanza'
+    _URL_LITERALS = ('dr.dk/bonanza/',)
+
+
+class DrTuberIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|m)\\.)?drtuber\\.com/(?:video|embed)/(?P<id>\\d+)(?:/(?P<display_id>[\\w-]+))?'
+    _module = 'youtube_dl.extractor.drtuber'
+    IE_NAME = 'DrTuber'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('drtuber.com/',)
+
+
+class DRTVIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:www\\.)?dr\\.dk/(?:tv/se|nyheder|radio(?:/ondemand)?)/(?:[^/]+/)*|\n                            (?:www\\.)?(?:dr\\.dk|dr-massive\\.com)/drtv/(?:se|episode)/\n                        )\n                        (?P<id>[\\da-z_-]+)\n                    '
+    _module = 'youtube_dl.extractor.drtv'
+    IE_NAME = 'drtv'
+    _URL_LITERALS = ('/drtv/', 'dr.dk/')
+
+
+class DRTVLiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dr\\.dk/(?:tv|TV)/live/(?P<id>[\\da-z-]+)'
+    _module = 'youtube_dl.extractor.drtv'
+    IE_NAME = 'drtv:live'
+    _URL_LITERALS = ('dr.dk/',)
+
+
+class DTubeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?d\\.tube/(?:#!/)?v/(?P<uploader_id>[0-9a-z.-]+)/(?P<id>[0-9a-z]{8})'
+    _module = 'youtube_dl.extractor.dtube'
+    IE_NAME = 'DTube'
+    _URL_LITERALS = ('d.tube/',)
+
+
+class DVTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.aktualne\\.cz/(?:[^/]+/)+r~(?P<id>[0-9a-f]{32})'
+    _module = 'youtube_dl.extractor.dvtv'
+    IE_NAME = 'dvtv'
+    IE_DESC = 'http://video.aktualne.cz/'
+    _URL_LITERALS = ('://video.aktualne.cz/',)
+
+
+class DumpertIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<protocol>https?)://(?:(?:www|legacy)\\.)?dumpert\\.nl/(?:mediabase|embed|item)/(?P<id>[0-9]+[/_][0-9a-zA-Z]+)'
+    _module = 'youtube_dl.extractor.dumpert'
+    IE_NAME = 'Dumpert'
+    _URL_LITERALS = ('dumpert.nl/',)
+
+
+class DefenseGouvFrIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://.*?\\.defense\\.gouv\\.fr/layout/set/ligthboxvideo/base-de-medias/webtv/(?P<id>[^/?#]*)'
+    _module = 'youtube_dl.extractor.defense'
+    IE_NAME = 'defense.gouv.fr'
+    _URL_LITERALS = ('.defense.gouv.fr/layout/set/ligthboxvideo/base-de-medias/webtv/',)
+
+
+class DiscoveryGoBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.discoverygo'
+    IE_NAME = 'DiscoveryGoBase'
+    _URL_LITERALS = None
+
+
+class DiscoveryIE(DiscoveryGoBaseIE):
+    _VALID_URL = '(?x)https?://\n        (?P<site>\n            (?:(?:www|go)\\.)?discovery|\n            (?:www\\.)?\n                (?:\n                    investigationdiscovery|\n                    discoverylife|\n                    animalplanet|\n                    ahctv|\n                    destinationamerica|\n                    sciencechannel|\n                    tlc|\n                    velocity\n                )|\n            watch\\.\n                (?:\n                    hgtv|\n                    foodnetwork|\n                    travelchannel|\n                    diynetwork|\n                    cookingchanneltv|\n                    motortrend\n                )\n        )\\.com/tv-shows/(?P<show_slug>[^/]+)/(?:video|full-episode)s/(?P<id>[^./?#]+)'
+    _module = 'youtube_dl.extractor.discovery'
+    IE_NAME = 'Discovery'
+    _URL_LITERALS = ('.com/tv-shows/',)
+
+
+class DiscoveryGoIE(DiscoveryGoBaseIE):
+    _VALID_URL = '(?x)https?://(?:www\\.)?(?:\n            discovery|\n            investigationdiscovery|\n            discoverylife|\n            animalplanet|\n            ahctv|\n            destinationamerica|\n            sciencechannel|\n            tlc|\n            velocitychannel\n        )go\\.com/(?:[^/]+/)+(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.discoverygo'
+    IE_NAME = 'DiscoveryGo'
+    _AGE_LIMIT = 14
+    _URL_LITERALS = ('go.com/',)
+
+
+class DiscoveryGoPlaylistIE(DiscoveryGoBaseIE):
+    _VALID_URL = '(?x)https?://(?:www\\.)?(?:\n            discovery|\n            investigationdiscovery|\n            discoverylife|\n            animalplanet|\n            ahctv|\n            destinationamerica|\n            sciencechannel|\n            tlc|\n            velocitychannel\n        )go\\.com/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.discoverygo'
+    IE_NAME = 'DiscoveryGoPlaylist'
+    _URL_LITERALS = ('go.com/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if DiscoveryGoIE.suitable(url) else super(
+            DiscoveryGoPlaylistIE, cls).suitable(url)
+
+
+class DiscoveryNetworksDeIE(DPlayIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<domain>(?:tlc|dmax)\\.de|dplay\\.co\\.uk)/(?:programme|show)/(?P<programme>[^/]+)/video/(?P<alternate_id>[^/]+)'
+    _module = 'youtube_dl.extractor.discoverynetworks'
+    IE_NAME = 'DiscoveryNetworksDe'
+    _URL_LITERALS = ('/video/',)
+
+
+class DiscoveryVRIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?discoveryvr\\.com/watch/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.discoveryvr'
+    IE_NAME = 'DiscoveryVR'
+    _URL_LITERALS = ('discoveryvr.com/watch/',)
+
+
+class DisneyIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        https?://(?P<domain>(?:[^/]+\\.)?(?:disney\\.[a-z]{2,3}(?:\\.[a-z]{2})?|disney(?:(?:me|latino)\\.com|turkiye\\.com\\.tr|channel\\.de)|(?:starwars|marvelkids)\\.com))/(?:(?:embed/|(?:[^/]+/)+[\\w-]+-)(?P<id>[a-z0-9]{24})|(?:[^/]+/)?(?P<display_id>[^/?#]+))'
+    _module = 'youtube_dl.extractor.disney'
+    IE_NAME = 'Disney'
+    _URL_LITERALS = ('.com', 'channel.de', 'disney.', 'turkiye.com.tr')
+
+
+class DigitallySpeakingIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:s?evt\\.dispeak|events\\.digitallyspeaking)\\.com/(?:[^/]+/)+xml/(?P<id>[^.]+)\\.xml'
+    _module = 'youtube_dl.extractor.dispeak'
+    IE_NAME = 'DigitallySpeaking'
+    _URL_LITERALS = ('events.digitallyspeaking', 'evt.dispeak')
+
+
+class DropboxIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dropbox[.]com/sh?/(?P<id>[a-zA-Z0-9]{15})/.*'
+    _module = 'youtube_dl.extractor.dropbox'
+    IE_NAME = 'Dropbox'
+    _URL_LITERALS = ('dropbox.com/s',)
+
+
+class DWIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dw\\.com/(?:[^/]+/)+(?:av|e)-(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.dw'
+    IE_NAME = 'dw'
+    _URL_LITERALS = ('dw.com/',)
+
+
+class DWArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dw\\.com/(?:[^/]+/)+a-(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.dw'
+    IE_NAME = 'dw:article'
+    _URL_LITERALS = ('dw.com/',)
+
+
+class EaglePlatformIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    (?:\n                        eagleplatform:(?P<custom_host>[^/]+):|\n                        https?://(?P<host>.+?\\.media\\.eagleplatform\\.com)/index/player\\?.*\\brecord_id=\n                    )\n                    (?P<id>\\d+)\n                '
+    _module = 'youtube_dl.extractor.eagleplatform'
+    IE_NAME = 'EaglePlatform'
+    _URL_LITERALS = ('.media.eagleplatform.com', 'eagleplatform:')
+
+
+class EbaumsWorldIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ebaumsworld\\.com/videos/[^/]+/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.ebaumsworld'
+    IE_NAME = 'EbaumsWorld'
+    _URL_LITERALS = ('ebaumsworld.com/videos/',)
+
+
+class EchoMskIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?echo\\.msk\\.ru/sounds/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.echomsk'
+    IE_NAME = 'EchoMsk'
+    _URL_LITERALS = ('echo.msk.ru/sounds/',)
+
+
+class EggheadCourseIE(LazyLoadExtractor):
+    _VALID_URL = 'https://egghead\\.io/courses/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.egghead'
+    IE_NAME = 'egghead:course'
+    IE_DESC = 'egghead.io course'
+    _URL_LITERALS = ('https://egghead.io/courses/',)
+
+
+class EggheadLessonIE(LazyLoadExtractor):
+    _VALID_URL = 'https://egghead\\.io/(?:api/v1/)?lessons/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.egghead'
+    IE_NAME = 'egghead:lesson'
+    IE_DESC = 'egghead.io lesson'
+    _URL_LITERALS = ('https://egghead.io/',)
+
+
+class EHowIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ehow\\.com/[^/_?]*_(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.ehow'
+    IE_NAME = 'eHow'
+    _URL_LITERALS = ('ehow.com/',)
+
+
+class EightTracksIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://8tracks\\.com/(?P<user>[^/]+)/(?P<id>[^/#]+)(?:#.*)?$'
+    _module = 'youtube_dl.extractor.eighttracks'
+    IE_NAME = '8tracks'
+    _URL_LITERALS = ('://8tracks.com/',)
+
+
+class EinthusanIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?P<host>einthusan\\.(?:tv|com|ca))/movie/watch/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.einthusan'
+    IE_NAME = 'Einthusan'
+    _URL_LITERALS = ('einthusan.',)
+
+
+class EitbIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?eitb\\.tv/(?:eu/bideoa|es/video)/[^/]+/\\d+/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.eitb'
+    IE_NAME = 'eitb.tv'
+    _URL_LITERALS = ('eitb.tv/e',)
+
+
+class EllenTubeBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.ellentube'
+    IE_NAME = 'EllenTubeBase'
+    _URL_LITERALS = None
+
+
+class EllenTubeIE(EllenTubeBaseIE):
+    _VALID_URL = '(?x)\n                        (?:\n                            ellentube:|\n                            https://api-prod\\.ellentube\\.com/ellenapi/api/item/\n                        )\n                        (?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})\n                    '
+    _module = 'youtube_dl.extractor.ellentube'
+    IE_NAME = 'EllenTube'
+    _URL_LITERALS = ('ellentube:', 'https://api-prod.ellentube.com/ellenapi/api/item/')
+
+
+class EllenTubeVideoIE(EllenTubeBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?ellentube\\.com/video/(?P<id>.+?)\\.html'
+    _module = 'youtube_dl.extractor.ellentube'
+    IE_NAME = 'EllenTubeVideo'
+    _URL_LITERALS = ('ellentube.com/video/',)
+
+
+class EllenTubePlaylistIE(EllenTubeBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?ellentube\\.com/(?:episode|studios)/(?P<id>.+?)\\.html'
+    _module = 'youtube_dl.extractor.ellentube'
+    IE_NAME = 'EllenTubePlaylist'
+    _URL_LITERALS = ('ellentube.com/',)
+
+
+class ElPaisIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^.]+\\.)?elpais\\.com/.*/(?P<id>[^/#?]+)\\.html(?:$|[?#])'
+    _module = 'youtube_dl.extractor.elpais'
+    IE_NAME = 'ElPais'
+    IE_DESC = 'El País'
+    _URL_LITERALS = ('elpais.com/',)
+
+
+class EmbedlyIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www|cdn\\.)?embedly\\.com/widgets/media\\.html\\?(?:[^#]*?&)?url=(?P<id>[^#&]+)'
+    _module = 'youtube_dl.extractor.embedly'
+    IE_NAME = 'Embedly'
+    _URL_LITERALS = ('embedly.com/widgets/media.html?',)
+
+
+class EngadgetIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?engadget\\.com/video/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.engadget'
+    IE_NAME = 'Engadget'
+    _URL_LITERALS = ('engadget.com/video/',)
+
+
+class EpornerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?eporner\\.com/(?:hd-porn|embed)/(?P<id>\\w+)(?:/(?P<display_id>[\\w-]+))?'
+    _module = 'youtube_dl.extractor.eporner'
+    IE_NAME = 'Eporner'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('eporner.com/',)
+
+
+class EroProfileIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?eroprofile\\.com/m/videos/view/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.eroprofile'
+    IE_NAME = 'EroProfile'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('eroprofile.com/m/videos/view/',)
+
+
+class EscapistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://?(?:(?:www|v1)\\.)?escapistmagazine\\.com/videos/view/[^/]+/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.escapist'
+    IE_NAME = 'Escapist'
+    _URL_LITERALS = ('escapistmagazine.com/videos/view/',)
+
+
+class OnceIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://.+?\\.unicornmedia\\.com/now/(?:ads/vmap/)?[^/]+/[^/]+/(?P<domain_id>[^/]+)/(?P<application_id>[^/]+)/(?:[^/]+/)?(?P<media_item_id>[^/]+)/content\\.(?:once|m3u8|mp4)'
+    _module = 'youtube_dl.extractor.once'
+    IE_NAME = 'Once'
+    _URL_LITERALS = ('.unicornmedia.com/now/',)
+
+
+class ESPNIE(OnceIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:\n                                (?:\n                                    (?:(?:\\w+\\.)+)?espn\\.go|\n                                    (?:www\\.)?espn\n                                )\\.com/\n                                (?:\n                                    (?:\n                                        video/(?:clip|iframe/twitter)|\n                                        watch/player\n                                    )\n                                    (?:\n                                        .*?\\?.*?\\bid=|\n                                        /_/id/\n                                    )|\n                                    [^/]+/video/\n                                )\n                            )|\n                            (?:www\\.)espnfc\\.(?:com|us)/(?:video/)?[^/]+/\\d+/video/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.espn'
+    IE_NAME = 'ESPN'
+    _URL_LITERALS = ('.com/', 'www.espnfc.')
+
+
+class ESPNArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:espn\\.go|(?:www\\.)?espn)\\.com/(?:[^/]+/)*(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.espn'
+    IE_NAME = 'ESPNArticle'
+    _URL_LITERALS = ('.com/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if ESPNIE.suitable(url) else super(ESPNArticleIE, cls).suitable(url)
+
+
+class FiveThirtyEightIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?fivethirtyeight\\.com/features/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.espn'
+    IE_NAME = 'FiveThirtyEight'
+    _URL_LITERALS = ('fivethirtyeight.com/features/',)
+
+
+class EsriVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.esri\\.com/watch/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.esri'
+    IE_NAME = 'EsriVideo'
+    _URL_LITERALS = ('://video.esri.com/watch/',)
+
+
+class EuropaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://ec\\.europa\\.eu/avservices/(?:video/player|audio/audioDetails)\\.cfm\\?.*?\\bref=(?P<id>[A-Za-z0-9-]+)'
+    _module = 'youtube_dl.extractor.europa'
+    IE_NAME = 'Europa'
+    _URL_LITERALS = ('://ec.europa.eu/avservices/',)
+
+
+class EveryonesMixtapeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?everyonesmixtape\\.com/#/mix/(?P<id>[0-9a-zA-Z]+)(?:/(?P<songnr>[0-9]))?$'
+    _module = 'youtube_dl.extractor.everyonesmixtape'
+    IE_NAME = 'EveryonesMixtape'
+    _URL_LITERALS = ('everyonesmixtape.com/#/mix/',)
+
+
+class ExpoTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?expotv\\.com/videos/[^?#]*/(?P<id>[0-9]+)($|[?#])'
+    _module = 'youtube_dl.extractor.expotv'
+    IE_NAME = 'ExpoTV'
+    _URL_LITERALS = ('expotv.com/videos/',)
+
+
+class ExpressenIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?expressen\\.se/\n                        (?:(?:tvspelare/video|videoplayer/embed)/)?\n                        tv/(?:[^/]+/)*\n                        (?P<id>[^/?#&]+)\n                    '
+    _module = 'youtube_dl.extractor.expressen'
+    IE_NAME = 'Expressen'
+    _URL_LITERALS = ('expressen.se/',)
+
+
+class EyedoTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?eyedo\\.tv/[^/]+/(?:#!/)?Live/Detail/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.eyedotv'
+    IE_NAME = 'EyedoTV'
+    _URL_LITERALS = ('eyedo.tv/',)
+
+
+class FacebookIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                (?:\n                    https?://\n                        (?:[\\w-]+\\.)?(?:facebook\\.com|facebookcorewwwi\\.onion)/\n                        (?:[^#]*?\\#!/)?\n                        (?:\n                            (?:\n                                video/video\\.php|\n                                photo\\.php|\n                                video\\.php|\n                                video/embed|\n                                story\\.php\n                            )\\?(?:.*?)(?:v|video_id|story_fbid)=|\n                            [^/]+/videos/(?:[^/]+/)?|\n                            [^/]+/posts/|\n                            groups/[^/]+/permalink/\n                        )|\n                    facebook:\n                )\n                (?P<id>[0-9]+)\n                '
+    _module = 'youtube_dl.extractor.facebook'
+    IE_NAME = 'facebook'
+    _URL_LITERALS = ('.com', 'corewwwi.onion', 'facebook:')
+
+
+class FacebookPluginsVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[\\w-]+\\.)?facebook\\.com/plugins/video\\.php\\?.*?\\bhref=(?P<id>https.+)'
+    _module = 'youtube_dl.extractor.facebook'
+    IE_NAME = 'FacebookPluginsVideo'
+    _URL_LITERALS = ('facebook.com/plugins/video.php?',)
+
+
+class FazIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?faz\\.net/(?:[^/]+/)*.*?-(?P<id>\\d+)\\.html'
+    _module = 'youtube_dl.extractor.faz'
+    IE_NAME = 'faz.net'
+    _URL_LITERALS = ('faz.net/',)
+
+
+class FC2IE(LazyLoadExtractor):
+    _VALID_URL = '^(?:https?://video\\.fc2\\.com/(?:[^/]+/)*content/|fc2:)(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.fc2'
+    IE_NAME = 'fc2'
+    _URL_LITERALS = ('://video.fc2.com/', 'fc2:')
+
+
+class FC2EmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.fc2\\.com/flv2\\.swf\\?(?P<query>.+)'
+    _module = 'youtube_dl.extractor.fc2'
+    IE_NAME = 'fc2:embed'
+    _URL_LITERALS = ('://video.fc2.com/flv2.swf?',)
+
+
+class FczenitIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?fc-zenit\\.ru/video/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.fczenit'
+    IE_NAME = 'Fczenit'
+    _URL_LITERALS = ('fc-zenit.ru/video/',)
+
+
+class FilmOnIE(LazyLoadExtractor):
+    _VALID_URL = '(?:https?://(?:www\\.)?filmon\\.com/vod/view/|filmon:)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.filmon'
+    IE_NAME = 'filmon'
+    _URL_LITERALS = ('filmon.com/vod/view/', 'filmon:')
+
+
+class FilmOnChannelIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?filmon\\.com/(?:tv|channel)/(?P<id>[a-z0-9-]+)'
+    _module = 'youtube_dl.extractor.filmon'
+    IE_NAME = 'filmon:channel'
+    _URL_LITERALS = ('filmon.com/',)
+
+
+class FilmwebIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?filmweb\\.no/(?P<type>trailere|filmnytt)/article(?P<id>\\d+)\\.ece'
+    _module = 'youtube_dl.extractor.filmweb'
+    IE_NAME = 'Filmweb'
+    _URL_LITERALS = ('filmweb.no/',)
+
+
+class FirstTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?1tv\\.ru/(?:[^/]+/)+(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.firsttv'
+    IE_NAME = '1tv'
+    IE_DESC = 'Первый канал'
+    _URL_LITERALS = ('1tv.ru/',)
+
+
+class FiveMinIE(LazyLoadExtractor):
+    _VALID_URL = '(?:5min:|https?://(?:[^/]*?5min\\.com/|delivery\\.vidible\\.tv/aol)(?:(?:Scripts/PlayerSeed\\.js|playerseed/?)?\\?.*?playList=)?)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.fivemin'
+    IE_NAME = '5min'
+    _URL_LITERALS = ('5min.com/', '5min:', 'delivery.vidible.tv/aol')
+
+
+class FiveTVIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?5-tv\\.ru/\n                        (?:\n                            (?:[^/]+/)+(?P<id>\\d+)|\n                            (?P<path>[^/?#]+)(?:[/?#])?\n                        )\n                    '
+    _module = 'youtube_dl.extractor.fivetv'
+    IE_NAME = 'FiveTV'
+    _URL_LITERALS = ('5-tv.ru/',)
+
+
+class FlickrIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.|secure\\.)?flickr\\.com/photos/[\\w\\-_@]+/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.flickr'
+    IE_NAME = 'Flickr'
+    _URL_LITERALS = ('flickr.com/photos/',)
+
+
+class FolketingetIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ft\\.dk/webtv/video/[^?#]*?\\.(?P<id>[0-9]+)\\.aspx'
+    _module = 'youtube_dl.extractor.folketinget'
+    IE_NAME = 'Folketinget'
+    IE_DESC = 'Folketinget (ft.dk; Danish parliament)'
+    _URL_LITERALS = ('ft.dk/webtv/video/',)
+
+
+class FootyRoomIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://footyroom\\.com/matches/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.footyroom'
+    IE_NAME = 'FootyRoom'
+    _URL_LITERALS = ('://footyroom.com/matches/',)
+
+
+class Formula1IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?formula1\\.com/(?:content/fom-website/)?en/video/\\d{4}/\\d{1,2}/(?P<id>.+?)\\.html'
+    _module = 'youtube_dl.extractor.formula1'
+    IE_NAME = 'Formula1'
+    _URL_LITERALS = ('formula1.com/',)
+
+
+class FourTubeBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.fourtube'
+    IE_NAME = 'FourTubeBase'
+    _URL_LITERALS = None
+
+
+class FourTubeIE(FourTubeBaseIE):
+    _VALID_URL = 'https?://(?:(?P<kind>www|m)\\.)?4tube\\.com/(?:videos|embed)/(?P<id>\\d+)(?:/(?P<display_id>[^/?#&]+))?'
+    _module = 'youtube_dl.extractor.fourtube'
+    IE_NAME = '4tube'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('4tube.com/',)
+
+
+class PornTubeIE(FourTubeBaseIE):
+    _VALID_URL = 'https?://(?:(?P<kind>www|m)\\.)?porntube\\.com/(?:videos/(?P<display_id>[^/]+)_|embed/)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.fourtube'
+    IE_NAME = 'PornTube'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('porntube.com/',)
+
+
+class PornerBrosIE(FourTubeBaseIE):
+    _VALID_URL = 'https?://(?:(?P<kind>www|m)\\.)?pornerbros\\.com/(?:videos/(?P<display_id>[^/]+)_|embed/)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.fourtube'
+    IE_NAME = 'PornerBros'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('pornerbros.com/',)
+
+
+class FuxIE(FourTubeBaseIE):
+    _VALID_URL = 'https?://(?:(?P<kind>www|m)\\.)?fux\\.com/(?:video|embed)/(?P<id>\\d+)(?:/(?P<display_id>[^/?#&]+))?'
+    _module = 'youtube_dl.extractor.fourtube'
+    IE_NAME = 'Fux'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('fux.com/',)
+
+
+class FOXIE(AdobePassIE):
+    _VALID_URL = 'https?://(?:www\\.)?fox\\.com/watch/(?P<id>[\\da-fA-F]+)'
+    _module = 'youtube_dl.extractor.fox'
+    IE_NAME = 'FOX'
+    _AGE_LIMIT = 14
+    _URL_LITERALS = ('fox.com/watch/',)
+
+
+class FOX9IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?fox9\\.com/video/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.fox9'
+    IE_NAME = 'FOX9'
+    _URL_LITERALS = ('fox9.com/video/',)
+
+
+class FOX9NewsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?fox9\\.com/news/(?P<id>[^/?&#]+)'
+    _module = 'youtube_dl.extractor.fox9'
+    IE_NAME = 'FOX9News'
+    _URL_LITERALS = ('fox9.com/news/',)
+
+
+class FoxgayIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?foxgay\\.com/videos/(?:\\S+-)?(?P<id>\\d+)\\.shtml'
+    _module = 'youtube_dl.extractor.foxgay'
+    IE_NAME = 'Foxgay'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('foxgay.com/videos/',)
+
+
+class FoxNewsIE(AMPIE):
+    _VALID_URL = 'https?://(?P<host>video\\.(?:insider\\.)?fox(?:news|business)\\.com)/v/(?:video-embed\\.html\\?video_id=)?(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.foxnews'
+    IE_NAME = 'foxnews'
+    IE_DESC = 'Fox News and Fox Business Video'
+    _URL_LITERALS = ('video.',)
+
+
+class FoxNewsArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:insider\\.)?foxnews\\.com/(?!v)([^/]+/)+(?P<id>[a-z-]+)'
+    _module = 'youtube_dl.extractor.foxnews'
+    IE_NAME = 'foxnews:article'
+    _URL_LITERALS = ('foxnews.com/',)
+
+
+class FoxSportsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?foxsports\\.com/(?:[^/]+/)*video/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.foxsports'
+    IE_NAME = 'FoxSports'
+    _URL_LITERALS = ('foxsports.com/',)
+
+
+class FranceCultureIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?franceculture\\.fr/emissions/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.franceculture'
+    IE_NAME = 'FranceCulture'
+    _URL_LITERALS = ('franceculture.fr/emissions/',)
+
+
+class FranceInterIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?franceinter\\.fr/emissions/(?P<id>[^?#]+)'
+    _module = 'youtube_dl.extractor.franceinter'
+    IE_NAME = 'FranceInter'
+    _URL_LITERALS = ('franceinter.fr/emissions/',)
+
+
+class FranceTVIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    (?:\n                        https?://\n                            sivideo\\.webservices\\.francetelevisions\\.fr/tools/getInfosOeuvre/v2/\\?\n                            .*?\\bidDiffusion=[^&]+|\n                        (?:\n                            https?://videos\\.francetv\\.fr/video/|\n                            francetv:\n                        )\n                        (?P<id>[^@]+)(?:@(?P<catalog>.+))?\n                    )\n                    '
+    _module = 'youtube_dl.extractor.francetv'
+    IE_NAME = 'FranceTV'
+    _URL_LITERALS = ('://sivideo.webservices.francetelevisions.fr/tools/getinfosoeuvre/v2/?', '://videos.francetv.fr/video/', 'francetv:')
+
+
+class FranceTVBaseInfoExtractor(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.francetv'
+    IE_NAME = 'FranceTVBaseInfoExtract'
+    _URL_LITERALS = None
+
+
+class FranceTVSiteIE(FranceTVBaseInfoExtractor):
+    _VALID_URL = 'https?://(?:(?:www\\.)?france\\.tv|mobile\\.france\\.tv)/(?:[^/]+/)*(?P<id>[^/]+)\\.html'
+    _module = 'youtube_dl.extractor.francetv'
+    IE_NAME = 'FranceTVSite'
+    _URL_LITERALS = ('france.tv', 'mobile.france.tv')
+
+
+class FranceTVEmbedIE(FranceTVBaseInfoExtractor):
+    _VALID_URL = 'https?://embed\\.francetv\\.fr/*\\?.*?\\bue=(?P<id>[^&]+)'
+    _module = 'youtube_dl.extractor.francetv'
+    IE_NAME = 'FranceTVEmbed'
+    _URL_LITERALS = ('://embed.francetv.fr',)
+
+
+class FranceTVInfoIE(FranceTVBaseInfoExtractor):
+    _VALID_URL = 'https?://(?:www|mobile|france3-regions)\\.francetvinfo\\.fr/(?:[^/]+/)*(?P<id>[^/?#&.]+)'
+    _module = 'youtube_dl.extractor.francetv'
+    IE_NAME = 'francetvinfo.fr'
+    _URL_LITERALS = ('.francetvinfo.fr/',)
+
+
+class FranceTVInfoSportIE(FranceTVBaseInfoExtractor):
+    _VALID_URL = 'https?://sport\\.francetvinfo\\.fr/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.francetv'
+    IE_NAME = 'sport.francetvinfo.fr'
+    _URL_LITERALS = ('://sport.francetvinfo.fr/',)
+
+
+class FranceTVJeunesseIE(FranceTVBaseInfoExtractor):
+    _VALID_URL = '(?P<url>https?://(?:www\\.)?(?:zouzous|ludo)\\.fr/heros/(?P<id>[^/?#&]+))'
+    _module = 'youtube_dl.extractor.francetv'
+    IE_NAME = 'FranceTVJeunesse'
+    _URL_LITERALS = ('.fr/heros/',)
+
+
+class GenerationWhatIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://generation-what\\.francetv\\.fr/[^/]+/video/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.francetv'
+    IE_NAME = 'france2.fr:generation-what'
+    _URL_LITERALS = ('://generation-what.francetv.fr/',)
+
+
+class CultureboxIE(FranceTVBaseInfoExtractor):
+    _VALID_URL = 'https?://(?:m\\.)?culturebox\\.francetvinfo\\.fr/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.francetv'
+    IE_NAME = 'Culturebox'
+    _URL_LITERALS = ('culturebox.francetvinfo.fr/',)
+
+
+class FreesoundIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?freesound\\.org/people/[^/]+/sounds/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.freesound'
+    IE_NAME = 'Freesound'
+    _URL_LITERALS = ('freesound.org/people/',)
+
+
+class FreespeechIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?freespeech\\.org/stories/(?P<id>.+)'
+    _module = 'youtube_dl.extractor.freespeech'
+    IE_NAME = 'freespeech.org'
+    _URL_LITERALS = ('freespeech.org/stories/',)
+
+
+class FreshLiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://freshlive\\.tv/[^/]+/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.freshlive'
+    IE_NAME = 'FreshLive'
+    _URL_LITERALS = ('://freshlive.tv/',)
+
+
+class FrontendMastersBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.frontendmasters'
+    IE_NAME = 'FrontendMastersBase'
+    _URL_LITERALS = None
+
+
+class FrontendMastersIE(FrontendMastersBaseIE):
+    _VALID_URL = '(?:frontendmasters:|https?://api\\.frontendmasters\\.com/v\\d+/kabuki/video/)(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.frontendmasters'
+    IE_NAME = 'FrontendMasters'
+    _URL_LITERALS = ('://api.frontendmasters.com/v', 'frontendmasters:')
+
+
+class FrontendMastersPageBaseIE(FrontendMastersBaseIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.frontendmasters'
+    IE_NAME = 'FrontendMastersPageBase'
+    _URL_LITERALS = None
+
+
+class FrontendMastersLessonIE(FrontendMastersPageBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?frontendmasters\\.com/courses/(?P<course_name>[^/]+)/(?P<lesson_name>[^/]+)'
+    _module = 'youtube_dl.extractor.frontendmasters'
+    IE_NAME = 'FrontendMastersLesson'
+    _URL_LITERALS = ('frontendmasters.com/courses/',)
+
+
+class FrontendMastersCourseIE(FrontendMastersPageBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?frontendmasters\\.com/courses/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.frontendmasters'
+    IE_NAME = 'FrontendMastersCourse'
+    _URL_LITERALS = ('frontendmasters.com/courses/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if FrontendMastersLessonIE.suitable(url) else super(
+            FrontendMastersBaseIE, cls).suitable(url)
+
+
+class FunimationIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?funimation(?:\\.com|now\\.uk)/shows/[^/]+/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.funimation'
+    IE_NAME = 'Funimation'
+    _URL_LITERALS = ('.com', 'now.uk')
+
+
+class FunkIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?funk\\.net/(?:channel|playlist)/[^/]+/(?P<display_id>[0-9a-z-]+)-(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.funk'
+    IE_NAME = 'Funk'
+    _URL_LITERALS = ('funk.net/',)
+
+
+class FusionIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?fusion\\.(?:net|tv)/(?:video/|show/.+?\\bvideo=)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.fusion'
+    IE_NAME = 'Fusion'
+    _URL_LITERALS = ('fusion.',)
+
+
+class FXNetworksIE(AdobePassIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:fxnetworks|simpsonsworld)\\.com/video/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.fxnetworks'
+    IE_NAME = 'FXNetworks'
+    _AGE_LIMIT = 14
+    _URL_LITERALS = ('.com/video/',)
+
+
+class GaiaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?gaia\\.com/video/(?P<id>[^/?]+).*?\\bfullplayer=(?P<type>feature|preview)'
+    _module = 'youtube_dl.extractor.gaia'
+    IE_NAME = 'Gaia'
+    _URL_LITERALS = ('gaia.com/video/',)
+
+
+class GameInformerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?gameinformer\\.com/(?:[^/]+/)*(?P<id>[^.?&#]+)'
+    _module = 'youtube_dl.extractor.gameinformer'
+    IE_NAME = 'GameInformer'
+    _URL_LITERALS = ('gameinformer.com/',)
+
+
+class GameSpotIE(OnceIE):
+    _VALID_URL = 'https?://(?:www\\.)?gamespot\\.com/(?:video|article|review)s/(?:[^/]+/\\d+-|embed/)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.gamespot'
+    IE_NAME = 'GameSpot'
+    _URL_LITERALS = ('gamespot.com/',)
+
+
+class GameStarIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?game(?P<site>pro|star)\\.de/videos/.*,(?P<id>[0-9]+)\\.html'
+    _module = 'youtube_dl.extractor.gamestar'
+    IE_NAME = 'GameStar'
+    _URL_LITERALS = ('.de/videos/',)
+
+
+class GaskrankIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?gaskrank\\.tv/tv/(?P<categories>[^/]+)/(?P<id>[^/]+)\\.htm'
+    _module = 'youtube_dl.extractor.gaskrank'
+    IE_NAME = 'Gaskrank'
+    _URL_LITERALS = ('gaskrank.tv/tv/',)
+
+
+class GazetaIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<url>https?://(?:www\\.)?gazeta\\.ru/(?:[^/]+/)?video/(?:main/)*(?:\\d{4}/\\d{2}/\\d{2}/)?(?P<id>[A-Za-z0-9-_.]+)\\.s?html)'
+    _module = 'youtube_dl.extractor.gazeta'
+    IE_NAME = 'Gazeta'
+    _URL_LITERALS = ('gazeta.ru/',)
+
+
+class GDCVaultIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?gdcvault\\.com/play/(?P<id>\\d+)(?:/(?P<name>[\\w-]+))?'
+    _module = 'youtube_dl.extractor.gdcvault'
+    IE_NAME = 'GDCVault'
+    _URL_LITERALS = ('gdcvault.com/play/',)
+
+
+class GfycatIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|giant|thumbs)\\.)?gfycat\\.com/(?:ru/|ifr/|gifs/detail/)?(?P<id>[^-/?#\\.]+)'
+    _module = 'youtube_dl.extractor.gfycat'
+    IE_NAME = 'Gfycat'
+    _URL_LITERALS = ('gfycat.com/',)
+
+
+class GiantBombIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?giantbomb\\.com/videos/(?P<display_id>[^/]+)/(?P<id>\\d+-\\d+)'
+    _module = 'youtube_dl.extractor.giantbomb'
+    IE_NAME = 'GiantBomb'
+    _URL_LITERALS = ('giantbomb.com/videos/',)
+
+
+class GigaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?giga\\.de/(?:[^/]+/)*(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.giga'
+    IE_NAME = 'Giga'
+    _URL_LITERALS = ('giga.de/',)
+
+
+class GlideIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://share\\.glide\\.me/(?P<id>[A-Za-z0-9\\-=_+]+)'
+    _module = 'youtube_dl.extractor.glide'
+    IE_NAME = 'Glide'
+    IE_DESC = 'Glide mobile video messages (glide.me)'
+    _URL_LITERALS = ('://share.glide.me/',)
+
+
+class GloboIE(LazyLoadExtractor):
+    _VALID_URL = '(?:globo:|https?://.+?\\.globo\\.com/(?:[^/]+/)*(?:v/(?:[^/]+/)?|videos/))(?P<id>\\d{7,})'
+    _module = 'youtube_dl.extractor.globo'
+    IE_NAME = 'Globo'
+    _URL_LITERALS = ('.globo.com/', 'globo:')
+
+
+class GloboArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://.+?\\.globo\\.com/(?:[^/]+/)*(?P<id>[^/.]+)(?:\\.html)?'
+    _module = 'youtube_dl.extractor.globo'
+    IE_NAME = 'GloboArticle'
+    _URL_LITERALS = ('.globo.com/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if GloboIE.suitable(url) else super(GloboArticleIE, cls).suitable(url)
+
+
+class GoIE(AdobePassIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:(?P<sub_domain>abc|freeform|watchdisneychannel|watchdisneyjunior|watchdisneyxd|disneynow)\\.)?go|\n                            (?P<sub_domain_2>abc|freeform|disneynow)\n                        )\\.com/\n                        (?:\n                            (?:[^/]+/)*(?P<id>[Vv][Dd][Kk][Aa]\\w+)|\n                            (?:[^/]+/)*(?P<display_id>[^/?\\#]+)\n                        )\n                    '
+    _module = 'youtube_dl.extractor.go'
+    IE_NAME = 'Go'
+    _URL_LITERALS = ('.com/',)
+
+
+class GodTubeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?godtube\\.com/watch/\\?v=(?P<id>[\\da-zA-Z]+)'
+    _module = 'youtube_dl.extractor.godtube'
+    IE_NAME = 'GodTube'
+    _URL_LITERALS = ('godtube.com/watch/?v=',)
+
+
+class GolemIE(LazyLoadExtractor):
+    _VALID_URL = '^https?://video\\.golem\\.de/.+?/(?P<id>.+?)/'
+    _module = 'youtube_dl.extractor.golem'
+    IE_NAME = 'Golem'
+    _URL_LITERALS = ('://video.golem.de/',)
+
+
+class GoogleDriveIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                        https?://\n                            (?:\n                                (?:docs|drive)\\.google\\.com/\n                                (?:\n                                    (?:uc|open)\\?.*?id=|\n                                    file/d/\n                                )|\n                                video\\.google\\.com/get_player\\?.*?docid=\n                            )\n                            (?P<id>[a-zA-Z0-9_-]{28,})\n                    '
+    _module = 'youtube_dl.extractor.googledrive'
+    IE_NAME = 'GoogleDrive'
+    _URL_LITERALS = ('.google.com/', 'video.google.com/get_player?')
+
+
+class GooglePlusIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://plus\\.google\\.com/(?:[^/]+/)*?posts/(?P<id>\\w+)'
+    _module = 'youtube_dl.extractor.googleplus'
+    IE_NAME = 'plus.google'
+    IE_DESC = 'Google Plus'
+    _URL_LITERALS = ('://plus.google.com/',)
+
+
+class GoogleSearchIE(LazyLoadSearchExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.googlesearch'
+    IE_NAME = 'video.google:search'
+    IE_DESC = 'Google Video search'
+    _URL_LITERALS = ('gvsearch',)
+
+    @classmethod
+    def suitable(cls, url):
+        return re.match(cls._make_valid_url(), url) is not None
+
+    @classmethod
+    def _make_valid_url(cls):
+        return 'gvsearch(?P<prefix>|[1-9][0-9]*|all):(?P<query>[\\s\\S]+)'
+
+
+class GoshgayIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?goshgay\\.com/video(?P<id>\\d+?)($|/)'
+    _module = 'youtube_dl.extractor.goshgay'
+    IE_NAME = 'Goshgay'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('goshgay.com/video',)
+
+
+class GPUTechConfIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://on-demand\\.gputechconf\\.com/gtc/2015/video/S(?P<id>\\d+)\\.html'
+    _module = 'youtube_dl.extractor.gputechconf'
+    IE_NAME = 'GPUTechConf'
+    _URL_LITERALS = ('://on-demand.gputechconf.com/gtc/2015/video/s',)
+
+
+class GrouponIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?groupon\\.com/deals/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.groupon'
+    IE_NAME = 'Groupon'
+    _URL_LITERALS = ('groupon.com/deals/',)
+
+
+class HBOIE(HBOBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?hbo\\.com/(?:video|embed)(?:/[^/]+)*/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.hbo'
+    IE_NAME = 'hbo'
+    _URL_LITERALS = ('hbo.com/',)
+
+
+class HearThisAtIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?hearthis\\.at/(?P<artist>[^/]+)/(?P<title>[A-Za-z0-9\\-]+)/?$'
+    _module = 'youtube_dl.extractor.hearthisat'
+    IE_NAME = 'HearThisAt'
+    _URL_LITERALS = ('hearthis.at/',)
+
+
+class HeiseIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?heise\\.de/(?:[^/]+/)+[^/]+-(?P<id>[0-9]+)\\.html'
+    _module = 'youtube_dl.extractor.heise'
+    IE_NAME = 'Heise'
+    _URL_LITERALS = ('heise.de/',)
+
+
+class HellPornoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?hellporno\\.(?:com/videos|net/v)/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.hellporno'
+    IE_NAME = 'HellPorno'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('hellporno.',)
+
+
+class HelsinkiIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.helsinki\\.fi/Arkisto/flash\\.php\\?id=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.helsinki'
+    IE_NAME = 'Helsinki'
+    IE_DESC = 'helsinki.fi'
+    _URL_LITERALS = ('://video.helsinki.fi/arkisto/flash.php?id=',)
+
+
+class HentaiStigmaIE(LazyLoadExtractor):
+    _VALID_URL = '^https?://hentai\\.animestigma\\.com/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.hentaistigma'
+    IE_NAME = 'HentaiStigma'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('://hentai.animestigma.com/',)
+
+
+class HGTVComShowIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?hgtv\\.com/shows/[^/]+/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.hgtv'
+    IE_NAME = 'hgtv.com:show'
+    _URL_LITERALS = ('hgtv.com/shows/',)
+
+
+class HKETVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?hkedcity\\.net/etv/resource/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.hketv'
+    IE_NAME = 'hketv'
+    IE_DESC = '香港教育局教育電視 (HKETV) Educational Television, Hong Kong Educational Bureau'
+    _URL_LITERALS = ('hkedcity.net/etv/resource/',)
+
+
+class HiDiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?hidive\\.com/stream/(?P<title>[^/]+)/(?P<key>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.hidive'
+    IE_NAME = 'HiDive'
+    _URL_LITERALS = ('hidive.com/stream/',)
+
+
+class HistoricFilmsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?historicfilms\\.com/(?:tapes/|play)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.historicfilms'
+    IE_NAME = 'HistoricFilms'
+    _URL_LITERALS = ('historicfilms.com/',)
+
+
+class HitboxIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:hitbox|smashcast)\\.tv/(?:[^/]+/)*videos?/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.hitbox'
+    IE_NAME = 'hitbox'
+    _URL_LITERALS = ('.tv/',)
+
+
+class HitboxLiveIE(HitboxIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:hitbox|smashcast)\\.tv/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.hitbox'
+    IE_NAME = 'hitbox:live'
+    _URL_LITERALS = ('.tv/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if HitboxIE.suitable(url) else super(HitboxLiveIE, cls).suitable(url)
+
+
+class HitRecordIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?hitrecord\\.org/records/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.hitrecord'
+    IE_NAME = 'HitRecord'
+    _URL_LITERALS = ('hitrecord.org/records/',)
+
+
+class HornBunnyIE(LazyLoadExtractor):
+    _VALID_URL = 'http?://(?:www\\.)?hornbunny\\.com/videos/(?P<title_dash>[a-z-]+)-(?P<id>\\d+)\\.html'
+    _module = 'youtube_dl.extractor.hornbunny'
+    IE_NAME = 'HornBunny'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('hornbunny.com/videos/',)
+
+
+class HotNewHipHopIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?hotnewhiphop\\.com/.*\\.(?P<id>.*)\\.html'
+    _module = 'youtube_dl.extractor.hotnewhiphop'
+    IE_NAME = 'HotNewHipHop'
+    _URL_LITERALS = ('hotnewhiphop.com/',)
+
+
+class HotStarBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.hotstar'
+    IE_NAME = 'HotStarBase'
+    _URL_LITERALS = None
+
+
+class HotStarIE(HotStarBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?hotstar\\.com/(?:.+?[/-])?(?P<id>\\d{10})'
+    _module = 'youtube_dl.extractor.hotstar'
+    IE_NAME = 'hotstar'
+    _URL_LITERALS = ('hotstar.com/',)
+
+
+class HotStarPlaylistIE(HotStarBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?hotstar\\.com/tv/[^/]+/s-\\w+/list/[^/]+/t-(?P<id>\\w+)'
+    _module = 'youtube_dl.extractor.hotstar'
+    IE_NAME = 'hotstar:playlist'
+    _URL_LITERALS = ('hotstar.com/tv/',)
+
+
+class HowcastIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?howcast\\.com/videos/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.howcast'
+    IE_NAME = 'Howcast'
+    _URL_LITERALS = ('howcast.com/videos/',)
+
+
+class HowStuffWorksIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://[\\da-z-]+\\.(?:howstuffworks|stuff(?:(?:youshould|theydontwantyouto)know|toblowyourmind|momnevertoldyou)|(?:brain|car)stuffshow|fwthinking|geniusstuff)\\.com/(?:[^/]+/)*(?:\\d+-)?(?P<id>.+?)-video\\.htm'
+    _module = 'youtube_dl.extractor.howstuffworks'
+    IE_NAME = 'HowStuffWorks'
+    _URL_LITERALS = ('-video.htm',)
+
+
+class HRTiBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.hrti'
+    IE_NAME = 'HRTiBase'
+    _URL_LITERALS = None
+
+
+class HRTiIE(HRTiBaseIE):
+    _VALID_URL = '(?x)\n                        (?:\n                            hrti:(?P<short_id>[0-9]+)|\n                            https?://\n                                hrti\\.hrt\\.hr/(?:\\#/)?video/show/(?P<id>[0-9]+)/(?P<display_id>[^/]+)?\n                        )\n                    '
+    _module = 'youtube_dl.extractor.hrti'
+    IE_NAME = 'HRTi'
+    _AGE_LIMIT = 12
+    _URL_LITERALS = ('://hrti.hrt.hr/', 'rti:')
+
+
+class HRTiPlaylistIE(HRTiBaseIE):
+    _VALID_URL = 'https?://hrti\\.hrt\\.hr/(?:#/)?video/list/category/(?P<id>[0-9]+)/(?P<display_id>[^/]+)?'
+    _module = 'youtube_dl.extractor.hrti'
+    IE_NAME = 'HRTiPlaylist'
+    _URL_LITERALS = ('://hrti.hrt.hr/',)
+
+
+class HuajiaoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?huajiao\\.com/l/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.huajiao'
+    IE_NAME = 'Huajiao'
+    IE_DESC = '花椒直播'
+    _URL_LITERALS = ('huajiao.com/l/',)
+
+
+class HuffPostIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        https?://(embed\\.)?live\\.huffingtonpost\\.com/\n        (?:\n            r/segment/[^/]+/|\n            HPLEmbedPlayer/\\?segmentId=\n        )\n        (?P<id>[0-9a-f]+)'
+    _module = 'youtube_dl.extractor.huffpost'
+    IE_NAME = 'HuffPost'
+    IE_DESC = 'Huffington Post'
+    _URL_LITERALS = ('live.huffingtonpost.com/',)
+
+
+class HungamaIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?hungama\\.com/\n                        (?:\n                            (?:video|movie)/[^/]+/|\n                            tv-show/(?:[^/]+/){2}\\d+/episode/[^/]+/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.hungama'
+    IE_NAME = 'Hungama'
+    _URL_LITERALS = ('hungama.com/',)
+
+
+class HungamaSongIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?hungama\\.com/song/[^/]+/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.hungama'
+    IE_NAME = 'HungamaSong'
+    _URL_LITERALS = ('hungama.com/song/',)
+
+
+class HypemIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?hypem\\.com/track/(?P<id>[0-9a-z]{5})'
+    _module = 'youtube_dl.extractor.hypem'
+    IE_NAME = 'Hypem'
+    _URL_LITERALS = ('hypem.com/track/',)
+
+
+class IGNIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://.+?\\.ign\\.com/(?:[^/]+/)?(?P<type>videos|show_videos|articles|feature|(?:[^/]+/\\d+/video))(/.+)?/(?P<name_or_id>.+)'
+    _module = 'youtube_dl.extractor.ign'
+    IE_NAME = 'ign.com'
+    _URL_LITERALS = ('.ign.com/',)
+
+
+class OneUPIE(IGNIE):
+    _VALID_URL = 'https?://gamevideos\\.1up\\.com/(?P<type>video)/id/(?P<name_or_id>.+)\\.html'
+    _module = 'youtube_dl.extractor.ign'
+    IE_NAME = '1up.com'
+    _URL_LITERALS = ('://gamevideos.1up.com/',)
+
+
+class PCMagIE(IGNIE):
+    _VALID_URL = 'https?://(?:www\\.)?pcmag\\.com/(?P<type>videos|article2)(/.+)?/(?P<name_or_id>.+)'
+    _module = 'youtube_dl.extractor.ign'
+    IE_NAME = 'pcmag'
+    _URL_LITERALS = ('pcmag.com/',)
+
+
+class ImdbIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www|m)\\.imdb\\.com/(?:video|title|list).+?[/-]vi(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.imdb'
+    IE_NAME = 'imdb'
+    IE_DESC = 'Internet Movie Database trailers'
+    _URL_LITERALS = ('.imdb.com/',)
+
+
+class ImdbListIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?imdb\\.com/list/ls(?P<id>\\d{9})(?!/videoplayer/vi\\d+)'
+    _module = 'youtube_dl.extractor.imdb'
+    IE_NAME = 'imdb:list'
+    IE_DESC = 'Internet Movie Database lists'
+    _URL_LITERALS = ('imdb.com/list/ls',)
+
+
+class ImgurIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:i\\.)?imgur\\.com/(?!(?:a|gallery|(?:t(?:opic)?|r)/[^/]+)/)(?P<id>[a-zA-Z0-9]+)'
+    _module = 'youtube_dl.extractor.imgur'
+    IE_NAME = 'Imgur'
+    _URL_LITERALS = ('imgur.com/',)
+
+
+class ImgurGalleryIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:i\\.)?imgur\\.com/(?:gallery|(?:t(?:opic)?|r)/[^/]+)/(?P<id>[a-zA-Z0-9]+)'
+    _module = 'youtube_dl.extractor.imgur'
+    IE_NAME = 'imgur:gallery'
+    _URL_LITERALS = ('imgur.com/',)
+
+
+class ImgurAlbumIE(ImgurGalleryIE):
+    _VALID_URL = 'https?://(?:i\\.)?imgur\\.com/a/(?P<id>[a-zA-Z0-9]+)'
+    _module = 'youtube_dl.extractor.imgur'
+    IE_NAME = 'imgur:album'
+    _URL_LITERALS = ('imgur.com/a/',)
+
+
+class InaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ina\\.fr/(?:video|audio)/(?P<id>[A-Z0-9_]+)'
+    _module = 'youtube_dl.extractor.ina'
+    IE_NAME = 'Ina'
+    _URL_LITERALS = ('ina.fr/',)
+
+
+class IncIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?inc\\.com/(?:[^/]+/)+(?P<id>[^.]+).html'
+    _module = 'youtube_dl.extractor.inc'
+    IE_NAME = 'Inc'
+    _URL_LITERALS = ('inc.com/',)
+
+
+class IndavideoEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:embed\\.)?indavideo\\.hu/player/video/|assets\\.indavideo\\.hu/swf/player\\.swf\\?.*\\b(?:v(?:ID|id))=)(?P<id>[\\da-f]+)'
+    _module = 'youtube_dl.extractor.indavideo'
+    IE_NAME = 'IndavideoEmbed'
+    _URL_LITERALS = ('assets.indavideo.hu/swf/player.swf?', 'indavideo.hu/player/video/')
+
+
+class InfoQIE(BokeCCBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?infoq\\.com/(?:[^/]+/)+(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.infoq'
+    IE_NAME = 'InfoQ'
+    _URL_LITERALS = ('infoq.com/',)
+
+
+class InstagramIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<url>https?://(?:www\\.)?instagram\\.com/(?:p|tv)/(?P<id>[^/?#&]+))'
+    _module = 'youtube_dl.extractor.instagram'
+    IE_NAME = 'Instagram'
+    _URL_LITERALS = ('instagram.com/',)
+
+
+class InstagramPlaylistIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.instagram'
+    IE_NAME = 'InstagramPlaylist'
+    _URL_LITERALS = None
+
+
+class InstagramUserIE(InstagramPlaylistIE):
+    _VALID_URL = 'https?://(?:www\\.)?instagram\\.com/(?P<id>[^/]{2,})/?(?:$|[?#])'
+    _module = 'youtube_dl.extractor.instagram'
+    IE_NAME = 'instagram:user'
+    IE_DESC = 'Instagram user profile'
+    _URL_LITERALS = ('instagram.com/',)
+
+
+class InstagramTagIE(InstagramPlaylistIE):
+    _VALID_URL = 'https?://(?:www\\.)?instagram\\.com/explore/tags/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.instagram'
+    IE_NAME = 'instagram:tag'
+    IE_DESC = 'Instagram hashtag search'
+    _URL_LITERALS = ('instagram.com/explore/tags/',)
+
+
+class InternazionaleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?internazionale\\.it/video/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.internazionale'
+    IE_NAME = 'Internazionale'
+    _URL_LITERALS = ('internazionale.it/video/',)
+
+
+class InternetVideoArchiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.internetvideoarchive\\.net/(?:player|flash/players)/.*?\\?.*?publishedid.*?'
+    _module = 'youtube_dl.extractor.internetvideoarchive'
+    IE_NAME = 'InternetVideoArchive'
+    _URL_LITERALS = ('://video.internetvideoarchive.net/',)
+
+
+class IPrimaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+)\\.iprima\\.cz/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.iprima'
+    IE_NAME = 'IPrima'
+    _URL_LITERALS = ('.iprima.cz/',)
+
+
+class IqiyiIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:[^.]+\\.)?iqiyi\\.com|www\\.pps\\.tv)/.+\\.html'
+    _module = 'youtube_dl.extractor.iqiyi'
+    IE_NAME = 'iqiyi'
+    IE_DESC = '爱奇艺'
+    _URL_LITERALS = ('iqiyi.com', 'www.pps.tv')
+
+
+class Ir90TvIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?90tv\\.ir/video/(?P<id>[0-9]+)/.*'
+    _module = 'youtube_dl.extractor.ir90tv'
+    IE_NAME = 'Ir90Tv'
+    _URL_LITERALS = ('90tv.ir/video/',)
+
+
+class ITVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?itv\\.com/hub/[^/]+/(?P<id>[0-9a-zA-Z]+)'
+    _module = 'youtube_dl.extractor.itv'
+    IE_NAME = 'ITV'
+    _URL_LITERALS = ('itv.com/hub/',)
+
+
+class ITVBTCCIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?itv\\.com/btcc/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.itv'
+    IE_NAME = 'ITVBTCC'
+    _URL_LITERALS = ('itv.com/btcc/',)
+
+
+class IviIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ivi\\.(?:ru|tv)/(?:watch/(?:[^/]+/)?|video/player\\?.*?videoId=)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.ivi'
+    IE_NAME = 'ivi'
+    IE_DESC = 'ivi.ru'
+    _URL_LITERALS = ('ivi.',)
+
+
+class IviCompilationIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ivi\\.ru/watch/(?!\\d+)(?P<compilationid>[a-z\\d_-]+)(?:/season(?P<seasonid>\\d+))?$'
+    _module = 'youtube_dl.extractor.ivi'
+    IE_NAME = 'ivi:compilation'
+    IE_DESC = 'ivi.ru compilations'
+    _URL_LITERALS = ('ivi.ru/watch/',)
+
+
+class IvideonIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ivideon\\.com/tv/(?:[^/]+/)*camera/(?P<id>\\d+-[\\da-f]+)/(?P<camera_id>\\d+)'
+    _module = 'youtube_dl.extractor.ivideon'
+    IE_NAME = 'ivideon'
+    IE_DESC = 'Ivideon TV'
+    _URL_LITERALS = ('ivideon.com/tv/',)
+
+
+class IwaraIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.|ecchi\\.)?iwara\\.tv/videos/(?P<id>[a-zA-Z0-9]+)'
+    _module = 'youtube_dl.extractor.iwara'
+    IE_NAME = 'Iwara'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('iwara.tv/videos/',)
+
+
+class IzleseneIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        https?://(?:(?:www|m)\\.)?izlesene\\.com/\n        (?:video|embedplayer)/(?:[^/]+/)?(?P<id>[0-9]+)\n        '
+    _module = 'youtube_dl.extractor.izlesene'
+    IE_NAME = 'Izlesene'
+    _URL_LITERALS = ('izlesene.com/',)
+
+
+class JamendoIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            licensing\\.jamendo\\.com/[^/]+|\n                            (?:www\\.)?jamendo\\.com\n                        )\n                        /track/(?P<id>[0-9]+)(?:/(?P<display_id>[^/?#&]+))?\n                    '
+    _module = 'youtube_dl.extractor.jamendo'
+    IE_NAME = 'Jamendo'
+    _URL_LITERALS = ('jamendo.com', 'licensing.jamendo.com/')
+
+
+class JamendoAlbumIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?jamendo\\.com/album/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.jamendo'
+    IE_NAME = 'JamendoAlbum'
+    _URL_LITERALS = ('jamendo.com/album/',)
+
+
+class JeuxVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://.*?\\.jeuxvideo\\.com/.*/(.*?)\\.htm'
+    _module = 'youtube_dl.extractor.jeuxvideo'
+    IE_NAME = 'JeuxVideo'
+    _URL_LITERALS = ('.jeuxvideo.com/',)
+
+
+class JoveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?jove\\.com/video/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.jove'
+    IE_NAME = 'Jove'
+    _URL_LITERALS = ('jove.com/video/',)
+
+
+class JojIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    (?:\n                        joj:|\n                        https?://media\\.joj\\.sk/embed/\n                    )\n                    (?P<id>[^/?#^]+)\n                '
+    _module = 'youtube_dl.extractor.joj'
+    IE_NAME = 'Joj'
+    _URL_LITERALS = ('://media.joj.sk/embed/', 'joj:')
+
+
+class JWPlatformIE(LazyLoadExtractor):
+    _VALID_URL = '(?:https?://(?:content\\.jwplatform|cdn\\.jwplayer)\\.com/(?:(?:feed|player|thumb|preview)s|jw6|v2/media)/|jwplatform:)(?P<id>[a-zA-Z0-9]{8})'
+    _module = 'youtube_dl.extractor.jwplatform'
+    IE_NAME = 'JWPlatform'
+    _URL_LITERALS = ('dn.jwplayer', 'jwplatform:', 'ontent.jwplatform')
+
+
+class JpopsukiIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?jpopsuki\\.tv/(?:category/)?video/[^/]+/(?P<id>\\S+)'
+    _module = 'youtube_dl.extractor.jpopsukitv'
+    IE_NAME = 'jpopsuki.tv'
+    _URL_LITERALS = ('jpopsuki.tv/',)
+
+
+class KakaoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:play-)?tv\\.kakao\\.com/(?:channel/\\d+|embed/player)/cliplink/(?P<id>\\d+|[^?#&]+@my)'
+    _module = 'youtube_dl.extractor.kakao'
+    IE_NAME = 'Kakao'
+    _URL_LITERALS = ('tv.kakao.com/',)
+
+
+class KalturaIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                (?:\n                    kaltura:(?P<partner_id>\\d+):(?P<id>[0-9a-z_]+)|\n                    https?://\n                        (:?(?:www|cdnapi(?:sec)?)\\.)?kaltura\\.com(?::\\d+)?/\n                        (?:\n                            (?:\n                                # flash player\n                                index\\.php/(?:kwidget|extwidget/preview)|\n                                # html5 player\n                                html5/html5lib/[^/]+/mwEmbedFrame\\.php\n                            )\n                        )(?:/(?P<path>[^?]+))?(?:\\?(?P<query>.*))?\n                )\n                '
+    _module = 'youtube_dl.extractor.kaltura'
+    IE_NAME = 'Kaltura'
+    _URL_LITERALS = ('kaltura.com', 'kaltura:')
+
+
+class KanalPlayIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?kanal(?P<channel_id>5|9|11)play\\.se/(?:#!/)?(?:play/)?program/\\d+/video/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.kanalplay'
+    IE_NAME = 'KanalPlay'
+    IE_DESC = 'Kanal 5/9/11 Play'
+    _URL_LITERALS = ('play.se/',)
+
+
+class KankanIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.*?\\.)?kankan\\.com/.+?/(?P<id>\\d+)\\.shtml'
+    _module = 'youtube_dl.extractor.kankan'
+    IE_NAME = 'Kankan'
+    _URL_LITERALS = ('kankan.com/',)
+
+
+class KaraoketvIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?karaoketv\\.co\\.il/[^/]+/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.karaoketv'
+    IE_NAME = 'Karaoketv'
+    _URL_LITERALS = ('karaoketv.co.il/',)
+
+
+class KarriereVideosIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?karrierevideos\\.at(?:/[^/]+)+/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.karrierevideos'
+    IE_NAME = 'KarriereVideos'
+    _URL_LITERALS = ('karrierevideos.at',)
+
+
+class KeezMoviesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?keezmovies\\.com/video/(?:(?P<display_id>[^/]+)-)?(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.keezmovies'
+    IE_NAME = 'KeezMovies'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('keezmovies.com/video/',)
+
+
+class ExtremeTubeIE(KeezMoviesIE):
+    _VALID_URL = 'https?://(?:www\\.)?extremetube\\.com/(?:[^/]+/)?video/(?P<id>[^/#?&]+)'
+    _module = 'youtube_dl.extractor.extremetube'
+    IE_NAME = 'ExtremeTube'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('extremetube.com/',)
+
+
+class KetnetIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ketnet\\.be/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.ketnet'
+    IE_NAME = 'Ketnet'
+    _URL_LITERALS = ('ketnet.be/',)
+
+
+class KhanAcademyIE(LazyLoadExtractor):
+    _VALID_URL = '^https?://(?:(?:www|api)\\.)?khanacademy\\.org/(?P<key>[^/]+)/(?:[^/]+/){,2}(?P<id>[^?#/]+)(?:$|[?#])'
+    _module = 'youtube_dl.extractor.khanacademy'
+    IE_NAME = 'KhanAcademy'
+    _URL_LITERALS = ('khanacademy.org/',)
+
+
+class KickStarterIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?kickstarter\\.com/projects/(?P<id>[^/]*)/.*'
+    _module = 'youtube_dl.extractor.kickstarter'
+    IE_NAME = 'KickStarter'
+    _URL_LITERALS = ('kickstarter.com/projects/',)
+
+
+class KinjaEmbedIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://(?:[^.]+\\.)?\n        (?:\n            avclub|\n            clickhole|\n            deadspin|\n            gizmodo|\n            jalopnik|\n            jezebel|\n            kinja|\n            kotaku|\n            lifehacker|\n            splinternews|\n            the(?:inventory|onion|root|takeout)\n        )\\.com/\n        (?:\n            ajax/inset|\n            embed/video\n        )/iframe\\?.*?\\bid=\n        (?P<type>\n            fb|\n            imgur|\n            instagram|\n            jwp(?:layer)?-video|\n            kinjavideo|\n            mcp|\n            megaphone|\n            ooyala|\n            soundcloud(?:-playlist)?|\n            tumblr-post|\n            twitch-stream|\n            twitter|\n            ustream-channel|\n            vimeo|\n            vine|\n            youtube-(?:list|video)\n        )-(?P<id>[^&]+)'
+    _module = 'youtube_dl.extractor.kinja'
+    IE_NAME = 'KinjaEmbed'
+    _URL_LITERALS = ('.com/',)
+
+
+class KinoPoiskIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?kinopoisk\\.ru/film/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.kinopoisk'
+    IE_NAME = 'KinoPoisk'
+    _AGE_LIMIT = 12
+    _URL_LITERALS = ('kinopoisk.ru/film/',)
+
+
+class KonserthusetPlayIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:konserthusetplay|rspoplay)\\.se/\\?.*\\bm=(?P<id>[^&]+)'
+    _module = 'youtube_dl.extractor.konserthusetplay'
+    IE_NAME = 'KonserthusetPlay'
+    _URL_LITERALS = ('.se/?',)
+
+
+class KontrTubeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?kontrtube\\.ru/videos/(?P<id>\\d+)/(?P<display_id>[^/]+)/'
+    _module = 'youtube_dl.extractor.kontrtube'
+    IE_NAME = 'kontrtube'
+    IE_DESC = 'KontrTube.ru - Труба зовёт'
+    _URL_LITERALS = ('kontrtube.ru/videos/',)
+
+
+class KrasViewIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://krasview\\.ru/(?:video|embed)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.krasview'
+    IE_NAME = 'KrasView'
+    IE_DESC = 'Красвью'
+    _URL_LITERALS = ('://krasview.ru/',)
+
+
+class Ku6IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://v\\.ku6\\.com/show/(?P<id>[a-zA-Z0-9\\-\\_]+)(?:\\.)*html'
+    _module = 'youtube_dl.extractor.ku6'
+    IE_NAME = 'Ku6'
+    _URL_LITERALS = ('://v.ku6.com/show/',)
+
+
+class KUSIIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?kusi\\.com/(?P<path>story/.+|video\\?clipId=(?P<clipId>\\d+))'
+    _module = 'youtube_dl.extractor.kusi'
+    IE_NAME = 'KUSI'
+    _URL_LITERALS = ('kusi.com/',)
+
+
+class KuwoBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.kuwo'
+    IE_NAME = 'KuwoBase'
+    _URL_LITERALS = None
+
+
+class KuwoIE(KuwoBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?kuwo\\.cn/yinyue/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.kuwo'
+    IE_NAME = 'kuwo:song'
+    IE_DESC = '酷我音乐'
+    _URL_LITERALS = ('kuwo.cn/yinyue/',)
+
+
+class KuwoAlbumIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?kuwo\\.cn/album/(?P<id>\\d+?)/'
+    _module = 'youtube_dl.extractor.kuwo'
+    IE_NAME = 'kuwo:album'
+    IE_DESC = '酷我音乐 - 专辑'
+    _URL_LITERALS = ('kuwo.cn/album/',)
+
+
+class KuwoChartIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://yinyue\\.kuwo\\.cn/billboard_(?P<id>[^.]+).htm'
+    _module = 'youtube_dl.extractor.kuwo'
+    IE_NAME = 'kuwo:chart'
+    IE_DESC = '酷我音乐 - 排行榜'
+    _URL_LITERALS = ('://yinyue.kuwo.cn/billboard_',)
+
+
+class KuwoSingerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?kuwo\\.cn/mingxing/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.kuwo'
+    IE_NAME = 'kuwo:singer'
+    IE_DESC = '酷我音乐 - 歌手'
+    _URL_LITERALS = ('kuwo.cn/mingxing/',)
+
+
+class KuwoCategoryIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://yinyue\\.kuwo\\.cn/yy/cinfo_(?P<id>\\d+?).htm'
+    _module = 'youtube_dl.extractor.kuwo'
+    IE_NAME = 'kuwo:category'
+    IE_DESC = '酷我音乐 - 分类'
+    _URL_LITERALS = ('://yinyue.kuwo.cn/yy/cinfo_',)
+
+
+class KuwoMvIE(KuwoBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?kuwo\\.cn/mv/(?P<id>\\d+?)/'
+    _module = 'youtube_dl.extractor.kuwo'
+    IE_NAME = 'kuwo:mv'
+    IE_DESC = '酷我音乐 - MV'
+    _URL_LITERALS = ('kuwo.cn/mv/',)
+
+
+class LA7IE(LazyLoadExtractor):
+    _VALID_URL = '(?x)(https?://)?(?:\n        (?:www\\.)?la7\\.it/([^/]+)/(?:rivedila7|video)/|\n        tg\\.la7\\.it/repliche-tgla7\\?id=\n    )(?P<id>.+)'
+    _module = 'youtube_dl.extractor.la7'
+    IE_NAME = 'la7.it'
+    _URL_LITERALS = ('la7.it/', 'tg.la7.it/repliche-tgla7?id=')
+
+
+class Laola1TvEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?laola1\\.tv/titanplayer\\.php\\?.*?\\bvideoid=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.laola1tv'
+    IE_NAME = 'laola1tv:embed'
+    _URL_LITERALS = ('laola1.tv/titanplayer.php?',)
+
+
+class Laola1TvBaseIE(Laola1TvEmbedIE):
+    _VALID_URL = 'https?://(?:www\\.)?laola1\\.tv/titanplayer\\.php\\?.*?\\bvideoid=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.laola1tv'
+    IE_NAME = 'laola1tv:embed'
+    _URL_LITERALS = ('laola1.tv/titanplayer.php?',)
+
+
+class Laola1TvIE(Laola1TvBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?laola1\\.tv/[a-z]+-[a-z]+/[^/]+/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.laola1tv'
+    IE_NAME = 'laola1tv'
+    _URL_LITERALS = ('laola1.tv/',)
+
+
+class EHFTVIE(Laola1TvBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?ehftv\\.com/[a-z]+(?:-[a-z]+)?/[^/]+/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.laola1tv'
+    IE_NAME = 'ehftv'
+    _URL_LITERALS = ('ehftv.com/',)
+
+
+class ITTFIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://tv\\.ittf\\.com/video/[^/]+/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.laola1tv'
+    IE_NAME = 'ITTF'
+    _URL_LITERALS = ('://tv.ittf.com/video/',)
+
+
+class LCIIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?lci\\.fr/[^/]+/[\\w-]+-(?P<id>\\d+)\\.html'
+    _module = 'youtube_dl.extractor.lci'
+    IE_NAME = 'LCI'
+    _URL_LITERALS = ('lci.fr/',)
+
+
+class LcpPlayIE(ArkenaIE):
+    _VALID_URL = 'https?://play\\.lcp\\.fr/embed/(?P<id>[^/]+)/(?P<account_id>[^/]+)/[^/]+/[^/]+'
+    _module = 'youtube_dl.extractor.lcp'
+    IE_NAME = 'LcpPlay'
+    _URL_LITERALS = ('://play.lcp.fr/embed/',)
+
+
+class LcpIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?lcp\\.fr/(?:[^/]+/)*(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.lcp'
+    IE_NAME = 'Lcp'
+    _URL_LITERALS = ('lcp.fr/',)
+
+
+class Lecture2GoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://lecture2go\\.uni-hamburg\\.de/veranstaltungen/-/v/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.lecture2go'
+    IE_NAME = 'Lecture2Go'
+    _URL_LITERALS = ('://lecture2go.uni-hamburg.de/veranstaltungen/-/v/',)
+
+
+class LecturioBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.lecturio'
+    IE_NAME = 'LecturioBase'
+    _URL_LITERALS = None
+
+
+class LecturioIE(LecturioBaseIE):
+    _VALID_URL = '(?x)\n                    https://\n                        (?:\n                            app\\.lecturio\\.com/([^/]+/(?P<nt>[^/?#&]+)\\.lecture|(?:\\#/)?lecture/c/\\d+/(?P<id>\\d+))|\n                            (?:www\\.)?lecturio\\.de/[^/]+/(?P<nt_de>[^/?#&]+)\\.vortrag\n                        )\n                    '
+    _module = 'youtube_dl.extractor.lecturio'
+    IE_NAME = 'Lecturio'
+    _URL_LITERALS = ('app.lecturio.com/', 'lecturio.de/')
+
+
+class LecturioCourseIE(LecturioBaseIE):
+    _VALID_URL = 'https://app\\.lecturio\\.com/(?:[^/]+/(?P<nt>[^/?#&]+)\\.course|(?:#/)?course/c/(?P<id>\\d+))'
+    _module = 'youtube_dl.extractor.lecturio'
+    IE_NAME = 'LecturioCourse'
+    _URL_LITERALS = ('https://app.lecturio.com/',)
+
+
+class LecturioDeCourseIE(LecturioBaseIE):
+    _VALID_URL = 'https://(?:www\\.)?lecturio\\.de/[^/]+/(?P<id>[^/?#&]+)\\.kurs'
+    _module = 'youtube_dl.extractor.lecturio'
+    IE_NAME = 'LecturioDeCourse'
+    _URL_LITERALS = ('lecturio.de/',)
+
+
+class LeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.le\\.com/ptv/vplay|(?:sports\\.le|(?:www\\.)?lesports)\\.com/(?:match|video))/(?P<id>\\d+)\\.html'
+    _module = 'youtube_dl.extractor.leeco'
+    IE_NAME = 'Le'
+    IE_DESC = '乐视网'
+    _URL_LITERALS = ('.html',)
+
+
+class LePlaylistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://[a-z]+\\.le\\.com/(?!video)[a-z]+/(?P<id>[a-z0-9_]+)'
+    _module = 'youtube_dl.extractor.leeco'
+    IE_NAME = 'LePlaylist'
+    _URL_LITERALS = ('.le.com/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if LeIE.suitable(url) else super(LePlaylistIE, cls).suitable(url)
+
+
+class LetvCloudIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://yuntv\\.letv\\.com/bcloud.html\\?.+'
+    _module = 'youtube_dl.extractor.leeco'
+    IE_NAME = 'LetvCloud'
+    IE_DESC = '乐视云'
+    _URL_LITERALS = ('://yuntv.letv.com/bcloud',)
+
+
+class LEGOIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?lego\\.com/(?P<locale>[^/]+)/(?:[^/]+/)*videos/(?:[^/]+/)*[^/?#]+-(?P<id>[0-9a-f]+)'
+    _module = 'youtube_dl.extractor.lego'
+    IE_NAME = 'LEGO'
+    _URL_LITERALS = ('lego.com/',)
+
+
+class LemondeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?lemonde\\.fr/(?:[^/]+/)*(?P<id>[^/]+)\\.html'
+    _module = 'youtube_dl.extractor.lemonde'
+    IE_NAME = 'Lemonde'
+    _URL_LITERALS = ('lemonde.fr/',)
+
+
+class LentaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?lenta\\.ru/[^/]+/\\d+/\\d+/\\d+/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.lenta'
+    IE_NAME = 'Lenta'
+    _URL_LITERALS = ('lenta.ru/',)
+
+
+class LibraryOfCongressIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?loc\\.gov/(?:item/|today/cyberlc/feature_wdesc\\.php\\?.*\\brec=)(?P<id>[0-9a-z_.]+)'
+    _module = 'youtube_dl.extractor.libraryofcongress'
+    IE_NAME = 'loc'
+    IE_DESC = 'Library of Congress'
+    _URL_LITERALS = ('loc.gov/',)
+
+
+class LibsynIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<mainurl>https?://html5-player\\.libsyn\\.com/embed/episode/id/(?P<id>[0-9]+))'
+    _module = 'youtube_dl.extractor.libsyn'
+    IE_NAME = 'Libsyn'
+    _URL_LITERALS = ('://html5-player.libsyn.com/embed/episode/id/',)
+
+
+class LifeNewsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://life\\.ru/t/[^/]+/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.lifenews'
+    IE_NAME = 'life'
+    IE_DESC = 'Life.ru'
+    _URL_LITERALS = ('://life.ru/t/',)
+
+
+class LifeEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://embed\\.life\\.ru/(?:embed|video)/(?P<id>[\\da-f]{32})'
+    _module = 'youtube_dl.extractor.lifenews'
+    IE_NAME = 'life:embed'
+    _URL_LITERALS = ('://embed.life.ru/',)
+
+
+class LimelightBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.limelight'
+    IE_NAME = 'LimelightBase'
+    _URL_LITERALS = None
+
+
+class LimelightMediaIE(LimelightBaseIE):
+    _VALID_URL = '(?x)\n                        (?:\n                            limelight:media:|\n                            https?://\n                                (?:\n                                    link\\.videoplatform\\.limelight\\.com/media/|\n                                    assets\\.delvenetworks\\.com/player/loader\\.swf\n                                )\n                                \\?.*?\\bmediaId=\n                        )\n                        (?P<id>[a-z0-9]{32})\n                    '
+    _module = 'youtube_dl.extractor.limelight'
+    IE_NAME = 'limelight'
+    _URL_LITERALS = ('assets.delvenetworks.com/player/loader.swf', 'limelight:media:', 'link.videoplatform.limelight.com/media/')
+
+
+class LimelightChannelIE(LimelightBaseIE):
+    _VALID_URL = '(?x)\n                        (?:\n                            limelight:channel:|\n                            https?://\n                                (?:\n                                    link\\.videoplatform\\.limelight\\.com/media/|\n                                    assets\\.delvenetworks\\.com/player/loader\\.swf\n                                )\n                                \\?.*?\\bchannelId=\n                        )\n                        (?P<id>[a-z0-9]{32})\n                    '
+    _module = 'youtube_dl.extractor.limelight'
+    IE_NAME = 'limelight:channel'
+    _URL_LITERALS = ('assets.delvenetworks.com/player/loader.swf', 'limelight:channel:', 'link.videoplatform.limelight.com/media/')
+
+
+class LimelightChannelListIE(LimelightBaseIE):
+    _VALID_URL = '(?x)\n                        (?:\n                            limelight:channel_list:|\n                            https?://\n                                (?:\n                                    link\\.videoplatform\\.limelight\\.com/media/|\n                                    assets\\.delvenetworks\\.com/player/loader\\.swf\n                                )\n                                \\?.*?\\bchannelListId=\n                        )\n                        (?P<id>[a-z0-9]{32})\n                    '
+    _module = 'youtube_dl.extractor.limelight'
+    IE_NAME = 'limelight:channel_list'
+    _URL_LITERALS = ('assets.delvenetworks.com/player/loader.swf', 'limelight:channel_list:', 'link.videoplatform.limelight.com/media/')
+
+
+class LineTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://tv\\.line\\.me/v/(?P<id>\\d+)_[^/]+-(?P<segment>ep\\d+-\\d+)'
+    _module = 'youtube_dl.extractor.line'
+    IE_NAME = 'LineTV'
+    _URL_LITERALS = ('://tv.line.me/v/',)
+
+
+class LinkedInLearningBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.linkedin'
+    IE_NAME = 'LinkedInLearningBase'
+    _URL_LITERALS = None
+
+
+class LinkedInLearningIE(LinkedInLearningBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?linkedin\\.com/learning/(?P<course_slug>[^/]+)/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.linkedin'
+    IE_NAME = 'linkedin:learning'
+    _URL_LITERALS = ('linkedin.com/learning/',)
+
+
+class LinkedInLearningCourseIE(LinkedInLearningBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?linkedin\\.com/learning/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.linkedin'
+    IE_NAME = 'linkedin:learning:course'
+    _URL_LITERALS = ('linkedin.com/learning/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if LinkedInLearningIE.suitable(url) else super(LinkedInLearningCourseIE, cls).suitable(url)
+
+
+class LinuxAcademyIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?linuxacademy\\.com/cp/\n                        (?:\n                            courses/lesson/course/(?P<chapter_id>\\d+)/lesson/(?P<lesson_id>\\d+)|\n                            modules/view/id/(?P<course_id>\\d+)\n                        )\n                    '
+    _module = 'youtube_dl.extractor.linuxacademy'
+    IE_NAME = 'LinuxAcademy'
+    _URL_LITERALS = ('linuxacademy.com/cp/',)
+
+
+class LiTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?litv\\.tv/(?:vod|promo)/[^/]+/(?:content\\.do)?\\?.*?\\b(?:content_)?id=(?P<id>[^&]+)'
+    _module = 'youtube_dl.extractor.litv'
+    IE_NAME = 'LiTV'
+    _URL_LITERALS = ('litv.tv/',)
+
+
+class LiveJournalIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^.]+\\.)?livejournal\\.com/video/album/\\d+.+?\\bid=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.livejournal'
+    IE_NAME = 'LiveJournal'
+    _URL_LITERALS = ('livejournal.com/video/album/',)
+
+
+class LiveLeakIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:\\w+\\.)?liveleak\\.com/view\\?.*?\\b[it]=(?P<id>[\\w_]+)'
+    _module = 'youtube_dl.extractor.liveleak'
+    IE_NAME = 'LiveLeak'
+    _URL_LITERALS = ('liveleak.com/view?',)
+
+
+class LiveLeakEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?liveleak\\.com/ll_embed\\?.*?\\b(?P<kind>[ift])=(?P<id>[\\w_]+)'
+    _module = 'youtube_dl.extractor.liveleak'
+    IE_NAME = 'LiveLeakEmbed'
+    _URL_LITERALS = ('liveleak.com/ll_embed?',)
+
+
+class LivestreamIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:new\\.)?livestream\\.com/(?:accounts/(?P<account_id>\\d+)|(?P<account_name>[^/]+))/(?:events/(?P<event_id>\\d+)|(?P<event_name>[^/]+))(?:/videos/(?P<id>\\d+))?'
+    _module = 'youtube_dl.extractor.livestream'
+    IE_NAME = 'livestream'
+    _URL_LITERALS = ('livestream.com/',)
+
+
+class LivestreamOriginalIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://original\\.livestream\\.com/\n        (?P<user>[^/\\?#]+)(?:/(?P<type>video|folder)\n        (?:(?:\\?.*?Id=|/)(?P<id>.*?)(&|$))?)?\n        '
+    _module = 'youtube_dl.extractor.livestream'
+    IE_NAME = 'livestream:original'
+    _URL_LITERALS = ('://original.livestream.com/',)
+
+
+class LivestreamShortenerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://livestre\\.am/(?P<id>.+)'
+    _module = 'youtube_dl.extractor.livestream'
+    IE_NAME = 'livestream:shortener'
+    IE_DESC = False
+    _URL_LITERALS = ('://livestre.am/',)
+
+
+class LnkGoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?lnk(?:go)?\\.(?:alfa\\.)?lt/(?:visi-video/[^/]+|video)/(?P<id>[A-Za-z0-9-]+)(?:/(?P<episode_id>\\d+))?'
+    _module = 'youtube_dl.extractor.lnkgo'
+    IE_NAME = 'LnkGo'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('lt/vi',)
+
+
+class LocalNews8IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?localnews8\\.com/(?:[^/]+/)*(?P<display_id>[^/]+)/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.localnews8'
+    IE_NAME = 'LocalNews8'
+    _URL_LITERALS = ('localnews8.com/',)
+
+
+class NuevoBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.nuevo'
+    IE_NAME = 'NuevoBase'
+    _URL_LITERALS = None
+
+
+class LoveHomePornIE(NuevoBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?lovehomeporn\\.com/video/(?P<id>\\d+)(?:/(?P<display_id>[^/?#&]+))?'
+    _module = 'youtube_dl.extractor.lovehomeporn'
+    IE_NAME = 'LoveHomePorn'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('lovehomeporn.com/video/',)
+
+
+class LRTIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?lrt\\.lt/mediateka/irasas/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.lrt'
+    IE_NAME = 'lrt.lt'
+    _URL_LITERALS = ('lrt.lt/mediateka/irasas/',)
+
+
+class LyndaBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.lynda'
+    IE_NAME = 'LyndaBase'
+    _URL_LITERALS = None
+
+
+class LyndaIE(LyndaBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?(?:lynda\\.com|educourse\\.ga)/\n                        (?:\n                            (?:[^/]+/){2,3}(?P<course_id>\\d+)|\n                            player/embed\n                        )/\n                        (?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.lynda'
+    IE_NAME = 'lynda'
+    IE_DESC = 'lynda.com videos'
+    _URL_LITERALS = ('educourse.ga', 'lynda.com')
+
+
+class LyndaCourseIE(LyndaBaseIE):
+    _VALID_URL = 'https?://(?:www|m)\\.(?:lynda\\.com|educourse\\.ga)/(?P<coursepath>(?:[^/]+/){2,3}(?P<courseid>\\d+))-2\\.html'
+    _module = 'youtube_dl.extractor.lynda'
+    IE_NAME = 'lynda:course'
+    IE_DESC = 'lynda.com online courses'
+    _URL_LITERALS = ('educourse.ga', 'lynda.com')
+
+
+class M6IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?m6\\.fr/[^/]+/videos/(?P<id>\\d+)-[^\\.]+\\.html'
+    _module = 'youtube_dl.extractor.m6'
+    IE_NAME = 'm6'
+    _URL_LITERALS = ('m6.fr/',)
+
+
+class MailRuIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:(?:www|m)\\.)?my\\.mail\\.ru/\n                        (?:\n                            video/.*\\#video=/?(?P<idv1>(?:[^/]+/){3}\\d+)|\n                            (?:(?P<idv2prefix>(?:[^/]+/){2})video/(?P<idv2suffix>[^/]+/\\d+))\\.html|\n                            (?:video/embed|\\+/video/meta)/(?P<metaid>\\d+)\n                        )\n                    '
+    _module = 'youtube_dl.extractor.mailru'
+    IE_NAME = 'mailru'
+    IE_DESC = 'Видео@Mail.Ru'
+    _URL_LITERALS = ('my.mail.ru/',)
+
+
+class MailRuMusicSearchBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.mailru'
+    IE_NAME = 'MailRuMusicSearchBase'
+    _URL_LITERALS = None
+
+
+class MailRuMusicIE(MailRuMusicSearchBaseIE):
+    _VALID_URL = 'https?://my\\.mail\\.ru/music/songs/[^/?#&]+-(?P<id>[\\da-f]+)'
+    _module = 'youtube_dl.extractor.mailru'
+    IE_NAME = 'mailru:music'
+    IE_DESC = 'Музыка@Mail.Ru'
+    _URL_LITERALS = ('://my.mail.ru/music/songs/',)
+
+
+class MailRuMusicSearchIE(MailRuMusicSearchBaseIE):
+    _VALID_URL = 'https?://my\\.mail\\.ru/music/search/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.mailru'
+    IE_NAME = 'mailru:music:search'
+    IE_DESC = 'Музыка@Mail.Ru'
+    _URL_LITERALS = ('://my.mail.ru/music/search/',)
+
+
+class MallTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?mall\\.tv/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.malltv'
+    IE_NAME = 'MallTV'
+    _URL_LITERALS = ('mall.tv/',)
+
+
+class MangomoloBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.mangomolo'
+    IE_NAME = 'MangomoloBase'
+    _URL_LITERALS = None
+
+
+class MangomoloVideoIE(MangomoloBaseIE):
+    _VALID_URL = 'https?://(?:admin\\.mangomolo\\.com/analytics/index\\.php/customers/embed/|player\\.mangomolo\\.com/v1/)video\\?.*?\\bid=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.mangomolo'
+    IE_NAME = 'mangomolo:video'
+    _URL_LITERALS = ('admin.mangomolo.com/analytics/index.php/customers/embed/', 'player.mangomolo.com/v1/')
+
+
+class MangomoloLiveIE(MangomoloBaseIE):
+    _VALID_URL = 'https?://(?:admin\\.mangomolo\\.com/analytics/index\\.php/customers/embed/|player\\.mangomolo\\.com/v1/)(live|index)\\?.*?\\bchannelid=(?P<id>(?:[A-Za-z0-9+/=]|%2B|%2F|%3D)+)'
+    _module = 'youtube_dl.extractor.mangomolo'
+    IE_NAME = 'mangomolo:live'
+    _URL_LITERALS = ('admin.mangomolo.com/analytics/index.php/customers/embed/', 'player.mangomolo.com/v1/')
+
+
+class ManyVidsIE(LazyLoadExtractor):
+    _VALID_URL = '(?i)https?://(?:www\\.)?manyvids\\.com/video/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.manyvids'
+    IE_NAME = 'ManyVids'
+    _URL_LITERALS = ('manyvids.com/video/',)
+
+
+class MarkizaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?videoarchiv\\.markiza\\.sk/(?:video/(?:[^/]+/)*|embed/)(?P<id>\\d+)(?:[_/]|$)'
+    _module = 'youtube_dl.extractor.markiza'
+    IE_NAME = 'Markiza'
+    _URL_LITERALS = ('videoarchiv.markiza.sk/',)
+
+
+class MarkizaPageIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:(?:[^/]+\\.)?markiza|tvnoviny)\\.sk/(?:[^/]+/)*(?P<id>\\d+)_'
+    _module = 'youtube_dl.extractor.markiza'
+    IE_NAME = 'MarkizaPage'
+    _URL_LITERALS = ('.sk/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if MarkizaIE.suitable(url) else super(MarkizaPageIE, cls).suitable(url)
+
+
+class MassengeschmackTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?massengeschmack\\.tv/play/(?P<id>[^?&#]+)'
+    _module = 'youtube_dl.extractor.massengeschmacktv'
+    IE_NAME = 'massengeschmack.tv'
+    _URL_LITERALS = ('massengeschmack.tv/play/',)
+
+
+class MatchTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://matchtv\\.ru(?:/on-air|/?#live-player)'
+    _module = 'youtube_dl.extractor.matchtv'
+    IE_NAME = 'MatchTV'
+    _URL_LITERALS = ('://matchtv.ru',)
+
+
+class MDRIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:mdr|kika)\\.de/(?:.*)/[a-z-]+-?(?P<id>\\d+)(?:_.+?)?\\.html'
+    _module = 'youtube_dl.extractor.mdr'
+    IE_NAME = 'MDR'
+    IE_DESC = 'MDR.DE and KiKA'
+    _URL_LITERALS = ('.html',)
+
+
+class ThePlatformBaseIE(OnceIE):
+    _VALID_URL = 'https?://.+?\\.unicornmedia\\.com/now/(?:ads/vmap/)?[^/]+/[^/]+/(?P<domain_id>[^/]+)/(?P<application_id>[^/]+)/(?:[^/]+/)?(?P<media_item_id>[^/]+)/content\\.(?:once|m3u8|mp4)'
+    _module = 'youtube_dl.extractor.theplatform'
+    IE_NAME = 'ThePlatformBase'
+    _URL_LITERALS = ('.unicornmedia.com/now/',)
+
+
+class MediasetIE(ThePlatformBaseIE):
+    _VALID_URL = '(?x)\n                    (?:\n                        mediaset:|\n                        https?://\n                            (?:(?:www|static3)\\.)?mediasetplay\\.mediaset\\.it/\n                            (?:\n                                (?:video|on-demand)/(?:[^/]+/)+[^/]+_|\n                                player/index\\.html\\?.*?\\bprogramGuid=\n                            )\n                    )(?P<id>[0-9A-Z]{16,})\n                    '
+    _module = 'youtube_dl.extractor.mediaset'
+    IE_NAME = 'Mediaset'
+    _URL_LITERALS = ('mediaset:', 'mediasetplay.mediaset.it/')
+
+
+class MediasiteIE(LazyLoadExtractor):
+    _VALID_URL = '(?xi)https?://[^/]+/Mediasite/(?:Play|Showcase/(?:default|livebroadcast)/Presentation)/(?P<id>(?:[0-9a-f]{32,34}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12,14}))(?P<query>\\?[^#]+|)'
+    _module = 'youtube_dl.extractor.mediasite'
+    IE_NAME = 'Mediasite'
+    _URL_LITERALS = ('/mediasite/',)
+
+
+class MediasiteCatalogIE(LazyLoadExtractor):
+    _VALID_URL = '(?xi)\n                        (?P<url>https?://[^/]+/Mediasite)\n                        /Catalog/Full/\n                        (?P<catalog_id>(?:[0-9a-f]{32,34}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12,14}))\n                        (?:\n                            /(?P<current_folder_id>(?:[0-9a-f]{32,34}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12,14}))\n                            /(?P<root_dynamic_folder_id>(?:[0-9a-f]{32,34}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12,14}))\n                        )?\n                    '
+    _module = 'youtube_dl.extractor.mediasite'
+    IE_NAME = 'MediasiteCatalog'
+    _URL_LITERALS = ('/catalog/full/',)
+
+
+class MediasiteNamedCatalogIE(LazyLoadExtractor):
+    _VALID_URL = '(?xi)(?P<url>https?://[^/]+/Mediasite)/Catalog/catalogs/(?P<catalog_name>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.mediasite'
+    IE_NAME = 'MediasiteNamedCatalog'
+    _URL_LITERALS = ('/catalog/catalogs/',)
+
+
+class MediciIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?medici\\.tv/#!/(?P<id>[^?#&]+)'
+    _module = 'youtube_dl.extractor.medici'
+    IE_NAME = 'Medici'
+    _URL_LITERALS = ('medici.tv/#!/',)
+
+
+class MegaphoneIE(LazyLoadExtractor):
+    _VALID_URL = 'https://player\\.megaphone\\.fm/(?P<id>[A-Z0-9]+)'
+    _module = 'youtube_dl.extractor.megaphone'
+    IE_NAME = 'megaphone.fm'
+    IE_DESC = 'megaphone.fm embedded players'
+    _URL_LITERALS = ('https://player.megaphone.fm/',)
+
+
+class MeipaiIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?meipai\\.com/media/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.meipai'
+    IE_NAME = 'Meipai'
+    IE_DESC = '美拍'
+    _URL_LITERALS = ('meipai.com/media/',)
+
+
+class MelonVODIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://vod\\.melon\\.com/video/detail2\\.html?\\?.*?mvId=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.melonvod'
+    IE_NAME = 'MelonVOD'
+    _URL_LITERALS = ('://vod.melon.com/video/detail2.htm',)
+
+
+class METAIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.meta\\.ua/(?:iframe/)?(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.meta'
+    IE_NAME = 'META'
+    _URL_LITERALS = ('://video.meta.ua/',)
+
+
+class MetacafeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?metacafe\\.com/watch/(?P<video_id>[^/]+)/(?P<display_id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.metacafe'
+    IE_NAME = 'metacafe'
+    _URL_LITERALS = ('metacafe.com/watch/',)
+
+
+class MetacriticIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?metacritic\\.com/.+?/trailers/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.metacritic'
+    IE_NAME = 'Metacritic'
+    _URL_LITERALS = ('metacritic.com/',)
+
+
+class MgoonIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://(?:www\\.)?\n    (?:(:?m\\.)?mgoon\\.com/(?:ch/(?:.+)/v|play/view)|\n        video\\.mgoon\\.com)/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.mgoon'
+    IE_NAME = 'Mgoon'
+    _URL_LITERALS = ('mgoon.com/', 'video.mgoon.com')
+
+
+class MGTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?mgtv\\.com/(v|b)/(?:[^/]+/)*(?P<id>\\d+)\\.html'
+    _module = 'youtube_dl.extractor.mgtv'
+    IE_NAME = 'MGTV'
+    IE_DESC = '芒果TV'
+    _URL_LITERALS = ('mgtv.com/',)
+
+
+class MiaoPaiIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?miaopai\\.com/show/(?P<id>[-A-Za-z0-9~_]+)'
+    _module = 'youtube_dl.extractor.miaopai'
+    IE_NAME = 'MiaoPai'
+    _URL_LITERALS = ('miaopai.com/show/',)
+
+
+class MicrosoftVirtualAcademyBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.microsoftvirtualacademy'
+    IE_NAME = 'MicrosoftVirtualAcademyBase'
+    _URL_LITERALS = None
+
+
+class MicrosoftVirtualAcademyIE(MicrosoftVirtualAcademyBaseIE):
+    _VALID_URL = '(?:mva:|https?://(?:mva\\.microsoft|(?:www\\.)?microsoftvirtualacademy)\\.com/[^/]+/training-courses/[^/?#&]+-)(?P<course_id>\\d+)(?::|\\?l=)(?P<id>[\\da-zA-Z]+_\\d+)'
+    _module = 'youtube_dl.extractor.microsoftvirtualacademy'
+    IE_NAME = 'mva'
+    IE_DESC = 'Microsoft Virtual Academy videos'
+    _URL_LITERALS = ('.com/', 'mva:')
+
+
+class MicrosoftVirtualAcademyCourseIE(MicrosoftVirtualAcademyBaseIE):
+    _VALID_URL = '(?:mva:course:|https?://(?:mva\\.microsoft|(?:www\\.)?microsoftvirtualacademy)\\.com/[^/]+/training-courses/(?P<display_id>[^/?#&]+)-)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.microsoftvirtualacademy'
+    IE_NAME = 'mva:course'
+    IE_DESC = 'Microsoft Virtual Academy courses'
+    _URL_LITERALS = ('.com/', 'mva:course:')
+
+    @classmethod
+    def suitable(cls, url):
+        return False if MicrosoftVirtualAcademyIE.suitable(url) else super(
+            MicrosoftVirtualAcademyCourseIE, cls).suitable(url)
+
+
+class MinistryGridIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ministrygrid\\.com/([^/?#]*/)*(?P<id>[^/#?]+)/?(?:$|[?#])'
+    _module = 'youtube_dl.extractor.ministrygrid'
+    IE_NAME = 'MinistryGrid'
+    _URL_LITERALS = ('ministrygrid.com/',)
+
+
+class MinotoIE(LazyLoadExtractor):
+    _VALID_URL = '(?:minoto:|https?://(?:play|iframe|embed)\\.minoto-video\\.com/(?P<player_id>[0-9]+)/)(?P<id>[a-zA-Z0-9]+)'
+    _module = 'youtube_dl.extractor.minoto'
+    IE_NAME = 'Minoto'
+    _URL_LITERALS = ('.minoto-video.com/', 'minoto:')
+
+
+class MioMioIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?miomio\\.tv/watch/cc(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.miomio'
+    IE_NAME = 'miomio.tv'
+    _URL_LITERALS = ('miomio.tv/watch/cc',)
+
+
+class TechTVMITIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://techtv\\.mit\\.edu/(?:videos|embeds)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.mit'
+    IE_NAME = 'techtv.mit.edu'
+    _URL_LITERALS = ('://techtv.mit.edu/',)
+
+
+class OCWMITIE(LazyLoadExtractor):
+    _VALID_URL = '^https?://ocw\\.mit\\.edu/courses/(?P<topic>[a-z0-9\\-]+)'
+    _module = 'youtube_dl.extractor.mit'
+    IE_NAME = 'ocw.mit.edu'
+    _URL_LITERALS = ('://ocw.mit.edu/courses/',)
+
+
+class MiTeleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?mitele\\.es/(?:[^/]+/)+(?P<id>[^/]+)/player'
+    _module = 'youtube_dl.extractor.mitele'
+    IE_NAME = 'MiTele'
+    IE_DESC = 'mitele.es'
+    _URL_LITERALS = ('mitele.es/',)
+
+
+class MixcloudBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.mixcloud'
+    IE_NAME = 'MixcloudBase'
+    _URL_LITERALS = None
+
+
+class MixcloudIE(MixcloudBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|beta|m)\\.)?mixcloud\\.com/([^/]+)/(?!stream|uploads|favorites|listens|playlists)([^/]+)'
+    _module = 'youtube_dl.extractor.mixcloud'
+    IE_NAME = 'mixcloud'
+    _URL_LITERALS = ('mixcloud.com/',)
+
+
+class MixcloudPlaylistBaseIE(MixcloudBaseIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.mixcloud'
+    IE_NAME = 'MixcloudPlaylistBase'
+    _URL_LITERALS = None
+
+
+class MixcloudUserIE(MixcloudPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?mixcloud\\.com/(?P<id>[^/]+)/(?P<type>uploads|favorites|listens|stream)?/?$'
+    _module = 'youtube_dl.extractor.mixcloud'
+    IE_NAME = 'mixcloud:user'
+    _URL_LITERALS = ('mixcloud.com/',)
+
+
+class MixcloudPlaylistIE(MixcloudPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?mixcloud\\.com/(?P<user>[^/]+)/playlists/(?P<playlist>[^/]+)/?$'
+    _module = 'youtube_dl.extractor.mixcloud'
+    IE_NAME = 'mixcloud:playlist'
+    _URL_LITERALS = ('mixcloud.com/',)
+
+
+class NHLBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.nhl'
+    IE_NAME = 'NHLBase'
+    _URL_LITERALS = None
+
+
+class MLBIE(NHLBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:[\\da-z_-]+\\.)*(?P<site>mlb)\\.com/\n                        (?:\n                            (?:\n                                (?:[^/]+/)*c-|\n                                (?:\n                                    shared/video/embed/(?:embed|m-internal-embed)\\.html|\n                                    (?:[^/]+/)+(?:play|index)\\.jsp|\n                                )\\?.*?\\bcontent_id=\n                            )\n                            (?P<id>\\d+)\n                        )\n                    '
+    _module = 'youtube_dl.extractor.mlb'
+    IE_NAME = 'MLB'
+    _URL_LITERALS = ('.com/',)
+
+
+class MnetIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?mnet\\.(?:com|interest\\.me)/tv/vod/(?:.*?\\bclip_id=)?(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.mnet'
+    IE_NAME = 'Mnet'
+    _URL_LITERALS = ('mnet.',)
+
+
+class MoeVideoIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        https?://(?P<host>(?:www\\.)?\n        (?:(?:moevideo|playreplay|videochart)\\.net|thesame\\.tv))/\n        (?:video|framevideo|embed)/(?P<id>[0-9a-z]+\\.[0-9A-Za-z]+)'
+    _module = 'youtube_dl.extractor.moevideo'
+    IE_NAME = 'MoeVideo'
+    IE_DESC = 'LetitBit video services: moevideo.net, playreplay.net and videochart.net'
+    _URL_LITERALS = ('.net', 'thesame.tv')
+
+
+class MofosexIE(KeezMoviesIE):
+    _VALID_URL = 'https?://(?:www\\.)?mofosex\\.com/videos/(?P<id>\\d+)/(?P<display_id>[^/?#&.]+)\\.html'
+    _module = 'youtube_dl.extractor.mofosex'
+    IE_NAME = 'Mofosex'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('mofosex.com/videos/',)
+
+
+class MojvideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?mojvideo\\.com/video-(?P<display_id>[^/]+)/(?P<id>[a-f0-9]+)'
+    _module = 'youtube_dl.extractor.mojvideo'
+    IE_NAME = 'Mojvideo'
+    _URL_LITERALS = ('mojvideo.com/video-',)
+
+
+class MorningstarIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|news)\\.)morningstar\\.com/[cC]over/video[cC]enter\\.aspx\\?id=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.morningstar'
+    IE_NAME = 'Morningstar'
+    IE_DESC = 'morningstar.com'
+    _URL_LITERALS = ('.morningstar.com/',)
+
+
+class MotherlessIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?motherless\\.com/(?:g/[a-z0-9_]+/)?(?P<id>[A-Z0-9]+)'
+    _module = 'youtube_dl.extractor.motherless'
+    IE_NAME = 'Motherless'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('motherless.com/',)
+
+
+class MotherlessGroupIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?motherless\\.com/gv?/(?P<id>[a-z0-9_]+)'
+    _module = 'youtube_dl.extractor.motherless'
+    IE_NAME = 'MotherlessGroup'
+    _URL_LITERALS = ('motherless.com/g',)
+
+    @classmethod
+    def suitable(cls, url):
+        return (False if MotherlessIE.suitable(url)
+                else super(MotherlessGroupIE, cls).suitable(url))
+
+
+class MotorsportIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?motorsport\\.com/[^/?#]+/video/(?:[^/?#]+/)(?P<id>[^/]+)/?(?:$|[?#])'
+    _module = 'youtube_dl.extractor.motorsport'
+    IE_NAME = 'Motorsport'
+    IE_DESC = 'motorsport.com'
+    _URL_LITERALS = ('motorsport.com/',)
+
+
+class MovieClipsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?movieclips\\.com/videos/.+-(?P<id>\\d+)(?:\\?|$)'
+    _module = 'youtube_dl.extractor.movieclips'
+    IE_NAME = 'MovieClips'
+    _URL_LITERALS = ('movieclips.com/videos/',)
+
+
+class MoviezineIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?moviezine\\.se/video/(?P<id>[^?#]+)'
+    _module = 'youtube_dl.extractor.moviezine'
+    IE_NAME = 'Moviezine'
+    _URL_LITERALS = ('moviezine.se/video/',)
+
+
+class MovingImageIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://movingimage\\.nls\\.uk/film/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.movingimage'
+    IE_NAME = 'MovingImage'
+    _URL_LITERALS = ('://movingimage.nls.uk/film/',)
+
+
+class MSNIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?msn\\.com/(?:[^/]+/)+(?P<display_id>[^/]+)/[a-z]{2}-(?P<id>[\\da-zA-Z]+)'
+    _module = 'youtube_dl.extractor.msn'
+    IE_NAME = 'MSN'
+    _URL_LITERALS = ('msn.com/',)
+
+
+class MTVIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?mtv\\.com/(?:video-clips|(?:full-)?episodes)/(?P<id>[^/?#.]+)'
+    _module = 'youtube_dl.extractor.mtv'
+    IE_NAME = 'mtv'
+    _URL_LITERALS = ('mtv.com/',)
+
+
+class CMTIE(MTVIE):
+    _VALID_URL = 'https?://(?:www\\.)?cmt\\.com/(?:videos|shows|(?:full-)?episodes|video-clips)/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.cmt'
+    IE_NAME = 'cmt.com'
+    _URL_LITERALS = ('cmt.com/',)
+
+
+class MTVVideoIE(MTVServicesInfoExtractor):
+    _VALID_URL = '(?x)^https?://\n        (?:(?:www\\.)?mtv\\.com/videos/.+?/(?P<videoid>[0-9]+)/[^/]+$|\n           m\\.mtv\\.com/videos/video\\.rbml\\?.*?id=(?P<mgid>[^&]+))'
+    _module = 'youtube_dl.extractor.mtv'
+    IE_NAME = 'mtv:video'
+    _URL_LITERALS = ('m.mtv.com/videos/video.rbml?', 'mtv.com/videos/')
+
+
+class MTVServicesEmbeddedIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://media\\.mtvnservices\\.com/embed/(?P<mgid>.+?)(\\?|/|$)'
+    _module = 'youtube_dl.extractor.mtv'
+    IE_NAME = 'mtvservices:embedded'
+    _URL_LITERALS = ('://media.mtvnservices.com/embed/',)
+
+
+class MTVDEIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?mtv\\.de/(?:musik/videoclips|folgen|news)/(?P<id>[0-9a-z]+)'
+    _module = 'youtube_dl.extractor.mtv'
+    IE_NAME = 'mtv.de'
+    _URL_LITERALS = ('mtv.de/',)
+
+
+class MTVJapanIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?mtvjapan\\.com/videos/(?P<id>[0-9a-z]+)'
+    _module = 'youtube_dl.extractor.mtv'
+    IE_NAME = 'mtvjapan'
+    _URL_LITERALS = ('mtvjapan.com/videos/',)
+
+
+class MuenchenTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?muenchen\\.tv/livestream'
+    _module = 'youtube_dl.extractor.muenchentv'
+    IE_NAME = 'MuenchenTV'
+    IE_DESC = 'münchen.tv'
+    _URL_LITERALS = ('muenchen.tv/livestream',)
+
+
+class MusicPlayOnIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?musicplayon\\.com/play(?:-touch)?\\?(?:v|pl=\\d+&play)=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.musicplayon'
+    IE_NAME = 'MusicPlayOn'
+    _URL_LITERALS = ('musicplayon.com/play',)
+
+
+class MwaveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://mwave\\.interest\\.me/(?:[^/]+/)?mnettv/videodetail\\.m\\?searchVideoDetailVO\\.clip_id=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.mwave'
+    IE_NAME = 'Mwave'
+    _URL_LITERALS = ('mnettv/videodetail.m?searchvideodetailvo.clip_id=',)
+
+
+class MwaveMeetGreetIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://mwave\\.interest\\.me/(?:[^/]+/)?meetgreet/view/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.mwave'
+    IE_NAME = 'MwaveMeetGreet'
+    _URL_LITERALS = ('://mwave.interest.me/',)
+
+
+class MyChannelsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?mychannels\\.com/.*(?P<id_type>video|production)_id=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.mychannels'
+    IE_NAME = 'MyChannels'
+    _URL_LITERALS = ('mychannels.com/',)
+
+
+class MySpaceIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        myspace\\.com/[^/]+/\n                        (?P<mediatype>\n                            video/[^/]+/(?P<video_id>\\d+)|\n                            music/song/[^/?#&]+-(?P<song_id>\\d+)-\\d+(?:[/?#&]|$)\n                        )\n                    '
+    _module = 'youtube_dl.extractor.myspace'
+    IE_NAME = 'MySpace'
+    _URL_LITERALS = ('://myspace.com/',)
+
+
+class MySpaceAlbumIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://myspace\\.com/([^/]+)/music/album/(?P<title>.*-)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.myspace'
+    IE_NAME = 'MySpace:album'
+    _URL_LITERALS = ('://myspace.com/',)
+
+
+class MySpassIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?myspass\\.de/([^/]+/)*(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.myspass'
+    IE_NAME = 'MySpass'
+    _URL_LITERALS = ('myspass.de/',)
+
+
+class SprutoBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.vimple'
+    IE_NAME = 'SprutoBase'
+    _URL_LITERALS = None
+
+
+class MyviIE(SprutoBaseIE):
+    _VALID_URL = '(?x)\n                        (?:\n                            https?://\n                                (?:www\\.)?\n                                myvi\\.\n                                (?:\n                                    (?:ru/player|tv)/\n                                    (?:\n                                        (?:\n                                            embed/html|\n                                            flash|\n                                            api/Video/Get\n                                        )/|\n                                        content/preloader\\.swf\\?.*\\bid=\n                                    )|\n                                    ru/watch/\n                                )|\n                            myvi:\n                        )\n                        (?P<id>[\\da-zA-Z_-]+)\n                    '
+    _module = 'youtube_dl.extractor.myvi'
+    IE_NAME = 'Myvi'
+    _URL_LITERALS = ('myvi.', 'myvi:')
+
+
+class MyviEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?myvi\\.tv/(?:[^?]+\\?.*?\\bv=|embed/)(?P<id>[\\da-z]+)'
+    _module = 'youtube_dl.extractor.myvi'
+    IE_NAME = 'MyviEmbed'
+    _URL_LITERALS = ('myvi.tv/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if MyviIE.suitable(url) else super(MyviEmbedIE, cls).suitable(url)
+
+
+class MyVidsterIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?myvidster\\.com/video/(?P<id>\\d+)/'
+    _module = 'youtube_dl.extractor.myvidster'
+    IE_NAME = 'MyVidster'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('myvidster.com/video/',)
+
+
+class NationalGeographicVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.nationalgeographic\\.com/.*?'
+    _module = 'youtube_dl.extractor.nationalgeographic'
+    IE_NAME = 'natgeo:video'
+    _URL_LITERALS = ('://video.nationalgeographic.com/',)
+
+
+class NationalGeographicTVIE(FOXIE):
+    _VALID_URL = 'https?://(?:www\\.)?nationalgeographic\\.com/tv/watch/(?P<id>[\\da-fA-F]+)'
+    _module = 'youtube_dl.extractor.nationalgeographic'
+    IE_NAME = 'NationalGeographicTV'
+    _AGE_LIMIT = 14
+    _URL_LITERALS = ('nationalgeographic.com/tv/watch/',)
+
+
+class NaverIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:m\\.)?tv(?:cast)?\\.naver\\.com/v/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.naver'
+    IE_NAME = 'Naver'
+    _URL_LITERALS = ('.naver.com/v/',)
+
+
+class NBAIE(TurnerBaseIE):
+    _VALID_URL = 'https?://(?:watch\\.|www\\.)?nba\\.com/(?P<path>(?:[^/]+/)+(?P<id>[^?]*?))/?(?:/index\\.html)?(?:\\?.*)?$'
+    _module = 'youtube_dl.extractor.nba'
+    IE_NAME = 'NBA'
+    _URL_LITERALS = ('nba.com/',)
+
+
+class CSNNEIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?csnne\\.com/video/(?P<id>[0-9a-z-]+)'
+    _module = 'youtube_dl.extractor.nbc'
+    IE_NAME = 'CSNNE'
+    _URL_LITERALS = ('csnne.com/video/',)
+
+
+class NBCIE(AdobePassIE):
+    _VALID_URL = 'https?(?P<permalink>://(?:www\\.)?nbc\\.com/(?:classic-tv/)?[^/]+/video/[^/]+/(?P<id>n?\\d+))'
+    _module = 'youtube_dl.extractor.nbc'
+    IE_NAME = 'NBC'
+    _URL_LITERALS = ('nbc.com/',)
+
+
+class NBCOlympicsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://www\\.nbcolympics\\.com/video/(?P<id>[a-z-]+)'
+    _module = 'youtube_dl.extractor.nbc'
+    IE_NAME = 'nbcolympics'
+    _URL_LITERALS = ('://www.nbcolympics.com/video/',)
+
+
+class NBCOlympicsStreamIE(AdobePassIE):
+    _VALID_URL = 'https?://stream\\.nbcolympics\\.com/(?P<id>[0-9a-z-]+)'
+    _module = 'youtube_dl.extractor.nbc'
+    IE_NAME = 'nbcolympics:stream'
+    _URL_LITERALS = ('://stream.nbcolympics.com/',)
+
+
+class NBCSportsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nbcsports\\.com//?(?:[^/]+/)+(?P<id>[0-9a-z-]+)'
+    _module = 'youtube_dl.extractor.nbc'
+    IE_NAME = 'NBCSports'
+    _URL_LITERALS = ('nbcsports.com/',)
+
+
+class NBCSportsStreamIE(AdobePassIE):
+    _VALID_URL = 'https?://stream\\.nbcsports\\.com/.+?\\bpid=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.nbc'
+    IE_NAME = 'NBCSportsStream'
+    _URL_LITERALS = ('://stream.nbcsports.com/',)
+
+
+class NBCSportsVPlayerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://vplayer\\.nbcsports\\.com/(?:[^/]+/)+(?P<id>[0-9a-zA-Z_]+)'
+    _module = 'youtube_dl.extractor.nbc'
+    IE_NAME = 'NBCSportsVPlayer'
+    _URL_LITERALS = ('://vplayer.nbcsports.com/',)
+
+
+class NDRBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.ndr'
+    IE_NAME = 'NDRBase'
+    _URL_LITERALS = None
+
+
+class NDRIE(NDRBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?ndr\\.de/(?:[^/]+/)*(?P<id>[^/?#]+),[\\da-z]+\\.html'
+    _module = 'youtube_dl.extractor.ndr'
+    IE_NAME = 'ndr'
+    IE_DESC = 'NDR.de - Norddeutscher Rundfunk'
+    _URL_LITERALS = ('ndr.de/',)
+
+
+class NJoyIE(NDRBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?n-joy\\.de/(?:[^/]+/)*(?:(?P<display_id>[^/?#]+),)?(?P<id>[\\da-z]+)\\.html'
+    _module = 'youtube_dl.extractor.ndr'
+    IE_NAME = 'njoy'
+    IE_DESC = 'N-JOY'
+    _URL_LITERALS = ('n-joy.de/',)
+
+
+class NDREmbedBaseIE(LazyLoadExtractor):
+    _VALID_URL = '(?:ndr:(?P<id_s>[\\da-z]+)|https?://www\\.ndr\\.de/(?P<id>[\\da-z]+)-ppjson\\.json)'
+    _module = 'youtube_dl.extractor.ndr'
+    IE_NAME = 'ndr:embed:base'
+    _URL_LITERALS = ('://www.ndr.de/', 'ndr:')
+
+
+class NDREmbedIE(NDREmbedBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?ndr\\.de/(?:[^/]+/)*(?P<id>[\\da-z]+)-(?:player|externalPlayer)\\.html'
+    _module = 'youtube_dl.extractor.ndr'
+    IE_NAME = 'ndr:embed'
+    _URL_LITERALS = ('ndr.de/',)
+
+
+class NJoyEmbedIE(NDREmbedBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?n-joy\\.de/(?:[^/]+/)*(?P<id>[\\da-z]+)-(?:player|externalPlayer)_[^/]+\\.html'
+    _module = 'youtube_dl.extractor.ndr'
+    IE_NAME = 'njoy:embed'
+    _URL_LITERALS = ('n-joy.de/',)
+
+
+class NDTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?ndtv\\.com/(?:[^/]+/)*videos?/?(?:[^/]+/)*[^/?^&]+-(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.ndtv'
+    IE_NAME = 'NDTV'
+    _URL_LITERALS = ('ndtv.com/',)
+
+
+class NetzkinoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?netzkino\\.de/\\#!/(?P<category>[^/]+)/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.netzkino'
+    IE_NAME = 'Netzkino'
+    _AGE_LIMIT = 12
+    _URL_LITERALS = ('netzkino.de/#!/',)
+
+
+class NerdCubedFeedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nerdcubed\\.co\\.uk/feed\\.json'
+    _module = 'youtube_dl.extractor.nerdcubed'
+    IE_NAME = 'NerdCubedFeed'
+    _URL_LITERALS = ('nerdcubed.co.uk/feed.json',)
+
+
+class NetEaseMusicBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.neteasemusic'
+    IE_NAME = 'NetEaseMusicBase'
+    _URL_LITERALS = None
+
+
+class NetEaseMusicIE(NetEaseMusicBaseIE):
+    _VALID_URL = 'https?://music\\.163\\.com/(#/)?song\\?id=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.neteasemusic'
+    IE_NAME = 'netease:song'
+    IE_DESC = '网易云音乐'
+    _URL_LITERALS = ('://music.163.com/',)
+
+
+class NetEaseMusicAlbumIE(NetEaseMusicBaseIE):
+    _VALID_URL = 'https?://music\\.163\\.com/(#/)?album\\?id=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.neteasemusic'
+    IE_NAME = 'netease:album'
+    IE_DESC = '网易云音乐 - 专辑'
+    _URL_LITERALS = ('://music.163.com/',)
+
+
+class NetEaseMusicSingerIE(NetEaseMusicBaseIE):
+    _VALID_URL = 'https?://music\\.163\\.com/(#/)?artist\\?id=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.neteasemusic'
+    IE_NAME = 'netease:singer'
+    IE_DESC = '网易云音乐 - 歌手'
+    _URL_LITERALS = ('://music.163.com/',)
+
+
+class NetEaseMusicListIE(NetEaseMusicBaseIE):
+    _VALID_URL = 'https?://music\\.163\\.com/(#/)?(playlist|discover/toplist)\\?id=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.neteasemusic'
+    IE_NAME = 'netease:playlist'
+    IE_DESC = '网易云音乐 - 歌单'
+    _URL_LITERALS = ('://music.163.com/',)
+
+
+class NetEaseMusicMvIE(NetEaseMusicBaseIE):
+    _VALID_URL = 'https?://music\\.163\\.com/(#/)?mv\\?id=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.neteasemusic'
+    IE_NAME = 'netease:mv'
+    IE_DESC = '网易云音乐 - MV'
+    _URL_LITERALS = ('://music.163.com/',)
+
+
+class NetEaseMusicProgramIE(NetEaseMusicBaseIE):
+    _VALID_URL = 'https?://music\\.163\\.com/(#/?)program\\?id=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.neteasemusic'
+    IE_NAME = 'netease:program'
+    IE_DESC = '网易云音乐 - 电台节目'
+    _URL_LITERALS = ('://music.163.com/',)
+
+
+class NetEaseMusicDjRadioIE(NetEaseMusicBaseIE):
+    _VALID_URL = 'https?://music\\.163\\.com/(#/)?djradio\\?id=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.neteasemusic'
+    IE_NAME = 'netease:djradio'
+    IE_DESC = '网易云音乐 - 电台'
+    _URL_LITERALS = ('://music.163.com/',)
+
+
+class NewgroundsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?newgrounds\\.com/(?:audio/listen|portal/view)/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.newgrounds'
+    IE_NAME = 'Newgrounds'
+    _URL_LITERALS = ('newgrounds.com/',)
+
+
+class NewgroundsPlaylistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?newgrounds\\.com/(?:collection|[^/]+/search/[^/]+)/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.newgrounds'
+    IE_NAME = 'NewgroundsPlaylist'
+    _URL_LITERALS = ('newgrounds.com/',)
+
+
+class NewstubeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?newstube\\.ru/media/(?P<id>.+)'
+    _module = 'youtube_dl.extractor.newstube'
+    IE_NAME = 'Newstube'
+    _URL_LITERALS = ('newstube.ru/media/',)
+
+
+class NextMediaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://hk\\.apple\\.nextmedia\\.com/[^/]+/[^/]+/(?P<date>\\d+)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.nextmedia'
+    IE_NAME = 'NextMedia'
+    IE_DESC = '蘋果日報'
+    _URL_LITERALS = ('://hk.apple.nextmedia.com/',)
+
+
+class NextMediaActionNewsIE(NextMediaIE):
+    _VALID_URL = 'https?://hk\\.dv\\.nextmedia\\.com/actionnews/[^/]+/(?P<date>\\d+)/(?P<id>\\d+)/\\d+'
+    _module = 'youtube_dl.extractor.nextmedia'
+    IE_NAME = 'NextMediaActionNews'
+    IE_DESC = '蘋果日報 - 動新聞'
+    _URL_LITERALS = ('://hk.dv.nextmedia.com/actionnews/',)
+
+
+class AppleDailyIE(NextMediaIE):
+    _VALID_URL = 'https?://(www|ent)\\.appledaily\\.com\\.tw/[^/]+/[^/]+/[^/]+/(?P<date>\\d+)/(?P<id>\\d+)(/.*)?'
+    _module = 'youtube_dl.extractor.nextmedia'
+    IE_NAME = 'AppleDaily'
+    IE_DESC = '臺灣蘋果日報'
+    _URL_LITERALS = ('.appledaily.com.tw/',)
+
+
+class NextTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nexttv\\.com\\.tw/(?:[^/]+/)+(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.nextmedia'
+    IE_NAME = 'NextTV'
+    IE_DESC = '壹電視'
+    _URL_LITERALS = ('nexttv.com.tw/',)
+
+
+class NexxIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                        (?:\n                            https?://api\\.nexx(?:\\.cloud|cdn\\.com)/v3/(?P<domain_id>\\d+)/videos/byid/|\n                            nexx:(?:(?P<domain_id_s>\\d+):)?|\n                            https?://arc\\.nexx\\.cloud/api/video/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.nexx'
+    IE_NAME = 'Nexx'
+    _URL_LITERALS = ('://api.nexx', '://arc.nexx.cloud/api/video/', 'nexx:')
+
+
+class NexxEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://embed\\.nexx(?:\\.cloud|cdn\\.com)/\\d+/(?:video/)?(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.nexx'
+    IE_NAME = 'NexxEmbed'
+    _URL_LITERALS = ('://embed.nexx',)
+
+
+class NFLIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?P<host>\n                            (?:www\\.)?\n                            (?:\n                                (?:\n                                    nfl|\n                                    buffalobills|\n                                    miamidolphins|\n                                    patriots|\n                                    newyorkjets|\n                                    baltimoreravens|\n                                    bengals|\n                                    clevelandbrowns|\n                                    steelers|\n                                    houstontexans|\n                                    colts|\n                                    jaguars|\n                                    titansonline|\n                                    denverbroncos|\n                                    kcchiefs|\n                                    raiders|\n                                    chargers|\n                                    dallascowboys|\n                                    giants|\n                                    philadelphiaeagles|\n                                    redskins|\n                                    chicagobears|\n                                    detroitlions|\n                                    packers|\n                                    vikings|\n                                    atlantafalcons|\n                                    panthers|\n                                    neworleanssaints|\n                                    buccaneers|\n                                    azcardinals|\n                                    stlouisrams|\n                                    49ers|\n                                    seahawks\n                                )\\.com|\n                                .+?\\.clubs\\.nfl\\.com\n                            )\n                        )/\n                        (?:.+?/)*\n                        (?P<id>[^/#?&]+)\n                    '
+    _module = 'youtube_dl.extractor.nfl'
+    IE_NAME = 'nfl.com'
+    _URL_LITERALS = ('.clubs.nfl.com', '.com')
+
+
+class NhkVodIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://www3\\.nhk\\.or\\.jp/nhkworld/(?P<lang>[a-z]{2})/ondemand/(?P<type>video|audio)/(?P<id>\\d{7}|[a-z]+-\\d{8}-\\d+)'
+    _module = 'youtube_dl.extractor.nhk'
+    IE_NAME = 'NhkVod'
+    _URL_LITERALS = ('://www3.nhk.or.jp/nhkworld/',)
+
+
+class NHLIE(NHLBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<site>nhl|wch2016)\\.com/(?:[^/]+/)*c-(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.nhl'
+    IE_NAME = 'nhl.com'
+    _URL_LITERALS = ('.com/',)
+
+
+class NickIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?P<domain>(?:(?:www|beta)\\.)?nick(?:jr)?\\.com)/(?:[^/]+/)?(?:videos/clip|[^/]+/videos)/(?P<id>[^/?#.]+)'
+    _module = 'youtube_dl.extractor.nick'
+    IE_NAME = 'nick.com'
+    _URL_LITERALS = ('.com',)
+
+
+class NickBrIE(MTVServicesInfoExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?P<domain>(?:www\\.)?nickjr|mundonick\\.uol)\\.com\\.br|\n                            (?:www\\.)?nickjr\\.[a-z]{2}|\n                            (?:www\\.)?nickelodeonjunior\\.fr\n                        )\n                        /(?:programas/)?[^/]+/videos/(?:episodios/)?(?P<id>[^/?\\#.]+)\n                    '
+    _module = 'youtube_dl.extractor.nick'
+    IE_NAME = 'nickelodeon:br'
+    _URL_LITERALS = ('.com.br', 'nickelodeonjunior.fr', 'nickjr.')
+
+
+class NickDeIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<host>nick\\.(?:de|com\\.pl|ch)|nickelodeon\\.(?:nl|be|at|dk|no|se))/[^/]+/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.nick'
+    IE_NAME = 'nick.de'
+    _URL_LITERALS = ('http',)
+
+
+class NickNightIE(NickDeIE):
+    _VALID_URL = 'https?://(?:www\\.)(?P<host>nicknight\\.(?:de|at|tv))/(?:playlist|shows)/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.nick'
+    IE_NAME = 'nicknight'
+    _URL_LITERALS = ('nicknight.',)
+
+
+class NickRuIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)nickelodeon\\.(?:ru|fr|es|pt|ro|hu|com\\.tr)/[^/]+/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.nick'
+    IE_NAME = 'nickelodeonru'
+    _URL_LITERALS = ('://www.nickelodeon.',)
+
+
+class NiconicoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.|secure\\.|sp\\.)?nicovideo\\.jp/watch/(?P<id>(?:[a-z]{2})?[0-9]+)'
+    _module = 'youtube_dl.extractor.niconico'
+    IE_NAME = 'niconico'
+    IE_DESC = 'ニコニコ動画'
+    _URL_LITERALS = ('nicovideo.jp/watch/',)
+
+
+class NiconicoPlaylistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nicovideo\\.jp/mylist/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.niconico'
+    IE_NAME = 'NiconicoPlaylist'
+    _URL_LITERALS = ('nicovideo.jp/mylist/',)
+
+
+class NineCNineMediaIE(LazyLoadExtractor):
+    _VALID_URL = '9c9media:(?P<destination_code>[^:]+):(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.ninecninemedia'
+    IE_NAME = '9c9media'
+    _URL_LITERALS = ('9c9media:',)
+
+
+class NineGagIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?9gag(?:\\.com/tv|\\.tv)/(?:p|embed)/(?P<id>[a-zA-Z0-9]+)(?:/(?P<display_id>[^?#/]+))?'
+    _module = 'youtube_dl.extractor.ninegag'
+    IE_NAME = '9gag'
+    _URL_LITERALS = ('9gag.',)
+
+
+class NineNowIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?9now\\.com\\.au/(?:[^/]+/){2}(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.ninenow'
+    IE_NAME = '9now.com.au'
+    _URL_LITERALS = ('9now.com.au/',)
+
+
+class NintendoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nintendo\\.com/games/detail/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.nintendo'
+    IE_NAME = 'Nintendo'
+    _URL_LITERALS = ('nintendo.com/games/detail/',)
+
+
+class NJPWWorldIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://njpwworld\\.com/p/(?P<id>[a-z0-9_]+)'
+    _module = 'youtube_dl.extractor.njpwworld'
+    IE_NAME = 'NJPWWorld'
+    IE_DESC = '新日本プロレスワールド'
+    _URL_LITERALS = ('://njpwworld.com/p/',)
+
+
+class NobelPrizeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nobelprize\\.org/mediaplayer.*?\\bid=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.nobelprize'
+    IE_NAME = 'NobelPrize'
+    _URL_LITERALS = ('nobelprize.org/mediaplayer',)
+
+
+class NocoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www\\.)?noco\\.tv/emission/|player\\.noco\\.tv/\\?idvideo=)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.noco'
+    IE_NAME = 'Noco'
+    _URL_LITERALS = ('noco.tv/emission/', 'player.noco.tv/?idvideo=')
+
+
+class NonkTubeIE(NuevoBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?nonktube\\.com/(?:(?:video|embed)/|media/nuevo/embed\\.php\\?.*?\\bid=)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.nonktube'
+    IE_NAME = 'NonkTube'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('nonktube.com/',)
+
+
+class NoovoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?noovo\\.ca/videos/(?P<id>[^/]+/[^/?#&]+)'
+    _module = 'youtube_dl.extractor.noovo'
+    IE_NAME = 'Noovo'
+    _URL_LITERALS = ('noovo.ca/videos/',)
+
+
+class NormalbootsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?normalboots\\.com/video/(?P<id>[0-9a-z-]*)/?$'
+    _module = 'youtube_dl.extractor.normalboots'
+    IE_NAME = 'Normalboots'
+    _URL_LITERALS = ('normalboots.com/video/',)
+
+
+class NosVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nosvideo\\.com/(?:embed/|\\?v=)(?P<id>[A-Za-z0-9]{12})/?'
+    _module = 'youtube_dl.extractor.nosvideo'
+    IE_NAME = 'NosVideo'
+    _URL_LITERALS = ('nosvideo.com/',)
+
+
+class NovaEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://media\\.cms\\.nova\\.cz/embed/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.nova'
+    IE_NAME = 'NovaEmbed'
+    _URL_LITERALS = ('://media.cms.nova.cz/embed/',)
+
+
+class NovaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^.]+\\.)?(?P<site>tv(?:noviny)?|tn|novaplus|vymena|fanda|krasna|doma|prask)\\.nova\\.cz/(?:[^/]+/)+(?P<id>[^/]+?)(?:\\.html|/|$)'
+    _module = 'youtube_dl.extractor.nova'
+    IE_NAME = 'Nova'
+    IE_DESC = 'TN.cz, Prásk.tv, Nova.cz, Novaplus.cz, FANDA.tv, Krásná.cz and Doma.cz'
+    _URL_LITERALS = ('.nova.cz/',)
+
+
+class NownessBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.nowness'
+    IE_NAME = 'NownessBase'
+    _URL_LITERALS = None
+
+
+class NownessIE(NownessBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|cn)\\.)?nowness\\.com/(?:story|(?:series|category)/[^/]+)/(?P<id>[^/]+?)(?:$|[?#])'
+    _module = 'youtube_dl.extractor.nowness'
+    IE_NAME = 'nowness'
+    _URL_LITERALS = ('nowness.com/',)
+
+
+class NownessPlaylistIE(NownessBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|cn)\\.)?nowness\\.com/playlist/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.nowness'
+    IE_NAME = 'nowness:playlist'
+    _URL_LITERALS = ('nowness.com/playlist/',)
+
+
+class NownessSeriesIE(NownessBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|cn)\\.)?nowness\\.com/series/(?P<id>[^/]+?)(?:$|[?#])'
+    _module = 'youtube_dl.extractor.nowness'
+    IE_NAME = 'nowness:series'
+    _URL_LITERALS = ('nowness.com/series/',)
+
+
+class NozIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?noz\\.de/video/(?P<id>[0-9]+)/'
+    _module = 'youtube_dl.extractor.noz'
+    IE_NAME = 'Noz'
+    _URL_LITERALS = ('noz.de/video/',)
+
+
+class NPOBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.npo'
+    IE_NAME = 'NPOBase'
+    _URL_LITERALS = None
+
+
+class NPOIE(NPOBaseIE):
+    _VALID_URL = '(?x)\n                    (?:\n                        npo:|\n                        https?://\n                            (?:www\\.)?\n                            (?:\n                                npo\\.nl/(?:[^/]+/)*|\n                                (?:ntr|npostart)\\.nl/(?:[^/]+/){2,}|\n                                omroepwnl\\.nl/video/fragment/[^/]+__|\n                                (?:zapp|npo3)\\.nl/(?:[^/]+/){2,}\n                            )\n                        )\n                        (?P<id>[^/?#]+)\n                '
+    _module = 'youtube_dl.extractor.npo'
+    IE_NAME = 'npo'
+    IE_DESC = 'npo.nl, ntr.nl, omroepwnl.nl, zapp.nl and npo3.nl'
+    _URL_LITERALS = ('.nl/', 'npo.nl/', 'npo:', 'omroepwnl.nl/video/fragment/')
+
+    @classmethod
+    def suitable(cls, url):
+        return (False if any(ie.suitable(url)
+                for ie in (NPOLiveIE, NPORadioIE, NPORadioFragmentIE))
+                else super(NPOIE, cls).suitable(url))
+
+
+class NPOPlaylistBaseIE(NPOIE):
+    _VALID_URL = '(?x)\n                    (?:\n                        npo:|\n                        https?://\n                            (?:www\\.)?\n                            (?:\n                                npo\\.nl/(?:[^/]+/)*|\n                                (?:ntr|npostart)\\.nl/(?:[^/]+/){2,}|\n                                omroepwnl\\.nl/video/fragment/[^/]+__|\n                                (?:zapp|npo3)\\.nl/(?:[^/]+/){2,}\n                            )\n                        )\n                        (?P<id>[^/?#]+)\n                '
+    _module = 'youtube_dl.extractor.npo'
+    IE_NAME = 'npo'
+    IE_DESC = 'npo.nl, ntr.nl, omroepwnl.nl, zapp.nl and npo3.nl'
+    _URL_LITERALS = ('.nl/', 'npo.nl/', 'npo:', 'omroepwnl.nl/video/fragment/')
+
+    @classmethod
+    def suitable(cls, url):
+        return (False if any(ie.suitable(url)
+                for ie in (NPOLiveIE, NPORadioIE, NPORadioFragmentIE))
+                else super(NPOIE, cls).suitable(url))
+
+
+class AndereTijdenIE(NPOPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?anderetijden\\.nl/programma/(?:[^/]+/)+(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.npo'
+    IE_NAME = 'anderetijden'
+    IE_DESC = 'npo.nl, ntr.nl, omroepwnl.nl, zapp.nl and npo3.nl'
+    _URL_LITERALS = ('anderetijden.nl/programma/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return (False if any(ie.suitable(url)
+                for ie in (NPOLiveIE, NPORadioIE, NPORadioFragmentIE))
+                else super(NPOIE, cls).suitable(url))
+
+
+class NPOLiveIE(NPOBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?npo(?:start)?\\.nl/live(?:/(?P<id>[^/?#&]+))?'
+    _module = 'youtube_dl.extractor.npo'
+    IE_NAME = 'npo.nl:live'
+    _URL_LITERALS = ('.nl/live',)
+
+
+class NPORadioIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?npo\\.nl/radio/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.npo'
+    IE_NAME = 'npo.nl:radio'
+    _URL_LITERALS = ('npo.nl/radio/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if NPORadioFragmentIE.suitable(url) else super(NPORadioIE, cls).suitable(url)
+
+
+class NPORadioFragmentIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?npo\\.nl/radio/[^/]+/fragment/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.npo'
+    IE_NAME = 'npo.nl:radio:fragment'
+    _URL_LITERALS = ('npo.nl/radio/',)
+
+
+class NPODataMidEmbedIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.npo'
+    IE_NAME = 'NPODataMidEmbed'
+    _URL_LITERALS = None
+
+
+class SchoolTVIE(NPODataMidEmbedIE):
+    _VALID_URL = 'https?://(?:www\\.)?schooltv\\.nl/video/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.npo'
+    IE_NAME = 'schooltv'
+    _URL_LITERALS = ('schooltv.nl/video/',)
+
+
+class HetKlokhuisIE(NPODataMidEmbedIE):
+    _VALID_URL = 'https?://(?:www\\.)?hetklokhuis\\.nl/[^/]+/\\d+/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.npo'
+    IE_NAME = 'hetklokhuis'
+    _URL_LITERALS = ('hetklokhuis.nl/',)
+
+
+class VPROIE(NPOPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:(?:tegenlicht\\.)?vpro|2doc)\\.nl/(?:[^/]+/)*(?P<id>[^/]+)\\.html'
+    _module = 'youtube_dl.extractor.npo'
+    IE_NAME = 'vpro'
+    IE_DESC = 'npo.nl, ntr.nl, omroepwnl.nl, zapp.nl and npo3.nl'
+    _URL_LITERALS = ('.html',)
+
+    @classmethod
+    def suitable(cls, url):
+        return (False if any(ie.suitable(url)
+                for ie in (NPOLiveIE, NPORadioIE, NPORadioFragmentIE))
+                else super(NPOIE, cls).suitable(url))
+
+
+class WNLIE(NPOPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?omroepwnl\\.nl/video/detail/(?P<id>[^/]+)__\\d+'
+    _module = 'youtube_dl.extractor.npo'
+    IE_NAME = 'wnl'
+    IE_DESC = 'npo.nl, ntr.nl, omroepwnl.nl, zapp.nl and npo3.nl'
+    _URL_LITERALS = ('omroepwnl.nl/video/detail/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return (False if any(ie.suitable(url)
+                for ie in (NPOLiveIE, NPORadioIE, NPORadioFragmentIE))
+                else super(NPOIE, cls).suitable(url))
+
+
+class NprIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?npr\\.org/(?:sections/[^/]+/)?\\d{4}/\\d{2}/\\d{2}/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.npr'
+    IE_NAME = 'Npr'
+    _URL_LITERALS = ('npr.org/',)
+
+
+class NRKBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.nrk'
+    IE_NAME = 'NRKBase'
+    _URL_LITERALS = None
+
+
+class NRKIE(NRKBaseIE):
+    _VALID_URL = '(?x)\n                        (?:\n                            nrk:|\n                            https?://\n                                (?:\n                                    (?:www\\.)?nrk\\.no/video/PS\\*|\n                                    v8[-.]psapi\\.nrk\\.no/mediaelement/\n                                )\n                            )\n                            (?P<id>[^?#&]+)\n                        '
+    _module = 'youtube_dl.extractor.nrk'
+    IE_NAME = 'NRK'
+    _URL_LITERALS = ('nrk.no/video/ps*', 'nrk:', 'psapi.nrk.no/mediaelement/')
+
+
+class NRKPlaylistBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.nrk'
+    IE_NAME = 'NRKPlaylistBase'
+    _URL_LITERALS = None
+
+
+class NRKPlaylistIE(NRKPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?nrk\\.no/(?!video|skole)(?:[^/]+/)+(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.nrk'
+    IE_NAME = 'NRKPlaylist'
+    _URL_LITERALS = ('nrk.no/',)
+
+
+class NRKSkoleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nrk\\.no/skole/?\\?.*\\bmediaId=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.nrk'
+    IE_NAME = 'NRKSkole'
+    IE_DESC = 'NRK Skole'
+    _URL_LITERALS = ('nrk.no/skole',)
+
+
+class NRKTVIE(NRKBaseIE):
+    _VALID_URL = '(?x)\n                        https?://\n                            (?:tv|radio)\\.nrk(?:super)?\\.no/\n                            (?:serie(?:/[^/]+){1,2}|program)/\n                            (?![Ee]pisodes)(?P<id>[a-zA-Z]{4}\\d{8})\n                            (?:/\\d{2}-\\d{2}-\\d{4})?\n                            (?:\\#del=(?P<part_id>\\d+))?\n                    '
+    _module = 'youtube_dl.extractor.nrk'
+    IE_NAME = 'NRKTV'
+    IE_DESC = 'NRK TV and NRK Radio'
+    _URL_LITERALS = ('.nrk',)
+
+
+class NRKTVDirekteIE(NRKTVIE):
+    _VALID_URL = 'https?://(?:tv|radio)\\.nrk\\.no/direkte/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.nrk'
+    IE_NAME = 'NRKTVDirekte'
+    IE_DESC = 'NRK TV Direkte and NRK Radio Direkte'
+    _URL_LITERALS = ('.nrk.no/direkte/',)
+
+
+class NRKTVEpisodeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://tv\\.nrk\\.no/serie/(?P<id>[^/]+/sesong/\\d+/episode/\\d+)'
+    _module = 'youtube_dl.extractor.nrk'
+    IE_NAME = 'NRKTVEpisode'
+    _URL_LITERALS = ('://tv.nrk.no/serie/',)
+
+
+class NRKTVEpisodesIE(NRKPlaylistBaseIE):
+    _VALID_URL = 'https?://tv\\.nrk\\.no/program/[Ee]pisodes/[^/]+/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.nrk'
+    IE_NAME = 'NRKTVEpisodes'
+    _URL_LITERALS = ('://tv.nrk.no/program/',)
+
+
+class NRKTVSerieBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.nrk'
+    IE_NAME = 'NRKTVSerieBase'
+    _URL_LITERALS = None
+
+
+class NRKTVSeasonIE(NRKTVSerieBaseIE):
+    _VALID_URL = 'https?://tv\\.nrk\\.no/serie/[^/]+/sesong/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.nrk'
+    IE_NAME = 'NRKTVSeason'
+    _URL_LITERALS = ('://tv.nrk.no/serie/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return (False if NRKTVIE.suitable(url) or NRKTVEpisodeIE.suitable(url)
+                else super(NRKTVSeasonIE, cls).suitable(url))
+
+
+class NRKTVSeriesIE(NRKTVSerieBaseIE):
+    _VALID_URL = 'https?://(?:tv|radio)\\.nrk(?:super)?\\.no/serie/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.nrk'
+    IE_NAME = 'NRKTVSeries'
+    _URL_LITERALS = None
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False if any(ie.suitable(url)
+                         for ie in (NRKTVIE, NRKTVEpisodeIE, NRKTVSeasonIE))
+            else super(NRKTVSeriesIE, cls).suitable(url))
+
+
+class NRLTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nrl\\.com/tv(/[^/]+)*/(?P<id>[^/?&#]+)'
+    _module = 'youtube_dl.extractor.nrl'
+    IE_NAME = 'NRLTV'
+    _URL_LITERALS = ('nrl.com/tv',)
+
+
+class NTVCoJpCUIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://cu\\.ntv\\.co\\.jp/(?!program)(?P<id>[^/?&#]+)'
+    _module = 'youtube_dl.extractor.ntvcojp'
+    IE_NAME = 'cu.ntv.co.jp'
+    IE_DESC = 'Nippon Television Network'
+    _URL_LITERALS = ('://cu.ntv.co.jp/',)
+
+
+class NTVDeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?n-tv\\.de/mediathek/videos/[^/?#]+/[^/?#]+-article(?P<id>.+)\\.html'
+    _module = 'youtube_dl.extractor.ntvde'
+    IE_NAME = 'n-tv.de'
+    _URL_LITERALS = ('n-tv.de/mediathek/videos/',)
+
+
+class NTVRuIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ntv\\.ru/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.ntvru'
+    IE_NAME = 'ntv.ru'
+    _URL_LITERALS = ('ntv.ru/',)
+
+
+class NYTimesBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.nytimes'
+    IE_NAME = 'NYTimesBase'
+    _URL_LITERALS = None
+
+
+class NYTimesIE(NYTimesBaseIE):
+    _VALID_URL = 'https?://(?:(?:www\\.)?nytimes\\.com/video/(?:[^/]+/)+?|graphics8\\.nytimes\\.com/bcvideo/\\d+(?:\\.\\d+)?/iframe/embed\\.html\\?videoId=)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.nytimes'
+    IE_NAME = 'NYTimes'
+    _URL_LITERALS = ('graphics8.nytimes.com/bcvideo/', 'nytimes.com/video/')
+
+
+class NYTimesArticleIE(NYTimesBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?nytimes\\.com/(.(?<!video))*?/(?:[^/]+/)*(?P<id>[^.]+)(?:\\.html)?'
+    _module = 'youtube_dl.extractor.nytimes'
+    IE_NAME = 'NYTimesArticle'
+    _URL_LITERALS = ('nytimes.com/',)
+
+
+class NuvidIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www|m)\\.nuvid\\.com/video/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.nuvid'
+    IE_NAME = 'Nuvid'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('.nuvid.com/video/',)
+
+
+class NZZIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nzz\\.ch/(?:[^/]+/)*[^/?#]+-ld\\.(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.nzz'
+    IE_NAME = 'NZZ'
+    _URL_LITERALS = ('nzz.ch/',)
+
+
+class OdaTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?odatv\\.com/(?:mob|vid)_video\\.php\\?.*\\bid=(?P<id>[^&]+)'
+    _module = 'youtube_dl.extractor.odatv'
+    IE_NAME = 'OdaTV'
+    _URL_LITERALS = ('_video.php?',)
+
+
+class OdnoklassnikiIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                https?://\n                    (?:(?:www|m|mobile)\\.)?\n                    (?:odnoklassniki|ok)\\.ru/\n                    (?:\n                        video(?:embed)?/|\n                        web-api/video/moviePlayer/|\n                        live/|\n                        dk\\?.*?st\\.mvId=\n                    )\n                    (?P<id>[\\d-]+)\n                '
+    _module = 'youtube_dl.extractor.odnoklassniki'
+    IE_NAME = 'Odnoklassniki'
+    _URL_LITERALS = ('.ru/',)
+
+
+class OktoberfestTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?oktoberfest-tv\\.de/[^/]+/[^/]+/video/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.oktoberfesttv'
+    IE_NAME = 'OktoberfestTV'
+    _URL_LITERALS = ('oktoberfest-tv.de/',)
+
+
+class OnDemandKoreaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ondemandkorea\\.com/(?P<id>[^/]+)\\.html'
+    _module = 'youtube_dl.extractor.ondemandkorea'
+    IE_NAME = 'OnDemandKorea'
+    _URL_LITERALS = ('ondemandkorea.com/',)
+
+
+class OnetIE(OnetBaseIE):
+    _VALID_URL = 'https?://(?:(?:www\\.)?onet\\.tv|onet100\\.vod\\.pl)/[a-z]/[a-z]+/(?P<display_id>[0-9a-z-]+)/(?P<id>[0-9a-z]+)'
+    _module = 'youtube_dl.extractor.onet'
+    IE_NAME = 'onet.tv'
+    _URL_LITERALS = ('onet.tv', 'onet100.vod.pl')
+
+
+class OnetChannelIE(OnetBaseIE):
+    _VALID_URL = 'https?://(?:(?:www\\.)?onet\\.tv|onet100\\.vod\\.pl)/[a-z]/(?P<id>[a-z]+)(?:[?#]|$)'
+    _module = 'youtube_dl.extractor.onet'
+    IE_NAME = 'onet.tv:channel'
+    _URL_LITERALS = ('onet.tv', 'onet100.vod.pl')
+
+
+class OnetMVPIE(OnetBaseIE):
+    _VALID_URL = 'onetmvp:(?P<id>\\d+\\.\\d+)'
+    _module = 'youtube_dl.extractor.onet'
+    IE_NAME = 'OnetMVP'
+    _URL_LITERALS = ('onetmvp:',)
+
+
+class OnetPlIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?(?:onet|businessinsider\\.com|plejada)\\.pl/(?:[^/]+/)+(?P<id>[0-9a-z]+)'
+    _module = 'youtube_dl.extractor.onet'
+    IE_NAME = 'onet.pl'
+    _URL_LITERALS = ('.pl/',)
+
+
+class OnionStudiosIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?onionstudios\\.com/(?:video(?:s/[^/]+-|/)|embed\\?.*\\bid=)(?P<id>\\d+)(?!-)'
+    _module = 'youtube_dl.extractor.onionstudios'
+    IE_NAME = 'OnionStudios'
+    _URL_LITERALS = ('onionstudios.com/',)
+
+
+class OoyalaBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.ooyala'
+    IE_NAME = 'OoyalaBase'
+    _URL_LITERALS = None
+
+
+class OoyalaIE(OoyalaBaseIE):
+    _VALID_URL = '(?:ooyala:|https?://.+?\\.ooyala\\.com/.*?(?:embedCode|ec)=)(?P<id>.+?)(&|$)'
+    _module = 'youtube_dl.extractor.ooyala'
+    IE_NAME = 'Ooyala'
+    _URL_LITERALS = ('.ooyala.com/', 'ooyala:')
+
+
+class OoyalaExternalIE(OoyalaBaseIE):
+    _VALID_URL = '(?x)\n                    (?:\n                        ooyalaexternal:|\n                        https?://.+?\\.ooyala\\.com/.*?\\bexternalId=\n                    )\n                    (?P<partner_id>[^:]+)\n                    :\n                    (?P<id>.+)\n                    (?:\n                        :|\n                        .*?&pcode=\n                    )\n                    (?P<pcode>.+?)\n                    (?:&|$)\n                    '
+    _module = 'youtube_dl.extractor.ooyala'
+    IE_NAME = 'OoyalaExternal'
+    _URL_LITERALS = ('.ooyala.com/', 'ooyalaexternal:')
+
+
+class OraTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:ora\\.tv|unsafespeech\\.com)/([^/]+/)*(?P<id>[^/\\?#]+)'
+    _module = 'youtube_dl.extractor.ora'
+    IE_NAME = 'OraTV'
+    _URL_LITERALS = ('ora.tv', 'unsafespeech.com')
+
+
+class ORFTVthekIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://tvthek\\.orf\\.at/(?:[^/]+/)+(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.orf'
+    IE_NAME = 'orf:tvthek'
+    IE_DESC = 'ORF TVthek'
+    _URL_LITERALS = ('://tvthek.orf.at/',)
+
+
+class ORFRadioIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.orf'
+    IE_NAME = 'ORFRadio'
+    _URL_LITERALS = None
+
+
+class ORFFM4IE(ORFRadioIE):
+    _VALID_URL = 'https?://(?P<station>fm4)\\.orf\\.at/player/(?P<date>[0-9]+)/(?P<show>\\w+)'
+    _module = 'youtube_dl.extractor.orf'
+    IE_NAME = 'orf:fm4'
+    IE_DESC = 'radio FM4'
+    _URL_LITERALS = ('.orf.at/player/',)
+
+
+class ORFFM4StoryIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://fm4\\.orf\\.at/stories/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.orf'
+    IE_NAME = 'orf:fm4:story'
+    IE_DESC = 'fm4.orf.at stories'
+    _URL_LITERALS = ('://fm4.orf.at/stories/',)
+
+
+class ORFOE1IE(ORFRadioIE):
+    _VALID_URL = 'https?://(?P<station>oe1)\\.orf\\.at/player/(?P<date>[0-9]+)/(?P<show>\\w+)'
+    _module = 'youtube_dl.extractor.orf'
+    IE_NAME = 'orf:oe1'
+    IE_DESC = 'Radio Österreich 1'
+    _URL_LITERALS = ('.orf.at/player/',)
+
+
+class ORFIPTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://iptv\\.orf\\.at/(?:#/)?stories/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.orf'
+    IE_NAME = 'orf:iptv'
+    IE_DESC = 'iptv.ORF.at'
+    _URL_LITERALS = ('://iptv.orf.at/',)
+
+
+class OutsideTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?outsidetv\\.com/(?:[^/]+/)*?play/[a-zA-Z0-9]{8}/\\d+/\\d+/(?P<id>[a-zA-Z0-9]{8})'
+    _module = 'youtube_dl.extractor.outsidetv'
+    IE_NAME = 'OutsideTV'
+    _URL_LITERALS = ('outsidetv.com/',)
+
+
+class PacktPubBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.packtpub'
+    IE_NAME = 'PacktPubBase'
+    _URL_LITERALS = None
+
+
+class PacktPubIE(PacktPubBaseIE):
+    _VALID_URL = 'https?://(?:(?:www\\.)?packtpub\\.com/mapt|subscription\\.packtpub\\.com)/video/[^/]+/(?P<course_id>\\d+)/(?P<chapter_id>[^/]+)/(?P<id>[^/]+)(?:/(?P<display_id>[^/?&#]+))?'
+    _module = 'youtube_dl.extractor.packtpub'
+    IE_NAME = 'PacktPub'
+    _URL_LITERALS = ('packtpub.com/mapt', 'subscription.packtpub.com')
+
+
+class PacktPubCourseIE(PacktPubBaseIE):
+    _VALID_URL = '(?P<url>https?://(?:(?:www\\.)?packtpub\\.com/mapt|subscription\\.packtpub\\.com)/video/[^/]+/(?P<id>\\d+))'
+    _module = 'youtube_dl.extractor.packtpub'
+    IE_NAME = 'PacktPubCourse'
+    _URL_LITERALS = ('packtpub.com/mapt', 'subscription.packtpub.com')
+
+    @classmethod
+    def suitable(cls, url):
+        return False if PacktPubIE.suitable(url) else super(
+            PacktPubCourseIE, cls).suitable(url)
+
+
+class PandaTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?panda\\.tv/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.pandatv'
+    IE_NAME = 'PandaTV'
+    IE_DESC = '熊猫TV'
+    _URL_LITERALS = ('panda.tv/',)
+
+
+class PandoraTVIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                        https?://\n                            (?:\n                                (?:www\\.)?pandora\\.tv/view/(?P<user_id>[^/]+)/(?P<id>\\d+)|  # new format\n                                (?:.+?\\.)?channel\\.pandora\\.tv/channel/video\\.ptv\\?|        # old format\n                                m\\.pandora\\.tv/?\\?                                          # mobile\n                            )\n                    '
+    _module = 'youtube_dl.extractor.pandoratv'
+    IE_NAME = 'pandora.tv'
+    IE_DESC = '판도라TV'
+    _URL_LITERALS = ('channel.pandora.tv/channel/video.ptv?', 'm.pandora.tv', 'pandora.tv/view/')
+
+
+class ParliamentLiveUKIE(LazyLoadExtractor):
+    _VALID_URL = '(?i)https?://(?:www\\.)?parliamentlive\\.tv/Event/Index/(?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'youtube_dl.extractor.parliamentliveuk'
+    IE_NAME = 'parliamentlive.tv'
+    IE_DESC = 'UK parliament videos'
+    _URL_LITERALS = ('parliamentlive.tv/event/index/',)
+
+
+class PatreonIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?patreon\\.com/(?:creation\\?hid=|posts/(?:[\\w-]+-)?)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.patreon'
+    IE_NAME = 'Patreon'
+    _URL_LITERALS = ('patreon.com/',)
+
+
+class PBSIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://\n        (?:\n           # Direct video URL\n           (?:(?:video|www|player)\\.pbs\\.org|video\\.aptv\\.org|video\\.gpb\\.org|video\\.mpbonline\\.org|video\\.wnpt\\.org|video\\.wfsu\\.org|video\\.wsre\\.org|video\\.wtcitv\\.org|video\\.pba\\.org|video\\.alaskapublic\\.org|video\\.azpbs\\.org|portal\\.knme\\.org|video\\.vegaspbs\\.org|watch\\.aetn\\.org|video\\.ket\\.org|video\\.wkno\\.org|video\\.lpb\\.org|videos\\.oeta\\.tv|video\\.optv\\.org|watch\\.wsiu\\.org|video\\.keet\\.org|pbs\\.kixe\\.org|video\\.kpbs\\.org|video\\.kqed\\.org|vids\\.kvie\\.org|video\\.pbssocal\\.org|video\\.valleypbs\\.org|video\\.cptv\\.org|watch\\.knpb\\.org|video\\.soptv\\.org|video\\.rmpbs\\.org|video\\.kenw\\.org|video\\.kued\\.org|video\\.wyomingpbs\\.org|video\\.cpt12\\.org|video\\.kbyueleven\\.org|video\\.thirteen\\.org|video\\.wgbh\\.org|video\\.wgby\\.org|watch\\.njtvonline\\.org|watch\\.wliw\\.org|video\\.mpt\\.tv|watch\\.weta\\.org|video\\.whyy\\.org|video\\.wlvt\\.org|video\\.wvpt\\.net|video\\.whut\\.org|video\\.wedu\\.org|video\\.wgcu\\.org|video\\.wpbt2\\.org|video\\.wucftv\\.org|video\\.wuft\\.org|watch\\.wxel\\.org|video\\.wlrn\\.org|video\\.wusf\\.usf\\.edu|video\\.scetv\\.org|video\\.unctv\\.org|video\\.pbshawaii\\.org|video\\.idahoptv\\.org|video\\.ksps\\.org|watch\\.opb\\.org|watch\\.nwptv\\.org|video\\.will\\.illinois\\.edu|video\\.networkknowledge\\.tv|video\\.wttw\\.com|video\\.iptv\\.org|video\\.ninenet\\.org|video\\.wfwa\\.org|video\\.wfyi\\.org|video\\.mptv\\.org|video\\.wnin\\.org|video\\.wnit\\.org|video\\.wpt\\.org|video\\.wvut\\.org|video\\.weiu\\.net|video\\.wqpt\\.org|video\\.wycc\\.org|video\\.wipb\\.org|video\\.indianapublicmedia\\.org|watch\\.cetconnect\\.org|video\\.thinktv\\.org|video\\.wbgu\\.org|video\\.wgvu\\.org|video\\.netnebraska\\.org|video\\.pioneer\\.org|watch\\.sdpb\\.org|video\\.tpt\\.org|watch\\.ksmq\\.org|watch\\.kpts\\.org|watch\\.ktwu\\.org|watch\\.easttennesseepbs\\.org|video\\.wcte\\.tv|video\\.wljt\\.org|video\\.wosu\\.org|video\\.woub\\.org|video\\.wvpublic\\.org|video\\.wkyupbs\\.org|video\\.kera\\.org|video\\.mpbn\\.net|video\\.mountainlake\\.org|video\\.nhptv\\.org|video\\.vpt\\.org|video\\.witf\\.org|watch\\.wqed\\.org|video\\.wmht\\.org|video\\.deltabroadcasting\\.org|video\\.dptv\\.org|video\\.wcmu\\.org|video\\.wkar\\.org|wnmuvideo\\.nmu\\.edu|video\\.wdse\\.org|video\\.wgte\\.org|video\\.lptv\\.org|video\\.kmos\\.org|watch\\.montanapbs\\.org|video\\.krwg\\.org|video\\.kacvtv\\.org|video\\.kcostv\\.org|video\\.wcny\\.org|video\\.wned\\.org|watch\\.wpbstv\\.org|video\\.wskg\\.org|video\\.wxxi\\.org|video\\.wpsu\\.org|on-demand\\.wvia\\.org|video\\.wtvi\\.org|video\\.westernreservepublicmedia\\.org|video\\.ideastream\\.org|video\\.kcts9\\.org|video\\.basinpbs\\.org|video\\.houstonpbs\\.org|video\\.klrn\\.org|video\\.klru\\.tv|video\\.wtjx\\.org|video\\.ideastations\\.org|video\\.kbtc\\.org)/(?:(?:vir|port)alplayer|video)/(?P<id>[0-9]+)(?:[?/]|$) |\n           # Article with embedded player (or direct video)\n           (?:www\\.)?pbs\\.org/(?:[^/]+/){1,5}(?P<presumptive_id>[^/]+?)(?:\\.html)?/?(?:$|[?\\#]) |\n           # Player\n           (?:video|player)\\.pbs\\.org/(?:widget/)?partnerplayer/(?P<player_id>[^/]+)/\n        )\n    '
+    _module = 'youtube_dl.extractor.pbs'
+    IE_NAME = 'pbs'
+    IE_DESC = 'Public Broadcasting Service (PBS) and member stations: PBS: Public Broadcasting Service, APT - Alabama Public Television (WBIQ), GPB/Georgia Public Broadcasting (WGTV), Mississippi Public Broadcasting (WMPN), Nashville Public Television (WNPT), WFSU-TV (WFSU), WSRE (WSRE), WTCI (WTCI), WPBA/Channel 30 (WPBA), Alaska Public Media (KAKM), Arizona PBS (KAET), KNME-TV/Channel 5 (KNME), Vegas PBS (KLVX), AETN/ARKANSAS ETV NETWORK (KETS), KET (WKLE), WKNO/Channel 10 (WKNO), LPB/LOUISIANA PUBLIC BROADCASTING (WLPB), OETA (KETA), Ozarks Public Television (KOZK), WSIU Public Broadcasting (WSIU), KEET TV (KEET), KIXE/Channel 9 (KIXE), KPBS San Diego (KPBS), KQED (KQED), KVIE Public Television (KVIE), PBS SoCal/KOCE (KOCE), ValleyPBS (KVPT), CONNECTICUT PUBLIC TELEVISION (WEDH), KNPB Channel 5 (KNPB), SOPTV (KSYS), Rocky Mountain PBS (KRMA), KENW-TV3 (KENW), KUED Channel 7 (KUED), Wyoming PBS (KCWC), Colorado Public Television / KBDI 12 (KBDI), KBYU-TV (KBYU), Thirteen/WNET New York (WNET), WGBH/Channel 2 (WGBH), WGBY (WGBY), NJTV Public Media NJ (WNJT), WLIW21 (WLIW), mpt/Maryland Public Television (WMPB), WETA Television and Radio (WETA), WHYY (WHYY), PBS 39 (WLVT), WVPT - Your Source for PBS and More! (WVPT), Howard University Television (WHUT), WEDU PBS (WEDU), WGCU Public Media (WGCU), WPBT2 (WPBT), WUCF TV (WUCF), WUFT/Channel 5 (WUFT), WXEL/Channel 42 (WXEL), WLRN/Channel 17 (WLRN), WUSF Public Broadcasting (WUSF), ETV (WRLK), UNC-TV (WUNC), PBS Hawaii - Oceanic Cable Channel 10 (KHET), Idaho Public Television (KAID), KSPS (KSPS), OPB (KOPB), KWSU/Channel 10 & KTNW/Channel 31 (KWSU), WILL-TV (WILL), Network Knowledge - WSEC/Springfield (WSEC), WTTW11 (WTTW), Iowa Public Television/IPTV (KDIN), Nine Network (KETC), PBS39 Fort Wayne (WFWA), WFYI Indianapolis (WFYI), Milwaukee Public Television (WMVS), WNIN (WNIN), WNIT Public Television (WNIT), WPT (WPNE), WVUT/Channel 22 (WVUT), WEIU/Channel 51 (WEIU), WQPT-TV (WQPT), WYCC PBS Chicago (WYCC), WIPB-TV (WIPB), WTIU (WTIU), CET  (WCET), ThinkTVNetwork (WPTD), WBGU-TV (WBGU), WGVU TV (WGVU), NET1 (KUON), Pioneer Public Television (KWCM), SDPB Television (KUSD), TPT (KTCA), KSMQ (KSMQ), KPTS/Channel 8 (KPTS), KTWU/Channel 11 (KTWU), East Tennessee PBS (WSJK), WCTE-TV (WCTE), WLJT, Channel 11 (WLJT), WOSU TV (WOSU), WOUB/WOUC (WOUB), WVPB (WVPB), WKYU-PBS (WKYU), KERA 13 (KERA), MPBN (WCBB), Mountain Lake PBS (WCFE), NHPTV (WENH), Vermont PBS (WETK), witf (WITF), WQED Multimedia (WQED), WMHT Educational Telecommunications (WMHT), Q-TV (WDCQ), WTVS Detroit Public TV (WTVS), CMU Public Television (WCMU), WKAR-TV (WKAR), WNMU-TV Public TV 13 (WNMU), WDSE - WRPT (WDSE), WGTE TV (WGTE), Lakeland Public Television (KAWE), KMOS-TV - Channels 6.1, 6.2 and 6.3 (KMOS), MontanaPBS (KUSM), KRWG/Channel 22 (KRWG), KACV (KACV), KCOS/Channel 13 (KCOS), WCNY/Channel 24 (WCNY), WNED (WNED), WPBS (WPBS), WSKG Public TV (WSKG), WXXI (WXXI), WPSU (WPSU), WVIA Public Media Studios (WVIA), WTVI (WTVI), Western Reserve PBS (WNEO), WVIZ/PBS ideastream (WVIZ), KCTS 9 (KCTS), Basin PBS (KPBT), KUHT / Channel 8 (KUHT), KLRN (KLRN), KLRU (KLRU), WTJX Channel 12 (WTJX), WCVE PBS (WCVE), KBTC Public Television (KBTC)'
+    _URL_LITERALS = ('.pbs.org', '.pbs.org/', 'on-demand.wvia.org', 'pbs.kixe.org', 'pbs.org/', 'portal.knme.org', 'video.alaskapublic.org', 'video.aptv.org', 'video.azpbs.org', 'video.basinpbs.org', 'video.cpt12.org', 'video.cptv.org', 'video.deltabroadcasting.org', 'video.dptv.org', 'video.gpb.org', 'video.houstonpbs.org', 'video.idahoptv.org', 'video.ideastations.org', 'video.ideastream.org', 'video.indianapublicmedia.org', 'video.iptv.org', 'video.kacvtv.org', 'video.kbtc.org', 'video.kbyueleven.org', 'video.kcostv.org', 'video.kcts9.org', 'video.keet.org', 'video.kenw.org', 'video.kera.org', 'video.ket.org', 'video.klrn.org', 'video.klru.tv', 'video.kmos.org', 'video.kpbs.org', 'video.kqed.org', 'video.krwg.org', 'video.ksps.org', 'video.kued.org', 'video.lpb.org', 'video.lptv.org', 'video.mountainlake.org', 'video.mpbn.net', 'video.mpbonline.org', 'video.mpt.tv', 'video.mptv.org', 'video.netnebraska.org', 'video.networkknowledge.tv', 'video.nhptv.org', 'video.ninenet.org', 'video.optv.org', 'video.pba.org', 'video.pbshawaii.org', 'video.pbssocal.org', 'video.pioneer.org', 'video.rmpbs.org', 'video.scetv.org', 'video.soptv.org', 'video.thinktv.org', 'video.thirteen.org', 'video.tpt.org', 'video.unctv.org', 'video.valleypbs.org', 'video.vegaspbs.org', 'video.vpt.org', 'video.wbgu.org', 'video.wcmu.org', 'video.wcny.org', 'video.wcte.tv', 'video.wdse.org', 'video.wedu.org', 'video.weiu.net', 'video.westernreservepublicmedia.org', 'video.wfsu.org', 'video.wfwa.org', 'video.wfyi.org', 'video.wgbh.org', 'video.wgby.org', 'video.wgcu.org', 'video.wgte.org', 'video.wgvu.org', 'video.whut.org', 'video.whyy.org', 'video.will.illinois.edu', 'video.wipb.org', 'video.witf.org', 'video.wkar.org', 'video.wkno.org', 'video.wkyupbs.org', 'video.wljt.org', 'video.wlrn.org', 'video.wlvt.org', 'video.wmht.org', 'video.wned.org', 'video.wnin.org', 'video.wnit.org', 'video.wnpt.org', 'video.wosu.org', 'video.woub.org', 'video.wpbt2.org', 'video.wpsu.org', 'video.wpt.org', 'video.wqpt.org', 'video.wskg.org', 'video.wsre.org', 'video.wtcitv.org', 'video.wtjx.org', 'video.wttw.com', 'video.wtvi.org', 'video.wucftv.org', 'video.wuft.org', 'video.wusf.usf.edu', 'video.wvpt.net', 'video.wvpublic.org', 'video.wvut.org', 'video.wxxi.org', 'video.wycc.org', 'video.wyomingpbs.org', 'videos.oeta.tv', 'vids.kvie.org', 'watch.aetn.org', 'watch.cetconnect.org', 'watch.easttennesseepbs.org', 'watch.knpb.org', 'watch.kpts.org', 'watch.ksmq.org', 'watch.ktwu.org', 'watch.montanapbs.org', 'watch.njtvonline.org', 'watch.nwptv.org', 'watch.opb.org', 'watch.sdpb.org', 'watch.weta.org', 'watch.wliw.org', 'watch.wpbstv.org', 'watch.wqed.org', 'watch.wsiu.org', 'watch.wxel.org', 'wnmuvideo.nmu.edu')
+
+
+class PearVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?pearvideo\\.com/video_(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.pearvideo'
+    IE_NAME = 'PearVideo'
+    _URL_LITERALS = ('pearvideo.com/video_',)
+
+
+class PeerTubeIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    (?:\n                        peertube:(?P<host>[^:]+):|\n                        https?://(?P<host_2>(?:\n                            # Taken from https://instances.joinpeertube.org/instances\n                            peertube\\.rainbowswingers\\.net|\n                            tube\\.stanisic\\.nl|\n                            peer\\.suiri\\.us|\n                            medias\\.libox\\.fr|\n                            videomensoif\\.ynh\\.fr|\n                            peertube\\.travelpandas\\.eu|\n                            peertube\\.rachetjay\\.fr|\n                            peertube\\.montecsys\\.fr|\n                            tube\\.eskuero\\.me|\n                            peer\\.tube|\n                            peertube\\.umeahackerspace\\.se|\n                            tube\\.nx-pod\\.de|\n                            video\\.monsieurbidouille\\.fr|\n                            tube\\.openalgeria\\.org|\n                            vid\\.lelux\\.fi|\n                            video\\.anormallostpod\\.ovh|\n                            tube\\.crapaud-fou\\.org|\n                            peertube\\.stemy\\.me|\n                            lostpod\\.space|\n                            exode\\.me|\n                            peertube\\.snargol\\.com|\n                            vis\\.ion\\.ovh|\n                            videosdulib\\.re|\n                            v\\.mbius\\.io|\n                            videos\\.judrey\\.eu|\n                            peertube\\.osureplayviewer\\.xyz|\n                            peertube\\.mathieufamily\\.ovh|\n                            www\\.videos-libr\\.es|\n                            fightforinfo\\.com|\n                            peertube\\.fediverse\\.ru|\n                            peertube\\.oiseauroch\\.fr|\n                            video\\.nesven\\.eu|\n                            v\\.bearvideo\\.win|\n                            video\\.qoto\\.org|\n                            justporn\\.cc|\n                            video\\.vny\\.fr|\n                            peervideo\\.club|\n                            tube\\.taker\\.fr|\n                            peertube\\.chantierlibre\\.org|\n                            tube\\.ipfixe\\.info|\n                            tube\\.kicou\\.info|\n                            tube\\.dodsorf\\.as|\n                            videobit\\.cc|\n                            video\\.yukari\\.moe|\n                            videos\\.elbinario\\.net|\n                            hkvideo\\.live|\n                            pt\\.tux\\.tf|\n                            www\\.hkvideo\\.live|\n                            FIGHTFORINFO\\.com|\n                            pt\\.765racing\\.com|\n                            peertube\\.gnumeria\\.eu\\.org|\n                            nordenmedia\\.com|\n                            peertube\\.co\\.uk|\n                            tube\\.darfweb\\.eu|\n                            tube\\.kalah-france\\.org|\n                            0ch\\.in|\n                            vod\\.mochi\\.academy|\n                            film\\.node9\\.org|\n                            peertube\\.hatthieves\\.es|\n                            video\\.fitchfamily\\.org|\n                            peertube\\.ddns\\.net|\n                            video\\.ifuncle\\.kr|\n                            video\\.fdlibre\\.eu|\n                            tube\\.22decembre\\.eu|\n                            peertube\\.harmoniescreatives\\.com|\n                            tube\\.fabrigli\\.fr|\n                            video\\.thedwyers\\.co|\n                            video\\.bruitbruit\\.com|\n                            peertube\\.foxfam\\.club|\n                            peer\\.philoxweb\\.be|\n                            videos\\.bugs\\.social|\n                            peertube\\.malbert\\.xyz|\n                            peertube\\.bilange\\.ca|\n                            libretube\\.net|\n                            diytelevision\\.com|\n                            peertube\\.fedilab\\.app|\n                            libre\\.video|\n                            video\\.mstddntfdn\\.online|\n                            us\\.tv|\n                            peertube\\.sl-network\\.fr|\n                            peertube\\.dynlinux\\.io|\n                            peertube\\.david\\.durieux\\.family|\n                            peertube\\.linuxrocks\\.online|\n                            peerwatch\\.xyz|\n                            v\\.kretschmann\\.social|\n                            tube\\.otter\\.sh|\n                            yt\\.is\\.nota\\.live|\n                            tube\\.dragonpsi\\.xyz|\n                            peertube\\.boneheadmedia\\.com|\n                            videos\\.funkwhale\\.audio|\n                            watch\\.44con\\.com|\n                            peertube\\.gcaillaut\\.fr|\n                            peertube\\.icu|\n                            pony\\.tube|\n                            spacepub\\.space|\n                            tube\\.stbr\\.io|\n                            v\\.mom-gay\\.faith|\n                            tube\\.port0\\.xyz|\n                            peertube\\.simounet\\.net|\n                            play\\.jergefelt\\.se|\n                            peertube\\.zeteo\\.me|\n                            tube\\.danq\\.me|\n                            peertube\\.kerenon\\.com|\n                            tube\\.fab-l3\\.org|\n                            tube\\.calculate\\.social|\n                            peertube\\.mckillop\\.org|\n                            tube\\.netzspielplatz\\.de|\n                            vod\\.ksite\\.de|\n                            peertube\\.laas\\.fr|\n                            tube\\.govital\\.net|\n                            peertube\\.stephenson\\.cc|\n                            bistule\\.nohost\\.me|\n                            peertube\\.kajalinifi\\.de|\n                            video\\.ploud\\.jp|\n                            video\\.omniatv\\.com|\n                            peertube\\.ffs2play\\.fr|\n                            peertube\\.leboulaire\\.ovh|\n                            peertube\\.tronic-studio\\.com|\n                            peertube\\.public\\.cat|\n                            peertube\\.metalbanana\\.net|\n                            video\\.1000i100\\.fr|\n                            peertube\\.alter-nativ-voll\\.de|\n                            tube\\.pasa\\.tf|\n                            tube\\.worldofhauru\\.xyz|\n                            pt\\.kamp\\.site|\n                            peertube\\.teleassist\\.fr|\n                            videos\\.mleduc\\.xyz|\n                            conf\\.tube|\n                            media\\.privacyinternational\\.org|\n                            pt\\.forty-two\\.nl|\n                            video\\.halle-leaks\\.de|\n                            video\\.grosskopfgames\\.de|\n                            peertube\\.schaeferit\\.de|\n                            peertube\\.jackbot\\.fr|\n                            tube\\.extinctionrebellion\\.fr|\n                            peertube\\.f-si\\.org|\n                            video\\.subak\\.ovh|\n                            videos\\.koweb\\.fr|\n                            peertube\\.zergy\\.net|\n                            peertube\\.roflcopter\\.fr|\n                            peertube\\.floss-marketing-school\\.com|\n                            vloggers\\.social|\n                            peertube\\.iriseden\\.eu|\n                            videos\\.ubuntu-paris\\.org|\n                            peertube\\.mastodon\\.host|\n                            armstube\\.com|\n                            peertube\\.s2s\\.video|\n                            peertube\\.lol|\n                            tube\\.open-plug\\.eu|\n                            open\\.tube|\n                            peertube\\.ch|\n                            peertube\\.normandie-libre\\.fr|\n                            peertube\\.slat\\.org|\n                            video\\.lacaveatonton\\.ovh|\n                            peertube\\.uno|\n                            peertube\\.servebeer\\.com|\n                            peertube\\.fedi\\.quebec|\n                            tube\\.h3z\\.jp|\n                            tube\\.plus200\\.com|\n                            peertube\\.eric\\.ovh|\n                            tube\\.metadocs\\.cc|\n                            tube\\.unmondemeilleur\\.eu|\n                            gouttedeau\\.space|\n                            video\\.antirep\\.net|\n                            nrop\\.cant\\.at|\n                            tube\\.ksl-bmx\\.de|\n                            tube\\.plaf\\.fr|\n                            tube\\.tchncs\\.de|\n                            video\\.devinberg\\.com|\n                            hitchtube\\.fr|\n                            peertube\\.kosebamse\\.com|\n                            yunopeertube\\.myddns\\.me|\n                            peertube\\.varney\\.fr|\n                            peertube\\.anon-kenkai\\.com|\n                            tube\\.maiti\\.info|\n                            tubee\\.fr|\n                            videos\\.dinofly\\.com|\n                            toobnix\\.org|\n                            videotape\\.me|\n                            voca\\.tube|\n                            video\\.heromuster\\.com|\n                            video\\.lemediatv\\.fr|\n                            video\\.up\\.edu\\.ph|\n                            balafon\\.video|\n                            video\\.ivel\\.fr|\n                            thickrips\\.cloud|\n                            pt\\.laurentkruger\\.fr|\n                            video\\.monarch-pass\\.net|\n                            peertube\\.artica\\.center|\n                            video\\.alternanet\\.fr|\n                            indymotion\\.fr|\n                            fanvid\\.stopthatimp\\.net|\n                            video\\.farci\\.org|\n                            v\\.lesterpig\\.com|\n                            video\\.okaris\\.de|\n                            tube\\.pawelko\\.net|\n                            peertube\\.mablr\\.org|\n                            tube\\.fede\\.re|\n                            pytu\\.be|\n                            evertron\\.tv|\n                            devtube\\.dev-wiki\\.de|\n                            raptube\\.antipub\\.org|\n                            video\\.selea\\.se|\n                            peertube\\.mygaia\\.org|\n                            video\\.oh14\\.de|\n                            peertube\\.livingutopia\\.org|\n                            peertube\\.the-penguin\\.de|\n                            tube\\.thechangebook\\.org|\n                            tube\\.anjara\\.eu|\n                            pt\\.pube\\.tk|\n                            video\\.samedi\\.pm|\n                            mplayer\\.demouliere\\.eu|\n                            widemus\\.de|\n                            peertube\\.me|\n                            peertube\\.zapashcanon\\.fr|\n                            video\\.latavernedejohnjohn\\.fr|\n                            peertube\\.pcservice46\\.fr|\n                            peertube\\.mazzonetto\\.eu|\n                            video\\.irem\\.univ-paris-diderot\\.fr|\n                            video\\.livecchi\\.cloud|\n                            alttube\\.fr|\n                            video\\.coop\\.tools|\n                            video\\.cabane-libre\\.org|\n                            peertube\\.openstreetmap\\.fr|\n                            videos\\.alolise\\.org|\n                            irrsinn\\.video|\n                            video\\.antopie\\.org|\n                            scitech\\.video|\n                            tube2\\.nemsia\\.org|\n                            video\\.amic37\\.fr|\n                            peertube\\.freeforge\\.eu|\n                            video\\.arbitrarion\\.com|\n                            video\\.datsemultimedia\\.com|\n                            stoptrackingus\\.tv|\n                            peertube\\.ricostrongxxx\\.com|\n                            docker\\.videos\\.lecygnenoir\\.info|\n                            peertube\\.togart\\.de|\n                            tube\\.postblue\\.info|\n                            videos\\.domainepublic\\.net|\n                            peertube\\.cyber-tribal\\.com|\n                            video\\.gresille\\.org|\n                            peertube\\.dsmouse\\.net|\n                            cinema\\.yunohost\\.support|\n                            tube\\.theocevaer\\.fr|\n                            repro\\.video|\n                            tube\\.4aem\\.com|\n                            quaziinc\\.com|\n                            peertube\\.metawurst\\.space|\n                            videos\\.wakapo\\.com|\n                            video\\.ploud\\.fr|\n                            video\\.freeradical\\.zone|\n                            tube\\.valinor\\.fr|\n                            refuznik\\.video|\n                            pt\\.kircheneuenburg\\.de|\n                            peertube\\.asrun\\.eu|\n                            peertube\\.lagob\\.fr|\n                            videos\\.side-ways\\.net|\n                            91video\\.online|\n                            video\\.valme\\.io|\n                            video\\.taboulisme\\.com|\n                            videos-libr\\.es|\n                            tv\\.mooh\\.fr|\n                            nuage\\.acostey\\.fr|\n                            video\\.monsieur-a\\.fr|\n                            peertube\\.librelois\\.fr|\n                            videos\\.pair2jeux\\.tube|\n                            videos\\.pueseso\\.club|\n                            peer\\.mathdacloud\\.ovh|\n                            media\\.assassinate-you\\.net|\n                            vidcommons\\.org|\n                            ptube\\.rousset\\.nom\\.fr|\n                            tube\\.cyano\\.at|\n                            videos\\.squat\\.net|\n                            video\\.iphodase\\.fr|\n                            peertube\\.makotoworkshop\\.org|\n                            peertube\\.serveur\\.slv-valbonne\\.fr|\n                            vault\\.mle\\.party|\n                            hostyour\\.tv|\n                            videos\\.hack2g2\\.fr|\n                            libre\\.tube|\n                            pire\\.artisanlogiciel\\.net|\n                            videos\\.numerique-en-commun\\.fr|\n                            video\\.netsyms\\.com|\n                            video\\.die-partei\\.social|\n                            video\\.writeas\\.org|\n                            peertube\\.swarm\\.solvingmaz\\.es|\n                            tube\\.pericoloso\\.ovh|\n                            watching\\.cypherpunk\\.observer|\n                            videos\\.adhocmusic\\.com|\n                            tube\\.rfc1149\\.net|\n                            peertube\\.librelabucm\\.org|\n                            videos\\.numericoop\\.fr|\n                            peertube\\.koehn\\.com|\n                            peertube\\.anarchmusicall\\.net|\n                            tube\\.kampftoast\\.de|\n                            vid\\.y-y\\.li|\n                            peertube\\.xtenz\\.xyz|\n                            diode\\.zone|\n                            tube\\.egf\\.mn|\n                            peertube\\.nomagic\\.uk|\n                            visionon\\.tv|\n                            videos\\.koumoul\\.com|\n                            video\\.rastapuls\\.com|\n                            video\\.mantlepro\\.com|\n                            video\\.deadsuperhero\\.com|\n                            peertube\\.musicstudio\\.pro|\n                            peertube\\.we-keys\\.fr|\n                            artitube\\.artifaille\\.fr|\n                            peertube\\.ethernia\\.net|\n                            tube\\.midov\\.pl|\n                            peertube\\.fr|\n                            watch\\.snoot\\.tube|\n                            peertube\\.donnadieu\\.fr|\n                            argos\\.aquilenet\\.fr|\n                            tube\\.nemsia\\.org|\n                            tube\\.bruniau\\.net|\n                            videos\\.darckoune\\.moe|\n                            tube\\.traydent\\.info|\n                            dev\\.videos\\.lecygnenoir\\.info|\n                            peertube\\.nayya\\.org|\n                            peertube\\.live|\n                            peertube\\.mofgao\\.space|\n                            video\\.lequerrec\\.eu|\n                            peertube\\.amicale\\.net|\n                            aperi\\.tube|\n                            tube\\.ac-lyon\\.fr|\n                            video\\.lw1\\.at|\n                            www\\.yiny\\.org|\n                            videos\\.pofilo\\.fr|\n                            tube\\.lou\\.lt|\n                            choob\\.h\\.etbus\\.ch|\n                            tube\\.hoga\\.fr|\n                            peertube\\.heberge\\.fr|\n                            video\\.obermui\\.de|\n                            videos\\.cloudfrancois\\.fr|\n                            betamax\\.video|\n                            video\\.typica\\.us|\n                            tube\\.piweb\\.be|\n                            video\\.blender\\.org|\n                            peertube\\.cat|\n                            tube\\.kdy\\.ch|\n                            pe\\.ertu\\.be|\n                            peertube\\.social|\n                            videos\\.lescommuns\\.org|\n                            tv\\.datamol\\.org|\n                            videonaute\\.fr|\n                            dialup\\.express|\n                            peertube\\.nogafa\\.org|\n                            megatube\\.lilomoino\\.fr|\n                            peertube\\.tamanoir\\.foucry\\.net|\n                            peertube\\.devosi\\.org|\n                            peertube\\.1312\\.media|\n                            tube\\.bootlicker\\.party|\n                            skeptikon\\.fr|\n                            video\\.blueline\\.mg|\n                            tube\\.homecomputing\\.fr|\n                            tube\\.ouahpiti\\.info|\n                            video\\.tedomum\\.net|\n                            video\\.g3l\\.org|\n                            fontube\\.fr|\n                            peertube\\.gaialabs\\.ch|\n                            tube\\.kher\\.nl|\n                            peertube\\.qtg\\.fr|\n                            video\\.migennes\\.net|\n                            tube\\.p2p\\.legal|\n                            troll\\.tv|\n                            videos\\.iut-orsay\\.fr|\n                            peertube\\.solidev\\.net|\n                            videos\\.cemea\\.org|\n                            video\\.passageenseine\\.fr|\n                            videos\\.festivalparminous\\.org|\n                            peertube\\.touhoppai\\.moe|\n                            sikke\\.fi|\n                            peer\\.hostux\\.social|\n                            share\\.tube|\n                            peertube\\.walkingmountains\\.fr|\n                            videos\\.benpro\\.fr|\n                            peertube\\.parleur\\.net|\n                            peertube\\.heraut\\.eu|\n                            tube\\.aquilenet\\.fr|\n                            peertube\\.gegeweb\\.eu|\n                            framatube\\.org|\n                            thinkerview\\.video|\n                            tube\\.conferences-gesticulees\\.net|\n                            peertube\\.datagueule\\.tv|\n                            video\\.lqdn\\.fr|\n                            tube\\.mochi\\.academy|\n                            media\\.zat\\.im|\n                            video\\.colibris-outilslibres\\.org|\n                            tube\\.svnet\\.fr|\n                            peertube\\.video|\n                            peertube3\\.cpy\\.re|\n                            peertube2\\.cpy\\.re|\n                            videos\\.tcit\\.fr|\n                            peertube\\.cpy\\.re\n                        ))/(?:videos/(?:watch|embed)|api/v\\d/videos)/\n                    )\n                    (?P<id>[\\da-fA-F]{8}-[\\da-fA-F]{4}-[\\da-fA-F]{4}-[\\da-fA-F]{4}-[\\da-fA-F]{12})\n                    '
+    _module = 'youtube_dl.extractor.peertube'
+    IE_NAME = 'PeerTube'
+    _URL_LITERALS = ('0ch.in', '91video.online', 'alttube.fr', 'aperi.tube', 'argos.aquilenet.fr', 'armstube.com', 'artitube.artifaille.fr', 'balafon.video', 'betamax.video', 'bistule.nohost.me', 'choob.h.etbus.ch', 'cinema.yunohost.support', 'conf.tube', 'dev.videos.lecygnenoir.info', 'devtube.dev-wiki.de', 'dialup.express', 'diode.zone', 'diytelevision.com', 'docker.videos.lecygnenoir.info', 'evertron.tv', 'exode.me', 'fanvid.stopthatimp.net', 'fightforinfo.com', 'film.node9.org', 'fontube.fr', 'framatube.org', 'gouttedeau.space', 'hitchtube.fr', 'hkvideo.live', 'hostyour.tv', 'indymotion.fr', 'irrsinn.video', 'justporn.cc', 'libre.tube', 'libre.video', 'libretube.net', 'lostpod.space', 'media.assassinate-you.net', 'media.privacyinternational.org', 'media.zat.im', 'medias.libox.fr', 'megatube.lilomoino.fr', 'mplayer.demouliere.eu', 'nordenmedia.com', 'nrop.cant.at', 'nuage.acostey.fr', 'open.tube', 'pe.ertu.be', 'peer.hostux.social', 'peer.mathdacloud.ovh', 'peer.philoxweb.be', 'peer.suiri.us', 'peer.tube', 'peertube.1312.media', 'peertube.alter-nativ-voll.de', 'peertube.amicale.net', 'peertube.anarchmusicall.net', 'peertube.anon-kenkai.com', 'peertube.artica.center', 'peertube.asrun.eu', 'peertube.bilange.ca', 'peertube.boneheadmedia.com', 'peertube.cat', 'peertube.ch', 'peertube.chantierlibre.org', 'peertube.co.uk', 'peertube.cpy.re', 'peertube.cyber-tribal.com', 'peertube.datagueule.tv', 'peertube.david.durieux.family', 'peertube.ddns.net', 'peertube.devosi.org', 'peertube.donnadieu.fr', 'peertube.dsmouse.net', 'peertube.dynlinux.io', 'peertube.eric.ovh', 'peertube.ethernia.net', 'peertube.f-si.org', 'peertube.fedi.quebec', 'peertube.fedilab.app', 'peertube.fediverse.ru', 'peertube.ffs2play.fr', 'peertube.floss-marketing-school.com', 'peertube.foxfam.club', 'peertube.fr', 'peertube.freeforge.eu', 'peertube.gaialabs.ch', 'peertube.gcaillaut.fr', 'peertube.gegeweb.eu', 'peertube.gnumeria.eu.org', 'peertube.harmoniescreatives.com', 'peertube.hatthieves.es', 'peertube.heberge.fr', 'peertube.heraut.eu', 'peertube.icu', 'peertube.iriseden.eu', 'peertube.jackbot.fr', 'peertube.kajalinifi.de', 'peertube.kerenon.com', 'peertube.koehn.com', 'peertube.kosebamse.com', 'peertube.laas.fr', 'peertube.lagob.fr', 'peertube.leboulaire.ovh', 'peertube.librelabucm.org', 'peertube.librelois.fr', 'peertube.linuxrocks.online', 'peertube.live', 'peertube.livingutopia.org', 'peertube.lol', 'peertube.mablr.org', 'peertube.makotoworkshop.org', 'peertube.malbert.xyz', 'peertube.mastodon.host', 'peertube.mathieufamily.ovh', 'peertube.mazzonetto.eu', 'peertube.mckillop.org', 'peertube.me', 'peertube.metalbanana.net', 'peertube.metawurst.space', 'peertube.mofgao.space', 'peertube.montecsys.fr', 'peertube.musicstudio.pro', 'peertube.mygaia.org', 'peertube.nayya.org', 'peertube.nogafa.org', 'peertube.nomagic.uk', 'peertube.normandie-libre.fr', 'peertube.oiseauroch.fr', 'peertube.openstreetmap.fr', 'peertube.osureplayviewer.xyz', 'peertube.parleur.net', 'peertube.pcservice46.fr', 'peertube.public.cat', 'peertube.qtg.fr', 'peertube.rachetjay.fr', 'peertube.rainbowswingers.net', 'peertube.ricostrongxxx.com', 'peertube.roflcopter.fr', 'peertube.s2s.video', 'peertube.schaeferit.de', 'peertube.servebeer.com', 'peertube.serveur.slv-valbonne.fr', 'peertube.simounet.net', 'peertube.sl-network.fr', 'peertube.slat.org', 'peertube.snargol.com', 'peertube.social', 'peertube.solidev.net', 'peertube.stemy.me', 'peertube.stephenson.cc', 'peertube.swarm.solvingmaz.es', 'peertube.tamanoir.foucry.net', 'peertube.teleassist.fr', 'peertube.the-penguin.de', 'peertube.togart.de', 'peertube.touhoppai.moe', 'peertube.travelpandas.eu', 'peertube.tronic-studio.com', 'peertube.umeahackerspace.se', 'peertube.uno', 'peertube.varney.fr', 'peertube.video', 'peertube.walkingmountains.fr', 'peertube.we-keys.fr', 'peertube.xtenz.xyz', 'peertube.zapashcanon.fr', 'peertube.zergy.net', 'peertube.zeteo.me', 'peertube2.cpy.re', 'peertube3.cpy.re', 'peertube:', 'peervideo.club', 'peerwatch.xyz', 'pire.artisanlogiciel.net', 'play.jergefelt.se', 'pony.tube', 'pt.765racing.com', 'pt.forty-two.nl', 'pt.kamp.site', 'pt.kircheneuenburg.de', 'pt.laurentkruger.fr', 'pt.pube.tk', 'pt.tux.tf', 'ptube.rousset.nom.fr', 'pytu.be', 'quaziinc.com', 'raptube.antipub.org', 'refuznik.video', 'repro.video', 'scitech.video', 'share.tube', 'sikke.fi', 'skeptikon.fr', 'spacepub.space', 'stoptrackingus.tv', 'thickrips.cloud', 'thinkerview.video', 'toobnix.org', 'troll.tv', 'tube.22decembre.eu', 'tube.4aem.com', 'tube.ac-lyon.fr', 'tube.anjara.eu', 'tube.aquilenet.fr', 'tube.bootlicker.party', 'tube.bruniau.net', 'tube.calculate.social', 'tube.conferences-gesticulees.net', 'tube.crapaud-fou.org', 'tube.cyano.at', 'tube.danq.me', 'tube.darfweb.eu', 'tube.dodsorf.as', 'tube.dragonpsi.xyz', 'tube.egf.mn', 'tube.eskuero.me', 'tube.extinctionrebellion.fr', 'tube.fab-l3.org', 'tube.fabrigli.fr', 'tube.fede.re', 'tube.govital.net', 'tube.h3z.jp', 'tube.hoga.fr', 'tube.homecomputing.fr', 'tube.ipfixe.info', 'tube.kalah-france.org', 'tube.kampftoast.de', 'tube.kdy.ch', 'tube.kher.nl', 'tube.kicou.info', 'tube.ksl-bmx.de', 'tube.lou.lt', 'tube.maiti.info', 'tube.metadocs.cc', 'tube.midov.pl', 'tube.mochi.academy', 'tube.nemsia.org', 'tube.netzspielplatz.de', 'tube.nx-pod.de', 'tube.open-plug.eu', 'tube.openalgeria.org', 'tube.otter.sh', 'tube.ouahpiti.info', 'tube.p2p.legal', 'tube.pasa.tf', 'tube.pawelko.net', 'tube.pericoloso.ovh', 'tube.piweb.be', 'tube.plaf.fr', 'tube.plus200.com', 'tube.port0.xyz', 'tube.postblue.info', 'tube.rfc1149.net', 'tube.stanisic.nl', 'tube.stbr.io', 'tube.svnet.fr', 'tube.taker.fr', 'tube.tchncs.de', 'tube.thechangebook.org', 'tube.theocevaer.fr', 'tube.traydent.info', 'tube.unmondemeilleur.eu', 'tube.valinor.fr', 'tube.worldofhauru.xyz', 'tube2.nemsia.org', 'tubee.fr', 'tv.datamol.org', 'tv.mooh.fr', 'us.tv', 'v.bearvideo.win', 'v.kretschmann.social', 'v.lesterpig.com', 'v.mbius.io', 'v.mom-gay.faith', 'vault.mle.party', 'vid.lelux.fi', 'vid.y-y.li', 'vidcommons.org', 'video.1000i100.fr', 'video.alternanet.fr', 'video.amic37.fr', 'video.anormallostpod.ovh', 'video.antirep.net', 'video.antopie.org', 'video.arbitrarion.com', 'video.blender.org', 'video.blueline.mg', 'video.bruitbruit.com', 'video.cabane-libre.org', 'video.colibris-outilslibres.org', 'video.coop.tools', 'video.datsemultimedia.com', 'video.deadsuperhero.com', 'video.devinberg.com', 'video.die-partei.social', 'video.farci.org', 'video.fdlibre.eu', 'video.fitchfamily.org', 'video.freeradical.zone', 'video.g3l.org', 'video.gresille.org', 'video.grosskopfgames.de', 'video.halle-leaks.de', 'video.heromuster.com', 'video.ifuncle.kr', 'video.iphodase.fr', 'video.irem.univ-paris-diderot.fr', 'video.ivel.fr', 'video.lacaveatonton.ovh', 'video.latavernedejohnjohn.fr', 'video.lemediatv.fr', 'video.lequerrec.eu', 'video.livecchi.cloud', 'video.lqdn.fr', 'video.lw1.at', 'video.mantlepro.com', 'video.migennes.net', 'video.monarch-pass.net', 'video.monsieur-a.fr', 'video.monsieurbidouille.fr', 'video.mstddntfdn.online', 'video.nesven.eu', 'video.netsyms.com', 'video.obermui.de', 'video.oh14.de', 'video.okaris.de', 'video.omniatv.com', 'video.passageenseine.fr', 'video.ploud.fr', 'video.ploud.jp', 'video.qoto.org', 'video.rastapuls.com', 'video.samedi.pm', 'video.selea.se', 'video.subak.ovh', 'video.taboulisme.com', 'video.tedomum.net', 'video.thedwyers.co', 'video.typica.us', 'video.up.edu.ph', 'video.valme.io', 'video.vny.fr', 'video.writeas.org', 'video.yukari.moe', 'videobit.cc', 'videomensoif.ynh.fr', 'videonaute.fr', 'videos-libr.es', 'videos.adhocmusic.com', 'videos.alolise.org', 'videos.benpro.fr', 'videos.bugs.social', 'videos.cemea.org', 'videos.cloudfrancois.fr', 'videos.darckoune.moe', 'videos.dinofly.com', 'videos.domainepublic.net', 'videos.elbinario.net', 'videos.festivalparminous.org', 'videos.funkwhale.audio', 'videos.hack2g2.fr', 'videos.iut-orsay.fr', 'videos.judrey.eu', 'videos.koumoul.com', 'videos.koweb.fr', 'videos.lescommuns.org', 'videos.mleduc.xyz', 'videos.numericoop.fr', 'videos.numerique-en-commun.fr', 'videos.pair2jeux.tube', 'videos.pofilo.fr', 'videos.pueseso.club', 'videos.side-ways.net', 'videos.squat.net', 'videos.tcit.fr', 'videos.ubuntu-paris.org', 'videos.wakapo.com', 'videosdulib.re', 'videotape.me', 'vis.ion.ovh', 'visionon.tv', 'vloggers.social', 'voca.tube', 'vod.ksite.de', 'vod.mochi.academy', 'watch.44con.com', 'watch.snoot.tube', 'watching.cypherpunk.observer', 'widemus.de', 'www.hkvideo.live', 'www.videos-libr.es', 'www.yiny.org', 'yt.is.nota.live', 'yunopeertube.myddns.me')
+
+
+class PeopleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?people\\.com/people/videos/0,,(?P<id>\\d+),00\\.html'
+    _module = 'youtube_dl.extractor.people'
+    IE_NAME = 'People'
+    _URL_LITERALS = ('people.com/people/videos/0,,',)
+
+
+class PerformGroupIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://player\\.performgroup\\.com/eplayer(?:/eplayer\\.html|\\.js)#/?(?P<id>[0-9a-f]{26})\\.(?P<auth_token>[0-9a-z]{26})'
+    _module = 'youtube_dl.extractor.performgroup'
+    IE_NAME = 'PerformGroup'
+    _URL_LITERALS = ('://player.performgroup.com/eplayer',)
+
+
+class PeriscopeBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.periscope'
+    IE_NAME = 'PeriscopeBase'
+    _URL_LITERALS = None
+
+
+class PeriscopeIE(PeriscopeBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:periscope|pscp)\\.tv/[^/]+/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.periscope'
+    IE_NAME = 'periscope'
+    IE_DESC = 'Periscope'
+    _URL_LITERALS = ('.tv/',)
+
+
+class PeriscopeUserIE(PeriscopeBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:periscope|pscp)\\.tv/(?P<id>[^/]+)/?$'
+    _module = 'youtube_dl.extractor.periscope'
+    IE_NAME = 'periscope:user'
+    IE_DESC = 'Periscope user videos'
+    _URL_LITERALS = ('.tv/',)
+
+
+class PhilharmonieDeParisIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            live\\.philharmoniedeparis\\.fr/(?:[Cc]oncert/|embed(?:app)?/|misc/Playlist\\.ashx\\?id=)|\n                            pad\\.philharmoniedeparis\\.fr/doc/CIMU/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.philharmoniedeparis'
+    IE_NAME = 'PhilharmonieDeParis'
+    IE_DESC = 'Philharmonie de Paris'
+    _URL_LITERALS = ('live.philharmoniedeparis.fr/', 'pad.philharmoniedeparis.fr/doc/cimu/')
+
+
+class PhoenixIE(DreiSatIE):
+    _VALID_URL = '(?x)https?://(?:www\\.)?phoenix\\.de/content/\n        (?:\n            phoenix/die_sendungen/(?:[^/]+/)?\n        )?\n        (?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.phoenix'
+    IE_NAME = 'phoenix.de'
+    _URL_LITERALS = ('phoenix.de/content/',)
+
+
+class PhotobucketIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[a-z0-9]+\\.)?photobucket\\.com/.*(([\\?\\&]current=)|_)(?P<id>.*)\\.(?P<ext>(flv)|(mp4))'
+    _module = 'youtube_dl.extractor.photobucket'
+    IE_NAME = 'Photobucket'
+    _URL_LITERALS = ('photobucket.com/',)
+
+
+class PicartoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www.)?picarto\\.tv/(?P<id>[a-zA-Z0-9]+)(?:/(?P<token>[a-zA-Z0-9]+))?'
+    _module = 'youtube_dl.extractor.picarto'
+    IE_NAME = 'Picarto'
+    _URL_LITERALS = ('picarto.tv/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if PicartoVodIE.suitable(url) else super(PicartoIE, cls).suitable(url)
+
+
+class PicartoVodIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www.)?picarto\\.tv/videopopout/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.picarto'
+    IE_NAME = 'PicartoVod'
+    _URL_LITERALS = ('picarto.tv/videopopout/',)
+
+
+class PikselIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://player\\.piksel\\.com/v/(?:refid/[^/]+/prefid/)?(?P<id>[a-z0-9_]+)'
+    _module = 'youtube_dl.extractor.piksel'
+    IE_NAME = 'Piksel'
+    _URL_LITERALS = ('://player.piksel.com/v/',)
+
+
+class PinkbikeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www\\.)?pinkbike\\.com/video/|es\\.pinkbike\\.org/i/kvid/kvid-y5\\.swf\\?id=)(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.pinkbike'
+    IE_NAME = 'Pinkbike'
+    _URL_LITERALS = ('es.pinkbike.org/i/kvid/kvid-y5.swf?id=', 'pinkbike.com/video/')
+
+
+class PladformIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:\n                                out\\.pladform\\.ru/player|\n                                static\\.pladform\\.ru/player\\.swf\n                            )\n                            \\?.*\\bvideoid=|\n                            video\\.pladform\\.ru/catalog/video/videoid/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.pladform'
+    IE_NAME = 'Pladform'
+    _URL_LITERALS = ('out.pladform.ru/player', 'static.pladform.ru/player.swf', 'video.pladform.ru/catalog/video/videoid/')
+
+
+class PlatziBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.platzi'
+    IE_NAME = 'PlatziBase'
+    _URL_LITERALS = None
+
+
+class PlatziIE(PlatziBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            platzi\\.com/clases|           # es version\n                            courses\\.platzi\\.com/classes  # en version\n                        )/[^/]+/(?P<id>\\d+)-[^/?\\#&]+\n                    '
+    _module = 'youtube_dl.extractor.platzi'
+    IE_NAME = 'Platzi'
+    _URL_LITERALS = ('courses.platzi.com/classes', 'platzi.com/clases')
+
+
+class PlatziCourseIE(PlatziBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            platzi\\.com/clases|           # es version\n                            courses\\.platzi\\.com/classes  # en version\n                        )/(?P<id>[^/?\\#&]+)\n                    '
+    _module = 'youtube_dl.extractor.platzi'
+    IE_NAME = 'PlatziCourse'
+    _URL_LITERALS = ('courses.platzi.com/classes', 'platzi.com/clases')
+
+    @classmethod
+    def suitable(cls, url):
+        return False if PlatziIE.suitable(url) else super(PlatziCourseIE, cls).suitable(url)
+
+
+class PlayFMIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?play\\.fm/(?P<slug>(?:[^/]+/)+(?P<id>[^/]+))/?(?:$|[?#])'
+    _module = 'youtube_dl.extractor.playfm'
+    IE_NAME = 'play.fm'
+    _URL_LITERALS = ('play.fm/',)
+
+
+class PlayPlusTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?playplus\\.(?:com|tv)/VOD/(?P<project_id>[0-9]+)/(?P<id>[0-9a-f]{32})'
+    _module = 'youtube_dl.extractor.playplustv'
+    IE_NAME = 'PlayPlusTV'
+    _URL_LITERALS = ('playplus.',)
+
+
+class PlaysTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?plays\\.tv/(?:video|embeds)/(?P<id>[0-9a-f]{18})'
+    _module = 'youtube_dl.extractor.plays'
+    IE_NAME = 'PlaysTV'
+    _URL_LITERALS = ('plays.tv/',)
+
+
+class PlaytvakIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?(?:playtvak|idnes|lidovky|metro)\\.cz/.*\\?(?:c|idvideo)=(?P<id>[^&]+)'
+    _module = 'youtube_dl.extractor.playtvak'
+    IE_NAME = 'Playtvak'
+    IE_DESC = 'Playtvak.cz, iDNES.cz and Lidovky.cz'
+    _URL_LITERALS = ('.cz/',)
+
+
+class PlayvidIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?playvid\\.com/watch(\\?v=|/)(?P<id>.+?)(?:#|$)'
+    _module = 'youtube_dl.extractor.playvid'
+    IE_NAME = 'Playvid'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('playvid.com/watch',)
+
+
+class PlaywireIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:config|cdn)\\.playwire\\.com(?:/v2)?/(?P<publisher_id>\\d+)/(?:videos/v2|embed|config)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.playwire'
+    IE_NAME = 'Playwire'
+    _URL_LITERALS = ('.playwire.com',)
+
+
+class PluralsightBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.pluralsight'
+    IE_NAME = 'PluralsightBase'
+    _URL_LITERALS = None
+
+
+class PluralsightIE(PluralsightBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|app)\\.)?pluralsight\\.com/(?:training/)?player\\?'
+    _module = 'youtube_dl.extractor.pluralsight'
+    IE_NAME = 'pluralsight'
+    _URL_LITERALS = ('pluralsight.com/',)
+
+
+class PluralsightCourseIE(PluralsightBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|app)\\.)?pluralsight\\.com/(?:library/)?courses/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.pluralsight'
+    IE_NAME = 'pluralsight:course'
+    _URL_LITERALS = ('pluralsight.com/',)
+
+
+class PodomaticIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    (?P<proto>https?)://\n                        (?:\n                            (?P<channel>[^.]+)\\.podomatic\\.com/entry|\n                            (?:www\\.)?podomatic\\.com/podcasts/(?P<channel_2>[^/]+)/episodes\n                        )/\n                        (?P<id>[^/?#&]+)\n                '
+    _module = 'youtube_dl.extractor.podomatic'
+    IE_NAME = 'podomatic'
+    _URL_LITERALS = ('.podomatic.com/entry', 'podomatic.com/podcasts/')
+
+
+class PokemonIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?pokemon\\.com/[a-z]{2}(?:.*?play=(?P<id>[a-z0-9]{32})|/(?:[^/]+/)+(?P<display_id>[^/?#&]+))'
+    _module = 'youtube_dl.extractor.pokemon'
+    IE_NAME = 'Pokemon'
+    _URL_LITERALS = ('pokemon.com/',)
+
+
+class PolskieRadioIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?polskieradio\\.pl/\\d+/\\d+/Artykul/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.polskieradio'
+    IE_NAME = 'PolskieRadio'
+    _URL_LITERALS = ('polskieradio.pl/',)
+
+
+class PolskieRadioCategoryIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?polskieradio\\.pl/\\d+(?:,[^/]+)?/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.polskieradio'
+    IE_NAME = 'PolskieRadioCategory'
+    _URL_LITERALS = ('polskieradio.pl/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if PolskieRadioIE.suitable(url) else super(PolskieRadioCategoryIE, cls).suitable(url)
+
+
+class PopcornTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://[^/]+\\.popcorntv\\.it/guarda/(?P<display_id>[^/]+)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.popcorntv'
+    IE_NAME = 'PopcornTV'
+    _URL_LITERALS = ('.popcorntv.it/guarda/',)
+
+
+class Porn91IE(LazyLoadExtractor):
+    _VALID_URL = '(?:https?://)(?:www\\.|)91porn\\.com/.+?\\?viewkey=(?P<id>[\\w\\d]+)'
+    _module = 'youtube_dl.extractor.porn91'
+    IE_NAME = '91porn'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('91porn.com/',)
+
+
+class PornComIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[a-zA-Z]+\\.)?porn\\.com/videos/(?:(?P<display_id>[^/]+)-)?(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.porncom'
+    IE_NAME = 'PornCom'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('porn.com/videos/',)
+
+
+class PornHdIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?pornhd\\.com/(?:[a-z]{2,4}/)?videos/(?P<id>\\d+)(?:/(?P<display_id>.+))?'
+    _module = 'youtube_dl.extractor.pornhd'
+    IE_NAME = 'PornHd'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('pornhd.com/',)
+
+
+class PornHubBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.pornhub'
+    IE_NAME = 'PornHubBase'
+    _URL_LITERALS = None
+
+
+class PornHubIE(PornHubBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:[^/]+\\.)?(?P<host>pornhub\\.(?:com|net))/(?:(?:view_video\\.php|video/show)\\?viewkey=|embed/)|\n                            (?:www\\.)?thumbzilla\\.com/video/\n                        )\n                        (?P<id>[\\da-z]+)\n                    '
+    _module = 'youtube_dl.extractor.pornhub'
+    IE_NAME = 'PornHub'
+    IE_DESC = 'PornHub and Thumbzilla'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('pornhub.', 'thumbzilla.com/video/')
+
+
+class PornHubPlaylistBaseIE(PornHubBaseIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.pornhub'
+    IE_NAME = 'PornHubPlaylistBase'
+    _URL_LITERALS = None
+
+
+class PornHubUserIE(PornHubPlaylistBaseIE):
+    _VALID_URL = '(?P<url>https?://(?:[^/]+\\.)?pornhub\\.(?:com|net)/(?:(?:user|channel)s|model|pornstar)/(?P<id>[^/?#&]+))(?:[?#&]|/(?!videos)|$)'
+    _module = 'youtube_dl.extractor.pornhub'
+    IE_NAME = 'PornHubUser'
+    _URL_LITERALS = ('pornhub.',)
+
+
+class PornHubPagedPlaylistBaseIE(PornHubPlaylistBaseIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.pornhub'
+    IE_NAME = 'PornHubPagedPlaylistBase'
+    _URL_LITERALS = None
+
+
+class PornHubPagedVideoListIE(PornHubPagedPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?(?P<host>pornhub\\.(?:com|net))/(?P<id>(?:[^/]+/)*[^/?#&]+)'
+    _module = 'youtube_dl.extractor.pornhub'
+    IE_NAME = 'PornHubPagedVideoList'
+    _URL_LITERALS = ('pornhub.',)
+
+    @classmethod
+    def suitable(cls, url):
+        return (False
+                if PornHubIE.suitable(url) or PornHubUserIE.suitable(url) or PornHubUserVideosUploadIE.suitable(url)
+                else super(PornHubPagedVideoListIE, cls).suitable(url))
+
+
+class PornHubUserVideosUploadIE(PornHubPagedPlaylistBaseIE):
+    _VALID_URL = '(?P<url>https?://(?:[^/]+\\.)?(?P<host>pornhub\\.(?:com|net))/(?:(?:user|channel)s|model|pornstar)/(?P<id>[^/]+)/videos/upload)'
+    _module = 'youtube_dl.extractor.pornhub'
+    IE_NAME = 'PornHubUserVideosUpload'
+    _URL_LITERALS = ('pornhub.',)
+
+
+class PornotubeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:\\w+\\.)?pornotube\\.com/(?:[^?#]*?)/video/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.pornotube'
+    IE_NAME = 'Pornotube'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('pornotube.com/',)
+
+
+class PornoVoisinesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?pornovoisines\\.com/videos/show/(?P<id>\\d+)/(?P<display_id>[^/.]+)'
+    _module = 'youtube_dl.extractor.pornovoisines'
+    IE_NAME = 'PornoVoisines'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('pornovoisines.com/videos/show/',)
+
+
+class PornoXOIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?pornoxo\\.com/videos/(?P<id>\\d+)/(?P<display_id>[^/]+)\\.html'
+    _module = 'youtube_dl.extractor.pornoxo'
+    IE_NAME = 'PornoXO'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('pornoxo.com/videos/',)
+
+
+class PuhuTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?puhutv\\.com/(?P<id>[^/?#&]+)-izle'
+    _module = 'youtube_dl.extractor.puhutv'
+    IE_NAME = 'puhutv'
+    _URL_LITERALS = ('puhutv.com/',)
+
+
+class PuhuTVSerieIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?puhutv\\.com/(?P<id>[^/?#&]+)-detay'
+    _module = 'youtube_dl.extractor.puhutv'
+    IE_NAME = 'puhutv:serie'
+    _URL_LITERALS = ('puhutv.com/',)
+
+
+class PressTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?presstv\\.ir/[^/]+/(?P<y>\\d+)/(?P<m>\\d+)/(?P<d>\\d+)/(?P<id>\\d+)/(?P<display_id>[^/]+)?'
+    _module = 'youtube_dl.extractor.presstv'
+    IE_NAME = 'PressTV'
+    _URL_LITERALS = ('presstv.ir/',)
+
+
+class ProSiebenSat1BaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.prosiebensat1'
+    IE_NAME = 'ProSiebenSat1Base'
+    _URL_LITERALS = None
+
+
+class ProSiebenSat1IE(ProSiebenSat1BaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?\n                        (?:\n                            (?:beta\\.)?\n                            (?:\n                                prosieben(?:maxx)?|sixx|sat1(?:gold)?|kabeleins(?:doku)?|the-voice-of-germany|7tv|advopedia\n                            )\\.(?:de|at|ch)|\n                            ran\\.de|fem\\.com|advopedia\\.de|galileo\\.tv/video\n                        )\n                        /(?P<id>.+)\n                    '
+    _module = 'youtube_dl.extractor.prosiebensat1'
+    IE_NAME = 'prosiebensat1'
+    IE_DESC = 'ProSiebenSat.1 Digital'
+    _URL_LITERALS = ('http',)
+
+
+class Puls4IE(ProSiebenSat1BaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?puls4\\.com/(?P<id>[^?#&]+)'
+    _module = 'youtube_dl.extractor.puls4'
+    IE_NAME = 'Puls4'
+    _URL_LITERALS = ('puls4.com/',)
+
+
+class PyvideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?pyvideo\\.org/(?P<category>[^/]+)/(?P<id>[^/?#&.]+)'
+    _module = 'youtube_dl.extractor.pyvideo'
+    IE_NAME = 'Pyvideo'
+    _URL_LITERALS = ('pyvideo.org/',)
+
+
+class QQMusicIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://y\\.qq\\.com/n/yqq/song/(?P<id>[0-9A-Za-z]+)\\.html'
+    _module = 'youtube_dl.extractor.qqmusic'
+    IE_NAME = 'qqmusic'
+    IE_DESC = 'QQ音乐'
+    _URL_LITERALS = ('://y.qq.com/n/yqq/song/',)
+
+
+class QQPlaylistBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.qqmusic'
+    IE_NAME = 'QQPlaylistBase'
+    _URL_LITERALS = None
+
+
+class QQMusicSingerIE(QQPlaylistBaseIE):
+    _VALID_URL = 'https?://y\\.qq\\.com/n/yqq/singer/(?P<id>[0-9A-Za-z]+)\\.html'
+    _module = 'youtube_dl.extractor.qqmusic'
+    IE_NAME = 'qqmusic:singer'
+    IE_DESC = 'QQ音乐 - 歌手'
+    _URL_LITERALS = ('://y.qq.com/n/yqq/singer/',)
+
+
+class QQMusicAlbumIE(QQPlaylistBaseIE):
+    _VALID_URL = 'https?://y\\.qq\\.com/n/yqq/album/(?P<id>[0-9A-Za-z]+)\\.html'
+    _module = 'youtube_dl.extractor.qqmusic'
+    IE_NAME = 'qqmusic:album'
+    IE_DESC = 'QQ音乐 - 专辑'
+    _URL_LITERALS = ('://y.qq.com/n/yqq/album/',)
+
+
+class QQMusicToplistIE(QQPlaylistBaseIE):
+    _VALID_URL = 'https?://y\\.qq\\.com/n/yqq/toplist/(?P<id>[0-9]+)\\.html'
+    _module = 'youtube_dl.extractor.qqmusic'
+    IE_NAME = 'qqmusic:toplist'
+    IE_DESC = 'QQ音乐 - 排行榜'
+    _URL_LITERALS = ('://y.qq.com/n/yqq/toplist/',)
+
+
+class QQMusicPlaylistIE(QQPlaylistBaseIE):
+    _VALID_URL = 'https?://y\\.qq\\.com/n/yqq/playlist/(?P<id>[0-9]+)\\.html'
+    _module = 'youtube_dl.extractor.qqmusic'
+    IE_NAME = 'qqmusic:playlist'
+    IE_DESC = 'QQ音乐 - 歌单'
+    _URL_LITERALS = ('://y.qq.com/n/yqq/playlist/',)
+
+
+class R7IE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                        https?://\n                        (?:\n                            (?:[a-zA-Z]+)\\.r7\\.com(?:/[^/]+)+/idmedia/|\n                            noticias\\.r7\\.com(?:/[^/]+)+/[^/]+-|\n                            player\\.r7\\.com/video/i/\n                        )\n                        (?P<id>[\\da-f]{24})\n                    '
+    _module = 'youtube_dl.extractor.r7'
+    IE_NAME = 'R7'
+    _URL_LITERALS = ('.r7.com', 'noticias.r7.com', 'player.r7.com/video/i/')
+
+
+class R7ArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[a-zA-Z]+)\\.r7\\.com/(?:[^/]+/)+[^/?#&]+-(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.r7'
+    IE_NAME = 'R7Article'
+    _URL_LITERALS = ('.r7.com/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if R7IE.suitable(url) else super(R7ArticleIE, cls).suitable(url)
+
+
+class RadioCanadaIE(LazyLoadExtractor):
+    _VALID_URL = '(?:radiocanada:|https?://ici\\.radio-canada\\.ca/widgets/mediaconsole/)(?P<app_code>[^:/]+)[:/](?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.radiocanada'
+    IE_NAME = 'radiocanada'
+    _URL_LITERALS = ('://ici.radio-canada.ca/widgets/mediaconsole/', 'radiocanada:')
+
+
+class RadioCanadaAudioVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://ici\\.radio-canada\\.ca/([^/]+/)*media-(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.radiocanada'
+    IE_NAME = 'radiocanada:audiovideo'
+    _URL_LITERALS = ('://ici.radio-canada.ca/',)
+
+
+class RadioDeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?P<id>.+?)\\.(?:radio\\.(?:de|at|fr|pt|es|pl|it)|rad\\.io)'
+    _module = 'youtube_dl.extractor.radiode'
+    IE_NAME = 'radio.de'
+    _URL_LITERALS = ('.rad',)
+
+
+class RadioJavanIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?radiojavan\\.com/videos/video/(?P<id>[^/]+)/?'
+    _module = 'youtube_dl.extractor.radiojavan'
+    IE_NAME = 'RadioJavan'
+    _URL_LITERALS = ('radiojavan.com/videos/video/',)
+
+
+class RadioBremenIE(LazyLoadExtractor):
+    _VALID_URL = 'http?://(?:www\\.)?radiobremen\\.de/mediathek/(?:index\\.html)?\\?id=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.radiobremen'
+    IE_NAME = 'radiobremen'
+    _URL_LITERALS = ('radiobremen.de/mediathek/',)
+
+
+class RadioFranceIE(LazyLoadExtractor):
+    _VALID_URL = '^https?://maison\\.radiofrance\\.fr/radiovisions/(?P<id>[^?#]+)'
+    _module = 'youtube_dl.extractor.radiofrance'
+    IE_NAME = 'radiofrance'
+    _URL_LITERALS = ('://maison.radiofrance.fr/radiovisions/',)
+
+
+class RaiBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.rai'
+    IE_NAME = 'RaiBase'
+    _URL_LITERALS = None
+
+
+class RaiPlayIE(RaiBaseIE):
+    _VALID_URL = '(?P<url>https?://(?:www\\.)?raiplay\\.it/.+?-(?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})\\.html)'
+    _module = 'youtube_dl.extractor.rai'
+    IE_NAME = 'RaiPlay'
+    _URL_LITERALS = ('raiplay.it/',)
+
+
+class RaiPlayLiveIE(RaiBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?raiplay\\.it/dirette/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.rai'
+    IE_NAME = 'RaiPlayLive'
+    _URL_LITERALS = ('raiplay.it/dirette/',)
+
+
+class RaiPlayPlaylistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?raiplay\\.it/programmi/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.rai'
+    IE_NAME = 'RaiPlayPlaylist'
+    _URL_LITERALS = ('raiplay.it/programmi/',)
+
+
+class RaiIE(RaiBaseIE):
+    _VALID_URL = 'https?://[^/]+\\.(?:rai\\.(?:it|tv)|rainews\\.it)/.+?-(?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})(?:-.+?)?\\.html'
+    _module = 'youtube_dl.extractor.rai'
+    IE_NAME = 'Rai'
+    _URL_LITERALS = ('.html',)
+
+
+class RayWenderlichIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            videos\\.raywenderlich\\.com/courses|\n                            (?:www\\.)?raywenderlich\\.com\n                        )/\n                        (?P<course_id>[^/]+)/lessons/(?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.raywenderlich'
+    IE_NAME = 'RayWenderlich'
+    _URL_LITERALS = ('raywenderlich.com', 'videos.raywenderlich.com/courses')
+
+
+class RayWenderlichCourseIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            videos\\.raywenderlich\\.com/courses|\n                            (?:www\\.)?raywenderlich\\.com\n                        )/\n                        (?P<id>[^/]+)\n                    '
+    _module = 'youtube_dl.extractor.raywenderlich'
+    IE_NAME = 'RayWenderlichCourse'
+    _URL_LITERALS = ('raywenderlich.com', 'videos.raywenderlich.com/courses')
+
+    @classmethod
+    def suitable(cls, url):
+        return False if RayWenderlichIE.suitable(url) else super(
+            RayWenderlichCourseIE, cls).suitable(url)
+
+
+class RBMARadioIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:rbmaradio|redbullradio)\\.com/shows/(?P<show_id>[^/]+)/episodes/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.rbmaradio'
+    IE_NAME = 'RBMARadio'
+    _URL_LITERALS = ('.com/shows/',)
+
+
+class RDSIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rds\\.ca/vid(?:[eé]|%C3%A9)os/(?:[^/]+/)*(?P<id>[^/]+)-\\d+\\.\\d+'
+    _module = 'youtube_dl.extractor.rds'
+    IE_NAME = 'RDS'
+    IE_DESC = 'RDS.ca'
+    _URL_LITERALS = ('rds.ca/vid',)
+
+
+class RedBullTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?redbull(?:\\.tv|\\.com(?:/[^/]+)?(?:/tv)?)(?:/events/[^/]+)?/(?:videos?|live)/(?P<id>AP-\\w+)'
+    _module = 'youtube_dl.extractor.redbulltv'
+    IE_NAME = 'RedBullTV'
+    _URL_LITERALS = ('redbull.',)
+
+
+class RedBullTVRrnContentIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?redbull(?:\\.tv|\\.com(?:/[^/]+)?(?:/tv)?)/(?:video|live)/rrn:content:[^:]+:(?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'youtube_dl.extractor.redbulltv'
+    IE_NAME = 'RedBullTVRrnContent'
+    _URL_LITERALS = ('redbull.',)
+
+
+class RedditIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://v\\.redd\\.it/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.reddit'
+    IE_NAME = 'Reddit'
+    _URL_LITERALS = ('://v.redd.it/',)
+
+
+class RedditRIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<url>https?://(?:[^/]+\\.)?reddit\\.com/r/[^/]+/comments/(?P<id>[^/?#&]+))'
+    _module = 'youtube_dl.extractor.reddit'
+    IE_NAME = 'RedditR'
+    _URL_LITERALS = ('reddit.com/r/',)
+
+
+class RedTubeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www\\.)?redtube\\.com/|embed\\.redtube\\.com/\\?.*?\\bid=)(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.redtube'
+    IE_NAME = 'RedTube'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('embed.redtube.com/?', 'redtube.com/')
+
+
+class RegioTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?regio-tv\\.de/video/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.regiotv'
+    IE_NAME = 'RegioTV'
+    _URL_LITERALS = ('regio-tv.de/video/',)
+
+
+class RENTVIE(LazyLoadExtractor):
+    _VALID_URL = '(?:rentv:|https?://(?:www\\.)?ren\\.tv/(?:player|video/epizod)/)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.rentv'
+    IE_NAME = 'RENTV'
+    _URL_LITERALS = ('ren.tv/', 'rentv:')
+
+
+class RENTVArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ren\\.tv/novosti/\\d{4}-\\d{2}-\\d{2}/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.rentv'
+    IE_NAME = 'RENTVArticle'
+    _URL_LITERALS = ('ren.tv/novosti/',)
+
+
+class RestudyIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|portal)\\.)?restudy\\.dk/video/[^/]+/id/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.restudy'
+    IE_NAME = 'Restudy'
+    _URL_LITERALS = ('restudy.dk/video/',)
+
+
+class ReutersIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?reuters\\.com/.*?\\?.*?videoId=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.reuters'
+    IE_NAME = 'Reuters'
+    _URL_LITERALS = ('reuters.com/',)
+
+
+class ReverbNationIE(LazyLoadExtractor):
+    _VALID_URL = '^https?://(?:www\\.)?reverbnation\\.com/.*?/song/(?P<id>\\d+).*?$'
+    _module = 'youtube_dl.extractor.reverbnation'
+    IE_NAME = 'ReverbNation'
+    _URL_LITERALS = ('reverbnation.com/',)
+
+
+class RICEIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://mediahub\\.rice\\.edu/app/[Pp]ortal/video\\.aspx\\?(?P<query>.+)'
+    _module = 'youtube_dl.extractor.rice'
+    IE_NAME = 'RICE'
+    _URL_LITERALS = ('://mediahub.rice.edu/app/',)
+
+
+class RMCDecouverteIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://rmcdecouverte\\.bfmtv\\.com/(?:(?:[^/]+/)*program_(?P<id>\\d+)|(?P<live_id>mediaplayer-direct))'
+    _module = 'youtube_dl.extractor.rmcdecouverte'
+    IE_NAME = 'RMCDecouverte'
+    _URL_LITERALS = ('://rmcdecouverte.bfmtv.com/',)
+
+
+class Ro220IE(LazyLoadExtractor):
+    _VALID_URL = '(?x)(?:https?://)?(?:www\\.)?220\\.ro/(?P<category>[^/]+)/(?P<shorttitle>[^/]+)/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.ro220'
+    IE_NAME = '220.ro'
+    _URL_LITERALS = ('220.ro/',)
+
+
+class RockstarGamesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rockstargames\\.com/videos(?:/video/|#?/?\\?.*\\bvideo=)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.rockstargames'
+    IE_NAME = 'RockstarGames'
+    _URL_LITERALS = ('rockstargames.com/videos',)
+
+
+class RoosterTeethIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?roosterteeth\\.com/(?:episode|watch)/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.roosterteeth'
+    IE_NAME = 'RoosterTeeth'
+    _URL_LITERALS = ('roosterteeth.com/',)
+
+
+class RottenTomatoesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rottentomatoes\\.com/m/[^/]+/trailers/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.rottentomatoes'
+    IE_NAME = 'RottenTomatoes'
+    _URL_LITERALS = ('rottentomatoes.com/m/',)
+
+
+class RoxwelIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?roxwel\\.com/player/(?P<filename>.+?)(\\.|\\?|$)'
+    _module = 'youtube_dl.extractor.roxwel'
+    IE_NAME = 'Roxwel'
+    _URL_LITERALS = ('roxwel.com/player/',)
+
+
+class RozhlasIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?prehravac\\.rozhlas\\.cz/audio/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.rozhlas'
+    IE_NAME = 'Rozhlas'
+    _URL_LITERALS = ('prehravac.rozhlas.cz/audio/',)
+
+
+class RTBFIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        https?://(?:www\\.)?rtbf\\.be/\n        (?:\n            video/[^?]+\\?.*\\bid=|\n            ouftivi/(?:[^/]+/)*[^?]+\\?.*\\bvideoId=|\n            auvio/[^/]+\\?.*\\b(?P<live>l)?id=\n        )(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.rtbf'
+    IE_NAME = 'RTBF'
+    _URL_LITERALS = ('rtbf.be/',)
+
+
+class RteBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.rte'
+    IE_NAME = 'RteBase'
+    _URL_LITERALS = None
+
+
+class RteIE(RteBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?rte\\.ie/player/[^/]{2,3}/show/[^/]+/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.rte'
+    IE_NAME = 'rte'
+    IE_DESC = 'Raidió Teilifís Éireann TV'
+    _URL_LITERALS = ('rte.ie/player/',)
+
+
+class RteRadioIE(RteBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?rte\\.ie/radio/utils/radioplayer/rteradioweb\\.html#!rii=(?:b?[0-9]*)(?:%3A|:|%5F|_)(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.rte'
+    IE_NAME = 'rte:radio'
+    IE_DESC = 'Raidió Teilifís Éireann radio'
+    _URL_LITERALS = ('rte.ie/radio/utils/radioplayer/rteradioweb.html#!rii=',)
+
+
+class RtlNlIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        https?://(?:(?:www|static)\\.)?\n        (?:\n            rtlxl\\.nl/[^\\#]*\\#!/[^/]+/|\n            rtl\\.nl/(?:(?:system/videoplayer/(?:[^/]+/)+(?:video_)?embed\\.html|embed)\\b.+?\\buuid=|video/)\n        )\n        (?P<id>[0-9a-f-]+)'
+    _module = 'youtube_dl.extractor.rtlnl'
+    IE_NAME = 'rtl.nl'
+    IE_DESC = 'rtl.nl and rtlxl.nl'
+    _URL_LITERALS = ('.nl/', 'xl.nl/')
+
+
+class RTL2IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rtl2\\.de/sendung/[^/]+/(?:video/(?P<vico_id>\\d+)[^/]+/(?P<vivi_id>\\d+)-|folge/)(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.rtl2'
+    IE_NAME = 'rtl2'
+    _URL_LITERALS = ('rtl2.de/sendung/',)
+
+
+class RTL2YouBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.rtl2'
+    IE_NAME = 'RTL2YouBase'
+    _URL_LITERALS = None
+
+
+class RTL2YouIE(RTL2YouBaseIE):
+    _VALID_URL = 'http?://you\\.rtl2\\.de/(?:video/\\d+/|youplayer/index\\.html\\?.*?\\bvid=)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.rtl2'
+    IE_NAME = 'rtl2:you'
+    _AGE_LIMIT = 12
+    _URL_LITERALS = ('://you.rtl2.de/',)
+
+
+class RTL2YouSeriesIE(RTL2YouBaseIE):
+    _VALID_URL = 'http?://you\\.rtl2\\.de/videos/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.rtl2'
+    IE_NAME = 'rtl2:you:series'
+    _URL_LITERALS = ('://you.rtl2.de/videos/',)
+
+
+class RTPIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rtp\\.pt/play/p(?P<program_id>[0-9]+)/(?P<id>[^/?#]+)/?'
+    _module = 'youtube_dl.extractor.rtp'
+    IE_NAME = 'RTP'
+    _URL_LITERALS = ('rtp.pt/play/p',)
+
+
+class RTVEALaCartaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rtve\\.es/(m/)?(alacarta/videos|filmoteca)/[^/]+/[^/]+/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.rtve'
+    IE_NAME = 'rtve.es:alacarta'
+    IE_DESC = 'RTVE a la carta'
+    _URL_LITERALS = ('rtve.es/',)
+
+
+class RTVELiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rtve\\.es/directo/(?P<id>[a-zA-Z0-9-]+)'
+    _module = 'youtube_dl.extractor.rtve'
+    IE_NAME = 'rtve.es:live'
+    IE_DESC = 'RTVE.es live streams'
+    _URL_LITERALS = ('rtve.es/directo/',)
+
+
+class RTVEInfantilIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rtve\\.es/infantil/serie/(?P<show>[^/]*)/video/(?P<short_title>[^/]*)/(?P<id>[0-9]+)/'
+    _module = 'youtube_dl.extractor.rtve'
+    IE_NAME = 'rtve.es:infantil'
+    IE_DESC = 'RTVE infantil'
+    _URL_LITERALS = ('rtve.es/infantil/serie/',)
+
+
+class RTVETelevisionIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rtve\\.es/television/[^/]+/[^/]+/(?P<id>\\d+).shtml'
+    _module = 'youtube_dl.extractor.rtve'
+    IE_NAME = 'rtve.es:television'
+    _URL_LITERALS = ('rtve.es/television/',)
+
+
+class RTVNHIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rtvnh\\.nl/video/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.rtvnh'
+    IE_NAME = 'RTVNH'
+    _URL_LITERALS = ('rtvnh.nl/video/',)
+
+
+class RTVSIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rtvs\\.sk/(?:radio|televizia)/archiv/\\d+/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.rtvs'
+    IE_NAME = 'RTVS'
+    _URL_LITERALS = ('rtvs.sk/',)
+
+
+class RUHDIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ruhd\\.ru/play\\.php\\?vid=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.ruhd'
+    IE_NAME = 'RUHD'
+    _URL_LITERALS = ('ruhd.ru/play.php?vid=',)
+
+
+class RutubeBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.rutube'
+    IE_NAME = 'RutubeBase'
+    _URL_LITERALS = None
+
+
+class RutubeIE(RutubeBaseIE):
+    _VALID_URL = 'https?://rutube\\.ru/(?:video|(?:play/)?embed)/(?P<id>[\\da-z]{32})'
+    _module = 'youtube_dl.extractor.rutube'
+    IE_NAME = 'rutube'
+    IE_DESC = 'Rutube videos'
+    _URL_LITERALS = ('://rutube.ru/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if RutubePlaylistIE.suitable(url) else super(RutubeIE, cls).suitable(url)
+
+
+class RutubePlaylistBaseIE(RutubeBaseIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.rutube'
+    IE_NAME = 'RutubePlaylistBase'
+    _URL_LITERALS = None
+
+
+class RutubeChannelIE(RutubePlaylistBaseIE):
+    _VALID_URL = 'https?://rutube\\.ru/tags/video/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.rutube'
+    IE_NAME = 'rutube:channel'
+    IE_DESC = 'Rutube channels'
+    _URL_LITERALS = ('://rutube.ru/tags/video/',)
+
+
+class RutubeEmbedIE(RutubeBaseIE):
+    _VALID_URL = 'https?://rutube\\.ru/(?:video|play)/embed/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.rutube'
+    IE_NAME = 'rutube:embed'
+    IE_DESC = 'Rutube embedded videos'
+    _URL_LITERALS = ('://rutube.ru/',)
+
+
+class RutubeMovieIE(RutubePlaylistBaseIE):
+    _VALID_URL = 'https?://rutube\\.ru/metainfo/tv/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.rutube'
+    IE_NAME = 'rutube:movie'
+    IE_DESC = 'Rutube movies'
+    _URL_LITERALS = ('://rutube.ru/metainfo/tv/',)
+
+
+class RutubePersonIE(RutubePlaylistBaseIE):
+    _VALID_URL = 'https?://rutube\\.ru/video/person/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.rutube'
+    IE_NAME = 'rutube:person'
+    IE_DESC = 'Rutube person videos'
+    _URL_LITERALS = ('://rutube.ru/video/person/',)
+
+
+class RutubePlaylistIE(RutubePlaylistBaseIE):
+    _VALID_URL = 'https?://rutube\\.ru/(?:video|(?:play/)?embed)/[\\da-z]{32}/\\?.*?\\bpl_id=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.rutube'
+    IE_NAME = 'rutube:playlist'
+    IE_DESC = 'Rutube playlists'
+    _URL_LITERALS = None
+
+    @classmethod
+    def suitable(cls, url):
+        if not super(RutubePlaylistIE, cls).suitable(url):
+            return False
+        params = compat_parse_qs(compat_urllib_parse_urlparse(url).query)
+        return params.get('pl_type', [None])[0] and int_or_none(params.get('pl_id', [None])[0])
+
+
+class RUTVIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:test)?player\\.(?:rutv\\.ru|vgtrk\\.com)/\n                        (?P<path>\n                            flash\\d+v/container\\.swf\\?id=|\n                            iframe/(?P<type>swf|video|live)/id/|\n                            index/iframe/cast_id/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.rutv'
+    IE_NAME = 'RUTV'
+    IE_DESC = 'RUTV.RU'
+    _URL_LITERALS = ('player.',)
+
+
+class RuutuIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:ruutu|supla)\\.fi/(?:video|supla)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.ruutu'
+    IE_NAME = 'Ruutu'
+    _URL_LITERALS = ('.fi/',)
+
+
+class RuvIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ruv\\.is/(?:sarpurinn/[^/]+|node)/(?P<id>[^/]+(?:/\\d+)?)'
+    _module = 'youtube_dl.extractor.ruv'
+    IE_NAME = 'Ruv'
+    _URL_LITERALS = ('ruv.is/',)
+
+
+class SafariBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.safari'
+    IE_NAME = 'SafariBase'
+    _URL_LITERALS = None
+
+
+class SafariIE(SafariBaseIE):
+    _VALID_URL = '(?x)\n                        https?://\n                            (?:www\\.)?(?:safaribooksonline|(?:learning\\.)?oreilly)\\.com/\n                            (?:\n                                library/view/[^/]+/(?P<course_id>[^/]+)/(?P<part>[^/?\\#&]+)\\.html|\n                                videos/[^/]+/[^/]+/(?P<reference_id>[^-]+-[^/?\\#&]+)\n                            )\n                    '
+    _module = 'youtube_dl.extractor.safari'
+    IE_NAME = 'safari'
+    IE_DESC = 'safaribooksonline.com online video'
+    _URL_LITERALS = ('.com/',)
+
+
+class SafariApiIE(SafariBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:safaribooksonline|(?:learning\\.)?oreilly)\\.com/api/v1/book/(?P<course_id>[^/]+)/chapter(?:-content)?/(?P<part>[^/?#&]+)\\.html'
+    _module = 'youtube_dl.extractor.safari'
+    IE_NAME = 'safari:api'
+    _URL_LITERALS = ('.com/api/v1/book/',)
+
+
+class SafariCourseIE(SafariBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:www\\.)?(?:safaribooksonline|(?:learning\\.)?oreilly)\\.com/\n                            (?:\n                                library/view/[^/]+|\n                                api/v1/book|\n                                videos/[^/]+\n                            )|\n                            techbus\\.safaribooksonline\\.com\n                        )\n                        /(?P<id>[^/]+)\n                    '
+    _module = 'youtube_dl.extractor.safari'
+    IE_NAME = 'safari:course'
+    IE_DESC = 'safaribooksonline.com online courses'
+    _URL_LITERALS = ('.com/', 'techbus.safaribooksonline.com')
+
+    @classmethod
+    def suitable(cls, url):
+        return (False if SafariIE.suitable(url) or SafariApiIE.suitable(url)
+                else super(SafariCourseIE, cls).suitable(url))
+
+
+class SapoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:v2|www)\\.)?videos\\.sapo\\.(?:pt|cv|ao|mz|tl)/(?P<id>[\\da-zA-Z]{20})'
+    _module = 'youtube_dl.extractor.sapo'
+    IE_NAME = 'Sapo'
+    IE_DESC = 'SAPO Vídeos'
+    _URL_LITERALS = ('videos.sapo.',)
+
+
+class SaveFromIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://[^.]+\\.savefrom\\.net/\\#url=(?P<url>.*)$'
+    _module = 'youtube_dl.extractor.savefrom'
+    IE_NAME = 'savefrom.net'
+    _URL_LITERALS = ('.savefrom.net/#url=',)
+
+
+class SBSIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?sbs\\.com\\.au/(?:ondemand|news)/video/(?:single/)?(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.sbs'
+    IE_NAME = 'SBS'
+    IE_DESC = 'sbs.com.au'
+    _URL_LITERALS = ('sbs.com.au/',)
+
+
+class ScreencastIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?screencast\\.com/t/(?P<id>[a-zA-Z0-9]+)'
+    _module = 'youtube_dl.extractor.screencast'
+    IE_NAME = 'Screencast'
+    _URL_LITERALS = ('screencast.com/t/',)
+
+
+class ScreencastOMaticIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://screencast-o-matic\\.com/watch/(?P<id>[0-9a-zA-Z]+)'
+    _module = 'youtube_dl.extractor.screencastomatic'
+    IE_NAME = 'ScreencastOMatic'
+    _URL_LITERALS = ('://screencast-o-matic.com/watch/',)
+
+
+class AWSIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.aws'
+    IE_NAME = 'AWS'
+    _URL_LITERALS = None
+
+
+class ScrippsNetworksWatchIE(AWSIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        watch\\.\n                        (?P<site>geniuskitchen)\\.com/\n                        (?:\n                            player\\.[A-Z0-9]+\\.html\\#|\n                            show/(?:[^/]+/){2}|\n                            player/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.scrippsnetworks'
+    IE_NAME = 'scrippsnetworks:watch'
+    _URL_LITERALS = ('://watch.',)
+
+
+class SCTEBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.scte'
+    IE_NAME = 'SCTEBase'
+    _URL_LITERALS = None
+
+
+class SCTEIE(SCTEBaseIE):
+    _VALID_URL = 'https?://learning\\.scte\\.org/mod/scorm/view\\.php?.*?\\bid=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.scte'
+    IE_NAME = 'SCTE'
+    _URL_LITERALS = ('://learning.scte.org/mod/scorm/view.ph',)
+
+
+class SCTECourseIE(SCTEBaseIE):
+    _VALID_URL = 'https?://learning\\.scte\\.org/(?:mod/sub)?course/view\\.php?.*?\\bid=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.scte'
+    IE_NAME = 'SCTECourse'
+    _URL_LITERALS = ('://learning.scte.org/',)
+
+
+class SeekerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?seeker\\.com/(?P<display_id>.*)-(?P<article_id>\\d+)\\.html'
+    _module = 'youtube_dl.extractor.seeker'
+    IE_NAME = 'Seeker'
+    _URL_LITERALS = ('seeker.com/',)
+
+
+class SenateISVPIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?senate\\.gov/isvp/?\\?(?P<qs>.+)'
+    _module = 'youtube_dl.extractor.senateisvp'
+    IE_NAME = 'SenateISVP'
+    _URL_LITERALS = ('senate.gov/isvp',)
+
+
+class SendtoNewsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://embed\\.sendtonews\\.com/player2/embedplayer\\.php\\?.*\\bSC=(?P<id>[0-9A-Za-z-]+)'
+    _module = 'youtube_dl.extractor.sendtonews'
+    IE_NAME = 'SendtoNews'
+    _URL_LITERALS = ('://embed.sendtonews.com/player2/embedplayer.php?',)
+
+
+class ServusIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?servus\\.com/(?:(?:at|de)/p/[^/]+|tv/videos)/(?P<id>[aA]{2}-\\w+|\\d+-\\d+)'
+    _module = 'youtube_dl.extractor.servus'
+    IE_NAME = 'Servus'
+    _URL_LITERALS = ('servus.com/',)
+
+
+class SevenPlusIE(BrightcoveNewIE):
+    _VALID_URL = 'https?://(?:www\\.)?7plus\\.com\\.au/(?P<path>[^?]+\\?.*?\\bepisode-id=(?P<id>[^&#]+))'
+    _module = 'youtube_dl.extractor.sevenplus'
+    IE_NAME = '7plus'
+    _URL_LITERALS = ('7plus.com.au/',)
+
+
+class SexuIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?sexu\\.com/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.sexu'
+    IE_NAME = 'Sexu'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('sexu.com/',)
+
+
+class SeznamZpravyIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?seznamzpravy\\.cz/iframe/player\\?.*\\bsrc='
+    _module = 'youtube_dl.extractor.seznamzpravy'
+    IE_NAME = 'SeznamZpravy'
+    _URL_LITERALS = ('seznamzpravy.cz/iframe/player?',)
+
+
+class SeznamZpravyArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:seznam\\.cz/zpravy|seznamzpravy\\.cz)/clanek/(?:[^/?#&]+)-(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.seznamzpravy'
+    IE_NAME = 'SeznamZpravyArticle'
+    _URL_LITERALS = ('.cz/zpravy', 'zpravy.cz')
+
+
+class ShahidBaseIE(AWSIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.shahid'
+    IE_NAME = 'ShahidBase'
+    _URL_LITERALS = None
+
+
+class ShahidIE(ShahidBaseIE):
+    _VALID_URL = 'https?://shahid\\.mbc\\.net/ar/(?:serie|show|movie)s/[^/]+/(?P<type>episode|clip|movie)-(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.shahid'
+    IE_NAME = 'Shahid'
+    _URL_LITERALS = ('://shahid.mbc.net/ar/',)
+
+
+class ShahidShowIE(ShahidBaseIE):
+    _VALID_URL = 'https?://shahid\\.mbc\\.net/ar/(?:show|serie)s/[^/]+/(?:show|series)-(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.shahid'
+    IE_NAME = 'ShahidShow'
+    _URL_LITERALS = ('://shahid.mbc.net/ar/s',)
+
+
+class SharedBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.shared'
+    IE_NAME = 'SharedBase'
+    _URL_LITERALS = None
+
+
+class SharedIE(SharedBaseIE):
+    _VALID_URL = 'https?://shared\\.sx/(?P<id>[\\da-z]{10})'
+    _module = 'youtube_dl.extractor.shared'
+    IE_NAME = 'Shared'
+    IE_DESC = 'shared.sx'
+    _URL_LITERALS = ('://shared.sx/',)
+
+
+class VivoIE(SharedBaseIE):
+    _VALID_URL = 'https?://vivo\\.sx/(?P<id>[\\da-z]{10})'
+    _module = 'youtube_dl.extractor.shared'
+    IE_NAME = 'Vivo'
+    IE_DESC = 'vivo.sx'
+    _URL_LITERALS = ('://vivo.sx/',)
+
+
+class ShowRoomLiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?showroom-live\\.com/(?!onlive|timetable|event|campaign|news|ranking|room)(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.showroomlive'
+    IE_NAME = 'ShowRoomLive'
+    _URL_LITERALS = ('showroom-live.com/',)
+
+
+class SinaIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://(?:.*?\\.)?video\\.sina\\.com\\.cn/\n                        (?:\n                            (?:view/|.*\\#)(?P<video_id>\\d+)|\n                            .+?/(?P<pseudo_id>[^/?#]+)(?:\\.s?html)|\n                            # This is used by external sites like Weibo\n                            api/sinawebApi/outplay.php/(?P<token>.+?)\\.swf\n                        )\n                  '
+    _module = 'youtube_dl.extractor.sina'
+    IE_NAME = 'Sina'
+    _URL_LITERALS = ('video.sina.com.cn/',)
+
+
+class SixPlayIE(LazyLoadExtractor):
+    _VALID_URL = '(?:6play:|https?://(?:www\\.)?(?P<domain>6play\\.fr|rtlplay\\.be|play\\.rtl\\.hr|rtlmost\\.hu)/.+?-c_)(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.sixplay'
+    IE_NAME = '6play'
+    _URL_LITERALS = ('6play.fr', '6play:', 'play.rtl.hr', 'rtlmost.hu', 'rtlplay.be')
+
+
+class SkylineWebcamsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?skylinewebcams\\.com/[^/]+/webcam/(?:[^/]+/)+(?P<id>[^/]+)\\.html'
+    _module = 'youtube_dl.extractor.skylinewebcams'
+    IE_NAME = 'SkylineWebcams'
+    _URL_LITERALS = ('skylinewebcams.com/',)
+
+
+class SkyNewsArabiaBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.skynewsarabia'
+    IE_NAME = 'SkyNewsArabiaBase'
+    _URL_LITERALS = None
+
+
+class SkyNewsArabiaIE(SkyNewsArabiaBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?skynewsarabia\\.com/web/video/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.skynewsarabia'
+    IE_NAME = 'skynewsarabia:video'
+    _URL_LITERALS = ('skynewsarabia.com/web/video/',)
+
+
+class SkyNewsArabiaArticleIE(SkyNewsArabiaBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?skynewsarabia\\.com/web/article/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.skynewsarabia'
+    IE_NAME = 'skynewsarabia:article'
+    _URL_LITERALS = ('skynewsarabia.com/web/article/',)
+
+
+class SkyBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.sky'
+    IE_NAME = 'SkyBase'
+    _URL_LITERALS = None
+
+
+class SkyNewsIE(SkyBaseIE):
+    _VALID_URL = 'https?://news\\.sky\\.com/video/[0-9a-z-]+-(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.sky'
+    IE_NAME = 'SkyNews'
+    _URL_LITERALS = ('://news.sky.com/video/',)
+
+
+class SkySportsIE(SkyBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?skysports\\.com/watch/video/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.sky'
+    IE_NAME = 'SkySports'
+    _URL_LITERALS = ('skysports.com/watch/video/',)
+
+
+class SlideshareIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?slideshare\\.net/[^/]+?/(?P<title>.+?)($|\\?)'
+    _module = 'youtube_dl.extractor.slideshare'
+    IE_NAME = 'Slideshare'
+    _URL_LITERALS = ('slideshare.net/',)
+
+
+class SlidesLiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://slideslive\\.com/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.slideslive'
+    IE_NAME = 'SlidesLive'
+    _URL_LITERALS = ('://slideslive.com/',)
+
+
+class SlutloadIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:\\w+\\.)?slutload\\.com/(?:video/[^/]+|embed_player|watch)/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.slutload'
+    IE_NAME = 'Slutload'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('slutload.com/',)
+
+
+class SmotriIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:smotri\\.com/video/view/\\?id=|pics\\.smotri\\.com/(?:player|scrubber_custom8)\\.swf\\?file=)(?P<id>v(?P<realvideoid>[0-9]+)[a-z0-9]{4})'
+    _module = 'youtube_dl.extractor.smotri'
+    IE_NAME = 'smotri'
+    IE_DESC = 'Smotri.com'
+    _URL_LITERALS = ('pics.smotri.com/', 'smotri.com/video/view/?id=')
+
+
+class SmotriCommunityIE(LazyLoadExtractor):
+    _VALID_URL = "https?://(?:www\\.)?smotri\\.com/community/video/(?P<id>[0-9A-Za-z_\\'-]+)"
+    _module = 'youtube_dl.extractor.smotri'
+    IE_NAME = 'smotri:community'
+    IE_DESC = 'Smotri.com community videos'
+    _URL_LITERALS = ('smotri.com/community/video/',)
+
+
+class SmotriUserIE(LazyLoadExtractor):
+    _VALID_URL = "https?://(?:www\\.)?smotri\\.com/user/(?P<id>[0-9A-Za-z_\\'-]+)"
+    _module = 'youtube_dl.extractor.smotri'
+    IE_NAME = 'smotri:user'
+    IE_DESC = 'Smotri.com user videos'
+    _URL_LITERALS = ('smotri.com/user/',)
+
+
+class SmotriBroadcastIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<url>smotri\\.com/live/(?P<id>[^/]+))/?.*'
+    _module = 'youtube_dl.extractor.smotri'
+    IE_NAME = 'smotri:broadcast'
+    IE_DESC = 'Smotri.com broadcasts'
+    _URL_LITERALS = ('smotri.com/live/',)
+
+
+class SnotrIE(LazyLoadExtractor):
+    _VALID_URL = 'http?://(?:www\\.)?snotr\\.com/video/(?P<id>\\d+)/([\\w]+)'
+    _module = 'youtube_dl.extractor.snotr'
+    IE_NAME = 'Snotr'
+    _URL_LITERALS = ('snotr.com/video/',)
+
+
+class SohuIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?P<mytv>my\\.)?tv\\.sohu\\.com/.+?/(?(mytv)|n)(?P<id>\\d+)\\.shtml.*?'
+    _module = 'youtube_dl.extractor.sohu'
+    IE_NAME = 'Sohu'
+    _URL_LITERALS = ('tv.sohu.com/',)
+
+
+class SonyLIVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?sonyliv\\.com/details/[^/]+/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.sonyliv'
+    IE_NAME = 'SonyLIV'
+    _URL_LITERALS = ('sonyliv.com/details/',)
+
+
+class SoundcloudEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:w|player|p)\\.soundcloud\\.com/player/?.*?url=(?P<id>.*)'
+    _module = 'youtube_dl.extractor.soundcloud'
+    IE_NAME = 'SoundcloudEmbed'
+    _URL_LITERALS = ('.soundcloud.com/player',)
+
+
+class SoundcloudIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)^(?:https?://)?\n                    (?:(?:(?:www\\.|m\\.)?soundcloud\\.com/\n                            (?!stations/track)\n                            (?P<uploader>[\\w\\d-]+)/\n                            (?!(?:tracks|albums|sets(?:/.+?)?|reposts|likes|spotlight)/?(?:$|[?#]))\n                            (?P<title>[\\w\\d-]+)/?\n                            (?P<token>[^?]+?)?(?:[?].*)?$)\n                       |(?:api(?:-v2)?\\.soundcloud\\.com/tracks/(?P<track_id>\\d+)\n                          (?:/?\\?secret_token=(?P<secret_token>[^&]+))?)\n                    )\n                    '
+    _module = 'youtube_dl.extractor.soundcloud'
+    IE_NAME = 'soundcloud'
+    _URL_LITERALS = ('.soundcloud.com/tracks/', 'soundcloud.com/')
+
+
+class SoundcloudPlaylistBaseIE(SoundcloudIE):
+    _VALID_URL = '(?x)^(?:https?://)?\n                    (?:(?:(?:www\\.|m\\.)?soundcloud\\.com/\n                            (?!stations/track)\n                            (?P<uploader>[\\w\\d-]+)/\n                            (?!(?:tracks|albums|sets(?:/.+?)?|reposts|likes|spotlight)/?(?:$|[?#]))\n                            (?P<title>[\\w\\d-]+)/?\n                            (?P<token>[^?]+?)?(?:[?].*)?$)\n                       |(?:api(?:-v2)?\\.soundcloud\\.com/tracks/(?P<track_id>\\d+)\n                          (?:/?\\?secret_token=(?P<secret_token>[^&]+))?)\n                    )\n                    '
+    _module = 'youtube_dl.extractor.soundcloud'
+    IE_NAME = 'soundcloud'
+    _URL_LITERALS = ('.soundcloud.com/tracks/', 'soundcloud.com/')
+
+
+class SoundcloudSetIE(SoundcloudPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|m)\\.)?soundcloud\\.com/(?P<uploader>[\\w\\d-]+)/sets/(?P<slug_title>[\\w\\d-]+)(?:/(?P<token>[^?/]+))?'
+    _module = 'youtube_dl.extractor.soundcloud'
+    IE_NAME = 'soundcloud:set'
+    _URL_LITERALS = ('soundcloud.com/',)
+
+
+class SoundcloudPagedPlaylistBaseIE(SoundcloudPlaylistBaseIE):
+    _VALID_URL = '(?x)^(?:https?://)?\n                    (?:(?:(?:www\\.|m\\.)?soundcloud\\.com/\n                            (?!stations/track)\n                            (?P<uploader>[\\w\\d-]+)/\n                            (?!(?:tracks|albums|sets(?:/.+?)?|reposts|likes|spotlight)/?(?:$|[?#]))\n                            (?P<title>[\\w\\d-]+)/?\n                            (?P<token>[^?]+?)?(?:[?].*)?$)\n                       |(?:api(?:-v2)?\\.soundcloud\\.com/tracks/(?P<track_id>\\d+)\n                          (?:/?\\?secret_token=(?P<secret_token>[^&]+))?)\n                    )\n                    '
+    _module = 'youtube_dl.extractor.soundcloud'
+    IE_NAME = 'soundcloud'
+    _URL_LITERALS = ('.soundcloud.com/tracks/', 'soundcloud.com/')
+
+
+class SoundcloudUserIE(SoundcloudPagedPlaylistBaseIE):
+    _VALID_URL = '(?x)\n                        https?://\n                            (?:(?:www|m)\\.)?soundcloud\\.com/\n                            (?P<user>[^/]+)\n                            (?:/\n                                (?P<rsrc>tracks|albums|sets|reposts|likes|spotlight)\n                            )?\n                            /?(?:[?#].*)?$\n                    '
+    _module = 'youtube_dl.extractor.soundcloud'
+    IE_NAME = 'soundcloud:user'
+    _URL_LITERALS = ('soundcloud.com/',)
+
+
+class SoundcloudTrackStationIE(SoundcloudPagedPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|m)\\.)?soundcloud\\.com/stations/track/[^/]+/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.soundcloud'
+    IE_NAME = 'soundcloud:trackstation'
+    _URL_LITERALS = ('soundcloud.com/stations/track/',)
+
+
+class SoundcloudPlaylistIE(SoundcloudPlaylistBaseIE):
+    _VALID_URL = 'https?://api(?:-v2)?\\.soundcloud\\.com/playlists/(?P<id>[0-9]+)(?:/?\\?secret_token=(?P<token>[^&]+?))?$'
+    _module = 'youtube_dl.extractor.soundcloud'
+    IE_NAME = 'soundcloud:playlist'
+    _URL_LITERALS = ('.soundcloud.com/playlists/',)
+
+
+class SoundcloudSearchIE(LazyLoadSearchExtractor, SoundcloudIE):
+    _VALID_URL = '(?x)^(?:https?://)?\n                    (?:(?:(?:www\\.|m\\.)?soundcloud\\.com/\n                            (?!stations/track)\n                            (?P<uploader>[\\w\\d-]+)/\n                            (?!(?:tracks|albums|sets(?:/.+?)?|reposts|likes|spotlight)/?(?:$|[?#]))\n                            (?P<title>[\\w\\d-]+)/?\n                            (?P<token>[^?]+?)?(?:[?].*)?$)\n                       |(?:api(?:-v2)?\\.soundcloud\\.com/tracks/(?P<track_id>\\d+)\n                          (?:/?\\?secret_token=(?P<secret_token>[^&]+))?)\n                    )\n                    '
+    _module = 'youtube_dl.extractor.soundcloud'
+    IE_NAME = 'soundcloud:search'
+    IE_DESC = 'Soundcloud search'
+    _URL_LITERALS = ('scsearch',)
+
+    @classmethod
+    def suitable(cls, url):
+        return re.match(cls._make_valid_url(), url) is not None
+
+    @classmethod
+    def _make_valid_url(cls):
+        return 'scsearch(?P<prefix>|[1-9][0-9]*|all):(?P<query>[\\s\\S]+)'
+
+
+class SoundgasmIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?soundgasm\\.net/u/(?P<user>[0-9a-zA-Z_-]+)/(?P<display_id>[0-9a-zA-Z_-]+)'
+    _module = 'youtube_dl.extractor.soundgasm'
+    IE_NAME = 'soundgasm'
+    _URL_LITERALS = ('soundgasm.net/u/',)
+
+
+class SoundgasmProfileIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?soundgasm\\.net/u/(?P<id>[^/]+)/?(?:\\#.*)?$'
+    _module = 'youtube_dl.extractor.soundgasm'
+    IE_NAME = 'soundgasm:profile'
+    _URL_LITERALS = ('soundgasm.net/u/',)
+
+
+class SouthParkIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<url>southpark\\.cc\\.com/(?:clips|(?:full-)?episodes|collections)/(?P<id>.+?)(\\?|#|$))'
+    _module = 'youtube_dl.extractor.southpark'
+    IE_NAME = 'southpark.cc.com'
+    _URL_LITERALS = ('southpark.cc.com/',)
+
+
+class SouthParkDeIE(SouthParkIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<url>southpark\\.de/(?:clips|alle-episoden|collections)/(?P<id>.+?)(\\?|#|$))'
+    _module = 'youtube_dl.extractor.southpark'
+    IE_NAME = 'southpark.de'
+    _URL_LITERALS = ('southpark.de/',)
+
+
+class SouthParkDkIE(SouthParkIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<url>southparkstudios\\.(?:dk|nu)/(?:clips|full-episodes|collections)/(?P<id>.+?)(\\?|#|$))'
+    _module = 'youtube_dl.extractor.southpark'
+    IE_NAME = 'southparkstudios.dk'
+    _URL_LITERALS = ('southparkstudios.',)
+
+
+class SouthParkEsIE(SouthParkIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<url>southpark\\.cc\\.com/episodios-en-espanol/(?P<id>.+?)(\\?|#|$))'
+    _module = 'youtube_dl.extractor.southpark'
+    IE_NAME = 'southpark.cc.com:español'
+    _URL_LITERALS = ('southpark.cc.com/episodios-en-espanol/',)
+
+
+class SouthParkNlIE(SouthParkIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<url>southpark\\.nl/(?:clips|(?:full-)?episodes|collections)/(?P<id>.+?)(\\?|#|$))'
+    _module = 'youtube_dl.extractor.southpark'
+    IE_NAME = 'southpark.nl'
+    _URL_LITERALS = ('southpark.nl/',)
+
+
+class SpankBangIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?spankbang\\.com/(?P<id>[\\da-z]+)/(?:video|play|embed)\\b'
+    _module = 'youtube_dl.extractor.spankbang'
+    IE_NAME = 'SpankBang'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('spankbang.com/',)
+
+
+class SpankBangPlaylistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?spankbang\\.com/(?P<id>[\\da-z]+)/playlist/[^/]+'
+    _module = 'youtube_dl.extractor.spankbang'
+    IE_NAME = 'SpankBangPlaylist'
+    _URL_LITERALS = ('spankbang.com/',)
+
+
+class SpankwireIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<url>spankwire\\.com/[^/]*/video(?P<id>[0-9]+)/?)'
+    _module = 'youtube_dl.extractor.spankwire'
+    IE_NAME = 'Spankwire'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('spankwire.com/',)
+
+
+class SpiegelIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?spiegel\\.de/video/[^/]*-(?P<id>[0-9]+)(?:-embed|-iframe)?(?:\\.html)?(?:#.*)?$'
+    _module = 'youtube_dl.extractor.spiegel'
+    IE_NAME = 'Spiegel'
+    _URL_LITERALS = ('spiegel.de/video/',)
+
+
+class SpiegelArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?spiegel\\.de/(?!video/)[^?#]*?-(?P<id>[0-9]+)\\.html'
+    _module = 'youtube_dl.extractor.spiegel'
+    IE_NAME = 'Spiegel:Article'
+    IE_DESC = 'Articles on spiegel.de'
+    _URL_LITERALS = ('spiegel.de/',)
+
+
+class SpiegeltvIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?spiegel\\.tv/videos/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.spiegeltv'
+    IE_NAME = 'Spiegeltv'
+    _URL_LITERALS = ('spiegel.tv/videos/',)
+
+
+class BellatorIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bellator\\.com/[^/]+/[\\da-z]{6}(?:[/?#&]|$)'
+    _module = 'youtube_dl.extractor.spike'
+    IE_NAME = 'Bellator'
+    _URL_LITERALS = ('bellator.com/',)
+
+
+class ParamountNetworkIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?paramountnetwork\\.com/[^/]+/[\\da-z]{6}(?:[/?#&]|$)'
+    _module = 'youtube_dl.extractor.spike'
+    IE_NAME = 'ParamountNetwork'
+    _URL_LITERALS = ('paramountnetwork.com/',)
+
+
+class StitcherIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?stitcher\\.com/podcast/(?:[^/]+/)+e/(?:(?P<display_id>[^/#?&]+?)-)?(?P<id>\\d+)(?:[/#?&]|$)'
+    _module = 'youtube_dl.extractor.stitcher'
+    IE_NAME = 'Stitcher'
+    _URL_LITERALS = ('stitcher.com/podcast/',)
+
+
+class Sport5IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www|vod)?\\.sport5\\.co\\.il/.*\\b(?:Vi|docID)=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.sport5'
+    IE_NAME = 'Sport5'
+    _URL_LITERALS = ('.sport5.co.il/',)
+
+
+class SportBoxIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:news\\.sportbox|matchtv)\\.ru/vdl/player(?:/[^/]+/|\\?.*?\\bn?id=)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.sportbox'
+    IE_NAME = 'SportBox'
+    _URL_LITERALS = ('.ru/vdl/player',)
+
+
+class SportDeutschlandIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://sportdeutschland\\.tv/(?P<sport>[^/?#]+)/(?P<id>[^?#/]+)(?:$|[?#])'
+    _module = 'youtube_dl.extractor.sportdeutschland'
+    IE_NAME = 'SportDeutschland'
+    _URL_LITERALS = ('://sportdeutschland.tv/',)
+
+
+class SpringboardPlatformIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        cms\\.springboardplatform\\.com/\n                        (?:\n                            (?:previews|embed_iframe)/(?P<index>\\d+)/video/(?P<id>\\d+)|\n                            xml_feeds_advanced/index/(?P<index_2>\\d+)/rss3/(?P<id_2>\\d+)\n                        )\n                    '
+    _module = 'youtube_dl.extractor.springboardplatform'
+    IE_NAME = 'SpringboardPlatform'
+    _URL_LITERALS = ('://cms.springboardplatform.com/',)
+
+
+class SproutIE(AdobePassIE):
+    _VALID_URL = 'https?://(?:www\\.)?sproutonline\\.com/watch/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.sprout'
+    IE_NAME = 'Sprout'
+    _URL_LITERALS = ('sproutonline.com/watch/',)
+
+
+class SRGSSRIE(LazyLoadExtractor):
+    _VALID_URL = '(?:https?://tp\\.srgssr\\.ch/p(?:/[^/]+)+\\?urn=urn|srgssr):(?P<bu>srf|rts|rsi|rtr|swi):(?:[^:]+:)?(?P<type>video|audio):(?P<id>[0-9a-f\\-]{36}|\\d+)'
+    _module = 'youtube_dl.extractor.srgssr'
+    IE_NAME = 'SRGSSR'
+    _URL_LITERALS = ('://tp.srgssr.ch/p', 'srgssr')
+
+
+class RTSIE(SRGSSRIE):
+    _VALID_URL = 'rts:(?P<rts_id>\\d+)|https?://(?:.+?\\.)?rts\\.ch/(?:[^/]+/){2,}(?P<id>[0-9]+)-(?P<display_id>.+?)\\.html'
+    _module = 'youtube_dl.extractor.rts'
+    IE_NAME = 'RTS'
+    IE_DESC = 'RTS.ch'
+    _URL_LITERALS = ('rts.ch/', 'rts:')
+
+
+class SRGSSRPlayIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:(?:www|play)\\.)?\n                        (?P<bu>srf|rts|rsi|rtr|swissinfo)\\.ch/play/(?:tv|radio)/\n                        (?:\n                            [^/]+/(?P<type>video|audio)/[^?]+|\n                            popup(?P<type_2>video|audio)player\n                        )\n                        \\?id=(?P<id>[0-9a-f\\-]{36}|\\d+)\n                    '
+    _module = 'youtube_dl.extractor.srgssr'
+    IE_NAME = 'SRGSSRPlay'
+    IE_DESC = 'srf.ch, rts.ch, rsi.ch, rtr.ch and swissinfo.ch play sites'
+    _URL_LITERALS = ('.ch/play/',)
+
+
+class SRMediathekIE(ARDMediathekIE):
+    _VALID_URL = 'https?://sr-mediathek(?:\\.sr-online)?\\.de/index\\.php\\?.*?&id=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.srmediathek'
+    IE_NAME = 'sr:mediathek'
+    IE_DESC = 'Saarländischer Rundfunk'
+    _URL_LITERALS = ('.de/index.php?',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if ARDBetaMediathekIE.suitable(url) else super(ARDMediathekIE, cls).suitable(url)
+
+
+class StanfordOpenClassroomIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://openclassroom\\.stanford\\.edu(?P<path>/?|(/MainFolder/(?:HomePage|CoursePage|VideoPage)\\.php([?]course=(?P<course>[^&]+)(&video=(?P<video>[^&]+))?(&.*)?)?))$'
+    _module = 'youtube_dl.extractor.stanfordoc'
+    IE_NAME = 'stanfordoc'
+    IE_DESC = 'Stanford Open ClassRoom'
+    _URL_LITERALS = ('://openclassroom.stanford.edu',)
+
+
+class SteamIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        https?://store\\.steampowered\\.com/\n            (agecheck/)?\n            (?P<urltype>video|app)/ #If the page is only for videos or for a game\n            (?P<gameID>\\d+)/?\n            (?P<videoID>\\d*)(?P<extra>\\??) # For urltype == video we sometimes get the videoID\n        |\n        https?://(?:www\\.)?steamcommunity\\.com/sharedfiles/filedetails/\\?id=(?P<fileID>[0-9]+)\n    '
+    _module = 'youtube_dl.extractor.steam'
+    IE_NAME = 'Steam'
+    _URL_LITERALS = ('://store.steampowered.com/', 'steamcommunity.com/sharedfiles/filedetails/?id=')
+
+
+class StreamableIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://streamable\\.com/(?:[es]/)?(?P<id>\\w+)'
+    _module = 'youtube_dl.extractor.streamable'
+    IE_NAME = 'Streamable'
+    _URL_LITERALS = ('://streamable.com/',)
+
+
+class StreamcloudIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://streamcloud\\.eu/(?P<id>[a-zA-Z0-9_-]+)(?:/(?P<fname>[^#?]*)\\.html)?'
+    _module = 'youtube_dl.extractor.streamcloud'
+    IE_NAME = 'streamcloud.eu'
+    _URL_LITERALS = ('://streamcloud.eu/',)
+
+
+class StreamCZIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?stream\\.cz/.+/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.streamcz'
+    IE_NAME = 'StreamCZ'
+    _URL_LITERALS = ('stream.cz/',)
+
+
+class StreetVoiceIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?streetvoice\\.com/[^/]+/songs/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.streetvoice'
+    IE_NAME = 'StreetVoice'
+    _URL_LITERALS = ('streetvoice.com/',)
+
+
+class StretchInternetIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://portal\\.stretchinternet\\.com/[^/]+/portal\\.htm\\?.*?\\beventId=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.stretchinternet'
+    IE_NAME = 'StretchInternet'
+    _URL_LITERALS = ('://portal.stretchinternet.com/',)
+
+
+class STVPlayerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://player\\.stv\\.tv/(?P<type>episode|video)/(?P<id>[a-z0-9]{4})'
+    _module = 'youtube_dl.extractor.stv'
+    IE_NAME = 'stv:player'
+    _URL_LITERALS = ('://player.stv.tv/',)
+
+
+class SunPornoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www\\.)?sunporno\\.com/videos|embeds\\.sunporno\\.com/embed)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.sunporno'
+    IE_NAME = 'SunPorno'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('embeds.sunporno.com/embed', 'sunporno.com/videos')
+
+
+class SverigesRadioBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.sverigesradio'
+    IE_NAME = 'SverigesRadioBase'
+    _URL_LITERALS = None
+
+
+class SverigesRadioEpisodeIE(SverigesRadioBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?sverigesradio\\.se/(?:sida/)?avsnitt/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.sverigesradio'
+    IE_NAME = 'sverigesradio:episode'
+    _URL_LITERALS = ('sverigesradio.se/',)
+
+
+class SverigesRadioPublicationIE(SverigesRadioBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?sverigesradio\\.se/sida/(?:artikel|gruppsida)\\.aspx\\?.*?\\bartikel=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.sverigesradio'
+    IE_NAME = 'sverigesradio:publication'
+    _URL_LITERALS = ('sverigesradio.se/sida/',)
+
+
+class SVTBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.svt'
+    IE_NAME = 'SVTBase'
+    _URL_LITERALS = None
+
+
+class SVTIE(SVTBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?svt\\.se/wd\\?(?:.*?&)?widgetId=(?P<widget_id>\\d+)&.*?\\barticleId=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.svt'
+    IE_NAME = 'SVT'
+    _URL_LITERALS = ('svt.se/wd?',)
+
+
+class SVTPageIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?svt\\.se/(?:[^/]+/)*(?P<id>[^/?&#]+)'
+    _module = 'youtube_dl.extractor.svt'
+    IE_NAME = 'SVTPage'
+    _URL_LITERALS = ('svt.se/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if SVTIE.suitable(url) else super(SVTPageIE, cls).suitable(url)
+
+
+class SVTPlayBaseIE(SVTBaseIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.svt'
+    IE_NAME = 'SVTPlayBase'
+    _URL_LITERALS = None
+
+
+class SVTPlayIE(SVTPlayBaseIE):
+    _VALID_URL = '(?x)\n                    (?:\n                        svt:(?P<svt_id>[^/?#&]+)|\n                        https?://(?:www\\.)?(?:svtplay|oppetarkiv)\\.se/(?:video|klipp|kanaler)/(?P<id>[^/?#&]+)\n                    )\n                    '
+    _module = 'youtube_dl.extractor.svt'
+    IE_NAME = 'SVTPlay'
+    IE_DESC = 'SVT Play and Öppet arkiv'
+    _URL_LITERALS = ('.se/', 'svt:')
+
+
+class SVTSeriesIE(SVTPlayBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?svtplay\\.se/(?P<id>[^/?&#]+)'
+    _module = 'youtube_dl.extractor.svt'
+    IE_NAME = 'SVTSeries'
+    _URL_LITERALS = ('svtplay.se/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if SVTIE.suitable(url) or SVTPlayIE.suitable(url) else super(SVTSeriesIE, cls).suitable(url)
+
+
+class SWRMediathekIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?swrmediathek\\.de/(?:content/)?player\\.htm\\?show=(?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'youtube_dl.extractor.swrmediathek'
+    IE_NAME = 'SWRMediathek'
+    _URL_LITERALS = ('swrmediathek.de/',)
+
+
+class SyfyIE(AdobePassIE):
+    _VALID_URL = 'https?://(?:www\\.)?syfy\\.com/(?:[^/]+/)?videos/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.syfy'
+    IE_NAME = 'Syfy'
+    _URL_LITERALS = ('syfy.com/',)
+
+
+class SztvHuIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www\\.)?sztv\\.hu|www\\.tvszombathely\\.hu)/(?:[^/]+)/.+-(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.sztvhu'
+    IE_NAME = 'SztvHu'
+    _URL_LITERALS = ('sztv.hu', 'www.tvszombathely.hu')
+
+
+class TagesschauPlayerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tagesschau\\.de/multimedia/(?P<kind>audio|video)/(?P=kind)-(?P<id>\\d+)~player(?:_[^/?#&]+)?\\.html'
+    _module = 'youtube_dl.extractor.tagesschau'
+    IE_NAME = 'tagesschau:player'
+    _URL_LITERALS = ('tagesschau.de/multimedia/',)
+
+
+class TagesschauIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tagesschau\\.de/(?P<path>[^/]+/(?:[^/]+/)*?(?P<id>[^/#?]+?(?:-?[0-9]+)?))(?:~_?[^/#?]+?)?\\.html'
+    _module = 'youtube_dl.extractor.tagesschau'
+    IE_NAME = 'Tagesschau'
+    _URL_LITERALS = ('tagesschau.de/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if TagesschauPlayerIE.suitable(url) else super(TagesschauIE, cls).suitable(url)
+
+
+class TassIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:tass\\.ru|itar-tass\\.com)/[^/]+/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tass'
+    IE_NAME = 'Tass'
+    _URL_LITERALS = ('itar-tass.com', 'tass.ru')
+
+
+class TastyTradeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tastytrade\\.com/tt/shows/[^/]+/episodes/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.tastytrade'
+    IE_NAME = 'TastyTrade'
+    _URL_LITERALS = ('tastytrade.com/tt/shows/',)
+
+
+class TBSIE(TurnerBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<site>tbs|tntdrama)\\.com(?P<path>/(?:movies|shows/[^/]+/(?:clips|season-\\d+/episode-\\d+))/(?P<id>[^/?#]+))'
+    _module = 'youtube_dl.extractor.tbs'
+    IE_NAME = 'TBS'
+    _URL_LITERALS = ('.com',)
+
+
+class TDSLifewayIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://tds\\.lifeway\\.com/v1/trainingdeliverysystem/courses/(?P<id>\\d+)/index\\.html'
+    _module = 'youtube_dl.extractor.tdslifeway'
+    IE_NAME = 'TDSLifeway'
+    _URL_LITERALS = ('://tds.lifeway.com/v1/trainingdeliverysystem/courses/',)
+
+
+class TeachableBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.teachable'
+    IE_NAME = 'TeachableBase'
+    _URL_LITERALS = None
+
+
+class TeachableIE(TeachableBaseIE):
+    _VALID_URL = '(?x)\n                    (?:\n                        teachable:https?://(?P<site_t>[^/]+)|\n                        https?://(?:www\\.)?(?P<site>upskillcourses\\.com|academy\\.gns3\\.com|academyhacker\\.com|stackskills\\.com|market\\.saleshacker\\.com|learnability\\.org|edurila\\.com|courses\\.workitdaily\\.com)\n                    )\n                    /courses/[^/]+/lectures/(?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.teachable'
+    IE_NAME = 'Teachable'
+    _URL_LITERALS = ('academy.gns3.com', 'academyhacker.com', 'courses.workitdaily.com', 'edurila.com', 'learnability.org', 'market.saleshacker.com', 'stackskills.com', 'teachable:http', 'upskillcourses.com')
+
+
+class TeachableCourseIE(TeachableBaseIE):
+    _VALID_URL = '(?x)\n                        (?:\n                            teachable:https?://(?P<site_t>[^/]+)|\n                            https?://(?:www\\.)?(?P<site>upskillcourses\\.com|academy\\.gns3\\.com|academyhacker\\.com|stackskills\\.com|market\\.saleshacker\\.com|learnability\\.org|edurila\\.com|courses\\.workitdaily\\.com)\n                        )\n                        /(?:courses|p)/(?:enrolled/)?(?P<id>[^/?#&]+)\n                    '
+    _module = 'youtube_dl.extractor.teachable'
+    IE_NAME = 'TeachableCourse'
+    _URL_LITERALS = ('academy.gns3.com', 'academyhacker.com', 'courses.workitdaily.com', 'edurila.com', 'learnability.org', 'market.saleshacker.com', 'stackskills.com', 'teachable:http', 'upskillcourses.com')
+
+    @classmethod
+    def suitable(cls, url):
+        return False if TeachableIE.suitable(url) else super(
+            TeachableCourseIE, cls).suitable(url)
+
+
+class TeacherTubeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?teachertube\\.com/(viewVideo\\.php\\?video_id=|music\\.php\\?music_id=|video/(?:[\\da-z-]+-)?|audio/)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.teachertube'
+    IE_NAME = 'teachertube'
+    IE_DESC = 'teachertube.com videos'
+    _URL_LITERALS = ('teachertube.com/',)
+
+
+class TeacherTubeUserIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?teachertube\\.com/(user/profile|collection)/(?P<user>[0-9a-zA-Z]+)/?'
+    _module = 'youtube_dl.extractor.teachertube'
+    IE_NAME = 'teachertube:user:collection'
+    IE_DESC = 'teachertube.com user and collection videos'
+    _URL_LITERALS = ('teachertube.com/',)
+
+
+class TeachingChannelIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?teachingchannel\\.org/videos/(?P<title>.+)'
+    _module = 'youtube_dl.extractor.teachingchannel'
+    IE_NAME = 'TeachingChannel'
+    _URL_LITERALS = ('teachingchannel.org/videos/',)
+
+
+class TeamcocoIE(TurnerBaseIE):
+    _VALID_URL = 'https?://(?:\\w+\\.)?teamcoco\\.com/(?P<id>([^/]+/)*[^/?#]+)'
+    _module = 'youtube_dl.extractor.teamcoco'
+    IE_NAME = 'Teamcoco'
+    _URL_LITERALS = ('teamcoco.com/',)
+
+
+class TeamTreeHouseIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?teamtreehouse\\.com/library/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.teamtreehouse'
+    IE_NAME = 'TeamTreeHouse'
+    _URL_LITERALS = ('teamtreehouse.com/library/',)
+
+
+class TechTalksIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://techtalks\\.tv/talks/(?:[^/]+/)?(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.techtalks'
+    IE_NAME = 'TechTalks'
+    _URL_LITERALS = ('://techtalks.tv/talks/',)
+
+
+class TEDIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        (?P<proto>https?://)\n        (?P<type>www|embed(?:-ssl)?)(?P<urlmain>\\.ted\\.com/\n        (\n            (?P<type_playlist>playlists(?:/(?P<playlist_id>\\d+))?) # We have a playlist\n            |\n            ((?P<type_talk>talks)) # We have a simple talk\n            |\n            (?P<type_watch>watch)/[^/]+/[^/]+\n        )\n        (/lang/(.*?))? # The url may contain the language\n        /(?P<name>[\\w-]+) # Here goes the name and then ".html"\n        .*)$\n        '
+    _module = 'youtube_dl.extractor.ted'
+    IE_NAME = 'ted'
+    _URL_LITERALS = ('.ted.com/',)
+
+
+class Tele5IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tele5\\.de/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.tele5'
+    IE_NAME = 'Tele5'
+    _URL_LITERALS = ('tele5.de/',)
+
+
+class Tele13IE(LazyLoadExtractor):
+    _VALID_URL = '^https?://(?:www\\.)?t13\\.cl/videos(?:/[^/]+)+/(?P<id>[\\w-]+)'
+    _module = 'youtube_dl.extractor.tele13'
+    IE_NAME = 'Tele13'
+    _URL_LITERALS = ('t13.cl/videos',)
+
+
+class TeleBruxellesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:telebruxelles|bx1)\\.be/(?:[^/]+/)*(?P<id>[^/#?]+)'
+    _module = 'youtube_dl.extractor.telebruxelles'
+    IE_NAME = 'TeleBruxelles'
+    _URL_LITERALS = ('.be/',)
+
+
+class TelecincoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:telecinco\\.es|cuatro\\.com|mediaset\\.es)/(?:[^/]+/)+(?P<id>.+?)\\.html'
+    _module = 'youtube_dl.extractor.telecinco'
+    IE_NAME = 'Telecinco'
+    IE_DESC = 'telecinco.es, cuatro.com and mediaset.es'
+    _URL_LITERALS = ('cuatro.com', 'mediaset.es', 'telecinco.es')
+
+
+class TelegraafIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?telegraaf\\.nl/video/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.telegraaf'
+    IE_NAME = 'Telegraaf'
+    _URL_LITERALS = ('telegraaf.nl/video/',)
+
+
+class TeleMBIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?telemb\\.be/(?P<display_id>.+?)_d_(?P<id>\\d+)\\.html'
+    _module = 'youtube_dl.extractor.telemb'
+    IE_NAME = 'TeleMB'
+    _URL_LITERALS = ('telemb.be/',)
+
+
+class TeleQuebecBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.telequebec'
+    IE_NAME = 'TeleQuebecBase'
+    _URL_LITERALS = None
+
+
+class TeleQuebecIE(TeleQuebecBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            zonevideo\\.telequebec\\.tv/media|\n                            coucou\\.telequebec\\.tv/videos\n                        )/(?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.telequebec'
+    IE_NAME = 'TeleQuebec'
+    _URL_LITERALS = ('coucou.telequebec.tv/videos', 'zonevideo.telequebec.tv/media')
+
+
+class TeleQuebecSquatIE(LazyLoadExtractor):
+    _VALID_URL = 'https://squat\\.telequebec\\.tv/videos/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.telequebec'
+    IE_NAME = 'TeleQuebecSquat'
+    _URL_LITERALS = ('https://squat.telequebec.tv/videos/',)
+
+
+class TeleQuebecEmissionIE(TeleQuebecBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            [^/]+\\.telequebec\\.tv/emissions/|\n                            (?:www\\.)?telequebec\\.tv/\n                        )\n                        (?P<id>[^?#&]+)\n                    '
+    _module = 'youtube_dl.extractor.telequebec'
+    IE_NAME = 'TeleQuebecEmission'
+    _URL_LITERALS = ('.telequebec.tv/emissions/', 'telequebec.tv/')
+
+
+class TeleQuebecLiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://zonevideo\\.telequebec\\.tv/(?P<id>endirect)'
+    _module = 'youtube_dl.extractor.telequebec'
+    IE_NAME = 'TeleQuebecLive'
+    _URL_LITERALS = ('://zonevideo.telequebec.tv/',)
+
+
+class TeleTaskIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tele-task\\.de/archive/video/html5/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.teletask'
+    IE_NAME = 'TeleTask'
+    _URL_LITERALS = ('tele-task.de/archive/video/html5/',)
+
+
+class TelewebionIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?telewebion\\.com/#!/episode/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.telewebion'
+    IE_NAME = 'Telewebion'
+    _URL_LITERALS = ('telewebion.com/#!/episode/',)
+
+
+class TennisTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tennistv\\.com/videos/(?P<id>[-a-z0-9]+)'
+    _module = 'youtube_dl.extractor.tennistv'
+    IE_NAME = 'TennisTV'
+    _URL_LITERALS = ('tennistv.com/videos/',)
+
+
+class TenPlayIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?10play\\.com\\.au/[^/]+/episodes/[^/]+/[^/]+/(?P<id>tpv\\d{6}[a-z]{5})'
+    _module = 'youtube_dl.extractor.tenplay'
+    IE_NAME = 'TenPlay'
+    _AGE_LIMIT = 10
+    _URL_LITERALS = ('10play.com.au/',)
+
+
+class TestURLIE(LazyLoadExtractor):
+    _VALID_URL = 'test(?:url)?:(?P<id>(?P<extractor>.+?)(?:_(?P<num>[0-9]+))?)$'
+    _module = 'youtube_dl.extractor.testurl'
+    IE_NAME = 'TestURL'
+    IE_DESC = False
+    _URL_LITERALS = ('test',)
+
+
+class TF1IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:videos|www|lci)\\.tf1|(?:www\\.)?(?:tfou|ushuaiatv|histoire|tvbreizh))\\.fr/(?:[^/]+/)*(?P<id>[^/?#.]+)'
+    _module = 'youtube_dl.extractor.tf1'
+    IE_NAME = 'TF1'
+    _URL_LITERALS = ('.fr/',)
+
+
+class TFOIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tfo\\.org/(?:en|fr)/(?:[^/]+/){2}(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tfo'
+    IE_NAME = 'TFO'
+    _URL_LITERALS = ('tfo.org/',)
+
+
+class TheInterceptIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://theintercept\\.com/fieldofvision/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.theintercept'
+    IE_NAME = 'TheIntercept'
+    _URL_LITERALS = ('://theintercept.com/fieldofvision/',)
+
+
+class ThePlatformIE(ThePlatformBaseIE, AdobePassIE):
+    _VALID_URL = '(?x)\n        (?:https?://(?:link|player)\\.theplatform\\.com/[sp]/(?P<provider_id>[^/]+)/\n           (?:(?:(?:[^/]+/)+select/)?(?P<media>media/(?:guid/\\d+/)?)?|(?P<config>(?:[^/\\?]+/(?:swf|config)|onsite)/select/))?\n         |theplatform:)(?P<id>[^/\\?&]+)'
+    _module = 'youtube_dl.extractor.theplatform'
+    IE_NAME = 'ThePlatform'
+    _URL_LITERALS = ('.theplatform.com/', 'theplatform:')
+
+
+class AENetworksBaseIE(ThePlatformIE):
+    _VALID_URL = '(?x)\n        (?:https?://(?:link|player)\\.theplatform\\.com/[sp]/(?P<provider_id>[^/]+)/\n           (?:(?:(?:[^/]+/)+select/)?(?P<media>media/(?:guid/\\d+/)?)?|(?P<config>(?:[^/\\?]+/(?:swf|config)|onsite)/select/))?\n         |theplatform:)(?P<id>[^/\\?&]+)'
+    _module = 'youtube_dl.extractor.aenetworks'
+    IE_NAME = 'AENetworksBase'
+    _URL_LITERALS = ('.theplatform.com/', 'theplatform:')
+
+
+class AENetworksIE(AENetworksBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?\n                        (?P<domain>\n                            (?:history(?:vault)?|aetv|mylifetime|lifetimemovieclub)\\.com|\n                            fyi\\.tv\n                        )/\n                        (?:\n                            shows/(?P<show_path>[^/]+(?:/[^/]+){0,2})|\n                            movies/(?P<movie_display_id>[^/]+)(?:/full-movie)?|\n                            specials/(?P<special_display_id>[^/]+)/(?:full-special|preview-)|\n                            collections/[^/]+/(?P<collection_display_id>[^/]+)\n                        )\n                    '
+    _module = 'youtube_dl.extractor.aenetworks'
+    IE_NAME = 'aenetworks'
+    IE_DESC = 'A+E Networks: A&E, Lifetime, History.com, FYI Network and History Vault'
+    _URL_LITERALS = ('.com', 'fyi.tv')
+
+
+class HistoryTopicIE(AENetworksBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?history\\.com/topics/[^/]+/(?P<id>[\\w+-]+?)-video'
+    _module = 'youtube_dl.extractor.aenetworks'
+    IE_NAME = 'history:topic'
+    IE_DESC = 'History.com Topic'
+    _URL_LITERALS = ('history.com/topics/',)
+
+
+class AMCNetworksIE(ThePlatformIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:amc|bbcamerica|ifc|(?:we|sundance)tv)\\.com/(?:movies|shows(?:/[^/]+)+)/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.amcnetworks'
+    IE_NAME = 'AMCNetworks'
+    _AGE_LIMIT = 17
+    _URL_LITERALS = ('.com/',)
+
+
+class NBCNewsIE(ThePlatformIE):
+    _VALID_URL = '(?x)https?://(?:www\\.)?(?:nbcnews|today|msnbc)\\.com/([^/]+/)*(?:.*-)?(?P<id>[^/?]+)'
+    _module = 'youtube_dl.extractor.nbc'
+    IE_NAME = 'NBCNews'
+    _URL_LITERALS = ('.com/',)
+
+
+class ThePlatformFeedIE(ThePlatformBaseIE):
+    _VALID_URL = 'https?://feed\\.theplatform\\.com/f/(?P<provider_id>[^/]+)/(?P<feed_id>[^?/]+)\\?(?:[^&]+&)*(?P<filter>by(?:Gui|I)d=(?P<id>[^&]+))'
+    _module = 'youtube_dl.extractor.theplatform'
+    IE_NAME = 'ThePlatformFeed'
+    _URL_LITERALS = ('://feed.theplatform.com/f/',)
+
+
+class CBSBaseIE(ThePlatformFeedIE):
+    _VALID_URL = 'https?://feed\\.theplatform\\.com/f/(?P<provider_id>[^/]+)/(?P<feed_id>[^?/]+)\\?(?:[^&]+&)*(?P<filter>by(?:Gui|I)d=(?P<id>[^&]+))'
+    _module = 'youtube_dl.extractor.cbs'
+    IE_NAME = 'CBSBase'
+    _URL_LITERALS = ('://feed.theplatform.com/f/',)
+
+
+class CBSIE(CBSBaseIE):
+    _VALID_URL = '(?:cbs:|https?://(?:www\\.)?(?:cbs\\.com/shows/[^/]+/video|colbertlateshow\\.com/(?:video|podcasts))/)(?P<id>[\\w-]+)'
+    _module = 'youtube_dl.extractor.cbs'
+    IE_NAME = 'CBS'
+    _URL_LITERALS = ('bs.com/shows/', 'cbs:', 'olbertlateshow.com/')
+
+
+class CBSInteractiveIE(CBSIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<site>cnet|zdnet)\\.com/(?:videos|video(?:/share)?)/(?P<id>[^/?]+)'
+    _module = 'youtube_dl.extractor.cbsinteractive'
+    IE_NAME = 'CBSInteractive'
+    _URL_LITERALS = ('.com/video',)
+
+
+class CBSNewsEmbedIE(CBSIE):
+    _VALID_URL = 'https?://(?:www\\.)?cbsnews\\.com/embed/video[^#]*#(?P<id>.+)'
+    _module = 'youtube_dl.extractor.cbsnews'
+    IE_NAME = 'cbsnews:embed'
+    _URL_LITERALS = ('cbsnews.com/embed/video',)
+
+
+class CBSNewsIE(CBSIE):
+    _VALID_URL = 'https?://(?:www\\.)?cbsnews\\.com/(?:news|video)/(?P<id>[\\da-z_-]+)'
+    _module = 'youtube_dl.extractor.cbsnews'
+    IE_NAME = 'cbsnews'
+    IE_DESC = 'CBS News'
+    _URL_LITERALS = ('cbsnews.com/',)
+
+
+class CBSSportsIE(CBSBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?cbssports\\.com/[^/]+/(?:video|news)/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.cbssports'
+    IE_NAME = 'CBSSports'
+    _URL_LITERALS = ('cbssports.com/',)
+
+
+class CorusIE(ThePlatformFeedIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?\n                        (?P<domain>\n                            (?:\n                                globaltv|\n                                etcanada|\n                                seriesplus|\n                                wnetwork|\n                                ytv\n                            )\\.com|\n                            (?:\n                                hgtv|\n                                foodnetwork|\n                                slice|\n                                history|\n                                showcase|\n                                bigbrothercanada|\n                                abcspark|\n                                disney(?:channel|lachaine)\n                            )\\.ca\n                        )\n                        /(?:[^/]+/)*\n                        (?:\n                            video\\.html\\?.*?\\bv=|\n                            videos?/(?:[^/]+/)*(?:[a-z0-9-]+-)?\n                        )\n                        (?P<id>\n                            [\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12}|\n                            (?:[A-Z]{4})?\\d{12,20}\n                        )\n                    '
+    _module = 'youtube_dl.extractor.corus'
+    IE_NAME = 'Corus'
+    _URL_LITERALS = ('video',)
+
+
+class TheSceneIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://thescene\\.com/watch/[^/]+/(?P<id>[^/#?]+)'
+    _module = 'youtube_dl.extractor.thescene'
+    IE_NAME = 'TheScene'
+    _URL_LITERALS = ('://thescene.com/watch/',)
+
+
+class TheStarIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?thestar\\.com/(?:[^/]+/)*(?P<id>.+)\\.html'
+    _module = 'youtube_dl.extractor.thestar'
+    IE_NAME = 'TheStar'
+    _URL_LITERALS = ('thestar.com/',)
+
+
+class TheSunIE(LazyLoadExtractor):
+    _VALID_URL = 'https://(?:www\\.)?thesun\\.co\\.uk/[^/]+/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.thesun'
+    IE_NAME = 'TheSun'
+    _URL_LITERALS = ('thesun.co.uk/',)
+
+
+class TheWeatherChannelIE(ThePlatformIE):
+    _VALID_URL = 'https?://(?:www\\.)?weather\\.com/(?:[^/]+/)*video/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.theweatherchannel'
+    IE_NAME = 'TheWeatherChannel'
+    _URL_LITERALS = ('weather.com/',)
+
+
+class ThisAmericanLifeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?thisamericanlife\\.org/(?:radio-archives/episode/|play_full\\.php\\?play=)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.thisamericanlife'
+    IE_NAME = 'ThisAmericanLife'
+    _URL_LITERALS = ('thisamericanlife.org/',)
+
+
+class ThisAVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?thisav\\.com/video/(?P<id>[0-9]+)/.*'
+    _module = 'youtube_dl.extractor.thisav'
+    IE_NAME = 'ThisAV'
+    _URL_LITERALS = ('thisav.com/video/',)
+
+
+class ThisOldHouseIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?thisoldhouse\\.com/(?:watch|how-to|tv-episode)/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.thisoldhouse'
+    IE_NAME = 'ThisOldHouse'
+    _URL_LITERALS = ('thisoldhouse.com/',)
+
+
+class ThreeQSDNIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://playout\\.3qsdn\\.com/(?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'youtube_dl.extractor.threeqsdn'
+    IE_NAME = '3qsdn'
+    IE_DESC = '3Q SDN'
+    _URL_LITERALS = ('://playout.3qsdn.com/',)
+
+
+class TikTokBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.tiktok'
+    IE_NAME = 'TikTokBase'
+    _URL_LITERALS = None
+
+
+class TikTokIE(TikTokBaseIE):
+    _VALID_URL = '(?x)\n                        https?://\n                            (?:\n                                (?:m\\.)?tiktok\\.com/v|\n                                (?:www\\.)?tiktok\\.com/share/video\n                            )\n                            /(?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.tiktok'
+    IE_NAME = 'TikTok'
+    _URL_LITERALS = ('tiktok.com/share/video', 'tiktok.com/v')
+
+
+class TikTokUserIE(TikTokBaseIE):
+    _VALID_URL = '(?x)\n                        https?://\n                            (?:\n                                (?:m\\.)?tiktok\\.com/h5/share/usr|\n                                (?:www\\.)?tiktok\\.com/share/user\n                            )\n                            /(?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.tiktok'
+    IE_NAME = 'TikTokUser'
+    _URL_LITERALS = ('tiktok.com/h5/share/usr', 'tiktok.com/share/user')
+
+
+class TinyPicIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?tinypic\\.com/player\\.php\\?v=(?P<id>[^&]+)&s=\\d+'
+    _module = 'youtube_dl.extractor.tinypic'
+    IE_NAME = 'tinypic'
+    IE_DESC = 'tinypic.com videos'
+    _URL_LITERALS = ('tinypic.com/player.php?v=',)
+
+
+class TMZIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tmz\\.com/videos/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.tmz'
+    IE_NAME = 'TMZ'
+    _URL_LITERALS = ('tmz.com/videos/',)
+
+
+class TMZArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tmz\\.com/\\d{4}/\\d{2}/\\d{2}/(?P<id>[^/]+)/?'
+    _module = 'youtube_dl.extractor.tmz'
+    IE_NAME = 'TMZArticle'
+    _URL_LITERALS = ('tmz.com/',)
+
+
+class TNAFlixNetworkBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.tnaflix'
+    IE_NAME = 'TNAFlixNetworkBase'
+    _URL_LITERALS = None
+
+
+class TNAFlixNetworkEmbedIE(TNAFlixNetworkBaseIE):
+    _VALID_URL = 'https?://player\\.(?:tna|emp)flix\\.com/video/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tnaflix'
+    IE_NAME = 'TNAFlixNetworkEmbed'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('flix.com/video/',)
+
+
+class TNAEMPFlixBaseIE(TNAFlixNetworkBaseIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.tnaflix'
+    IE_NAME = 'TNAEMPFlixBase'
+    _URL_LITERALS = None
+
+
+class TNAFlixIE(TNAEMPFlixBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?tnaflix\\.com/[^/]+/(?P<display_id>[^/]+)/video(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tnaflix'
+    IE_NAME = 'TNAFlix'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('tnaflix.com/',)
+
+
+class EMPFlixIE(TNAEMPFlixBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?empflix\\.com/(?:videos/(?P<display_id>.+?)-|[^/]+/(?P<display_id_2>[^/]+)/video)(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.tnaflix'
+    IE_NAME = 'EMPFlix'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('empflix.com/',)
+
+
+class MovieFapIE(TNAFlixNetworkBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?moviefap\\.com/videos/(?P<id>[0-9a-f]+)/(?P<display_id>[^/]+)\\.html'
+    _module = 'youtube_dl.extractor.tnaflix'
+    IE_NAME = 'MovieFap'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('moviefap.com/videos/',)
+
+
+class ToggleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.toggle\\.sg/(?:en|zh)/(?:[^/]+/){2,}(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.toggle'
+    IE_NAME = 'toggle'
+    _URL_LITERALS = ('://video.toggle.sg/',)
+
+
+class TOnlineIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?t-online\\.de/tv/(?:[^/]+/)*id_(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tonline'
+    IE_NAME = 't-online.de'
+    _URL_LITERALS = ('t-online.de/tv/',)
+
+
+class ToonGogglesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?toongoggles\\.com/shows/(?P<show_id>\\d+)(?:/[^/]+/episodes/(?P<episode_id>\\d+))?'
+    _module = 'youtube_dl.extractor.toongoggles'
+    IE_NAME = 'ToonGoggles'
+    _URL_LITERALS = ('toongoggles.com/shows/',)
+
+
+class TouTvIE(RadioCanadaIE):
+    _VALID_URL = 'https?://ici\\.tou\\.tv/(?P<id>[a-zA-Z0-9_-]+(?:/S[0-9]+[EC][0-9]+)?)'
+    _module = 'youtube_dl.extractor.toutv'
+    IE_NAME = 'tou.tv'
+    _URL_LITERALS = ('://ici.tou.tv/',)
+
+
+class ToypicsUserIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://videos\\.toypics\\.net/(?!view)(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.toypics'
+    IE_NAME = 'ToypicsUser'
+    IE_DESC = 'Toypics user profile'
+    _URL_LITERALS = ('://videos.toypics.net/',)
+
+
+class ToypicsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://videos\\.toypics\\.net/view/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.toypics'
+    IE_NAME = 'Toypics'
+    IE_DESC = 'Toypics video'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('://videos.toypics.net/view/',)
+
+
+class TrailerAddictIE(LazyLoadExtractor):
+    _VALID_URL = '(?:https?://)?(?:www\\.)?traileraddict\\.com/(?:trailer|clip)/(?P<movie>.+?)/(?P<trailer_name>.+)'
+    _module = 'youtube_dl.extractor.traileraddict'
+    IE_NAME = 'TrailerAddict'
+    _WORKING = False
+    _URL_LITERALS = ('traileraddict.com/',)
+
+
+class TriluliluIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|m)\\.)?trilulilu\\.ro/(?:[^/]+/)?(?P<id>[^/#\\?]+)'
+    _module = 'youtube_dl.extractor.trilulilu'
+    IE_NAME = 'Trilulilu'
+    _URL_LITERALS = ('trilulilu.ro/',)
+
+
+class TruNewsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?trunews\\.com/stream/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.trunews'
+    IE_NAME = 'TruNews'
+    _URL_LITERALS = ('trunews.com/stream/',)
+
+
+class TruTVIE(TurnerBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?trutv\\.com/(?:shows|full-episodes)/(?P<series_slug>[0-9A-Za-z-]+)/(?:videos/(?P<clip_slug>[0-9A-Za-z-]+)|(?P<id>\\d+))'
+    _module = 'youtube_dl.extractor.trutv'
+    IE_NAME = 'TruTV'
+    _URL_LITERALS = ('trutv.com/',)
+
+
+class Tube8IE(KeezMoviesIE):
+    _VALID_URL = 'https?://(?:www\\.)?tube8\\.com/(?:[^/]+/)+(?P<display_id>[^/]+)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tube8'
+    IE_NAME = 'Tube8'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('tube8.com/',)
+
+
+class TubiTvIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tubitv\\.com/(?:video|movies|tv-shows)/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.tubitv'
+    IE_NAME = 'TubiTv'
+    _URL_LITERALS = ('tubitv.com/',)
+
+
+class TumblrIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?P<blog_name>[^/?#&]+)\\.tumblr\\.com/(?:post|video)/(?P<id>[0-9]+)(?:$|[/?#])'
+    _module = 'youtube_dl.extractor.tumblr'
+    IE_NAME = 'Tumblr'
+    _URL_LITERALS = ('.tumblr.com/',)
+
+
+class TuneInBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.tunein'
+    IE_NAME = 'TuneInBase'
+    _URL_LITERALS = None
+
+
+class TuneInClipIE(TuneInBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?tunein\\.com/station/.*?audioClipId\\=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tunein'
+    IE_NAME = 'tunein:clip'
+    _URL_LITERALS = ('tunein.com/station/',)
+
+
+class TuneInStationIE(TuneInBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?tunein\\.com/(?:radio/.*?-s|station/.*?StationId=|embed/player/s)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tunein'
+    IE_NAME = 'tunein:station'
+    _URL_LITERALS = ('tunein.com/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if TuneInClipIE.suitable(url) else super(TuneInStationIE, cls).suitable(url)
+
+
+class TuneInProgramIE(TuneInBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?tunein\\.com/(?:radio/.*?-p|program/.*?ProgramId=|embed/player/p)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tunein'
+    IE_NAME = 'tunein:program'
+    _URL_LITERALS = ('tunein.com/',)
+
+
+class TuneInTopicIE(TuneInBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?tunein\\.com/(?:topic/.*?TopicId=|embed/player/t)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tunein'
+    IE_NAME = 'tunein:topic'
+    _URL_LITERALS = ('tunein.com/',)
+
+
+class TuneInShortenerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://tun\\.in/(?P<id>[A-Za-z0-9]+)'
+    _module = 'youtube_dl.extractor.tunein'
+    IE_NAME = 'tunein:shortener'
+    IE_DESC = False
+    _URL_LITERALS = ('://tun.in/',)
+
+
+class TunePkIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:www\\.)?tune\\.pk/(?:video/|player/embed_player.php?.*?\\bvid=)|\n                            embed\\.tune\\.pk/play/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.tunepk'
+    IE_NAME = 'TunePk'
+    _URL_LITERALS = ('embed.tune.pk/play/', 'tune.pk/')
+
+
+class TurboIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?turbo\\.fr/videos-voiture/(?P<id>[0-9]+)-'
+    _module = 'youtube_dl.extractor.turbo'
+    IE_NAME = 'Turbo'
+    _URL_LITERALS = ('turbo.fr/videos-voiture/',)
+
+
+class TV2IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tv2\\.no/v/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tv2'
+    IE_NAME = 'TV2'
+    _URL_LITERALS = ('tv2.no/v/',)
+
+
+class TV2ArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tv2\\.no/(?:a|\\d{4}/\\d{2}/\\d{2}(/[^/]+)+)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tv2'
+    IE_NAME = 'TV2Article'
+    _URL_LITERALS = ('tv2.no/',)
+
+
+class TV2DKIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?\n                        (?:\n                            tvsyd|\n                            tv2ostjylland|\n                            tvmidtvest|\n                            tv2fyn|\n                            tv2east|\n                            tv2lorry|\n                            tv2nord\n                        )\\.dk/\n                        (:[^/]+/)*\n                        (?P<id>[^/?\\#&]+)\n                    '
+    _module = 'youtube_dl.extractor.tv2dk'
+    IE_NAME = 'TV2DK'
+    _URL_LITERALS = ('.dk/',)
+
+
+class TV2HuIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tv2\\.hu/(?:[^/]+/)+(?P<id>\\d+)_[^/?#]+?\\.html'
+    _module = 'youtube_dl.extractor.tv2hu'
+    IE_NAME = 'tv2.hu'
+    _URL_LITERALS = ('tv2.hu/',)
+
+
+class TV4IE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://(?:www\\.)?\n        (?:\n            tv4\\.se/(?:[^/]+)/klipp/(?:.*)-|\n            tv4play\\.se/\n            (?:\n                (?:program|barn)/(?:[^/]+/|(?:[^\\?]+)\\?video_id=)|\n                iframe/video/|\n                film/|\n                sport/|\n            )\n        )(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.tv4'
+    IE_NAME = 'TV4'
+    IE_DESC = 'tv4.se and tv4play.se'
+    _URL_LITERALS = ('.se/', 'play.se/')
+
+
+class TV5MondePlusIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tv5mondeplus\\.com/toutes-les-videos/[^/]+/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.tv5mondeplus'
+    IE_NAME = 'TV5MondePlus'
+    IE_DESC = 'TV5MONDE+'
+    _URL_LITERALS = ('tv5mondeplus.com/toutes-les-videos/',)
+
+
+class TVAIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://videos\\.tva\\.ca/details/_(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tva'
+    IE_NAME = 'TVA'
+    _URL_LITERALS = ('://videos.tva.ca/details/_',)
+
+
+class TVANouvellesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tvanouvelles\\.ca/videos/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tvanouvelles'
+    IE_NAME = 'TVANouvelles'
+    _URL_LITERALS = ('tvanouvelles.ca/videos/',)
+
+
+class TVANouvellesArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tvanouvelles\\.ca/(?:[^/]+/)+(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.tvanouvelles'
+    IE_NAME = 'TVANouvellesArticle'
+    _URL_LITERALS = ('tvanouvelles.ca/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if TVANouvellesIE.suitable(url) else super(TVANouvellesArticleIE, cls).suitable(url)
+
+
+class TVCIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tvc\\.ru/video/iframe/id/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tvc'
+    IE_NAME = 'TVC'
+    _URL_LITERALS = ('tvc.ru/video/iframe/id/',)
+
+
+class TVCArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tvc\\.ru/(?!video/iframe/id/)(?P<id>[^?#]+)'
+    _module = 'youtube_dl.extractor.tvc'
+    IE_NAME = 'TVCArticle'
+    _URL_LITERALS = ('tvc.ru/',)
+
+
+class TvigleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:tvigle\\.ru/(?:[^/]+/)+(?P<display_id>[^/]+)/$|cloud\\.tvigle\\.ru/video/(?P<id>\\d+))'
+    _module = 'youtube_dl.extractor.tvigle'
+    IE_NAME = 'tvigle'
+    IE_DESC = 'Интернет-телевидение Tvigle.ru'
+    _URL_LITERALS = ('cloud.tvigle.ru/video/', 'tvigle.ru/')
+
+
+class TVLandIE(ParamountNetworkIE):
+    _VALID_URL = 'https?://(?:www\\.)?tvland\\.com/(?:video-clips|(?:full-)?episodes)/(?P<id>[^/?#.]+)'
+    _module = 'youtube_dl.extractor.tvland'
+    IE_NAME = 'tvland.com'
+    _URL_LITERALS = ('tvland.com/',)
+
+
+class TVN24IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:[^/]+)\\.)?tvn24(?:bis)?\\.pl/(?:[^/]+/)*(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.tvn24'
+    IE_NAME = 'TVN24'
+    _URL_LITERALS = ('.pl/',)
+
+
+class TVNetIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+)\\.tvnet\\.gov\\.vn/[^/]+/(?:\\d+/)?(?P<id>\\d+)(?:/|$)'
+    _module = 'youtube_dl.extractor.tvnet'
+    IE_NAME = 'TVNet'
+    _URL_LITERALS = ('.tvnet.gov.vn/',)
+
+
+class TVNoeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tvnoe\\.cz/video/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.tvnoe'
+    IE_NAME = 'TVNoe'
+    _URL_LITERALS = ('tvnoe.cz/video/',)
+
+
+class TVNowBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.tvnow'
+    IE_NAME = 'TVNowBase'
+    _URL_LITERALS = None
+
+
+class TVNowIE(TVNowBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?tvnow\\.(?:de|at|ch)/(?P<station>[^/]+)/\n                        (?P<show_id>[^/]+)/\n                        (?!(?:list|jahr)(?:/|$))(?P<id>[^/?\\#&]+)\n                    '
+    _module = 'youtube_dl.extractor.tvnow'
+    IE_NAME = 'TVNow'
+    _URL_LITERALS = ('tvnow.',)
+
+    @classmethod
+    def suitable(cls, url):
+        return (False if TVNowNewIE.suitable(url) or TVNowSeasonIE.suitable(url) or TVNowAnnualIE.suitable(url) or TVNowShowIE.suitable(url)
+                else super(TVNowIE, cls).suitable(url))
+
+
+class TVNowNewIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    (?P<base_url>https?://\n                        (?:www\\.)?tvnow\\.(?:de|at|ch)/\n                        (?:shows|serien))/\n                        (?P<show>[^/]+)-\\d+/\n                        [^/]+/\n                        episode-\\d+-(?P<episode>[^/?$&]+)-(?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.tvnow'
+    IE_NAME = 'TVNowNew'
+    _URL_LITERALS = ('tvnow.',)
+
+
+class TVNowNewBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.tvnow'
+    IE_NAME = 'TVNowNewBase'
+    _URL_LITERALS = None
+
+
+class TVNowListBaseIE(TVNowNewBaseIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.tvnow'
+    IE_NAME = 'TVNowListBase'
+    _URL_LITERALS = None
+
+    @classmethod
+    def suitable(cls, url):
+        return (False if TVNowNewIE.suitable(url)
+                else super(TVNowListBaseIE, cls).suitable(url))
+
+
+class TVNowSeasonIE(TVNowListBaseIE):
+    _VALID_URL = '(?x)\n                    (?P<base_url>\n                        https?://\n                            (?:www\\.)?tvnow\\.(?:de|at|ch)/(?:shows|serien)/\n                            [^/?#&]+-(?P<show_id>\\d+)\n                    )\n                    /staffel-(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tvnow'
+    IE_NAME = 'TVNowSeason'
+    _URL_LITERALS = ('tvnow.',)
+
+    @classmethod
+    def suitable(cls, url):
+        return (False if TVNowNewIE.suitable(url)
+                else super(TVNowListBaseIE, cls).suitable(url))
+
+
+class TVNowAnnualIE(TVNowListBaseIE):
+    _VALID_URL = '(?x)\n                    (?P<base_url>\n                        https?://\n                            (?:www\\.)?tvnow\\.(?:de|at|ch)/(?:shows|serien)/\n                            [^/?#&]+-(?P<show_id>\\d+)\n                    )\n                    /(?P<year>\\d{4})-(?P<month>\\d{2})'
+    _module = 'youtube_dl.extractor.tvnow'
+    IE_NAME = 'TVNowAnnual'
+    _URL_LITERALS = ('tvnow.',)
+
+    @classmethod
+    def suitable(cls, url):
+        return (False if TVNowNewIE.suitable(url)
+                else super(TVNowListBaseIE, cls).suitable(url))
+
+
+class TVNowShowIE(TVNowListBaseIE):
+    _VALID_URL = '(?x)\n                    (?P<base_url>\n                        https?://\n                            (?:www\\.)?tvnow\\.(?:de|at|ch)/(?:shows|serien)/\n                            [^/?#&]+-(?P<show_id>\\d+)\n                    )\n                    '
+    _module = 'youtube_dl.extractor.tvnow'
+    IE_NAME = 'TVNowShow'
+    _URL_LITERALS = ('tvnow.',)
+
+    @classmethod
+    def suitable(cls, url):
+        return (False if TVNowNewIE.suitable(url) or TVNowSeasonIE.suitable(url) or TVNowAnnualIE.suitable(url)
+                else super(TVNowShowIE, cls).suitable(url))
+
+
+class TVPEmbedIE(LazyLoadExtractor):
+    _VALID_URL = '(?:tvp:|https?://[^/]+\\.tvp\\.(?:pl|info)/sess/tvplayer\\.php\\?.*?object_id=)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tvp'
+    IE_NAME = 'tvp:embed'
+    IE_DESC = 'Telewizja Polska'
+    _URL_LITERALS = ('/sess/tvplayer.php?', 'tvp:')
+
+
+class TVPIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://[^/]+\\.tvp\\.(?:pl|info)/(?:video/(?:[^,\\s]*,)*|(?:(?!\\d+/)[^/]+/)*)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tvp'
+    IE_NAME = 'tvp'
+    IE_DESC = 'Telewizja Polska'
+    _URL_LITERALS = ('.tvp.',)
+
+
+class TVPWebsiteIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://vod\\.tvp\\.pl/website/(?P<display_id>[^,]+),(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tvp'
+    IE_NAME = 'tvp:series'
+    _URL_LITERALS = ('://vod.tvp.pl/website/',)
+
+
+class TVPlayIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    (?:\n                        mtg:|\n                        https?://\n                            (?:www\\.)?\n                            (?:\n                                tvplay(?:\\.skaties)?\\.lv(?:/parraides)?|\n                                (?:tv3play|play\\.tv3)\\.lt(?:/programos)?|\n                                tv3play(?:\\.tv3)?\\.ee/sisu|\n                                (?:tv(?:3|6|8|10)play|viafree)\\.se/program|\n                                (?:(?:tv3play|viasat4play|tv6play|viafree)\\.no|(?:tv3play|viafree)\\.dk)/programmer|\n                                play\\.nova(?:tv)?\\.bg/programi\n                            )\n                            /(?:[^/]+/)+\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.tvplay'
+    IE_NAME = 'mtg'
+    IE_DESC = 'MTG services'
+    _URL_LITERALS = ('.bg/programi', '.ee/sisu', '.se/program', '/programmer', 'mtg:', 'play.tv3', 'tv3play', 'tvplay')
+
+
+class ViafreeIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?\n                        viafree\\.\n                        (?:\n                            (?:dk|no)/programmer|\n                            se/program\n                        )\n                        /(?:[^/]+/)+(?P<id>[^/?#&]+)\n                    '
+    _module = 'youtube_dl.extractor.tvplay'
+    IE_NAME = 'Viafree'
+    _URL_LITERALS = ('viafree.',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if TVPlayIE.suitable(url) else super(ViafreeIE, cls).suitable(url)
+
+
+class TVPlayHomeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://tvplay\\.(?:tv3\\.lt|skaties\\.lv|tv3\\.ee)/[^/]+/[^/?#&]+-(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tvplay'
+    IE_NAME = 'TVPlayHome'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('://tvplay.',)
+
+
+class TVPlayerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tvplayer\\.com/watch/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.tvplayer'
+    IE_NAME = 'TVPlayer'
+    _URL_LITERALS = ('tvplayer.com/watch/',)
+
+
+class TweakersIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://tweakers\\.net/video/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.tweakers'
+    IE_NAME = 'Tweakers'
+    _URL_LITERALS = ('://tweakers.net/video/',)
+
+
+class TwentyFourVideoIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?P<host>\n                            (?:(?:www|porno)\\.)?24video\\.\n                            (?:net|me|xxx|sexy?|tube|adult|site)\n                        )/\n                        (?:\n                            video/(?:(?:view|xml)/)?|\n                            player/new24_play\\.swf\\?id=\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.twentyfourvideo'
+    IE_NAME = '24video'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('24video.',)
+
+
+class TwentyMinutenIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?20min\\.ch/\n                        (?:\n                            videotv/*\\?.*?\\bvid=|\n                            videoplayer/videoplayer\\.html\\?.*?\\bvideoId@\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.twentymin'
+    IE_NAME = '20min'
+    _URL_LITERALS = ('20min.ch/video',)
+
+
+class TwentyThreeVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.(?P<domain>twentythree\\.net|23video\\.com|filmweb\\.no)/v\\.ihtml/player\\.html\\?(?P<query>.*?\\bphoto(?:_|%5f)id=(?P<id>\\d+).*)'
+    _module = 'youtube_dl.extractor.twentythreevideo'
+    IE_NAME = '23video'
+    _URL_LITERALS = ('/v.ihtml/player.html?',)
+
+
+class TwitCastingIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?twitcasting\\.tv/(?P<uploader_id>[^/]+)/movie/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.twitcasting'
+    IE_NAME = 'TwitCasting'
+    _URL_LITERALS = ('twitcasting.tv/',)
+
+
+class TwitchBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.twitch'
+    IE_NAME = 'TwitchBase'
+    _URL_LITERALS = None
+
+
+class TwitchItemBaseIE(TwitchBaseIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.twitch'
+    IE_NAME = 'TwitchItemBase'
+    _URL_LITERALS = None
+
+
+class TwitchVideoIE(TwitchItemBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|go|m)\\.)?twitch\\.tv/[^/]+/b/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.twitch'
+    IE_NAME = 'twitch:video'
+    _URL_LITERALS = ('twitch.tv/',)
+
+
+class TwitchChapterIE(TwitchItemBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|go|m)\\.)?twitch\\.tv/[^/]+/c/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.twitch'
+    IE_NAME = 'twitch:chapter'
+    _URL_LITERALS = ('twitch.tv/',)
+
+
+class TwitchVodIE(TwitchItemBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:(?:www|go|m)\\.)?twitch\\.tv/(?:[^/]+/v(?:ideo)?|videos)/|\n                            player\\.twitch\\.tv/\\?.*?\\bvideo=v?\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.twitch'
+    IE_NAME = 'twitch:vod'
+    _URL_LITERALS = ('player.twitch.tv/?', 'twitch.tv/')
+
+
+class TwitchPlaylistBaseIE(TwitchBaseIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.twitch'
+    IE_NAME = 'TwitchPlaylistBase'
+    _URL_LITERALS = None
+
+
+class TwitchProfileIE(TwitchPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|go|m)\\.)?twitch\\.tv/(?P<id>[^/]+)/profile/?(?:\\#.*)?$'
+    _module = 'youtube_dl.extractor.twitch'
+    IE_NAME = 'twitch:profile'
+    _URL_LITERALS = ('twitch.tv/',)
+
+
+class TwitchVideosBaseIE(TwitchPlaylistBaseIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.twitch'
+    IE_NAME = 'TwitchVideosBase'
+    _URL_LITERALS = None
+
+
+class TwitchAllVideosIE(TwitchVideosBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|go|m)\\.)?twitch\\.tv/(?P<id>[^/]+)/videos/all'
+    _module = 'youtube_dl.extractor.twitch'
+    IE_NAME = 'twitch:videos:all'
+    _URL_LITERALS = ('twitch.tv/',)
+
+
+class TwitchUploadsIE(TwitchVideosBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|go|m)\\.)?twitch\\.tv/(?P<id>[^/]+)/videos/uploads'
+    _module = 'youtube_dl.extractor.twitch'
+    IE_NAME = 'twitch:videos:uploads'
+    _URL_LITERALS = ('twitch.tv/',)
+
+
+class TwitchPastBroadcastsIE(TwitchVideosBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|go|m)\\.)?twitch\\.tv/(?P<id>[^/]+)/videos/past-broadcasts'
+    _module = 'youtube_dl.extractor.twitch'
+    IE_NAME = 'twitch:videos:past-broadcasts'
+    _URL_LITERALS = ('twitch.tv/',)
+
+
+class TwitchHighlightsIE(TwitchVideosBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|go|m)\\.)?twitch\\.tv/(?P<id>[^/]+)/videos/highlights'
+    _module = 'youtube_dl.extractor.twitch'
+    IE_NAME = 'twitch:videos:highlights'
+    _URL_LITERALS = ('twitch.tv/',)
+
+
+class TwitchStreamIE(TwitchBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:(?:www|go|m)\\.)?twitch\\.tv/|\n                            player\\.twitch\\.tv/\\?.*?\\bchannel=\n                        )\n                        (?P<id>[^/#?]+)\n                    '
+    _module = 'youtube_dl.extractor.twitch'
+    IE_NAME = 'twitch:stream'
+    _URL_LITERALS = ('player.twitch.tv/?', 'twitch.tv/')
+
+    @classmethod
+    def suitable(cls, url):
+        return (False
+                if any(ie.suitable(url) for ie in (
+                    TwitchVideoIE,
+                    TwitchChapterIE,
+                    TwitchVodIE,
+                    TwitchProfileIE,
+                    TwitchAllVideosIE,
+                    TwitchUploadsIE,
+                    TwitchPastBroadcastsIE,
+                    TwitchHighlightsIE,
+                    TwitchClipsIE))
+                else super(TwitchStreamIE, cls).suitable(url))
+
+
+class TwitchClipsIE(TwitchBaseIE):
+    _VALID_URL = 'https?://(?:clips\\.twitch\\.tv/(?:embed\\?.*?\\bclip=|(?:[^/]+/)*)|(?:www\\.)?twitch\\.tv/[^/]+/clip/)(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.twitch'
+    IE_NAME = 'twitch:clips'
+    _URL_LITERALS = ('clips.twitch.tv/', 'twitch.tv/')
+
+
+class TwitterCardIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|m(?:obile)?)\\.)?twitter\\.com/i/(?:cards/tfw/v1|videos(?:/tweet)?)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.twitter'
+    IE_NAME = 'twitter:card'
+    _URL_LITERALS = ('twitter.com/i/',)
+
+
+class TwitterBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.twitter'
+    IE_NAME = 'TwitterBase'
+    _URL_LITERALS = None
+
+
+class TwitterIE(TwitterBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|m(?:obile)?)\\.)?twitter\\.com/(?:(?:i/web|[^/]+)/status|statuses)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.twitter'
+    IE_NAME = 'twitter'
+    _URL_LITERALS = ('twitter.com/',)
+
+
+class TwitterAmplifyIE(TwitterBaseIE):
+    _VALID_URL = 'https?://amp\\.twimg\\.com/v/(?P<id>[0-9a-f\\-]{36})'
+    _module = 'youtube_dl.extractor.twitter'
+    IE_NAME = 'twitter:amplify'
+    _URL_LITERALS = ('://amp.twimg.com/v/',)
+
+
+class TwitterBroadcastIE(TwitterBaseIE, PeriscopeBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|m(?:obile)?)\\.)?twitter\\.com/i/broadcasts/(?P<id>[0-9a-zA-Z]{13})'
+    _module = 'youtube_dl.extractor.twitter'
+    IE_NAME = 'twitter:broadcast'
+    _URL_LITERALS = ('twitter.com/i/broadcasts/',)
+
+
+class UdemyIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:[^/]+\\.)?udemy\\.com/\n                        (?:\n                            [^#]+\\#/lecture/|\n                            lecture/view/?\\?lectureId=|\n                            [^/]+/learn/v4/t/lecture/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.udemy'
+    IE_NAME = 'udemy'
+    _URL_LITERALS = ('udemy.com/',)
+
+
+class UdemyCourseIE(UdemyIE):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?udemy\\.com/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.udemy'
+    IE_NAME = 'udemy:course'
+    _URL_LITERALS = ('udemy.com/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if UdemyIE.suitable(url) else super(UdemyCourseIE, cls).suitable(url)
+
+
+class UDNEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.udn\\.com/(?:embed|play)/news/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.udn'
+    IE_NAME = 'UDNEmbed'
+    IE_DESC = '聯合影音'
+    _URL_LITERALS = ('://video.udn.com/',)
+
+
+class UFCTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ufc\\.tv/video/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.ufctv'
+    IE_NAME = 'UFCTV'
+    _URL_LITERALS = ('ufc.tv/video/',)
+
+
+class UKTVPlayIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://uktvplay\\.uktv\\.co\\.uk/.+?\\?.*?\\bvideo=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.uktvplay'
+    IE_NAME = 'UKTVPlay'
+    _URL_LITERALS = ('://uktvplay.uktv.co.uk/',)
+
+
+class DigitekaIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        https?://(?:www\\.)?(?:digiteka\\.net|ultimedia\\.com)/\n        (?:\n            deliver/\n            (?P<embed_type>\n                generic|\n                musique\n            )\n            (?:/[^/]+)*/\n            (?:\n                src|\n                article\n            )|\n            default/index/video\n            (?P<site_type>\n                generic|\n                music\n            )\n            /id\n        )/(?P<id>[\\d+a-z]+)'
+    _module = 'youtube_dl.extractor.digiteka'
+    IE_NAME = 'Digiteka'
+    _URL_LITERALS = ('digiteka.net', 'ultimedia.com')
+
+
+class DLiveVODIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dlive\\.tv/p/(?P<uploader_id>.+?)\\+(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.dlive'
+    IE_NAME = 'dlive:vod'
+    _URL_LITERALS = ('dlive.tv/p/',)
+
+
+class DLiveStreamIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dlive\\.tv/(?!p/)(?P<id>[\\w.-]+)'
+    _module = 'youtube_dl.extractor.dlive'
+    IE_NAME = 'dlive:stream'
+    _URL_LITERALS = ('dlive.tv/',)
+
+
+class UMGDeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?universal-music\\.de/[^/]+/videos/[^/?#]+-(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.umg'
+    IE_NAME = 'umg:de'
+    IE_DESC = 'Universal Music Deutschland'
+    _URL_LITERALS = ('universal-music.de/',)
+
+
+class UnistraIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://utv\\.unistra\\.fr/(?:index|video)\\.php\\?id_video\\=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.unistra'
+    IE_NAME = 'Unistra'
+    _URL_LITERALS = ('://utv.unistra.fr/',)
+
+
+class UnityIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?unity3d\\.com/learn/tutorials/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.unity'
+    IE_NAME = 'Unity'
+    _URL_LITERALS = ('unity3d.com/learn/tutorials/',)
+
+
+class UOLIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?uol\\.com\\.br/.*?(?:(?:mediaId|v)=|view/(?:[a-z0-9]+/)?|video(?:=|/(?:\\d{4}/\\d{2}/\\d{2}/)?))(?P<id>\\d+|[\\w-]+-[A-Z0-9]+)'
+    _module = 'youtube_dl.extractor.uol'
+    IE_NAME = 'uol.com.br'
+    _URL_LITERALS = ('uol.com.br/',)
+
+
+class UplynkIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://.*?\\.uplynk\\.com/(?P<path>ext/[0-9a-f]{32}/(?P<external_id>[^/?&]+)|(?P<id>[0-9a-f]{32}))\\.(?:m3u8|json)(?:.*?\\bpbs=(?P<session_id>[^&]+))?'
+    _module = 'youtube_dl.extractor.uplynk'
+    IE_NAME = 'uplynk'
+    _URL_LITERALS = ('.uplynk.com/',)
+
+
+class UplynkPreplayIE(UplynkIE):
+    _VALID_URL = 'https?://.*?\\.uplynk\\.com/preplay2?/(?P<path>ext/[0-9a-f]{32}/(?P<external_id>[^/?&]+)|(?P<id>[0-9a-f]{32}))\\.json'
+    _module = 'youtube_dl.extractor.uplynk'
+    IE_NAME = 'uplynk:preplay'
+    _URL_LITERALS = ('.uplynk.com/preplay',)
+
+
+class UrortIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?urort\\.p3\\.no/#!/Band/(?P<id>[^/]+)$'
+    _module = 'youtube_dl.extractor.urort'
+    IE_NAME = 'Urort'
+    IE_DESC = 'NRK P3 Urørt'
+    _URL_LITERALS = ('urort.p3.no/#!/band/',)
+
+
+class URPlayIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ur(?:play|skola)\\.se/(?:program|Produkter)/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.urplay'
+    IE_NAME = 'URPlay'
+    _URL_LITERALS = ('.se/',)
+
+
+class USANetworkIE(AdobePassIE):
+    _VALID_URL = 'https?://(?:www\\.)?usanetwork\\.com/(?:[^/]+/videos|movies)/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.usanetwork'
+    IE_NAME = 'USANetwork'
+    _URL_LITERALS = ('usanetwork.com/',)
+
+
+class USATodayIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?usatoday\\.com/(?:[^/]+/)*(?P<id>[^?/#]+)'
+    _module = 'youtube_dl.extractor.usatoday'
+    IE_NAME = 'USAToday'
+    _URL_LITERALS = ('usatoday.com/',)
+
+
+class UstreamIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ustream\\.tv/(?P<type>recorded|embed|embed/recorded)/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.ustream'
+    IE_NAME = 'ustream'
+    _URL_LITERALS = ('ustream.tv/',)
+
+
+class UstreamChannelIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ustream\\.tv/channel/(?P<slug>.+)'
+    _module = 'youtube_dl.extractor.ustream'
+    IE_NAME = 'ustream:channel'
+    _URL_LITERALS = ('ustream.tv/channel/',)
+
+
+class UstudioIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|v1)\\.)?ustudio\\.com/video/(?P<id>[^/]+)/(?P<display_id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.ustudio'
+    IE_NAME = 'ustudio'
+    _URL_LITERALS = ('ustudio.com/video/',)
+
+
+class UstudioEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:app|embed)\\.)?ustudio\\.com/embed/(?P<uid>[^/]+)/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.ustudio'
+    IE_NAME = 'ustudio:embed'
+    _URL_LITERALS = ('ustudio.com/embed/',)
+
+
+class Varzesh3IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?video\\.varzesh3\\.com/(?:[^/]+/)+(?P<id>[^/]+)/?'
+    _module = 'youtube_dl.extractor.varzesh3'
+    IE_NAME = 'Varzesh3'
+    _URL_LITERALS = ('video.varzesh3.com/',)
+
+
+class Vbox7IE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:[^/]+\\.)?vbox7\\.com/\n                        (?:\n                            play:|\n                            (?:\n                                emb/external\\.php|\n                                player/ext\\.swf\n                            )\\?.*?\\bvid=\n                        )\n                        (?P<id>[\\da-fA-F]+)\n                    '
+    _module = 'youtube_dl.extractor.vbox7'
+    IE_NAME = 'Vbox7'
+    _URL_LITERALS = ('vbox7.com/',)
+
+
+class VeeHDIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://veehd\\.com/video/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.veehd'
+    IE_NAME = 'VeeHD'
+    _URL_LITERALS = ('://veehd.com/video/',)
+
+
+class VeohIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?veoh\\.com/(?:watch|embed|iphone/#_Watch)/(?P<id>(?:v|e|yapi-)[\\da-zA-Z]+)'
+    _module = 'youtube_dl.extractor.veoh'
+    IE_NAME = 'Veoh'
+    _URL_LITERALS = ('veoh.com/',)
+
+
+class VestiIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?vesti\\.ru/(?P<id>.+)'
+    _module = 'youtube_dl.extractor.vesti'
+    IE_NAME = 'Vesti'
+    IE_DESC = 'Вести.Ru'
+    _URL_LITERALS = ('vesti.ru/',)
+
+
+class VevoBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.vevo'
+    IE_NAME = 'VevoBase'
+    _URL_LITERALS = None
+
+
+class VevoIE(VevoBaseIE):
+    _VALID_URL = '(?x)\n        (?:https?://(?:www\\.)?vevo\\.com/watch/(?!playlist|genre)(?:[^/]+/(?:[^/]+/)?)?|\n           https?://cache\\.vevo\\.com/m/html/embed\\.html\\?video=|\n           https?://videoplayer\\.vevo\\.com/embed/embedded\\?videoId=|\n           https?://embed\\.vevo\\.com/.*?[?&]isrc=|\n           vevo:)\n        (?P<id>[^&?#]+)'
+    _module = 'youtube_dl.extractor.vevo'
+    IE_NAME = 'Vevo'
+    _URL_LITERALS = ('://cache.vevo.com/m/html/embed.html?video=', '://embed.vevo.com/', '://videoplayer.vevo.com/embed/embedded?videoid=', 'vevo.com/watch/', 'vevo:')
+
+
+class VevoPlaylistIE(VevoBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?vevo\\.com/watch/(?P<kind>playlist|genre)/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.vevo'
+    IE_NAME = 'VevoPlaylist'
+    _URL_LITERALS = ('vevo.com/watch/',)
+
+
+class BTArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bt\\.no/(?:[^/]+/)+(?P<id>[^/]+)-\\d+\\.html'
+    _module = 'youtube_dl.extractor.vgtv'
+    IE_NAME = 'bt:article'
+    IE_DESC = 'Bergens Tidende Articles'
+    _URL_LITERALS = ('bt.no/',)
+
+
+class BTVestlendingenIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bt\\.no/spesial/vestlendingen/#!/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.vgtv'
+    IE_NAME = 'bt:vestlendingen'
+    IE_DESC = 'Bergens Tidende - Vestlendingen'
+    _URL_LITERALS = ('bt.no/spesial/vestlendingen/#!/',)
+
+
+class VH1IE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vh1\\.com/(?:video-clips|episodes)/(?P<id>[^/?#.]+)'
+    _module = 'youtube_dl.extractor.vh1'
+    IE_NAME = 'vh1.com'
+    _URL_LITERALS = ('vh1.com/',)
+
+
+class ViceIE(AdobePassIE):
+    _VALID_URL = 'https?://(?:(?:video|vms)\\.vice|(?:www\\.)?viceland)\\.com/(?P<locale>[^/]+)/(?:video/[^/]+|embed)/(?P<id>[\\da-f]+)'
+    _module = 'youtube_dl.extractor.vice'
+    IE_NAME = 'vice'
+    _URL_LITERALS = ('.com/',)
+
+
+class ViceArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https://www\\.vice\\.com/[^/]+/article/(?P<id>[^?#]+)'
+    _module = 'youtube_dl.extractor.vice'
+    IE_NAME = 'vice:article'
+    _URL_LITERALS = ('https://www.vice.com/',)
+
+
+class ViceShowIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?vice\\.com/(?:[^/]+/)?show/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.vice'
+    IE_NAME = 'vice:show'
+    _URL_LITERALS = ('vice.com/',)
+
+
+class VidbitIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vidbit\\.co/(?:watch|embed)\\?.*?\\bv=(?P<id>[\\da-zA-Z]+)'
+    _module = 'youtube_dl.extractor.vidbit'
+    IE_NAME = 'Vidbit'
+    _URL_LITERALS = ('vidbit.co/',)
+
+
+class ViddlerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?viddler\\.com/(?:v|embed|player)/(?P<id>[a-z0-9]+)(?:.+?\\bsecret=(\\d+))?'
+    _module = 'youtube_dl.extractor.viddler'
+    IE_NAME = 'Viddler'
+    _URL_LITERALS = ('viddler.com/',)
+
+
+class VideaIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        videa(?:kid)?\\.hu/\n                        (?:\n                            videok/(?:[^/]+/)*[^?#&]+-|\n                            player\\?.*?\\bv=|\n                            player/v/\n                        )\n                        (?P<id>[^?#&]+)\n                    '
+    _module = 'youtube_dl.extractor.videa'
+    IE_NAME = 'Videa'
+    _URL_LITERALS = ('.hu/',)
+
+
+class VideoDetectiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?videodetective\\.com/[^/]+/[^/]+/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.videodetective'
+    IE_NAME = 'VideoDetective'
+    _URL_LITERALS = ('videodetective.com/',)
+
+
+class VideofyMeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.videofy\\.me/.+?|p\\.videofy\\.me/v)/(?P<id>\\d+)(&|#|$)'
+    _module = 'youtube_dl.extractor.videofyme'
+    IE_NAME = 'videofy.me'
+    _URL_LITERALS = ('p.videofy.me/v', 'www.videofy.me/')
+
+
+class VideomoreIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    videomore:(?P<sid>\\d+)$|\n                    https?://(?:player\\.)?videomore\\.ru/\n                        (?:\n                            (?:\n                                embed|\n                                [^/]+/[^/]+\n                            )/|\n                            [^/]*\\?.*?\\btrack_id=\n                        )\n                        (?P<id>\\d+)\n                        (?:[/?#&]|\\.(?:xml|json)|$)\n                    '
+    _module = 'youtube_dl.extractor.videomore'
+    IE_NAME = 'videomore'
+    _AGE_LIMIT = 16
+    _URL_LITERALS = ('videomore.ru/', 'videomore:')
+
+
+class VideomoreVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://videomore\\.ru/(?:(?:[^/]+/){2})?(?P<id>[^/?#&]+)(?:/*|[?#&].*?)$'
+    _module = 'youtube_dl.extractor.videomore'
+    IE_NAME = 'videomore:video'
+    _AGE_LIMIT = 6
+    _URL_LITERALS = ('://videomore.ru/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if VideomoreIE.suitable(url) else super(VideomoreVideoIE, cls).suitable(url)
+
+
+class VideomoreSeasonIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://videomore\\.ru/(?!embed)(?P<id>[^/]+/[^/?#&]+)(?:/*|[?#&].*?)$'
+    _module = 'youtube_dl.extractor.videomore'
+    IE_NAME = 'videomore:season'
+    _URL_LITERALS = ('://videomore.ru/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return (False if (VideomoreIE.suitable(url) or VideomoreVideoIE.suitable(url))
+                else super(VideomoreSeasonIE, cls).suitable(url))
+
+
+class VideoPremiumIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?videopremium\\.(?:tv|me)/(?P<id>\\w+)(?:/.*)?'
+    _module = 'youtube_dl.extractor.videopremium'
+    IE_NAME = 'VideoPremium'
+    _URL_LITERALS = ('videopremium.',)
+
+
+class VideoPressIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://videopress\\.com/embed/(?P<id>[\\da-zA-Z]+)'
+    _module = 'youtube_dl.extractor.videopress'
+    IE_NAME = 'VideoPress'
+    _URL_LITERALS = ('://videopress.com/embed/',)
+
+
+class VidioIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vidio\\.com/watch/(?P<id>\\d+)-(?P<display_id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.vidio'
+    IE_NAME = 'Vidio'
+    _URL_LITERALS = ('vidio.com/watch/',)
+
+
+class VidLiiIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vidlii\\.com/(?:watch|embed)\\?.*?\\bv=(?P<id>[0-9A-Za-z_-]{11})'
+    _module = 'youtube_dl.extractor.vidlii'
+    IE_NAME = 'VidLii'
+    _URL_LITERALS = ('vidlii.com/',)
+
+
+class VidmeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://vid\\.me/(?:e/)?(?P<id>[\\da-zA-Z]{,5})(?:[^\\da-zA-Z]|$)'
+    _module = 'youtube_dl.extractor.vidme'
+    IE_NAME = 'vidme'
+    _URL_LITERALS = ('://vid.me/',)
+
+
+class VidmeListBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.vidme'
+    IE_NAME = 'VidmeListBase'
+    _URL_LITERALS = None
+
+
+class VidmeUserIE(VidmeListBaseIE):
+    _VALID_URL = 'https?://vid\\.me/(?:e/)?(?P<id>[\\da-zA-Z_-]{6,})(?!/likes)(?:[^\\da-zA-Z_-]|$)'
+    _module = 'youtube_dl.extractor.vidme'
+    IE_NAME = 'vidme:user'
+    _URL_LITERALS = ('://vid.me/',)
+
+
+class VidmeUserLikesIE(VidmeListBaseIE):
+    _VALID_URL = 'https?://vid\\.me/(?:e/)?(?P<id>[\\da-zA-Z_-]{6,})/likes'
+    _module = 'youtube_dl.extractor.vidme'
+    IE_NAME = 'vidme:user:likes'
+    _URL_LITERALS = ('://vid.me/',)
+
+
+class VidziIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vidzi\\.(?:tv|cc|si|nu)/(?:embed-)?(?P<id>[0-9a-zA-Z]+)'
+    _module = 'youtube_dl.extractor.vidzi'
+    IE_NAME = 'Vidzi'
+    _URL_LITERALS = ('vidzi.',)
+
+
+class VierIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?(?P<site>vier|vijf)\\.be/\n                        (?:\n                            (?:\n                                [^/]+/videos|\n                                video(?:/[^/]+)*\n                            )/\n                            (?P<display_id>[^/]+)(?:/(?P<id>\\d+))?|\n                            (?:\n                                video/v3/embed|\n                                embed/video/public\n                            )/(?P<embed_id>\\d+)\n                        )\n                    '
+    _module = 'youtube_dl.extractor.vier'
+    IE_NAME = 'vier'
+    IE_DESC = 'vier.be and vijf.be'
+    _URL_LITERALS = ('.be/',)
+
+
+class VierVideosIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<site>vier|vijf)\\.be/(?P<program>[^/]+)/videos(?:\\?.*\\bpage=(?P<page>\\d+)|$)'
+    _module = 'youtube_dl.extractor.vier'
+    IE_NAME = 'vier:videos'
+    _URL_LITERALS = ('.be/',)
+
+
+class ViewLiftBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.viewlift'
+    IE_NAME = 'ViewLiftBase'
+    _URL_LITERALS = None
+
+
+class ViewLiftIE(ViewLiftBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<domain>(?:(?:main\\.)?snagfilms|snagxtreme|funnyforfree|kiddovid|winnersview|(?:monumental|lax)sportsnetwork|vayafilm)\\.com|hoichoi\\.tv)(?:/(?:films/title|show|(?:news/)?videos?))?/(?P<id>[^?#]+)'
+    _module = 'youtube_dl.extractor.viewlift'
+    IE_NAME = 'ViewLift'
+    _URL_LITERALS = ('.com', 'hoichoi.tv')
+
+    @classmethod
+    def suitable(cls, url):
+        return False if ViewLiftEmbedIE.suitable(url) else super(ViewLiftIE, cls).suitable(url)
+
+
+class ViewLiftEmbedIE(ViewLiftBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|embed)\\.)?(?:(?:(?:main\\.)?snagfilms|snagxtreme|funnyforfree|kiddovid|winnersview|(?:monumental|lax)sportsnetwork|vayafilm)\\.com|hoichoi\\.tv)/embed/player\\?.*\\bfilmId=(?P<id>[\\da-f]{8}-(?:[\\da-f]{4}-){3}[\\da-f]{12})'
+    _module = 'youtube_dl.extractor.viewlift'
+    IE_NAME = 'ViewLiftEmbed'
+    _URL_LITERALS = ('.com', 'hoichoi.tv')
+
+
+class ViideaIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://(?:www\\.)?(?:\n            videolectures\\.net|\n            flexilearn\\.viidea\\.net|\n            presentations\\.ocwconsortium\\.org|\n            video\\.travel-zoom\\.si|\n            video\\.pomp-forum\\.si|\n            tv\\.nil\\.si|\n            video\\.hekovnik.com|\n            video\\.szko\\.si|\n            kpk\\.viidea\\.com|\n            inside\\.viidea\\.net|\n            video\\.kiberpipa\\.org|\n            bvvideo\\.si|\n            kongres\\.viidea\\.net|\n            edemokracija\\.viidea\\.com\n        )(?:/lecture)?/(?P<id>[^/]+)(?:/video/(?P<part>\\d+))?/*(?:[#?].*)?$'
+    _module = 'youtube_dl.extractor.viidea'
+    IE_NAME = 'Viidea'
+    _URL_LITERALS = ('bvvideo.si', 'edemokracija.viidea.com', 'flexilearn.viidea.net', 'inside.viidea.net', 'kongres.viidea.net', 'kpk.viidea.com', 'presentations.ocwconsortium.org', 'tv.nil.si', 'video.hekovnik', 'video.kiberpipa.org', 'video.pomp-forum.si', 'video.szko.si', 'video.travel-zoom.si', 'videolectures.net')
+
+
+class VimeoBaseInfoExtractor(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.vimeo'
+    IE_NAME = 'VimeoBaseInfoExtract'
+    _URL_LITERALS = None
+
+
+class VimeoIE(VimeoBaseInfoExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:\n                                www|\n                                player\n                            )\n                            \\.\n                        )?\n                        vimeo(?:pro)?\\.com/\n                        (?!(?:channels|album|showcase)/[^/?#]+/?(?:$|[?#])|[^/]+/review/|ondemand/)\n                        (?:.*?/)?\n                        (?:\n                            (?:\n                                play_redirect_hls|\n                                moogaloop\\.swf)\\?clip_id=\n                            )?\n                        (?:videos?/)?\n                        (?P<id>[0-9]+)\n                        (?:/[\\da-f]+)?\n                        /?(?:[?&].*)?(?:[#].*)?$\n                    '
+    _module = 'youtube_dl.extractor.vimeo'
+    IE_NAME = 'vimeo'
+    _URL_LITERALS = ('.com/',)
+
+
+class VimeoChannelIE(VimeoBaseInfoExtractor):
+    _VALID_URL = 'https://vimeo\\.com/channels/(?P<id>[^/?#]+)/?(?:$|[?#])'
+    _module = 'youtube_dl.extractor.vimeo'
+    IE_NAME = 'vimeo:channel'
+    _URL_LITERALS = ('https://vimeo.com/channels/',)
+
+
+class VimeoAlbumIE(VimeoChannelIE):
+    _VALID_URL = 'https://vimeo\\.com/(?:album|showcase)/(?P<id>\\d+)(?:$|[?#]|/(?!video))'
+    _module = 'youtube_dl.extractor.vimeo'
+    IE_NAME = 'vimeo:album'
+    _URL_LITERALS = ('https://vimeo.com/',)
+
+
+class VimeoGroupsIE(VimeoChannelIE):
+    _VALID_URL = 'https://vimeo\\.com/groups/(?P<id>[^/]+)(?:/(?!videos?/\\d+)|$)'
+    _module = 'youtube_dl.extractor.vimeo'
+    IE_NAME = 'vimeo:group'
+    _URL_LITERALS = ('https://vimeo.com/groups/',)
+
+
+class VimeoLikesIE(VimeoChannelIE):
+    _VALID_URL = 'https://(?:www\\.)?vimeo\\.com/(?P<id>[^/]+)/likes/?(?:$|[?#]|sort:)'
+    _module = 'youtube_dl.extractor.vimeo'
+    IE_NAME = 'vimeo:likes'
+    IE_DESC = 'Vimeo user likes'
+    _URL_LITERALS = ('vimeo.com/',)
+
+
+class VimeoOndemandIE(VimeoIE):
+    _VALID_URL = 'https?://(?:www\\.)?vimeo\\.com/ondemand/([^/]+/)?(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.vimeo'
+    IE_NAME = 'vimeo:ondemand'
+    _URL_LITERALS = ('vimeo.com/ondemand/',)
+
+
+class VimeoReviewIE(VimeoBaseInfoExtractor):
+    _VALID_URL = '(?P<url>https://vimeo\\.com/[^/]+/review/(?P<id>[^/]+)/[0-9a-f]{10})'
+    _module = 'youtube_dl.extractor.vimeo'
+    IE_NAME = 'vimeo:review'
+    IE_DESC = 'Review pages on vimeo'
+    _URL_LITERALS = ('https://vimeo.com/',)
+
+
+class VimeoUserIE(VimeoChannelIE):
+    _VALID_URL = 'https://vimeo\\.com/(?!(?:[0-9]+|watchlater)(?:$|[?#/]))(?P<id>[^/]+)(?:/videos|[#?]|$)'
+    _module = 'youtube_dl.extractor.vimeo'
+    IE_NAME = 'vimeo:user'
+    _URL_LITERALS = ('https://vimeo.com/',)
+
+
+class VimeoWatchLaterIE(VimeoChannelIE):
+    _VALID_URL = 'https://vimeo\\.com/(?:home/)?watchlater|:vimeowatchlater'
+    _module = 'youtube_dl.extractor.vimeo'
+    IE_NAME = 'vimeo:watchlater'
+    IE_DESC = 'Vimeo watch later list, "vimeowatchlater" keyword (requires authentication)'
+    _URL_LITERALS = (':vimeowatchlater', 'https://vimeo.com/')
+
+
+class VHXEmbedIE(VimeoBaseInfoExtractor):
+    _VALID_URL = 'https?://embed\\.vhx\\.tv/videos/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.vimeo'
+    IE_NAME = 'vhx:embed'
+    _URL_LITERALS = ('://embed.vhx.tv/videos/',)
+
+
+class VimpleIE(SprutoBaseIE):
+    _VALID_URL = 'https?://(?:player\\.vimple\\.(?:ru|co)/iframe|vimple\\.(?:ru|co))/(?P<id>[\\da-f-]{32,36})'
+    _module = 'youtube_dl.extractor.vimple'
+    IE_NAME = 'Vimple'
+    IE_DESC = 'Vimple - one-click video hosting'
+    _URL_LITERALS = ('player.vimple.', 'vimple.')
+
+
+class VineIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vine\\.co/(?:v|oembed)/(?P<id>\\w+)'
+    _module = 'youtube_dl.extractor.vine'
+    IE_NAME = 'Vine'
+    _URL_LITERALS = ('vine.co/',)
+
+
+class VineUserIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://vine\\.co/(?P<u>u/)?(?P<user>[^/]+)'
+    _module = 'youtube_dl.extractor.vine'
+    IE_NAME = 'vine:user'
+    _URL_LITERALS = ('://vine.co/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if VineIE.suitable(url) else super(VineUserIE, cls).suitable(url)
+
+
+class VikiBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.viki'
+    IE_NAME = 'VikiBase'
+    _URL_LITERALS = None
+
+
+class VikiIE(VikiBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?viki\\.(?:com|net|mx|jp|fr)/(?:videos|player)/(?P<id>[0-9]+v)'
+    _module = 'youtube_dl.extractor.viki'
+    IE_NAME = 'viki'
+    _URL_LITERALS = ('viki.',)
+
+
+class VikiChannelIE(VikiBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?viki\\.(?:com|net|mx|jp|fr)/(?:tv|news|movies|artists)/(?P<id>[0-9]+c)'
+    _module = 'youtube_dl.extractor.viki'
+    IE_NAME = 'viki:channel'
+    _URL_LITERALS = ('viki.',)
+
+
+class ViqeoIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                        (?:\n                            viqeo:|\n                            https?://cdn\\.viqeo\\.tv/embed/*\\?.*?\\bvid=|\n                            https?://api\\.viqeo\\.tv/v\\d+/data/startup?.*?\\bvideo(?:%5B%5D|\\[\\])=\n                        )\n                        (?P<id>[\\da-f]+)\n                    '
+    _module = 'youtube_dl.extractor.viqeo'
+    IE_NAME = 'Viqeo'
+    _URL_LITERALS = ('://api.viqeo.tv/v', '://cdn.viqeo.tv/embed', 'viqeo:')
+
+
+class ViuBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.viu'
+    IE_NAME = 'ViuBase'
+    _URL_LITERALS = None
+
+
+class ViuIE(ViuBaseIE):
+    _VALID_URL = '(?:viu:|https?://[^/]+\\.viu\\.com/[a-z]{2}/media/)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.viu'
+    IE_NAME = 'Viu'
+    _URL_LITERALS = ('.viu.com/', 'viu:')
+
+
+class ViuPlaylistIE(ViuBaseIE):
+    _VALID_URL = 'https?://www\\.viu\\.com/[^/]+/listing/playlist-(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.viu'
+    IE_NAME = 'viu:playlist'
+    _URL_LITERALS = ('://www.viu.com/',)
+
+
+class ViuOTTIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?viu\\.com/ott/(?P<country_code>[a-z]{2})/[a-z]{2}-[a-z]{2}/vod/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.viu'
+    IE_NAME = 'viu:ott'
+    _URL_LITERALS = ('viu.com/ott/',)
+
+
+class VKBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.vk'
+    IE_NAME = 'VKBase'
+    _URL_LITERALS = None
+
+
+class VKIE(VKBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:\n                                (?:(?:m|new)\\.)?vk\\.com/video_|\n                                (?:www\\.)?daxab.com/\n                            )\n                            ext\\.php\\?(?P<embed_query>.*?\\boid=(?P<oid>-?\\d+).*?\\bid=(?P<id>\\d+).*)|\n                            (?:\n                                (?:(?:m|new)\\.)?vk\\.com/(?:.+?\\?.*?z=)?video|\n                                (?:www\\.)?daxab.com/embed/\n                            )\n                            (?P<videoid>-?\\d+_\\d+)(?:.*\\blist=(?P<list_id>[\\da-f]+))?\n                        )\n                    '
+    _module = 'youtube_dl.extractor.vk'
+    IE_NAME = 'vk'
+    IE_DESC = 'VK'
+    _URL_LITERALS = ('com/embed/', 'ext.php?', 'vk.com/')
+
+
+class VKUserVideosIE(VKBaseIE):
+    _VALID_URL = 'https?://(?:(?:m|new)\\.)?vk\\.com/videos(?P<id>-?[0-9]+)(?!\\?.*\\bz=video)(?:[/?#&]|$)'
+    _module = 'youtube_dl.extractor.vk'
+    IE_NAME = 'vk:uservideos'
+    IE_DESC = "VK - User's Videos"
+    _URL_LITERALS = ('vk.com/videos',)
+
+
+class VKWallPostIE(VKBaseIE):
+    _VALID_URL = 'https?://(?:(?:(?:(?:m|new)\\.)?vk\\.com/(?:[^?]+\\?.*\\bw=)?wall(?P<id>-?\\d+_\\d+)))'
+    _module = 'youtube_dl.extractor.vk'
+    IE_NAME = 'vk:wallpost'
+    _URL_LITERALS = ('vk.com/',)
+
+
+class VLiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|m)\\.)?vlive\\.tv/video/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.vlive'
+    IE_NAME = 'vlive'
+    _URL_LITERALS = ('vlive.tv/video/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if VLivePlaylistIE.suitable(url) else super(VLiveIE, cls).suitable(url)
+
+
+class VLiveChannelIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://channels\\.vlive\\.tv/(?P<id>[0-9A-Z]+)'
+    _module = 'youtube_dl.extractor.vlive'
+    IE_NAME = 'vlive:channel'
+    _URL_LITERALS = ('://channels.vlive.tv/',)
+
+
+class VLivePlaylistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|m)\\.)?vlive\\.tv/video/(?P<video_id>[0-9]+)/playlist/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.vlive'
+    IE_NAME = 'vlive:playlist'
+    _URL_LITERALS = ('vlive.tv/video/',)
+
+
+class VodlockerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vodlocker\\.(?:com|city)/(?:embed-)?(?P<id>[0-9a-zA-Z]+)(?:\\..*?)?'
+    _module = 'youtube_dl.extractor.vodlocker'
+    IE_NAME = 'Vodlocker'
+    _URL_LITERALS = ('vodlocker.c',)
+
+
+class VODPlIE(OnetBaseIE):
+    _VALID_URL = 'https?://vod\\.pl/(?:[^/]+/)+(?P<id>[0-9a-zA-Z]+)'
+    _module = 'youtube_dl.extractor.vodpl'
+    IE_NAME = 'VODPl'
+    _URL_LITERALS = ('://vod.pl/',)
+
+
+class VODPlatformIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vod-platform\\.net/[eE]mbed/(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.vodplatform'
+    IE_NAME = 'VODPlatform'
+    _URL_LITERALS = ('vod-platform.net/',)
+
+
+class VoiceRepublicIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://voicerepublic\\.com/(?:talks|embed)/(?P<id>[0-9a-z-]+)'
+    _module = 'youtube_dl.extractor.voicerepublic'
+    IE_NAME = 'VoiceRepublic'
+    _URL_LITERALS = ('://voicerepublic.com/',)
+
+
+class VootIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?voot\\.com/(?:[^/]+/)+(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.voot'
+    IE_NAME = 'Voot'
+    _URL_LITERALS = ('voot.com/',)
+
+
+class VoxMediaVolumeIE(OnceIE):
+    _VALID_URL = 'https?://volume\\.vox-cdn\\.com/embed/(?P<id>[0-9a-f]{9})'
+    _module = 'youtube_dl.extractor.voxmedia'
+    IE_NAME = 'VoxMediaVolume'
+    _URL_LITERALS = ('://volume.vox-cdn.com/embed/',)
+
+
+class VoxMediaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:(?:theverge|vox|sbnation|eater|polygon|curbed|racked|funnyordie)\\.com|recode\\.net)/(?:[^/]+/)*(?P<id>[^/?]+)'
+    _module = 'youtube_dl.extractor.voxmedia'
+    IE_NAME = 'VoxMedia'
+    _URL_LITERALS = ('.com', 'recode.net')
+
+
+class VRTIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<site>vrt\\.be/vrtnws|sporza\\.be)/[a-z]{2}/\\d{4}/\\d{2}/\\d{2}/(?P<id>[^/?&#]+)'
+    _module = 'youtube_dl.extractor.vrt'
+    IE_NAME = 'VRT'
+    IE_DESC = 'VRT NWS, Flanders News, Flandern Info and Sporza'
+    _URL_LITERALS = ('sporza.be', 'vrt.be/vrtnws')
+
+
+class VrakIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vrak\\.tv/videos\\?.*?\\btarget=(?P<id>[\\d.]+)'
+    _module = 'youtube_dl.extractor.vrak'
+    IE_NAME = 'Vrak'
+    _AGE_LIMIT = 8
+    _URL_LITERALS = ('vrak.tv/videos?',)
+
+
+class VRVBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.vrv'
+    IE_NAME = 'VRVBase'
+    _URL_LITERALS = None
+
+
+class VRVIE(VRVBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?vrv\\.co/watch/(?P<id>[A-Z0-9]+)'
+    _module = 'youtube_dl.extractor.vrv'
+    IE_NAME = 'vrv'
+    _URL_LITERALS = ('vrv.co/watch/',)
+
+
+class CrunchyrollIE(CrunchyrollBaseIE, VRVIE):
+    _VALID_URL = 'https?://(?:(?P<prefix>www|m)\\.)?(?P<url>crunchyroll\\.(?:com|fr)/(?:media(?:-|/\\?id=)|(?:[^/]*/){1,2}[^/?&]*?)(?P<video_id>[0-9]+))(?:[/?&]|$)'
+    _module = 'youtube_dl.extractor.crunchyroll'
+    IE_NAME = 'crunchyroll'
+    _URL_LITERALS = ('crunchyroll.',)
+
+
+class VRVSeriesIE(VRVBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?vrv\\.co/series/(?P<id>[A-Z0-9]+)'
+    _module = 'youtube_dl.extractor.vrv'
+    IE_NAME = 'vrv:series'
+    _URL_LITERALS = ('vrv.co/series/',)
+
+
+class VShareIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vshare\\.io/[dv]/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.vshare'
+    IE_NAME = 'VShare'
+    _URL_LITERALS = ('vshare.io/',)
+
+
+class MedialaanIE(GigyaBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.|nieuws\\.)?\n                        (?:\n                            (?P<site_id>vtm|q2|vtmkzoom)\\.be/\n                            (?:\n                                video(?:/[^/]+/id/|/?\\?.*?\\baid=)|\n                                (?:[^/]+/)*\n                            )\n                        )\n                        (?P<id>[^/?#&]+)\n                    '
+    _module = 'youtube_dl.extractor.medialaan'
+    IE_NAME = 'Medialaan'
+    _URL_LITERALS = ('.be/',)
+
+
+class VubeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://vube\\.com/(?:[^/]+/)+(?P<id>[\\da-zA-Z]{10})\\b'
+    _module = 'youtube_dl.extractor.vube'
+    IE_NAME = 'vube'
+    IE_DESC = 'Vube.com'
+    _URL_LITERALS = ('://vube.com/',)
+
+
+class VuClipIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:m\\.)?vuclip\\.com/w\\?.*?cid=(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.vuclip'
+    IE_NAME = 'VuClip'
+    _URL_LITERALS = ('vuclip.com/w?',)
+
+
+class VVVVIDIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vvvvid\\.it/(?:#!)?(?:show|anime|film|series)/(?P<show_id>\\d+)/[^/]+/(?P<season_id>\\d+)/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.vvvvid'
+    IE_NAME = 'VVVVID'
+    _URL_LITERALS = ('vvvvid.it/',)
+
+
+class VyboryMosIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://vybory\\.mos\\.ru/(?:#precinct/|account/channels\\?.*?\\bstation_id=)(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.vyborymos'
+    IE_NAME = 'VyboryMos'
+    _URL_LITERALS = ('://vybory.mos.ru/',)
+
+
+class VzaarIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|view)\\.)?vzaar\\.com/(?:videos/)?(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.vzaar'
+    IE_NAME = 'Vzaar'
+    _URL_LITERALS = ('vzaar.com/',)
+
+
+class WakanimIE(LazyLoadExtractor):
+    _VALID_URL = 'https://(?:www\\.)?wakanim\\.tv/[^/]+/v2/catalogue/episode/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.wakanim'
+    IE_NAME = 'Wakanim'
+    _URL_LITERALS = ('wakanim.tv/',)
+
+
+class WallaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://vod\\.walla\\.co\\.il/[^/]+/(?P<id>\\d+)/(?P<display_id>.+)'
+    _module = 'youtube_dl.extractor.walla'
+    IE_NAME = 'Walla'
+    _URL_LITERALS = ('://vod.walla.co.il/',)
+
+
+class WashingtonPostIE(LazyLoadExtractor):
+    _VALID_URL = '(?:washingtonpost:|https?://(?:www\\.)?washingtonpost\\.com/video/(?:[^/]+/)*)(?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'youtube_dl.extractor.washingtonpost'
+    IE_NAME = 'washingtonpost'
+    _URL_LITERALS = ('washingtonpost.com/video/', 'washingtonpost:')
+
+
+class WashingtonPostArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?washingtonpost\\.com/(?:[^/]+/)*(?P<id>[^/?#]+)'
+    _module = 'youtube_dl.extractor.washingtonpost'
+    IE_NAME = 'washingtonpost:article'
+    _URL_LITERALS = ('washingtonpost.com/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if WashingtonPostIE.suitable(url) else super(WashingtonPostArticleIE, cls).suitable(url)
+
+
+class WatIE(LazyLoadExtractor):
+    _VALID_URL = '(?:wat:|https?://(?:www\\.)?wat\\.tv/video/.*-)(?P<id>[0-9a-z]+)'
+    _module = 'youtube_dl.extractor.wat'
+    IE_NAME = 'wat.tv'
+    _URL_LITERALS = ('wat.tv/video/', 'wat:')
+
+
+class WatchBoxIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?watchbox\\.de/(?P<kind>serien|filme)/(?:[^/]+/)*[^/]+-(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.watchbox'
+    IE_NAME = 'WatchBox'
+    _AGE_LIMIT = 12
+    _URL_LITERALS = ('watchbox.de/',)
+
+
+class WatchIndianPornIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?watchindianporn\\.net/(?:[^/]+/)*video/(?P<display_id>[^/]+)-(?P<id>[a-zA-Z0-9]+)\\.html'
+    _module = 'youtube_dl.extractor.watchindianporn'
+    IE_NAME = 'WatchIndianPorn'
+    IE_DESC = 'Watch Indian Porn'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('watchindianporn.net/',)
+
+
+class WDRIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://deviceids-medp\\.wdr\\.de/ondemand/\\d+/(?P<id>\\d+)\\.js'
+    _module = 'youtube_dl.extractor.wdr'
+    IE_NAME = 'WDR'
+    _URL_LITERALS = ('://deviceids-medp.wdr.de/ondemand/',)
+
+
+class WDRPageIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\d?\\.)?(?:wdr\\d?|sportschau)\\.de/(?:mediathek/)?(?:[^/]+/)*(?P<display_id>[^/]+)\\.html|https?://(?:www\\.)wdrmaus.de/(?:[^/]+/){1,2}[^/?#]+\\.php5'
+    _module = 'youtube_dl.extractor.wdr'
+    IE_NAME = 'WDRPage'
+    _URL_LITERALS = ('.html', '://www.wdrmaus')
+
+
+class WDRElefantIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)wdrmaus\\.de/elefantenseite/#(?P<id>.+)'
+    _module = 'youtube_dl.extractor.wdr'
+    IE_NAME = 'WDRElefant'
+    _URL_LITERALS = ('://www.wdrmaus.de/elefantenseite/#',)
+
+
+class WDRMobileIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        https?://mobile-ondemand\\.wdr\\.de/\n        .*?/fsk(?P<age_limit>[0-9]+)\n        /[0-9]+/[0-9]+/\n        (?P<id>[0-9]+)_(?P<title>[0-9]+)'
+    _module = 'youtube_dl.extractor.wdr'
+    IE_NAME = 'wdr:mobile'
+    _URL_LITERALS = ('://mobile-ondemand.wdr.de/',)
+
+
+class WebcasterIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://bl\\.webcaster\\.pro/(?:quote|media)/start/free_(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.webcaster'
+    IE_NAME = 'Webcaster'
+    _URL_LITERALS = ('://bl.webcaster.pro/',)
+
+
+class WebcasterFeedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://bl\\.webcaster\\.pro/feed/start/free_(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.webcaster'
+    IE_NAME = 'WebcasterFeed'
+    _URL_LITERALS = ('://bl.webcaster.pro/feed/start/free_',)
+
+
+class WebOfStoriesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?webofstories\\.com/play/(?:[^/]+/)?(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.webofstories'
+    IE_NAME = 'WebOfStories'
+    _URL_LITERALS = ('webofstories.com/play/',)
+
+
+class WebOfStoriesPlaylistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?webofstories\\.com/playAll/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.webofstories'
+    IE_NAME = 'WebOfStoriesPlaylist'
+    _URL_LITERALS = ('webofstories.com/playall/',)
+
+
+class WeiboIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?weibo\\.com/[0-9]+/(?P<id>[a-zA-Z0-9]+)'
+    _module = 'youtube_dl.extractor.weibo'
+    IE_NAME = 'Weibo'
+    _URL_LITERALS = ('weibo.com/',)
+
+
+class WeiboMobileIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://m\\.weibo\\.cn/status/(?P<id>[0-9]+)(\\?.+)?'
+    _module = 'youtube_dl.extractor.weibo'
+    IE_NAME = 'WeiboMobile'
+    _URL_LITERALS = ('://m.weibo.cn/status/',)
+
+
+class WeiqiTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?weiqitv\\.com/index/video_play\\?videoId=(?P<id>[A-Za-z0-9]+)'
+    _module = 'youtube_dl.extractor.weiqitv'
+    IE_NAME = 'WeiqiTV'
+    IE_DESC = 'WQTV'
+    _URL_LITERALS = ('weiqitv.com/index/video_play?videoid=',)
+
+
+class WistiaIE(LazyLoadExtractor):
+    _VALID_URL = '(?:wistia:|https?://(?:fast\\.)?wistia\\.(?:net|com)/embed/(?:iframe|medias)/)(?P<id>[a-z0-9]{10})'
+    _module = 'youtube_dl.extractor.wistia'
+    IE_NAME = 'Wistia'
+    _URL_LITERALS = ('wistia.', 'wistia:')
+
+
+class WorldStarHipHopIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www|m)\\.worldstar(?:candy|hiphop)\\.com/(?:videos|android)/video\\.php\\?.*?\\bv=(?P<id>[^&]+)'
+    _module = 'youtube_dl.extractor.worldstarhiphop'
+    IE_NAME = 'WorldStarHipHop'
+    _URL_LITERALS = ('/video.php?',)
+
+
+class WSJIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                        (?:\n                            https?://video-api\\.wsj\\.com/api-video/player/iframe\\.html\\?.*?\\bguid=|\n                            https?://(?:www\\.)?(?:wsj|barrons)\\.com/video/(?:[^/]+/)+|\n                            wsj:\n                        )\n                        (?P<id>[a-fA-F0-9-]{36})\n                    '
+    _module = 'youtube_dl.extractor.wsj'
+    IE_NAME = 'WSJ'
+    IE_DESC = 'Wall Street Journal'
+    _URL_LITERALS = ('.com/video/', '://video-api.wsj.com/api-video/player/iframe.html?', 'wsj:')
+
+
+class WSJArticleIE(LazyLoadExtractor):
+    _VALID_URL = '(?i)https?://(?:www\\.)?wsj\\.com/articles/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.wsj'
+    IE_NAME = 'WSJArticle'
+    _URL_LITERALS = ('wsj.com/articles/',)
+
+
+class WWEBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.wwe'
+    IE_NAME = 'WWEBase'
+    _URL_LITERALS = None
+
+
+class WWEIE(WWEBaseIE):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?wwe\\.com/(?:[^/]+/)*videos/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.wwe'
+    IE_NAME = 'WWE'
+    _URL_LITERALS = ('wwe.com/',)
+
+
+class XBefIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?xbef\\.com/video/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.xbef'
+    IE_NAME = 'XBef'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('xbef.com/video/',)
+
+
+class XboxClipsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?xboxclips\\.com/(?:video\\.php\\?.*vid=|[^/]+/)(?P<id>[\\w-]{36})'
+    _module = 'youtube_dl.extractor.xboxclips'
+    IE_NAME = 'XboxClips'
+    _URL_LITERALS = ('xboxclips.com/',)
+
+
+class XFileShareIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<host>clipwatching\\.com|gounlimited\\.to|govid\\.me|holavid\\.com|streamty\\.com|thevideobee\\.to|uqload\\.com|vidbom\\.com|vidlo\\.us|vidlocker\\.xyz|vidshare\\.tv|vup\\.to|xvideosharing\\.com)/(?:embed-)?(?P<id>[0-9a-zA-Z]+)'
+    _module = 'youtube_dl.extractor.xfileshare'
+    IE_NAME = 'XFileShare'
+    IE_DESC = 'XFileShare based sites: ClipWatching, GoUnlimited, GoVid, HolaVid, Streamty, TheVideoBee, Uqload, VidBom, vidlo, VidLocker, VidShare, VUp, XVideoSharing'
+    _URL_LITERALS = ('clipwatching.com', 'gounlimited.to', 'govid.me', 'holavid.com', 'streamty.com', 'thevideobee.to', 'uqload.com', 'vidbom.com', 'vidlo.us', 'vidlocker.xyz', 'vidshare.tv', 'vup.to', 'xvideosharing.com')
+
+
+class XHamsterIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:.+?\\.)?(?:xhamster\\.(?:com|one|desi)|xhms\\.pro|xhamster[27]\\.com)/\n                        (?:\n                            movies/(?P<id>\\d+)/(?P<display_id>[^/]*)\\.html|\n                            videos/(?P<display_id_2>[^/]*)-(?P<id_2>\\d+)\n                        )\n                    '
+    _module = 'youtube_dl.extractor.xhamster'
+    IE_NAME = 'XHamster'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('.com', 'amster.', 'ms.pro')
+
+
+class XHamsterEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?(?:xhamster\\.(?:com|one|desi)|xhms\\.pro|xhamster[27]\\.com)/xembed\\.php\\?video=(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.xhamster'
+    IE_NAME = 'XHamsterEmbed'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('/xembed.php?video=',)
+
+
+class XHamsterUserIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?(?:xhamster\\.(?:com|one|desi)|xhms\\.pro|xhamster[27]\\.com)/users/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.xhamster'
+    IE_NAME = 'XHamsterUser'
+    _URL_LITERALS = ('.com', 'amster.', 'ms.pro')
+
+
+class XiamiBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.xiami'
+    IE_NAME = 'XiamiBase'
+    _URL_LITERALS = None
+
+
+class XiamiSongIE(XiamiBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?xiami\\.com/song/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.xiami'
+    IE_NAME = 'xiami:song'
+    IE_DESC = '虾米音乐'
+    _URL_LITERALS = ('xiami.com/song/',)
+
+
+class XiamiPlaylistBaseIE(XiamiBaseIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.xiami'
+    IE_NAME = 'XiamiPlaylistBase'
+    _URL_LITERALS = None
+
+
+class XiamiAlbumIE(XiamiPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?xiami\\.com/album/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.xiami'
+    IE_NAME = 'xiami:album'
+    IE_DESC = '虾米音乐 - 专辑'
+    _URL_LITERALS = ('xiami.com/album/',)
+
+
+class XiamiArtistIE(XiamiPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?xiami\\.com/artist/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.xiami'
+    IE_NAME = 'xiami:artist'
+    IE_DESC = '虾米音乐 - 歌手'
+    _URL_LITERALS = ('xiami.com/artist/',)
+
+
+class XiamiCollectionIE(XiamiPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?xiami\\.com/collect/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.xiami'
+    IE_NAME = 'xiami:collection'
+    IE_DESC = '虾米音乐 - 精选集'
+    _URL_LITERALS = ('xiami.com/collect/',)
+
+
+class XimalayaBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.ximalaya'
+    IE_NAME = 'XimalayaBase'
+    _URL_LITERALS = None
+
+
+class XimalayaIE(XimalayaBaseIE):
+    _VALID_URL = 'https?://(?:www\\.|m\\.)?ximalaya\\.com/(?P<uid>[0-9]+)/sound/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.ximalaya'
+    IE_NAME = 'ximalaya'
+    IE_DESC = '喜马拉雅FM'
+    _URL_LITERALS = ('ximalaya.com/',)
+
+
+class XimalayaAlbumIE(XimalayaBaseIE):
+    _VALID_URL = 'https?://(?:www\\.|m\\.)?ximalaya\\.com/(?P<uid>[0-9]+)/album/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.ximalaya'
+    IE_NAME = 'ximalaya:album'
+    IE_DESC = '喜马拉雅FM 专辑'
+    _URL_LITERALS = ('ximalaya.com/',)
+
+
+class XMinusIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?x-minus\\.org/track/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.xminus'
+    IE_NAME = 'XMinus'
+    _URL_LITERALS = ('x-minus.org/track/',)
+
+
+class XNXXIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:video|www)\\.xnxx\\.com/video-?(?P<id>[0-9a-z]+)/'
+    _module = 'youtube_dl.extractor.xnxx'
+    IE_NAME = 'XNXX'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('.xnxx.com/video',)
+
+
+class XstreamIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    (?:\n                        xstream:|\n                        https?://frontend\\.xstream\\.(?:dk|net)/\n                    )\n                    (?P<partner_id>[^/]+)\n                    (?:\n                        :|\n                        /feed/video/\\?.*?\\bid=\n                    )\n                    (?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.xstream'
+    IE_NAME = 'Xstream'
+    _URL_LITERALS = ('://frontend.xstream.', 'xstream:')
+
+
+class VGTVIE(XstreamIE):
+    _VALID_URL = '(?x)\n                    (?:https?://(?:www\\.)?\n                    (?P<host>\n                        vgtv.no|bt.no/tv|aftenbladet.no/tv|fvn.no/fvntv|aftenposten.no/webtv|ap.vgtv.no/webtv|tv.aftonbladet.se/abtv|www.aftonbladet.se/tv\n                    )\n                    /?\n                    (?:\n                        (?:\\#!/)?(?:video|live)/|\n                        embed?.*id=|\n                        a(?:rticles)?/\n                    )|\n                    (?P<appname>\n                        vgtv|bttv|satv|fvntv|aptv|abtv\n                    ):)\n                    (?P<id>\\d+)\n                    '
+    _module = 'youtube_dl.extractor.vgtv'
+    IE_NAME = 'VGTV'
+    IE_DESC = 'VGTV, BTTV, FTV, Aftenposten and Aftonbladet'
+    _URL_LITERALS = ('abtv', 'aptv', 'bttv', 'fvntv', 'http', 'satv', 'vgtv')
+
+
+class XTubeUserIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?xtube\\.com/profile/(?P<id>[^/]+-\\d+)'
+    _module = 'youtube_dl.extractor.xtube'
+    IE_NAME = 'XTubeUser'
+    IE_DESC = 'XTube user profile'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('xtube.com/profile/',)
+
+
+class XTubeIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                        (?:\n                            xtube:|\n                            https?://(?:www\\.)?xtube\\.com/(?:watch\\.php\\?.*\\bv=|video-watch/(?:embedded/)?(?P<display_id>[^/]+)-)\n                        )\n                        (?P<id>[^/?&#]+)\n                    '
+    _module = 'youtube_dl.extractor.xtube'
+    IE_NAME = 'XTube'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('xtube.com/', 'xtube:')
+
+
+class XuiteIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://vlog\\.xuite\\.net/(?:play|embed)/(?P<id>(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?)'
+    _module = 'youtube_dl.extractor.xuite'
+    IE_NAME = 'Xuite'
+    IE_DESC = '隨意窩Xuite影音'
+    _URL_LITERALS = ('://vlog.xuite.net/',)
+
+
+class XVideosIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:[^/]+\\.)?xvideos2?\\.com/video|\n                            (?:www\\.)?xvideos\\.es/video|\n                            flashservice\\.xvideos\\.com/embedframe/|\n                            static-hw\\.xvideos\\.com/swf/xv-player\\.swf\\?.*?\\bid_video=\n                        )\n                        (?P<id>[0-9]+)\n                    '
+    _module = 'youtube_dl.extractor.xvideos'
+    IE_NAME = 'XVideos'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('.com/video', 'flashservice.xvideos.com/embedframe/', 'static-hw.xvideos.com/swf/xv-player.swf?', 'xvideos.es/video')
+
+
+class XXXYMoviesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?xxxymovies\\.com/videos/(?P<id>\\d+)/(?P<display_id>[^/]+)'
+    _module = 'youtube_dl.extractor.xxxymovies'
+    IE_NAME = 'XXXYMovies'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('xxxymovies.com/videos/',)
+
+
+class YahooIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<url>https?://(?:(?P<country>[a-zA-Z]{2}(?:-[a-zA-Z]{2})?|malaysia)\\.)?(?:[\\da-zA-Z_-]+\\.)?yahoo\\.com/(?:[^/]+/)*(?P<id>[^?&#]*-[0-9]+(?:-[a-z]+)?)\\.html)'
+    _module = 'youtube_dl.extractor.yahoo'
+    IE_NAME = 'Yahoo'
+    IE_DESC = 'Yahoo screen and movies'
+    _URL_LITERALS = ('yahoo.com/',)
+
+
+class YahooSearchIE(LazyLoadSearchExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.yahoo'
+    IE_NAME = 'screen.yahoo:search'
+    IE_DESC = 'Yahoo screen search'
+    _URL_LITERALS = ('yvsearch',)
+
+    @classmethod
+    def suitable(cls, url):
+        return re.match(cls._make_valid_url(), url) is not None
+
+    @classmethod
+    def _make_valid_url(cls):
+        return 'yvsearch(?P<prefix>|[1-9][0-9]*|all):(?P<query>[\\s\\S]+)'
+
+
+class YahooGyaOPlayerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:gyao\\.yahoo\\.co\\.jp/(?:player|episode/[^/]+)|streaming\\.yahoo\\.co\\.jp/c/y)/(?P<id>\\d+/v\\d+/v\\d+|[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'youtube_dl.extractor.yahoo'
+    IE_NAME = 'yahoo:gyao:player'
+    _URL_LITERALS = ('gyao.yahoo.co.jp/', 'streaming.yahoo.co.jp/c/y')
+
+
+class YahooGyaOIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:gyao\\.yahoo\\.co\\.jp/(?:p|title/[^/]+)|streaming\\.yahoo\\.co\\.jp/p/y)/(?P<id>\\d+/v\\d+|[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'youtube_dl.extractor.yahoo'
+    IE_NAME = 'yahoo:gyao'
+    _URL_LITERALS = ('gyao.yahoo.co.jp/', 'streaming.yahoo.co.jp/p/y')
+
+
+class YahooJapanNewsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?P<host>(?:news|headlines)\\.yahoo\\.co\\.jp)[^\\d]*(?P<id>\\d[\\d-]*\\d)?'
+    _module = 'youtube_dl.extractor.yahoo'
+    IE_NAME = 'yahoo:japannews'
+    IE_DESC = 'Yahoo! Japan News'
+    _URL_LITERALS = ('.yahoo.co.jp',)
+
+
+class YandexDiskIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://yadi\\.sk/[di]/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.yandexdisk'
+    IE_NAME = 'YandexDisk'
+    _URL_LITERALS = ('://yadi.sk/',)
+
+
+class YandexMusicBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.yandexmusic'
+    IE_NAME = 'YandexMusicBase'
+    _URL_LITERALS = None
+
+
+class YandexMusicTrackIE(YandexMusicBaseIE):
+    _VALID_URL = 'https?://music\\.yandex\\.(?:ru|kz|ua|by)/album/(?P<album_id>\\d+)/track/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.yandexmusic'
+    IE_NAME = 'yandexmusic:track'
+    IE_DESC = 'Яндекс.Музыка - Трек'
+    _URL_LITERALS = ('://music.yandex.',)
+
+
+class YandexMusicPlaylistBaseIE(YandexMusicBaseIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.yandexmusic'
+    IE_NAME = 'YandexMusicPlaylistBase'
+    _URL_LITERALS = None
+
+
+class YandexMusicAlbumIE(YandexMusicPlaylistBaseIE):
+    _VALID_URL = 'https?://music\\.yandex\\.(?:ru|kz|ua|by)/album/(?P<id>\\d+)/?(\\?|$)'
+    _module = 'youtube_dl.extractor.yandexmusic'
+    IE_NAME = 'yandexmusic:album'
+    IE_DESC = 'Яндекс.Музыка - Альбом'
+    _URL_LITERALS = ('://music.yandex.',)
+
+
+class YandexMusicPlaylistIE(YandexMusicPlaylistBaseIE):
+    _VALID_URL = 'https?://music\\.yandex\\.(?P<tld>ru|kz|ua|by)/users/(?P<user>[^/]+)/playlists/(?P<id>\\d+)'
+    _module = 'youtube_dl.extractor.yandexmusic'
+    IE_NAME = 'yandexmusic:playlist'
+    IE_DESC = 'Яндекс.Музыка - Плейлист'
+    _URL_LITERALS = ('://music.yandex.',)
+
+
+class YandexVideoIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            yandex\\.ru(?:/portal/(?:video|efir))?/?\\?.*?stream_id=|\n                            frontend\\.vh\\.yandex\\.ru/player/\n                        )\n                        (?P<id>[\\da-f]+)\n                    '
+    _module = 'youtube_dl.extractor.yandexvideo'
+    IE_NAME = 'YandexVideo'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('frontend.vh.yandex.ru/player/', 'yandex.ru')
+
+
+class YapFilesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|api)\\.)?yapfiles\\.ru/get_player/*\\?.*?\\bv=(?P<id>\\w+)'
+    _module = 'youtube_dl.extractor.yapfiles'
+    IE_NAME = 'YapFiles'
+    _URL_LITERALS = ('yapfiles.ru/get_player',)
+
+
+class YesJapanIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?yesjapan\\.com/video/(?P<slug>[A-Za-z0-9\\-]*)_(?P<id>[A-Za-z0-9]+)\\.html'
+    _module = 'youtube_dl.extractor.yesjapan'
+    IE_NAME = 'YesJapan'
+    _URL_LITERALS = ('yesjapan.com/video/',)
+
+
+class YinYueTaiIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://v\\.yinyuetai\\.com/video(?:/h5)?/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.yinyuetai'
+    IE_NAME = 'yinyuetai:video'
+    IE_DESC = '音悦Tai'
+    _URL_LITERALS = ('://v.yinyuetai.com/video',)
+
+
+class YnetIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?ynet\\.co\\.il/(?:.+?/)?0,7340,(?P<id>L(?:-[0-9]+)+),00\\.html'
+    _module = 'youtube_dl.extractor.ynet'
+    IE_NAME = 'Ynet'
+    _URL_LITERALS = ('ynet.co.il/',)
+
+
+class YouJizzIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:\\w+\\.)?youjizz\\.com/videos/(?:[^/#?]*-(?P<id>\\d+)\\.html|embed/(?P<embed_id>\\d+))'
+    _module = 'youtube_dl.extractor.youjizz'
+    IE_NAME = 'YouJizz'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('youjizz.com/videos/',)
+
+
+class YoukuIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        (?:\n            https?://(\n                (?:v|player)\\.youku\\.com/(?:v_show/id_|player\\.php/sid/)|\n                video\\.tudou\\.com/v/)|\n            youku:)\n        (?P<id>[A-Za-z0-9]+)(?:\\.html|/v\\.swf|)\n    '
+    _module = 'youtube_dl.extractor.youku'
+    IE_NAME = 'youku'
+    IE_DESC = '优酷'
+    _URL_LITERALS = ('.youku.com/', 'video.tudou.com/v/', 'youku:')
+
+
+class YoukuShowIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://list\\.youku\\.com/show/id_(?P<id>[0-9a-z]+)\\.html'
+    _module = 'youtube_dl.extractor.youku'
+    IE_NAME = 'youku:show'
+    _URL_LITERALS = ('://list.youku.com/show/id_',)
+
+
+class YouNowLiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?younow\\.com/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.younow'
+    IE_NAME = 'YouNowLive'
+    _URL_LITERALS = ('younow.com/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return (False
+                if YouNowChannelIE.suitable(url) or YouNowMomentIE.suitable(url)
+                else super(YouNowLiveIE, cls).suitable(url))
+
+
+class YouNowChannelIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?younow\\.com/(?P<id>[^/]+)/channel'
+    _module = 'youtube_dl.extractor.younow'
+    IE_NAME = 'YouNowChannel'
+    _URL_LITERALS = ('younow.com/',)
+
+
+class YouNowMomentIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?younow\\.com/[^/]+/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.younow'
+    IE_NAME = 'YouNowMoment'
+    _URL_LITERALS = ('younow.com/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return (False
+                if YouNowChannelIE.suitable(url)
+                else super(YouNowMomentIE, cls).suitable(url))
+
+
+class YouPornIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?youporn\\.com/watch/(?P<id>\\d+)/(?P<display_id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.youporn'
+    IE_NAME = 'YouPorn'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('youporn.com/watch/',)
+
+
+class YourPornIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:yourporn\\.sexy|sxyprn\\.com)/post/(?P<id>[^/?#&.]+)'
+    _module = 'youtube_dl.extractor.yourporn'
+    IE_NAME = 'YourPorn'
+    _AGE_LIMIT = 18
+    _URL_LITERALS = ('sxyprn.com', 'yourporn.sexy')
+
+
+class YourUploadIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:yourupload\\.com/(?:watch|embed)|embed\\.yourupload\\.com)/(?P<id>[A-Za-z0-9]+)'
+    _module = 'youtube_dl.extractor.yourupload'
+    IE_NAME = 'YourUpload'
+    _URL_LITERALS = ('embed.yourupload.com', 'yourupload.com/')
+
+
+class YoutubeBaseInfoExtractor(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'YoutubeBaseInfoExtract'
+    _URL_LITERALS = None
+
+
+class YoutubeIE(YoutubeBaseInfoExtractor):
+    _VALID_URL = '(?x)^\n                     (\n                         (?:https?://|//)                                    # http(s):// or protocol-independent URL\n                         (?:(?:(?:(?:\\w+\\.)?[yY][oO][uU][tT][uU][bB][eE](?:-nocookie)?\\.com/|\n                            (?:www\\.)?deturl\\.com/www\\.youtube\\.com/|\n                            (?:www\\.)?pwnyoutube\\.com/|\n                            (?:www\\.)?hooktube\\.com/|\n                            (?:www\\.)?yourepeat\\.com/|\n                            tube\\.majestyc\\.net/|\n                            # Invidious instances taken from https://github.com/omarroth/invidious/wiki/Invidious-Instances\n                            (?:(?:www|dev)\\.)?invidio\\.us/|\n                            (?:(?:www|no)\\.)?invidiou\\.sh/|\n                            (?:(?:www|fi|de)\\.)?invidious\\.snopyta\\.org/|\n                            (?:www\\.)?invidious\\.kabi\\.tk/|\n                            (?:www\\.)?invidious\\.13ad\\.de/|\n                            (?:www\\.)?invidious\\.mastodon\\.host/|\n                            (?:www\\.)?invidious\\.nixnet\\.xyz/|\n                            (?:www\\.)?invidious\\.drycat\\.fr/|\n                            (?:www\\.)?tube\\.poal\\.co/|\n                            (?:www\\.)?vid\\.wxzm\\.sx/|\n                            (?:www\\.)?yt\\.elukerio\\.org/|\n                            (?:www\\.)?yt\\.lelux\\.fi/|\n                            (?:www\\.)?kgg2m7yk5aybusll\\.onion/|\n                            (?:www\\.)?qklhadlycap4cnod\\.onion/|\n                            (?:www\\.)?axqzx4s6s54s32yentfqojs3x5i7faxza6xo3ehd4bzzsg2ii4fv2iid\\.onion/|\n                            (?:www\\.)?c7hqkpkpemu6e7emz5b4vyz7idjgdvgaaa3dyimmeojqbgpea3xqjoid\\.onion/|\n                            (?:www\\.)?fz253lmuao3strwbfbmx46yu7acac2jz27iwtorgmbqlkurlclmancad\\.onion/|\n                            (?:www\\.)?invidious\\.l4qlywnpwqsluw65ts7md3khrivpirse744un3x7mlskqauz5pyuzgqd\\.onion/|\n                            (?:www\\.)?owxfohz4kjyv25fvlqilyxast7inivgiktls3th44jhk3ej3i7ya\\.b32\\.i2p/|\n                            youtube\\.googleapis\\.com/)                        # the various hostnames, with wildcard subdomains\n                         (?:.*?\\#/)?                                          # handle anchor (#/) redirect urls\n                         (?:                                                  # the various things that can precede the ID:\n                             (?:(?:v|embed|e)/(?!videoseries))                # v/ or embed/ or e/\n                             |(?:                                             # or the v= param in all its forms\n                                 (?:(?:watch|movie)(?:_popup)?(?:\\.php)?/?)?  # preceding watch(_popup|.php) or nothing (like /?v=xxxx)\n                                 (?:\\?|\\#!?)                                  # the params delimiter ? or # or #!\n                                 (?:.*?[&;])??                                # any other preceding param (like /?s=tuff&v=xxxx or ?s=tuff&amp;v=V36LpHqtcDY)\n                                 v=\n                             )\n                         ))\n                         |(?:\n                            youtu\\.be|                                        # just youtu.be/xxxx\n                            vid\\.plus|                                        # or vid.plus/xxxx\n                            zwearz\\.com/watch|                                # or zwearz.com/watch/xxxx\n                         )/\n                         |(?:www\\.)?cleanvideosearch\\.com/media/action/yt/watch\\?videoId=\n                         )\n                     )?                                                       # all until now is optional -> you can pass the naked ID\n                     ([0-9A-Za-z_-]{11})                                      # here is it! the YouTube video ID\n                     (?!.*?\\blist=\n                        (?:\n                            (?:PL|LL|EC|UU|FL|RD|UL|TL|OLAK5uy_)[0-9A-Za-z-_]{10,}|                                  # combined list/video URLs are handled by the playlist IE\n                            WL                                                # WL are handled by the watch later IE\n                        )\n                     )\n                     (?(1).+)?                                                # if we found the ID, everything can follow\n                     $'
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'youtube'
+    IE_DESC = 'YouTube.com'
+    _URL_LITERALS = None
+
+
+class YoutubeEntryListBaseInfoExtractor(YoutubeBaseInfoExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'YoutubeEntryListBaseInfoExtract'
+    _URL_LITERALS = None
+
+
+class YoutubePlaylistBaseInfoExtractor(YoutubeEntryListBaseInfoExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'YoutubePlaylistBaseInfoExtract'
+    _URL_LITERALS = None
+
+
+class YoutubeChannelIE(YoutubePlaylistBaseInfoExtractor):
+    _VALID_URL = 'https?://(?:youtu\\.be|(?:\\w+\\.)?youtube(?:-nocookie)?\\.com|(?:www\\.)?invidio\\.us)/channel/(?P<id>[0-9A-Za-z_-]+)'
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'youtube:channel'
+    IE_DESC = 'YouTube.com channels'
+    _URL_LITERALS = ('.com', 'invidio.us', 'youtu.be')
+
+    @classmethod
+    def suitable(cls, url):
+        return (False if YoutubePlaylistsIE.suitable(url) or YoutubeLiveIE.suitable(url)
+                else super(YoutubeChannelIE, cls).suitable(url))
+
+
+class YoutubeFavouritesIE(YoutubeBaseInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?youtube\\.com/my_favorites|:ytfav(?:ou?rites)?'
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'youtube:favorites'
+    IE_DESC = 'YouTube.com favourite videos, ":ytfav" for short (requires authentication)'
+    _URL_LITERALS = (':ytfav', 'youtube.com/my_favorites')
+
+
+class YoutubeFeedsInfoExtractor(YoutubeBaseInfoExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'YoutubeFeedsInfoExtract'
+    _URL_LITERALS = None
+
+
+class YoutubeHistoryIE(YoutubeFeedsInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?youtube\\.com/feed/history|:ythistory'
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'YoutubeHistory'
+    IE_DESC = 'Youtube watch history, ":ythistory" for short (requires authentication)'
+    _URL_LITERALS = (':ythistory', 'youtube.com/feed/history')
+
+
+class YoutubeLiveIE(YoutubeBaseInfoExtractor):
+    _VALID_URL = '(?P<base_url>https?://(?:\\w+\\.)?youtube\\.com/(?:(?:user|channel|c)/)?(?P<id>[^/]+))/live'
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'youtube:live'
+    IE_DESC = 'YouTube.com live streams'
+    _URL_LITERALS = ('youtube.com/',)
+
+
+class YoutubePlaylistIE(YoutubePlaylistBaseInfoExtractor):
+    _VALID_URL = '(?x)(?:\n                        (?:https?://)?\n                        (?:\\w+\\.)?\n                        (?:\n                            (?:\n                                youtube\\.com|\n                                invidio\\.us\n                            )\n                            /\n                            (?:\n                               (?:course|view_play_list|my_playlists|artist|playlist|watch|embed/(?:videoseries|[0-9A-Za-z_-]{11}))\n                               \\? (?:.*?[&;])*? (?:p|a|list)=\n                            |  p/\n                            )|\n                            youtu\\.be/[0-9A-Za-z_-]{11}\\?.*?\\blist=\n                        )\n                        (\n                            (?:PL|LL|EC|UU|FL|RD|UL|TL|OLAK5uy_)?[0-9A-Za-z-_]{10,}\n                            # Top tracks, they can also include dots\n                            |(?:MC)[\\w\\.]*\n                        )\n                        .*\n                     |\n                        ((?:PL|LL|EC|UU|FL|RD|UL|TL|OLAK5uy_)[0-9A-Za-z-_]{10,})\n                     )'
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'youtube:playlist'
+    IE_DESC = 'YouTube.com playlists'
+    _URL_LITERALS = None
+
+
+class YoutubePlaylistsBaseInfoExtractor(YoutubeEntryListBaseInfoExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'YoutubePlaylistsBaseInfoExtract'
+    _URL_LITERALS = None
+
+
+class YoutubePlaylistsIE(YoutubePlaylistsBaseInfoExtractor):
+    _VALID_URL = 'https?://(?:\\w+\\.)?youtube\\.com/(?:user|channel)/(?P<id>[^/]+)/playlists'
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'youtube:playlists'
+    IE_DESC = 'YouTube.com user/channel playlists'
+    _URL_LITERALS = ('youtube.com/',)
+
+
+class YoutubeRecommendedIE(YoutubeFeedsInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?youtube\\.com/feed/recommended|:ytrec(?:ommended)?'
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'YoutubeRecommended'
+    IE_DESC = 'YouTube.com recommended videos, ":ytrec" for short (requires authentication)'
+    _URL_LITERALS = (':ytrec', 'youtube.com/feed/recommended')
+
+
+class YoutubeSearchBaseInfoExtractor(YoutubePlaylistBaseInfoExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'YoutubeSearchBaseInfoExtract'
+    _URL_LITERALS = None
+
+
+class YoutubeSearchIE(LazyLoadSearchExtractor, YoutubeSearchBaseInfoExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'youtube:search'
+    IE_DESC = 'YouTube.com searches'
+    _URL_LITERALS = ('ytsearch',)
+
+    @classmethod
+    def suitable(cls, url):
+        return re.match(cls._make_valid_url(), url) is not None
+
+    @classmethod
+    def _make_valid_url(cls):
+        return 'ytsearch(?P<prefix>|[1-9][0-9]*|all):(?P<query>[\\s\\S]+)'
+
+
+class YoutubeSearchDateIE(YoutubeSearchIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'youtube:search:date'
+    IE_DESC = 'YouTube.com searches, newest videos first'
+    _URL_LITERALS = ('ytsearchdate',)
+
+    @classmethod
+    def suitable(cls, url):
+        return re.match(cls._make_valid_url(), url) is not None
+
+    @classmethod
+    def _make_valid_url(cls):
+        return 'ytsearchdate(?P<prefix>|[1-9][0-9]*|all):(?P<query>[\\s\\S]+)'
+
+
+class YoutubeSearchURLIE(YoutubeSearchBaseInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?youtube\\.com/results\\?(.*?&)?(?:search_query|q)=(?P<query>[^&]+)(?:[&]|$)'
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'youtube:search_url'
+    IE_DESC = 'YouTube.com search URLs'
+    _URL_LITERALS = ('youtube.com/results?',)
+
+
+class YoutubeShowIE(YoutubePlaylistsBaseInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?youtube\\.com/show/(?P<id>[^?#]*)'
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'youtube:show'
+    IE_DESC = 'YouTube.com (multi-season) shows'
+    _URL_LITERALS = ('youtube.com/show/',)
+
+
+class YoutubeSubscriptionsIE(YoutubeFeedsInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?youtube\\.com/feed/subscriptions|:ytsubs(?:criptions)?'
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'YoutubeSubscriptions'
+    IE_DESC = 'YouTube.com subscriptions feed, "ytsubs" keyword (requires authentication)'
+    _URL_LITERALS = (':ytsubs', 'youtube.com/feed/subscriptions')
+
+
+class YoutubeTruncatedIDIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?youtube\\.com/watch\\?v=(?P<id>[0-9A-Za-z_-]{1,10})$'
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'youtube:truncated_id'
+    IE_DESC = False
+    _URL_LITERALS = ('youtube.com/watch?v=',)
+
+
+class YoutubeTruncatedURLIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        (?:https?://)?\n        (?:\\w+\\.)?[yY][oO][uU][tT][uU][bB][eE](?:-nocookie)?\\.com/\n        (?:watch\\?(?:\n            feature=[a-z_]+|\n            annotation_id=annotation_[^&]+|\n            x-yt-cl=[0-9]+|\n            hl=[^&]*|\n            t=[0-9]+\n        )?\n        |\n            attribution_link\\?a=[^&]+\n        )\n        $\n    '
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'youtube:truncated_url'
+    IE_DESC = False
+    _URL_LITERALS = ('.com/',)
+
+
+class YoutubeUserIE(YoutubeChannelIE):
+    _VALID_URL = '(?:(?:https?://(?:\\w+\\.)?youtube\\.com/(?:(?P<user>user|c)/)?(?!(?:attribution_link|watch|results|shared)(?:$|[^a-z_A-Z0-9-])))|ytuser:)(?!feed/)(?P<id>[A-Za-z0-9_-]+)'
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'youtube:user'
+    IE_DESC = 'YouTube.com user videos (URL or "ytuser" keyword)'
+    _URL_LITERALS = None
+
+    @classmethod
+    def suitable(cls, url):
+        # Don't return True if the url can be extracted with other youtube
+        # extractor, the regex would is too permissive and it would match.
+        other_yt_ies = iter(klass for (name, klass) in globals().items() if name.startswith('Youtube') and name.endswith('IE') and klass is not cls)
+        if any(ie.suitable(url) for ie in other_yt_ies):
+            return False
+        else:
+            return super(YoutubeUserIE, cls).suitable(url)
+
+
+class YoutubeWatchLaterIE(YoutubePlaylistIE):
+    _VALID_URL = 'https?://(?:www\\.)?youtube\\.com/(?:feed/watch_later|(?:playlist|watch)\\?(?:.+&)?list=WL)|:ytwatchlater'
+    _module = 'youtube_dl.extractor.youtube'
+    IE_NAME = 'youtube:watchlater'
+    IE_DESC = 'Youtube watch later list, ":ytwatchlater" for short (requires authentication)'
+    _URL_LITERALS = (':ytwatchlater', 'youtube.com/')
+
+
+class ZapiksIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?zapiks\\.(?:fr|com)/(?:(?:[a-z]{2}/)?(?P<display_id>.+?)\\.html|index\\.php\\?.*\\bmedia_id=(?P<id>\\d+))'
+    _module = 'youtube_dl.extractor.zapiks'
+    IE_NAME = 'Zapiks'
+    _URL_LITERALS = ('zapiks.',)
+
+
+class Zaq1IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?zaq1\\.pl/video/(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.zaq1'
+    IE_NAME = 'Zaq1'
+    _URL_LITERALS = ('zaq1.pl/video/',)
+
+
+class ZattooPlatformBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'ZattooPlatformBase'
+    _URL_LITERALS = None
+
+
+class QuicklineBaseIE(ZattooPlatformBaseIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'QuicklineBase'
+    _URL_LITERALS = None
+
+
+class QuicklineIE(QuicklineBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?mobiltv\\.quickline\\.com/watch/(?P<channel>[^/]+)/(?P<id>[0-9]+)'
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'Quickline'
+    _URL_LITERALS = ('mobiltv.quickline.com/watch/',)
+
+
+class QuicklineLiveIE(QuicklineBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?mobiltv\\.quickline\\.com/watch/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'QuicklineLive'
+    _URL_LITERALS = ('mobiltv.quickline.com/watch/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if QuicklineIE.suitable(url) else super(QuicklineLiveIE, cls).suitable(url)
+
+
+class ZattooBaseIE(ZattooPlatformBaseIE):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'ZattooBase'
+    _URL_LITERALS = None
+
+
+class ZattooIE(ZattooBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?zattoo\\.com/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'Zattoo'
+    _URL_LITERALS = ('zattoo.com/watch/',)
+
+
+class BBVTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?bbv\\-tv\\.net/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'BBVTV'
+    _URL_LITERALS = ('bbv-tv.net/watch/',)
+
+
+class EinsUndEinsTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?1und1\\.tv/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'EinsUndEinsTV'
+    _URL_LITERALS = ('1und1.tv/watch/',)
+
+
+class EWETVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?tvonline\\.ewe\\.de/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'EWETV'
+    _URL_LITERALS = ('tvonline.ewe.de/watch/',)
+
+
+class GlattvisionTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?iptv\\.glattvision\\.ch/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'GlattvisionTV'
+    _URL_LITERALS = ('iptv.glattvision.ch/watch/',)
+
+
+class MNetTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?tvplus\\.m\\-net\\.de/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'MNetTV'
+    _URL_LITERALS = ('tvplus.m-net.de/watch/',)
+
+
+class MyVisionTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?myvisiontv\\.ch/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'MyVisionTV'
+    _URL_LITERALS = ('myvisiontv.ch/watch/',)
+
+
+class NetPlusIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?netplus\\.tv/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'NetPlus'
+    _URL_LITERALS = ('netplus.tv/watch/',)
+
+
+class OsnatelTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?tvonline\\.osnatel\\.de/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'OsnatelTV'
+    _URL_LITERALS = ('tvonline.osnatel.de/watch/',)
+
+
+class QuantumTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?quantum\\-tv\\.com/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'QuantumTV'
+    _URL_LITERALS = ('quantum-tv.com/watch/',)
+
+
+class SaltTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?tv\\.salt\\.ch/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'SaltTV'
+    _URL_LITERALS = ('tv.salt.ch/watch/',)
+
+
+class SAKTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?saktv\\.ch/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'SAKTV'
+    _URL_LITERALS = ('saktv.ch/watch/',)
+
+
+class VTXTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?vtxtv\\.ch/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'VTXTV'
+    _URL_LITERALS = ('vtxtv.ch/watch/',)
+
+
+class WalyTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?player\\.waly\\.tv/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'WalyTV'
+    _URL_LITERALS = ('player.waly.tv/watch/',)
+
+
+class ZattooLiveIE(ZattooBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?zattoo\\.com/watch/(?P<id>[^/]+)'
+    _module = 'youtube_dl.extractor.zattoo'
+    IE_NAME = 'ZattooLive'
+    _URL_LITERALS = ('zattoo.com/watch/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if ZattooIE.suitable(url) else super(ZattooLiveIE, cls).suitable(url)
+
+
+class ZDFBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.zdf'
+    IE_NAME = 'ZDFBase'
+    _URL_LITERALS = None
+
+
+class ZDFIE(ZDFBaseIE):
+    _VALID_URL = 'https?://www\\.zdf\\.de/(?:[^/]+/)*(?P<id>[^/?]+)\\.html'
+    _module = 'youtube_dl.extractor.zdf'
+    IE_NAME = 'ZDF'
+    _URL_LITERALS = ('://www.zdf.de/',)
+
+
+class ZDFChannelIE(ZDFBaseIE):
+    _VALID_URL = 'https?://www\\.zdf\\.de/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'youtube_dl.extractor.zdf'
+    IE_NAME = 'ZDFChannel'
+    _URL_LITERALS = ('://www.zdf.de/',)
+
+    @classmethod
+    def suitable(cls, url):
+        return False if ZDFIE.suitable(url) else super(ZDFChannelIE, cls).suitable(url)
+
+
+class ZingMp3BaseInfoExtractor(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'youtube_dl.extractor.zingmp3'
+    IE_NAME = 'ZingMp3BaseInfoExtract'
+    _URL_LITERALS = None
+
+
+class ZingMp3IE(ZingMp3BaseInfoExtractor):
+    _VALID_URL = 'https?://mp3\\.zing\\.vn/(?:bai-hat|album|playlist|video-clip)/[^/]+/(?P<id>\\w+)\\.html'
+    _module = 'youtube_dl.extractor.zingmp3'
+    IE_NAME = 'zingmp3'
+    IE_DESC = 'mp3.zing.vn'
+    _URL_LITERALS = ('://mp3.zing.vn/',)
+
+
+class ZypeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://player\\.zype\\.com/embed/(?P<id>[\\da-fA-F]+)\\.js\\?.*?api_key=[^&]+'
+    _module = 'youtube_dl.extractor.zype'
+    IE_NAME = 'Zype'
+    _URL_LITERALS = ('://player.zype.com/embed/',)
+
+
+class GenericIE(LazyLoadExtractor):
+    _VALID_URL = '.*'
+    _module = 'youtube_dl.extractor.generic'
+    IE_NAME = 'generic'
+    IE_DESC = 'Generic downloader that works on some sites'
+    _URL_LITERALS = None
+
+_ALL_CLASSES = [ABCIE, ABCIViewIE, AbcNewsIE, AbcNewsVideoIE, ABCOTVSIE, ABCOTVSClipsIE, AcademicEarthCourseIE, ACastIE, ACastChannelIE, ADNIE, AdobeConnectIE, AdobeTVIE, AdobeTVShowIE, AdobeTVChannelIE, AdobeTVVideoIE, AdultSwimIE, AfreecaTVIE, AirMozillaIE, AlJazeeraIE, AlphaPornoIE, AmericasTestKitchenIE, AnimeOnDemandIE, AnvatoIE, AolIE, AllocineIE, AliExpressLiveIE, APAIE, AparatIE, AppleConnectIE, AppleTrailersIE, AppleTrailersSectionIE, ArchiveOrgIE, ArkenaIE, ARDBetaMediathekIE, ARDIE, ARDMediathekIE, ArteTVPlus7IE, ArteTVEmbedIE, ArteTVPlaylistIE, AsianCrushIE, AsianCrushPlaylistIE, AtresPlayerIE, ATTTechChannelIE, ATVAtIE, AudiMediaIE, AudioBoomIE, AudiomackIE, AudiomackAlbumIE, AWAANIE, AWAANVideoIE, AWAANLiveIE, AWAANSeasonIE, AZMedienIE, BaiduVideoIE, BandcampIE, BandcampAlbumIE, BandcampWeeklyIE, BBCCoUkIE, BBCCoUkArticleIE, BBCCoUkIPlayerPlaylistIE, BBCCoUkPlaylistIE, BBCIE, BeamProLiveIE, BeamProVodIE, BeegIE, BehindKinkIE, BellMediaIE, BeatportIE, BetIE, BFIPlayerIE, BigflixIE, BildIE, BiliBiliIE, BiliBiliBangumiIE, BilibiliAudioIE, BilibiliAudioAlbumIE, BioBioChileTVIE, BitChuteIE, BitChuteChannelIE, BIQLEIE, BleacherReportIE, BleacherReportCMSIE, BlinkxIE, BloombergIE, BokeCCIE, BostonGlobeIE, BpbIE, BRIE, BRMediathekIE, BravoTVIE, BreakIE, BrightcoveLegacyIE, BrightcoveNewIE, BusinessInsiderIE, BuzzFeedIE, BYUtvIE, C56IE, CamdemyIE, CamdemyFolderIE, CamModelsIE, CamTubeIE, CamWithHerIE, CanalplusIE, Canalc2IE, CanvasIE, CanvasEenIE, VrtNUIE, CarambaTVIE, CarambaTVPageIE, CartoonNetworkIE, CBCIE, CBCPlayerIE, CBCWatchVideoIE, CBCWatchIE, CBCOlympicsIE, CBSLocalIE, CBSNewsLiveVideoIE, CCCIE, CCCPlaylistIE, CCMAIE, CCTVIE, CDAIE, CeskaTelevizeIE, CeskaTelevizePoradyIE, Channel9IE, CharlieRoseIE, ChaturbateIE, ChilloutzoneIE, ChirbitIE, ChirbitProfileIE, CinchcastIE, CinemaxIE, CiscoLiveSessionIE, CiscoLiveSearchIE, CJSWIE, CliphunterIE, ClippitIE, ClipRsIE, ClipsyndicateIE, CloserToTruthIE, CloudflareStreamIE, CloudyIE, ClubicIE, ClypIE, CNBCIE, CNBCVideoIE, CNNIE, CNNBlogsIE, CNNArticleIE, CoubIE, ComedyCentralFullEpisodesIE, ComedyCentralIE, ComedyCentralShortnameIE, ComedyCentralTVIE, ToshIE, CommonMistakesIE, UnicodeBOMIE, MmsIE, RtmpIE, CondeNastIE, CONtvIE, CrackedIE, CrackleIE, CrooksAndLiarsIE, CrunchyrollShowPlaylistIE, CSpanIE, CtsNewsIE, CTVNewsIE, CultureUnpluggedIE, CuriosityStreamIE, CuriosityStreamCollectionIE, CWTVIE, DailyMailIE, DailymotionIE, DailymotionPlaylistIE, DailymotionUserIE, DaumIE, DaumClipIE, DaumPlaylistIE, DaumUserIE, DBTVIE, DctpTvIE, DeezerPlaylistIE, DemocracynowIE, DFBIE, DHMIE, DiggIE, DotsubIE, DouyuShowIE, DouyuTVIE, DPlayIE, DreiSatIE, DRBonanzaIE, DrTuberIE, DRTVIE, DRTVLiveIE, DTubeIE, DVTVIE, DumpertIE, DefenseGouvFrIE, DiscoveryIE, DiscoveryGoIE, DiscoveryGoPlaylistIE, DiscoveryNetworksDeIE, DiscoveryVRIE, DisneyIE, DigitallySpeakingIE, DropboxIE, DWIE, DWArticleIE, EaglePlatformIE, EbaumsWorldIE, EchoMskIE, EggheadCourseIE, EggheadLessonIE, EHowIE, EightTracksIE, EinthusanIE, EitbIE, EllenTubeIE, EllenTubeVideoIE, EllenTubePlaylistIE, ElPaisIE, EmbedlyIE, EngadgetIE, EpornerIE, EroProfileIE, EscapistIE, ESPNIE, ESPNArticleIE, FiveThirtyEightIE, EsriVideoIE, EuropaIE, EveryonesMixtapeIE, ExpoTVIE, ExpressenIE, EyedoTVIE, FacebookIE, FacebookPluginsVideoIE, FazIE, FC2IE, FC2EmbedIE, FczenitIE, FilmOnIE, FilmOnChannelIE, FilmwebIE, FirstTVIE, FiveMinIE, FiveTVIE, FlickrIE, FolketingetIE, FootyRoomIE, Formula1IE, FourTubeIE, PornTubeIE, PornerBrosIE, FuxIE, FOXIE, FOX9IE, FOX9NewsIE, FoxgayIE, FoxNewsIE, FoxNewsArticleIE, FoxSportsIE, FranceCultureIE, FranceInterIE, FranceTVIE, FranceTVSiteIE, FranceTVEmbedIE, FranceTVInfoIE, FranceTVInfoSportIE, FranceTVJeunesseIE, GenerationWhatIE, CultureboxIE, FreesoundIE, FreespeechIE, FreshLiveIE, FrontendMastersIE, FrontendMastersLessonIE, FrontendMastersCourseIE, FunimationIE, FunkIE, FusionIE, FXNetworksIE, GaiaIE, GameInformerIE, GameSpotIE, GameStarIE, GaskrankIE, GazetaIE, GDCVaultIE, GfycatIE, GiantBombIE, GigaIE, GlideIE, GloboIE, GloboArticleIE, GoIE, GodTubeIE, GolemIE, GoogleDriveIE, GooglePlusIE, GoogleSearchIE, GoshgayIE, GPUTechConfIE, GrouponIE, HBOIE, HearThisAtIE, HeiseIE, HellPornoIE, HelsinkiIE, HentaiStigmaIE, HGTVComShowIE, HKETVIE, HiDiveIE, HistoricFilmsIE, HitboxIE, HitboxLiveIE, HitRecordIE, HornBunnyIE, HotNewHipHopIE, HotStarIE, HotStarPlaylistIE, HowcastIE, HowStuffWorksIE, HRTiIE, HRTiPlaylistIE, HuajiaoIE, HuffPostIE, HungamaIE, HungamaSongIE, HypemIE, IGNIE, OneUPIE, PCMagIE, ImdbIE, ImdbListIE, ImgurIE, ImgurGalleryIE, ImgurAlbumIE, InaIE, IncIE, IndavideoEmbedIE, InfoQIE, InstagramIE, InstagramUserIE, InstagramTagIE, InternazionaleIE, InternetVideoArchiveIE, IPrimaIE, IqiyiIE, Ir90TvIE, ITVIE, ITVBTCCIE, IviIE, IviCompilationIE, IvideonIE, IwaraIE, IzleseneIE, JamendoIE, JamendoAlbumIE, JeuxVideoIE, JoveIE, JojIE, JWPlatformIE, JpopsukiIE, KakaoIE, KalturaIE, KanalPlayIE, KankanIE, KaraoketvIE, KarriereVideosIE, KeezMoviesIE, ExtremeTubeIE, KetnetIE, KhanAcademyIE, KickStarterIE, KinjaEmbedIE, KinoPoiskIE, KonserthusetPlayIE, KontrTubeIE, KrasViewIE, Ku6IE, KUSIIE, KuwoIE, KuwoAlbumIE, KuwoChartIE, KuwoSingerIE, KuwoCategoryIE, KuwoMvIE, LA7IE, Laola1TvEmbedIE, Laola1TvIE, EHFTVIE, ITTFIE, LCIIE, LcpPlayIE, LcpIE, Lecture2GoIE, LecturioIE, LecturioCourseIE, LecturioDeCourseIE, LeIE, LePlaylistIE, LetvCloudIE, LEGOIE, LemondeIE, LentaIE, LibraryOfCongressIE, LibsynIE, LifeNewsIE, LifeEmbedIE, LimelightMediaIE, LimelightChannelIE, LimelightChannelListIE, LineTVIE, LinkedInLearningIE, LinkedInLearningCourseIE, LinuxAcademyIE, LiTVIE, LiveJournalIE, LiveLeakIE, LiveLeakEmbedIE, LivestreamIE, LivestreamOriginalIE, LivestreamShortenerIE, LnkGoIE, LocalNews8IE, LoveHomePornIE, LRTIE, LyndaIE, LyndaCourseIE, M6IE, MailRuIE, MailRuMusicIE, MailRuMusicSearchIE, MallTVIE, MangomoloVideoIE, MangomoloLiveIE, ManyVidsIE, MarkizaIE, MarkizaPageIE, MassengeschmackTVIE, MatchTVIE, MDRIE, MediasetIE, MediasiteIE, MediasiteCatalogIE, MediasiteNamedCatalogIE, MediciIE, MegaphoneIE, MeipaiIE, MelonVODIE, METAIE, MetacafeIE, MetacriticIE, MgoonIE, MGTVIE, MiaoPaiIE, MicrosoftVirtualAcademyIE, MicrosoftVirtualAcademyCourseIE, MinistryGridIE, MinotoIE, MioMioIE, TechTVMITIE, OCWMITIE, MiTeleIE, MixcloudIE, MixcloudUserIE, MixcloudPlaylistIE, MLBIE, MnetIE, MoeVideoIE, MofosexIE, MojvideoIE, MorningstarIE, MotherlessIE, MotherlessGroupIE, MotorsportIE, MovieClipsIE, MoviezineIE, MovingImageIE, MSNIE, MTVIE, CMTIE, MTVVideoIE, MTVServicesEmbeddedIE, MTVDEIE, MTVJapanIE, MuenchenTVIE, MusicPlayOnIE, MwaveIE, MwaveMeetGreetIE, MyChannelsIE, MySpaceIE, MySpaceAlbumIE, MySpassIE, MyviIE, MyviEmbedIE, MyVidsterIE, NationalGeographicVideoIE, NationalGeographicTVIE, NaverIE, NBAIE, CSNNEIE, NBCIE, NBCOlympicsIE, NBCOlympicsStreamIE, NBCSportsIE, NBCSportsStreamIE, NBCSportsVPlayerIE, NDRIE, NJoyIE, NDREmbedBaseIE, NDREmbedIE, NJoyEmbedIE, NDTVIE, NetzkinoIE, NerdCubedFeedIE, NetEaseMusicIE, NetEaseMusicAlbumIE, NetEaseMusicSingerIE, NetEaseMusicListIE, NetEaseMusicMvIE, NetEaseMusicProgramIE, NetEaseMusicDjRadioIE, NewgroundsIE, NewgroundsPlaylistIE, NewstubeIE, NextMediaIE, NextMediaActionNewsIE, AppleDailyIE, NextTVIE, NexxIE, NexxEmbedIE, NFLIE, NhkVodIE, NHLIE, NickIE, NickBrIE, NickDeIE, NickNightIE, NickRuIE, NiconicoIE, NiconicoPlaylistIE, NineCNineMediaIE, NineGagIE, NineNowIE, NintendoIE, NJPWWorldIE, NobelPrizeIE, NocoIE, NonkTubeIE, NoovoIE, NormalbootsIE, NosVideoIE, NovaEmbedIE, NovaIE, NownessIE, NownessPlaylistIE, NownessSeriesIE, NozIE, NPOIE, AndereTijdenIE, NPOLiveIE, NPORadioIE, NPORadioFragmentIE, SchoolTVIE, HetKlokhuisIE, VPROIE, WNLIE, NprIE, NRKIE, NRKPlaylistIE, NRKSkoleIE, NRKTVIE, NRKTVDirekteIE, NRKTVEpisodeIE, NRKTVEpisodesIE, NRKTVSeasonIE, NRKTVSeriesIE, NRLTVIE, NTVCoJpCUIE, NTVDeIE, NTVRuIE, NYTimesIE, NYTimesArticleIE, NuvidIE, NZZIE, OdaTVIE, OdnoklassnikiIE, OktoberfestTVIE, OnDemandKoreaIE, OnetIE, OnetChannelIE, OnetMVPIE, OnetPlIE, OnionStudiosIE, OoyalaIE, OoyalaExternalIE, OraTVIE, ORFTVthekIE, ORFFM4IE, ORFFM4StoryIE, ORFOE1IE, ORFIPTVIE, OutsideTVIE, PacktPubIE, PacktPubCourseIE, PandaTVIE, PandoraTVIE, ParliamentLiveUKIE, PatreonIE, PBSIE, PearVideoIE, PeerTubeIE, PeopleIE, PerformGroupIE, PeriscopeIE, PeriscopeUserIE, PhilharmonieDeParisIE, PhoenixIE, PhotobucketIE, PicartoIE, PicartoVodIE, PikselIE, PinkbikeIE, PladformIE, PlatziIE, PlatziCourseIE, PlayFMIE, PlayPlusTVIE, PlaysTVIE, PlaytvakIE, PlayvidIE, PlaywireIE, PluralsightIE, PluralsightCourseIE, PodomaticIE, PokemonIE, PolskieRadioIE, PolskieRadioCategoryIE, PopcornTVIE, Porn91IE, PornComIE, PornHdIE, PornHubIE, PornHubUserIE, PornHubPagedVideoListIE, PornHubUserVideosUploadIE, PornotubeIE, PornoVoisinesIE, PornoXOIE, PuhuTVIE, PuhuTVSerieIE, PressTVIE, ProSiebenSat1IE, Puls4IE, PyvideoIE, QQMusicIE, QQMusicSingerIE, QQMusicAlbumIE, QQMusicToplistIE, QQMusicPlaylistIE, R7IE, R7ArticleIE, RadioCanadaIE, RadioCanadaAudioVideoIE, RadioDeIE, RadioJavanIE, RadioBremenIE, RadioFranceIE, RaiPlayIE, RaiPlayLiveIE, RaiPlayPlaylistIE, RaiIE, RayWenderlichIE, RayWenderlichCourseIE, RBMARadioIE, RDSIE, RedBullTVIE, RedBullTVRrnContentIE, RedditIE, RedditRIE, RedTubeIE, RegioTVIE, RENTVIE, RENTVArticleIE, RestudyIE, ReutersIE, ReverbNationIE, RICEIE, RMCDecouverteIE, Ro220IE, RockstarGamesIE, RoosterTeethIE, RottenTomatoesIE, RoxwelIE, RozhlasIE, RTBFIE, RteIE, RteRadioIE, RtlNlIE, RTL2IE, RTL2YouIE, RTL2YouSeriesIE, RTPIE, RTVEALaCartaIE, RTVELiveIE, RTVEInfantilIE, RTVETelevisionIE, RTVNHIE, RTVSIE, RUHDIE, RutubeIE, RutubeChannelIE, RutubeEmbedIE, RutubeMovieIE, RutubePersonIE, RutubePlaylistIE, RUTVIE, RuutuIE, RuvIE, SafariIE, SafariApiIE, SafariCourseIE, SapoIE, SaveFromIE, SBSIE, ScreencastIE, ScreencastOMaticIE, ScrippsNetworksWatchIE, SCTEIE, SCTECourseIE, SeekerIE, SenateISVPIE, SendtoNewsIE, ServusIE, SevenPlusIE, SexuIE, SeznamZpravyIE, SeznamZpravyArticleIE, ShahidIE, ShahidShowIE, SharedIE, VivoIE, ShowRoomLiveIE, SinaIE, SixPlayIE, SkylineWebcamsIE, SkyNewsArabiaIE, SkyNewsArabiaArticleIE, SkyNewsIE, SkySportsIE, SlideshareIE, SlidesLiveIE, SlutloadIE, SmotriIE, SmotriCommunityIE, SmotriUserIE, SmotriBroadcastIE, SnotrIE, SohuIE, SonyLIVIE, SoundcloudEmbedIE, SoundcloudIE, SoundcloudSetIE, SoundcloudUserIE, SoundcloudTrackStationIE, SoundcloudPlaylistIE, SoundcloudSearchIE, SoundgasmIE, SoundgasmProfileIE, SouthParkIE, SouthParkDeIE, SouthParkDkIE, SouthParkEsIE, SouthParkNlIE, SpankBangIE, SpankBangPlaylistIE, SpankwireIE, SpiegelIE, SpiegelArticleIE, SpiegeltvIE, BellatorIE, ParamountNetworkIE, StitcherIE, Sport5IE, SportBoxIE, SportDeutschlandIE, SpringboardPlatformIE, SproutIE, SRGSSRIE, RTSIE, SRGSSRPlayIE, SRMediathekIE, StanfordOpenClassroomIE, SteamIE, StreamableIE, StreamcloudIE, StreamCZIE, StreetVoiceIE, StretchInternetIE, STVPlayerIE, SunPornoIE, SverigesRadioEpisodeIE, SverigesRadioPublicationIE, SVTIE, SVTPageIE, SVTPlayIE, SVTSeriesIE, SWRMediathekIE, SyfyIE, SztvHuIE, TagesschauPlayerIE, TagesschauIE, TassIE, TastyTradeIE, TBSIE, TDSLifewayIE, TeachableIE, TeachableCourseIE, TeacherTubeIE, TeacherTubeUserIE, TeachingChannelIE, TeamcocoIE, TeamTreeHouseIE, TechTalksIE, TEDIE, Tele5IE, Tele13IE, TeleBruxellesIE, TelecincoIE, TelegraafIE, TeleMBIE, TeleQuebecIE, TeleQuebecSquatIE, TeleQuebecEmissionIE, TeleQuebecLiveIE, TeleTaskIE, TelewebionIE, TennisTVIE, TenPlayIE, TestURLIE, TF1IE, TFOIE, TheInterceptIE, ThePlatformIE, AENetworksIE, HistoryTopicIE, AMCNetworksIE, NBCNewsIE, ThePlatformFeedIE, CBSIE, CBSInteractiveIE, CBSNewsEmbedIE, CBSNewsIE, CBSSportsIE, CorusIE, TheSceneIE, TheStarIE, TheSunIE, TheWeatherChannelIE, ThisAmericanLifeIE, ThisAVIE, ThisOldHouseIE, ThreeQSDNIE, TikTokIE, TikTokUserIE, TinyPicIE, TMZIE, TMZArticleIE, TNAFlixNetworkEmbedIE, TNAFlixIE, EMPFlixIE, MovieFapIE, ToggleIE, TOnlineIE, ToonGogglesIE, TouTvIE, ToypicsUserIE, ToypicsIE, TrailerAddictIE, TriluliluIE, TruNewsIE, TruTVIE, Tube8IE, TubiTvIE, TumblrIE, TuneInClipIE, TuneInStationIE, TuneInProgramIE, TuneInTopicIE, TuneInShortenerIE, TunePkIE, TurboIE, TV2IE, TV2ArticleIE, TV2DKIE, TV2HuIE, TV4IE, TV5MondePlusIE, TVAIE, TVANouvellesIE, TVANouvellesArticleIE, TVCIE, TVCArticleIE, TvigleIE, TVLandIE, TVN24IE, TVNetIE, TVNoeIE, TVNowIE, TVNowNewIE, TVNowSeasonIE, TVNowAnnualIE, TVNowShowIE, TVPEmbedIE, TVPIE, TVPWebsiteIE, TVPlayIE, ViafreeIE, TVPlayHomeIE, TVPlayerIE, TweakersIE, TwentyFourVideoIE, TwentyMinutenIE, TwentyThreeVideoIE, TwitCastingIE, TwitchVideoIE, TwitchChapterIE, TwitchVodIE, TwitchProfileIE, TwitchAllVideosIE, TwitchUploadsIE, TwitchPastBroadcastsIE, TwitchHighlightsIE, TwitchStreamIE, TwitchClipsIE, TwitterCardIE, TwitterIE, TwitterAmplifyIE, TwitterBroadcastIE, UdemyIE, UdemyCourseIE, UDNEmbedIE, UFCTVIE, UKTVPlayIE, DigitekaIE, DLiveVODIE, DLiveStreamIE, UMGDeIE, UnistraIE, UnityIE, UOLIE, UplynkIE, UplynkPreplayIE, UrortIE, URPlayIE, USANetworkIE, USATodayIE, UstreamIE, UstreamChannelIE, UstudioIE, UstudioEmbedIE, Varzesh3IE, Vbox7IE, VeeHDIE, VeohIE, VestiIE, VevoIE, VevoPlaylistIE, BTArticleIE, BTVestlendingenIE, VH1IE, ViceIE, ViceArticleIE, ViceShowIE, VidbitIE, ViddlerIE, VideaIE, VideoDetectiveIE, VideofyMeIE, VideomoreIE, VideomoreVideoIE, VideomoreSeasonIE, VideoPremiumIE, VideoPressIE, VidioIE, VidLiiIE, VidmeIE, VidmeUserIE, VidmeUserLikesIE, VidziIE, VierIE, VierVideosIE, ViewLiftIE, ViewLiftEmbedIE, ViideaIE, VimeoIE, VimeoChannelIE, VimeoAlbumIE, VimeoGroupsIE, VimeoLikesIE, VimeoOndemandIE, VimeoReviewIE, VimeoUserIE, VimeoWatchLaterIE, VHXEmbedIE, VimpleIE, VineIE, VineUserIE, VikiIE, VikiChannelIE, ViqeoIE, ViuIE, ViuPlaylistIE, ViuOTTIE, VKIE, VKUserVideosIE, VKWallPostIE, VLiveIE, VLiveChannelIE, VLivePlaylistIE, VodlockerIE, VODPlIE, VODPlatformIE, VoiceRepublicIE, VootIE, VoxMediaVolumeIE, VoxMediaIE, VRTIE, VrakIE, VRVIE, CrunchyrollIE, VRVSeriesIE, VShareIE, MedialaanIE, VubeIE, VuClipIE, VVVVIDIE, VyboryMosIE, VzaarIE, WakanimIE, WallaIE, WashingtonPostIE, WashingtonPostArticleIE, WatIE, WatchBoxIE, WatchIndianPornIE, WDRIE, WDRPageIE, WDRElefantIE, WDRMobileIE, WebcasterIE, WebcasterFeedIE, WebOfStoriesIE, WebOfStoriesPlaylistIE, WeiboIE, WeiboMobileIE, WeiqiTVIE, WistiaIE, WorldStarHipHopIE, WSJIE, WSJArticleIE, WWEIE, XBefIE, XboxClipsIE, XFileShareIE, XHamsterIE, XHamsterEmbedIE, XHamsterUserIE, XiamiSongIE, XiamiAlbumIE, XiamiArtistIE, XiamiCollectionIE, XimalayaIE, XimalayaAlbumIE, XMinusIE, XNXXIE, XstreamIE, VGTVIE, XTubeUserIE, XTubeIE, XuiteIE, XVideosIE, XXXYMoviesIE, YahooIE, YahooSearchIE, YahooGyaOPlayerIE, YahooGyaOIE, YahooJapanNewsIE, YandexDiskIE, YandexMusicTrackIE, YandexMusicAlbumIE, YandexMusicPlaylistIE, YandexVideoIE, YapFilesIE, YesJapanIE, YinYueTaiIE, YnetIE, YouJizzIE, YoukuIE, YoukuShowIE, YouNowLiveIE, YouNowChannelIE, YouNowMomentIE, YouPornIE, YourPornIE, YourUploadIE, YoutubeIE, YoutubeChannelIE, YoutubeFavouritesIE, YoutubeHistoryIE, YoutubeLiveIE, YoutubePlaylistIE, YoutubePlaylistsIE, YoutubeRecommendedIE, YoutubeSearchIE, YoutubeSearchDateIE, YoutubeSearchURLIE, YoutubeShowIE, YoutubeSubscriptionsIE, YoutubeTruncatedIDIE, YoutubeTruncatedURLIE, YoutubeUserIE, YoutubeWatchLaterIE, ZapiksIE, Zaq1IE, QuicklineIE, QuicklineLiveIE, ZattooIE, BBVTVIE, EinsUndEinsTVIE, EWETVIE, GlattvisionTVIE, MNetTVIE, MyVisionTVIE, NetPlusIE, OsnatelTVIE, QuantumTVIE, SaltTVIE, SAKTVIE, VTXTVIE, WalyTVIE, ZattooLiveIE, ZDFIE, ZDFChannelIE, ZingMp3IE, ZypeIE, GenericIE]
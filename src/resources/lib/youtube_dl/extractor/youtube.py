@@ -3,11 +3,13 @@
 from __future__ import unicode_literals
 
 
+import hashlib
 import itertools
 import json
 import os.path
 import random
 import re
+import threading
 import time
 import traceback
 
@@ -38,9 +40,11 @@ from ..utils import (
     get_element_by_id,
     int_or_none,
     mimetype2ext,
+    ordered_concurrent_map,
     orderedSet,
     parse_codecs,
     parse_duration,
+    read_ahead_chain,
     remove_quotes,
     remove_start,
     smuggle_url,
@@ -82,6 +86,15 @@ class YoutubeBaseInfoExtractor(InfoExtractor):
             self.url_result(vid_id, 'Youtube', video_id=vid_id)
             for vid_id in ids]
 
+    def _read_ahead_pages(self, page, next_page):
+        """
+        Iterate over page and the pages following it, next_page(page, page_num)
+        downloading the next one. With youtube_page_read_ahead, that many next
+        pages are downloaded while the previous ones are processed.
+        """
+        return read_ahead_chain(
+            page, next_page, self._downloader.params.get('youtube_page_read_ahead'))
+
     def _login(self):
         """
         Attempt to log in to YouTube.
@@ -281,16 +294,14 @@ class YoutubeBaseInfoExtractor(InfoExtractor):
 
 
 class YoutubeEntryListBaseInfoExtractor(YoutubeBaseInfoExtractor):
+    _INFO_CACHE_TTL = 3 * 3600
+
     # Extract entries from page with "Load more" button
     def _entries(self, page, playlist_id):
-        more_widget_html = content_html = page
-        for page_num in itertools.count(1):
-            for entry in self._process_page(content_html):
-                yield entry
-
-            mobj = re.search(r'data-uix-load-more-href="/?(?P<more>[^"]+)"', more_widget_html)
+        def next_page(current, page_num):
+            mobj = re.search(r'data-uix-load-more-href="/?(?P<more>[^"]+)"', current[1])
             if not mobj:
-                break
+                return None
 
             count = 0
             retries = 3
@@ -315,8 +326,12 @@ class YoutubeEntryListBaseInfoExtractor(YoutubeBaseInfoExtractor):
             if not content_html.strip():
                 # Some webpages show a "Load more" button but they don't
                 # have more videos
-                break
-            more_widget_html = more['load_more_widget_html']
+                return None
+            return content_html, more['load_more_widget_html']
+
+        for content_html, _ in self._read_ahead_pages((page, page), next_page):
+            for entry in self._process_page(content_html):
+                yield entry
 
 
 class YoutubePlaylistBaseInfoExtractor(YoutubeEntryListBaseInfoExtractor):
@@ -1226,9 +1241,22 @@ class YoutubeIE(YoutubeBaseInfoExtractor):
         },
     ]
 
-    def __init__(self, *args, **kwargs):
-        super(YoutubeIE, self).__init__(*args, **kwargs)
-        self._player_cache = {}
+    # stream URLs expire after a few hours
+    _INFO_CACHE_TTL = 1800
+    _CONCURRENT_EXTRACTIONS = 4
+
+    # Signature permutations per player (type and id) and signature layout,
+    # shared by the extractors of the process and persisted in the cache.
+    # The player code is persisted once, addressed by its digest. For a new
+    # player, every layout of the signatures seen so far is computed.
+    _SIG_CACHE_SECTION = 'youtube-sigplayers'
+    _PLAYER_CACHE_SECTION = 'youtube-playerjs'
+    # former section, one entry per player and layout
+    _LEGACY_SIG_CACHE_SECTION = 'youtube-sigfuncs'
+    _sig_specs = {}
+    _sig_locks = {}
+    _sig_lock = threading.Lock()
+    _sig_migrated = False
 
     def report_video_info_webpage_download(self, video_id):
         """Report attempt to download video info webpage."""
@@ -1250,6 +1278,11 @@ class YoutubeIE(YoutubeBaseInfoExtractor):
         """ Return a string representation of a signature """
         return '.'.join(compat_str(len(part)) for part in example_sig.split('.'))
 
+    @staticmethod
+    def _signature_length(cache_id):
+        parts = cache_id.split('.')
+        return sum(int(part) for part in parts) + len(parts) - 1
+
     def _extract_signature_function(self, video_id, player_url, example_sig):
         id_m = re.match(
             r'.*?-(?P<id>[a-zA-Z0-9_-]+)(?:/watch_as3|/html5player(?:-new)?|(?:/[a-z]{2,3}_[A-Z]{2})?/base)?\.(?P<ext>[a-z]+)$',
@@ -1258,43 +1291,106 @@ class YoutubeIE(YoutubeBaseInfoExtractor):
             raise ExtractorError('Cannot identify player %r' % player_url)
         player_type = id_m.group('ext')
         player_id = id_m.group('id')
-
-        # Read from filesystem cache
-        func_id = '%s_%s_%s' % (
-            player_type, player_id, self._signature_cache_id(example_sig))
-        assert os.path.basename(func_id) == func_id
-
-        cache_spec = self._downloader.cache.load('youtube-sigfuncs', func_id)
-        if cache_spec is not None:
-            return lambda s: ''.join(s[i] for i in cache_spec)
+        player_key = '%s_%s' % (player_type, player_id)
+        assert os.path.basename(player_key) == player_key
+
+        layout = self._signature_cache_id(example_sig)
+        specs = self._sig_specs.get(player_key)
+        if specs is None or layout not in specs:
+            with self._sig_lock:
+                if not YoutubeIE._sig_migrated:
+                    self._migrate_sig_cache()
+                    YoutubeIE._sig_migrated = True
+                lock = self._sig_locks.setdefault(player_key, threading.Lock())
+            # the player is downloaded and interpreted by a single thread
+            with lock:
+                specs = self._get_signature_specs(
+                    video_id, player_url, player_type, player_id, player_key, layout)
+        cache_spec = specs[layout]
+        return lambda s: ''.join(s[i] for i in cache_spec)
+
+    def _get_signature_specs(self, video_id, player_url, player_type, player_id, player_key, layout):
+        specs = self._sig_specs.get(player_key)
+        if specs is not None and layout in specs:
+            return specs
+
+        cache = self._downloader.cache
+        entry = cache.load(self._SIG_CACHE_SECTION, player_key) or {}
+        specs = dict(entry.get('specs') or {})
+        if layout not in specs:
+            known_layouts = cache.load(self._SIG_CACHE_SECTION, 'layouts') or []
+            layouts = set([layout])
+            if not specs:
+                # a new player: precompute every layout seen so far
+                layouts.update(known_layouts)
+            code, digest = self._get_player_code(
+                video_id, player_url, player_type, player_id, entry.get('code'))
+            if player_type == 'js':
+                func = self._parse_sig_js(code, player_id)
+            elif player_type == 'swf':
+                func = self._parse_sig_swf(code)
+            else:
+                assert False, 'Invalid player type %r' % player_type
+            for cache_id in layouts - set(specs):
+                test_string = ''.join(map(compat_chr, range(self._signature_length(cache_id))))
+                try:
+                    specs[cache_id] = [ord(c) for c in func(test_string)]
+                except Exception:
+                    if cache_id == layout:
+                        raise
+            cache.store(self._SIG_CACHE_SECTION, player_key, {'code': digest, 'specs': specs})
+            if layout not in known_layouts:
+                cache.store(self._SIG_CACHE_SECTION, 'layouts', sorted(set(known_layouts) | set([layout])))
+
+        self._sig_specs[player_key] = specs
+        return specs
+
+    def _migrate_sig_cache(self):
+        """Move the entries of the former signature section to the current one"""
+        cache = self._downloader.cache
+        players = {}
+        for func_id, spec in cache.pop_file_section(self._LEGACY_SIG_CACHE_SECTION).items():
+            player_key, _, layout = func_id.rpartition('_')
+            if player_key and re.match(r'^\d+(?:\.\d+)*$', layout) and isinstance(spec, list):
+                players.setdefault(player_key, {})[layout] = spec
+        if not players:
+            return
+        for player_key, specs in players.items():
+            entry = cache.load(self._SIG_CACHE_SECTION, player_key) or {}
+            specs.update(entry.get('specs') or {})
+            cache.store(self._SIG_CACHE_SECTION, player_key, {'code': entry.get('code'), 'specs': specs})
+        known_layouts = cache.load(self._SIG_CACHE_SECTION, 'layouts') or []
+        cache.store(self._SIG_CACHE_SECTION, 'layouts', sorted(
+            set(known_layouts).union(*players.values())))
+
+    def _get_player_code(self, video_id, player_url, player_type, player_id, digest=None):
+        """Return the player code and, for JS players, its digest"""
+        cache = self._downloader.cache
+        if digest is not None:
+            code = cache.load(self._PLAYER_CACHE_SECTION, digest)
+            if code is not None:
+                return code, digest
 
         download_note = (
             'Downloading player %s' % player_url
             if self._downloader.params.get('verbose') else
             'Downloading %s player %s' % (player_type, player_id)
         )
-        if player_type == 'js':
-            code = self._download_webpage(
-                player_url, video_id,
-                note=download_note,
-                errnote='Download of %s failed' % player_url)
-            res = self._parse_sig_js(code)
-        elif player_type == 'swf':
+        if player_type == 'swf':
             urlh = self._request_webpage(
                 player_url, video_id,
                 note=download_note,
                 errnote='Download of %s failed' % player_url)
-            code = urlh.read()
-            res = self._parse_sig_swf(code)
-        else:
-            assert False, 'Invalid player type %r' % player_type
+            return urlh.read(), None
 
-        test_string = ''.join(map(compat_chr, range(len(example_sig))))
-        cache_res = res(test_string)
-        cache_spec = [ord(c) for c in cache_res]
-
-        self._downloader.cache.store('youtube-sigfuncs', func_id, cache_spec)
-        return res
+        code = self._download_webpage(
+            player_url, video_id,
+            note=download_note,
+            errnote='Download of %s failed' % player_url)
+        digest = hashlib.sha256(code.encode('utf-8')).hexdigest()
+        if cache.load(self._PLAYER_CACHE_SECTION, digest) is None:
+            cache.store(self._PLAYER_CACHE_SECTION, digest, code)
+        return code, digest
 
     def _print_sig_code(self, func, example_sig):
         def gen_sig_code(idxs):
@@ -1335,7 +1431,7 @@ class YoutubeIE(YoutubeBaseInfoExtractor):
                 '    return %s\n') % (signature_id_tuple, expr_code)
         self.to_screen('Extracted signature function:\n' + code)
 
-    def _parse_sig_js(self, jscode):
+    def _parse_sig_js(self, jscode, player_id=None):
         funcname = self._search_regex(
             (r'\b[cs]\s*&&\s*[adf]\.set\([^,]+\s*,\s*encodeURIComponent\s*\(\s*(?P<sig>[a-zA-Z0-9$]+)\(',
              r'\b[a-zA-Z0-9]+\s*&&\s*[a-zA-Z0-9]+\.set\([^,]+\s*,\s*encodeURIComponent\s*\(\s*(?P<sig>[a-zA-Z0-9$]+)\(',
@@ -1351,7 +1447,7 @@ class YoutubeIE(YoutubeBaseInfoExtractor):
              r'\bc\s*&&\s*[a-zA-Z0-9]+\.set\([^,]+\s*,\s*\([^)]*\)\s*\(\s*(?P<sig>[a-zA-Z0-9$]+)\('),
             jscode, 'Initial JS player signature function name', group='sig')
 
-        jsi = JSInterpreter(jscode)
+        jsi = JSInterpreter(jscode, cache_id=player_id)
         initial_function = jsi.extract_function(funcname)
         return lambda s: initial_function([s])
 
@@ -1374,13 +1470,7 @@ class YoutubeIE(YoutubeBaseInfoExtractor):
             player_url = compat_urlparse.urljoin(
                 'https://www.youtube.com', player_url)
         try:
-            player_id = (player_url, self._signature_cache_id(s))
-            if player_id not in self._player_cache:
-                func = self._extract_signature_function(
-                    video_id, player_url, s
-                )
-                self._player_cache[player_id] = func
-            func = self._player_cache[player_id]
+            func = self._extract_signature_function(video_id, player_url, s)
             if self._downloader.params.get('youtube_print_sig_code'):
                 self._print_sig_code(func, s)
             return func(s)
@@ -1612,6 +1702,13 @@ class YoutubeIE(YoutubeBaseInfoExtractor):
         video_id = mobj.group(2)
         return video_id
 
+    @classmethod
+    def _info_cache_id(cls, url):
+        # the time range and the smuggled data of the URL end up in the results
+        if re.search(r'[?&#](?:t|start|end)=|#__youtubedl_smuggle', url):
+            return url
+        return cls.extract_id(url)
+
     @staticmethod
     def _extract_chapters(description, duration):
         if not description:
@@ -1716,6 +1813,7 @@ class YoutubeIE(YoutubeBaseInfoExtractor):
                 return pl_response
 
         player_response = {}
+        concurrent_requests = self._downloader.params.get('youtube_concurrent_requests') or 1
 
         # Get video info
         embed_webpage = None
@@ -1773,7 +1871,8 @@ class YoutubeIE(YoutubeBaseInfoExtractor):
                 # The general idea is to take a union of itags of both DASH manifests (for example
                 # video with such 'manifest behavior' see https://github.com/ytdl-org/youtube-dl/issues/6093)
                 self.report_video_info_webpage_download(video_id)
-                for el in ('embedded', 'detailpage', 'vevo', ''):
+
+                def download_video_info(el):
                     query = {
                         'video_id': video_id,
                         'ps': 'default',
@@ -1785,11 +1884,22 @@ class YoutubeIE(YoutubeBaseInfoExtractor):
                         query['el'] = el
                     if sts:
                         query['sts'] = sts
-                    video_info_webpage = self._download_webpage(
+                    return self._download_webpage(
                         '%s://www.youtube.com/get_video_info' % proto,
                         video_id, note=False,
                         errnote='unable to download video info webpage',
                         fatal=False, query=query)
+
+                def video_info_webpages(variants):
+                    # The first variant usually carries the token: the fallback variants
+                    # are only requested (concurrently, merged in this priority order)
+                    # once it has not
+                    yield download_video_info(variants[0])
+                    for webpage in ordered_concurrent_map(
+                            download_video_info, variants[1:], concurrent_requests):
+                        yield webpage
+
+                for video_info_webpage in video_info_webpages(('embedded', 'detailpage', 'vevo', '')):
                     if not video_info_webpage:
                         continue
                     get_video_info = compat_parse_qs(video_info_webpage)
@@ -2334,34 +2444,55 @@ class YoutubeIE(YoutubeBaseInfoExtractor):
 
         # Look for the DASH manifest
         if self._downloader.params.get('youtube_include_dash_manifest', True):
-            dash_mpd_fatal = True
-            for mpd_url in dash_mpds:
-                dash_formats = {}
+            def extract_dash_formats(mpd_url, fatal):
+                def decrypt_sig(mobj):
+                    s = mobj.group(1)
+                    dec_s = self._decrypt_signature(s, video_id, player_url, age_gate)
+                    return '/signature/%s' % dec_s
+
+                mpd_url = re.sub(r'/s/([a-fA-F0-9\.]+)', decrypt_sig, mpd_url)
+
+                dash_formats = []
+                for df in self._extract_mpd_formats(
+                        mpd_url, video_id, fatal=fatal,
+                        formats_dict=self._formats):
+                    if not df.get('filesize'):
+                        df['filesize'] = _extract_filesize(df['url'])
+                    dash_formats.append(df)
+                return dash_formats
+
+            def fetch_dash_formats(mpd_url, fatal=True):
                 try:
-                    def decrypt_sig(mobj):
-                        s = mobj.group(1)
-                        dec_s = self._decrypt_signature(s, video_id, player_url, age_gate)
-                        return '/signature/%s' % dec_s
-
-                    mpd_url = re.sub(r'/s/([a-fA-F0-9\.]+)', decrypt_sig, mpd_url)
-
-                    for df in self._extract_mpd_formats(
-                            mpd_url, video_id, fatal=dash_mpd_fatal,
-                            formats_dict=self._formats):
-                        if not df.get('filesize'):
-                            df['filesize'] = _extract_filesize(df['url'])
-                        # Do not overwrite DASH format found in some previous DASH manifest
-                        if df['format_id'] not in dash_formats:
-                            dash_formats[df['format_id']] = df
-                        # Additional DASH manifests may end up in HTTP Error 403 therefore
-                        # allow them to fail without bug report message if we already have
-                        # some DASH manifest succeeded. This is temporary workaround to reduce
-                        # burst of bug reports until we figure out the reason and whether it
-                        # can be fixed at all.
-                        dash_mpd_fatal = False
+                    return extract_dash_formats(mpd_url, fatal), None
                 except (ExtractorError, KeyError) as e:
+                    return [], e
+
+            def fetched_dash_formats(mpd_urls):
+                if not mpd_urls:
+                    return
+                mpd_formats, error = fetch_dash_formats(mpd_urls[0])
+                yield mpd_formats, error
+                # Additional DASH manifests may end up in HTTP Error 403 therefore
+                # allow them to fail without bug report message if we already have
+                # some DASH manifest succeeded. This is temporary workaround to reduce
+                # burst of bug reports until we figure out the reason and whether it
+                # can be fixed at all. The fatality being known before they are
+                # requested, they are fetched concurrently and merged in order.
+                fatal = not mpd_formats
+                for result in ordered_concurrent_map(
+                        lambda mpd_url: fetch_dash_formats(mpd_url, fatal),
+                        mpd_urls[1:], concurrent_requests):
+                    yield result
+
+            for mpd_formats, error in fetched_dash_formats(dash_mpds):
+                if error is not None:
                     self.report_warning(
-                        'Skipping DASH manifest: %r' % e, video_id)
+                        'Skipping DASH manifest: %r' % error, video_id)
+                dash_formats = {}
+                for df in mpd_formats:
+                    # Do not overwrite DASH format found in some previous DASH manifest
+                    if df['format_id'] not in dash_formats:
+                        dash_formats[df['format_id']] = df
                 if dash_formats:
                     # Remove the formats we found through non-DASH, they
                     # contain less info and it can be wrong, because we use
@@ -3078,14 +3209,24 @@ class YoutubeSearchIE(SearchInfoExtractor, YoutubeSearchBaseInfoExtractor):
         url_query.update(self._EXTRA_QUERY_ARGS)
         result_url = 'https://www.youtube.com/results?' + compat_urllib_parse_urlencode(url_query)
 
-        for pagenum in itertools.count(1):
+        def download_page(result_url, pagenum):
             data = self._download_json(
                 result_url, video_id='query "%s"' % query,
                 note='Downloading page %s' % pagenum,
                 errnote='Unable to download API page',
                 query={'spf': 'navigate'})
-            html_content = data[1]['body']['content']
+            return data[1]['body']['content']
+
+        def next_page(html_content, pagenum):
+            next_link = self._html_search_regex(
+                r'href="(/results\?[^"]*\bsp=[^"]+)"[^>]*>\s*<span[^>]+class="[^"]*\byt-uix-button-content\b[^"]*"[^>]*>Next',
+                html_content, 'next link', default=None)
+            if next_link is None:
+                return None
+            return download_page(
+                compat_urlparse.urljoin('https://www.youtube.com/', next_link), pagenum + 1)
 
+        for html_content in self._read_ahead_pages(download_page(result_url, 1), next_page):
             if 'class="search-message' in html_content:
                 raise ExtractorError(
                     '[youtube] No video results', expected=True)
@@ -3094,12 +3235,6 @@ class YoutubeSearchIE(SearchInfoExtractor, YoutubeSearchBaseInfoExtractor):
             videos += new_videos
             if not new_videos or len(videos) > limit:
                 break
-            next_link = self._html_search_regex(
-                r'href="(/results\?[^"]*\bsp=[^"]+)"[^>]*>\s*<span[^>]+class="[^"]*\byt-uix-button-content\b[^"]*"[^>]*>Next',
-                html_content, 'next link', default=None)
-            if next_link is None:
-                break
-            result_url = compat_urlparse.urljoin('https://www.youtube.com/', next_link)
 
         if len(videos) > n:
             videos = videos[:n]
@@ -3160,6 +3295,7 @@ class YoutubeFeedsInfoExtractor(YoutubeBaseInfoExtractor):
     Subclasses must define the _FEED_NAME and _PLAYLIST_TITLE properties.
     """
     _LOGIN_REQUIRED = True
+    _INFO_CACHE_TTL = 600
 
     @property
     def IE_NAME(self):
@@ -3171,9 +3307,19 @@ class YoutubeFeedsInfoExtractor(YoutubeBaseInfoExtractor):
     def _entries(self, page):
         # The extraction process is the same as for playlists, but the regex
         # for the video ids doesn't contain an index
+        def next_page(current, page_num):
+            mobj = re.search(r'data-uix-load-more-href="/?(?P<more>[^"]+)"', current[1])
+            if not mobj:
+                return None
+
+            more = self._download_json(
+                'https://youtube.com/%s' % mobj.group('more'), self._PLAYLIST_TITLE,
+                'Downloading page #%s' % page_num,
+                transform_source=uppercase_escape)
+            return more['content_html'], more['load_more_widget_html']
+
         ids = []
-        more_widget_html = content_html = page
-        for page_num in itertools.count(1):
+        for content_html, _ in self._read_ahead_pages((page, page), next_page):
             matches = re.findall(r'href="\s*/watch\?v=([0-9A-Za-z_-]{11})', content_html)
 
             # 'recommended' feed has infinite 'load more' and each new portion spins
@@ -3188,17 +3334,6 @@ class YoutubeFeedsInfoExtractor(YoutubeBaseInfoExtractor):
             for entry in self._ids_to_results(new_ids):
                 yield entry
 
-            mobj = re.search(r'data-uix-load-more-href="/?(?P<more>[^"]+)"', more_widget_html)
-            if not mobj:
-                break
-
-            more = self._download_json(
-                'https://youtube.com/%s' % mobj.group('more'), self._PLAYLIST_TITLE,
-                'Downloading page #%s' % page_num,
-                transform_source=uppercase_escape)
-            content_html = more['content_html']
-            more_widget_html = more['load_more_widget_html']
-
     def _real_extract(self, url):
         page = self._download_webpage(
             'https://www.youtube.com/feed/%s' % self._FEED_NAME,
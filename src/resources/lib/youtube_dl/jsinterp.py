@@ -1,44 +1,822 @@
 from __future__ import unicode_literals
 
-import json
+import itertools
+import math
 import operator
 import re
+import threading
 
+from .compat import (
+    compat_chr,
+    compat_str,
+)
 from .utils import (
     ExtractorError,
-    remove_quotes,
 )
 
-_OPERATORS = [
-    ('|', operator.or_),
-    ('^', operator.xor),
-    ('&', operator.and_),
-    ('>>', operator.rshift),
-    ('<<', operator.lshift),
-    ('-', operator.sub),
-    ('+', operator.add),
-    ('%', operator.mod),
-    ('/', operator.truediv),
-    ('*', operator.mul),
-]
-_ASSIGN_OPERATORS = [(op + '=', opfunc) for op, opfunc in _OPERATORS]
-_ASSIGN_OPERATORS.append(('=', lambda cur, right: right))
+_TOKEN_RE = re.compile(r'''(?xs)
+    (?P<space>\s+|//[^\n]*|/\*.*?\*/)
+    |(?P<number>0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+    |(?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+    |(?P<name>[a-zA-Z_$][a-zA-Z_$0-9]*)
+    |(?P<punct>>>>=|===|!==|>>>|<<=|>>=|[-+*/%&|^=!<>]=|&&|\|\||\+\+|--|<<|>>|[-+*/%&|^=!<>~?:.,;()\[\]{}])
+''')
+_REGEX_RE = re.compile(r'/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[a-z]*')
+_ESCAPE_RE = re.compile(r'\\(?:u([0-9a-fA-F]{4})|x([0-9a-fA-F]{2})|(.))', re.S)
+_ESCAPES = {'n': '\n', 'r': '\r', 't': '\t', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+
+# after these tokens a slash starts a regular expression literal, not a division
+_REGEX_PRECEDERS = ('return', 'typeof', 'case', 'do', 'else', 'in', 'new', 'void', 'delete')
+
+# binary operators by increasing precedence
+_BINARY_OPERATORS = [
+    '||', '&&', '|', '^', '&', '== != === !==', '< > <= >= in instanceof', '<< >> >>>', '+ -', '* / %']
+_PRECEDENCE = dict(
+    (op, level) for level, ops in enumerate(_BINARY_OPERATORS) for op in ops.split())
+
+_ASSIGN_OPERATORS = ('=', '+=', '-=', '*=', '/=', '%=', '&=', '|=', '^=', '<<=', '>>=', '>>>=')
+
+# process wide cache of compiled functions, by (player id, function name)
+_COMPILED = {}
+_COMPILED_SIZE = 64
+_compiled_lock = threading.Lock()
+
+
+def _int32(v):
+    v = int(v or 0) & 0xffffffff
+    return v - 0x100000000 if v & 0x80000000 else v
+
+
+def _js_number(v):
+    if isinstance(v, bool):
+        return int(v)
+    if v is None:
+        return 0
+    if isinstance(v, compat_str):
+        try:
+            return float(v) if v.strip() else 0
+        except ValueError:
+            return float('nan')
+    return v
+
+
+def _js_str(v):
+    if v is None:
+        return 'undefined'
+    if isinstance(v, bool):
+        return 'true' if v else 'false'
+    if isinstance(v, float) and v.is_integer():
+        return compat_str(int(v))
+    if isinstance(v, list):
+        return ','.join('' if item is None else _js_str(item) for item in v)
+    return compat_str(v)
+
+
+def _js_add(a, b):
+    if isinstance(a, (compat_str, list)) or isinstance(b, (compat_str, list)):
+        return _js_str(a) + _js_str(b)
+    return _js_number(a) + _js_number(b)
+
+
+def _js_mod(a, b):
+    a, b = _js_number(a), _js_number(b)
+    if isinstance(a, int) and isinstance(b, int) and b:
+        # the sign of the result is the sign of the dividend
+        return int(math.fmod(a, b))
+    return math.fmod(a, b) if b else float('nan')
+
+
+def _js_div(a, b):
+    a, b = _js_number(a), _js_number(b)
+    if not b:
+        return float('nan') if not a else float('inf') * (1 if a > 0 else -1)
+    return operator.truediv(a, b)
+
+
+def _js_ushift(a, b):
+    return (_int32(a) & 0xffffffff) >> (_int32(b) & 31)
+
+
+def _js_strict_eq(a, b):
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)) and not isinstance(a, bool) and not isinstance(b, bool):
+        return a == b
+    return type(a) is type(b) and a == b
 
-_NAME_RE = r'[a-zA-Z_$][a-zA-Z_$0-9]*'
+
+_OPERATORS = {
+    '|': lambda a, b: _int32(a) | _int32(b),
+    '^': lambda a, b: _int32(a) ^ _int32(b),
+    '&': lambda a, b: _int32(a) & _int32(b),
+    '>>': lambda a, b: _int32(a) >> (_int32(b) & 31),
+    '<<': lambda a, b: _int32(_int32(a) << (_int32(b) & 31)),
+    '>>>': _js_ushift,
+    '-': lambda a, b: _js_number(a) - _js_number(b),
+    '+': _js_add,
+    '%': _js_mod,
+    '/': _js_div,
+    '*': lambda a, b: _js_number(a) * _js_number(b),
+    '==': lambda a, b: a == b,
+    '!=': lambda a, b: a != b,
+    '===': _js_strict_eq,
+    '!==': lambda a, b: not _js_strict_eq(a, b),
+    '<': lambda a, b: a < b,
+    '>': lambda a, b: a > b,
+    '<=': lambda a, b: a <= b,
+    '>=': lambda a, b: a >= b,
+    'in': lambda a, b: a in b,
+}
+
+
+def _index(v):
+    if isinstance(v, float) and v.is_integer():
+        return int(v)
+    return v
+
+
+def _get_item(obj, key):
+    key = _index(key)
+    if isinstance(obj, (list, compat_str)):
+        if key == 'length':
+            return len(obj)
+        if isinstance(key, int):
+            return obj[key] if 0 <= key < len(obj) else None
+    elif isinstance(obj, dict):
+        return obj.get(key)
+    if obj is None:
+        raise ExtractorError('Cannot read property %r of undefined' % (key, ))
+    return None
+
+
+def _set_item(obj, key, value):
+    key = _index(key)
+    if isinstance(obj, list):
+        if not isinstance(key, int) or key < 0:
+            raise ExtractorError('Unsupported array index %r' % (key, ))
+        if key >= len(obj):
+            obj.extend([None] * (key - len(obj) + 1))
+    obj[key] = value
+
+
+def _splice(obj, index=0, count=None, *items):
+    length = len(obj)
+    index = max(length + index, 0) if index < 0 else min(index, length)
+    count = length - index if count is None else max(min(count, length - index), 0)
+    res = obj[index:index + count]
+    obj[index:index + count] = items
+    return res
+
+
+def _slice(obj, start=0, end=None):
+    return obj[_index(start):_index(end) if end is not None else None]
+
+
+def _split(obj, sep=None, limit=None):
+    if sep is None:
+        res = [obj]
+    elif sep == '':
+        res = list(obj)
+    else:
+        res = obj.split(sep)
+    return res[:limit] if limit is not None else res
+
+
+def _index_of(obj, value, start=0):
+    try:
+        return obj.index(value, start)
+    except ValueError:
+        return -1
+
+
+def _reverse(obj):
+    obj.reverse()
+    return obj
+
+
+def _push(obj, *items):
+    obj.extend(items)
+    return len(obj)
+
+
+def _unshift(obj, *items):
+    obj[0:0] = items
+    return len(obj)
+
+
+def _for_each(obj, function):
+    for index, item in enumerate(list(obj)):
+        function([item, index, obj])
+
+
+_METHODS = {
+    'split': _split,
+    'join': lambda obj, sep=',': _js_str(sep).join(_js_str(item) if item is not None else '' for item in obj),
+    'reverse': _reverse,
+    'slice': _slice,
+    'splice': _splice,
+    'push': _push,
+    'pop': lambda obj: obj.pop() if obj else None,
+    'shift': lambda obj: obj.pop(0) if obj else None,
+    'unshift': _unshift,
+    'forEach': _for_each,
+    'indexOf': _index_of,
+    'concat': lambda obj, *items: obj + ''.join(map(_js_str, items)) if isinstance(obj, compat_str) else obj + [
+        x for item in items for x in (item if isinstance(item, list) else [item])],
+    'charCodeAt': lambda obj, index=0: ord(obj[_index(index)]) if 0 <= _index(index) < len(obj) else float('nan'),
+    'charAt': lambda obj, index=0: obj[_index(index)] if 0 <= _index(index) < len(obj) else '',
+}
+
+_BUILTINS = {
+    'String': {'fromCharCode': lambda args: ''.join(compat_chr(_int32(c) & 0xffff) for c in args)},
+    'Math': {
+        'floor': lambda args: int(math.floor(args[0])),
+        'ceil': lambda args: int(math.ceil(args[0])),
+        'abs': lambda args: abs(args[0]),
+        'max': lambda args: max(args),
+        'min': lambda args: min(args),
+        'pow': lambda args: args[0] ** args[1],
+    },
+}
+
+_CONSTANTS = {'true': True, 'false': False, 'null': None, 'undefined': None}
+
+
+def _unescape(literal):
+    def repl(m):
+        if m.group(1) or m.group(2):
+            return compat_chr(int(m.group(1) or m.group(2), 16))
+        return _ESCAPES.get(m.group(3), m.group(3))
+    return _ESCAPE_RE.sub(repl, literal[1:-1])
+
+
+def _regex_allowed(previous):
+    if previous is None:
+        return True
+    if previous[0] == 'punct':
+        return previous[1] not in (')', ']', '}')
+    return previous[0] == 'name' and previous[1] in _REGEX_PRECEDERS
+
+
+def _tokenize(code, pos=0):
+    previous = None
+    length = len(code)
+    while pos < length:
+        if code[pos] == '/' and code[pos + 1:pos + 2] not in ('*', '/') and _regex_allowed(previous):
+            m = _REGEX_RE.match(code, pos)
+            if m:
+                previous = ('regex', m.group(0), pos)
+                yield previous
+                pos = m.end()
+                continue
+        m = _TOKEN_RE.match(code, pos)
+        if m is None:
+            raise ExtractorError('Unexpected character %r in JS code at %d' % (code[pos], pos))
+        pos = m.end()
+        if m.lastgroup == 'space':
+            continue
+        previous = (m.lastgroup, m.group(0), m.start())
+        yield previous
+    yield ('end', None, pos)
+
+
+class _Scope(dict):
+    """Local variables of a function call, chained to the enclosing scope"""
+
+    @classmethod
+    def bind(cls, argnames, args, parent=None):
+        # missing arguments are undefined
+        return cls(zip(argnames, itertools.chain(args, itertools.repeat(None))), parent)
+
+    def __init__(self, values, parent=None):
+        dict.__init__(self, values)
+        self.parent = parent
+
+    def __missing__(self, name):
+        if self.parent is None:
+            raise KeyError(name)
+        return self.parent[name]
+
+
+class _Regex(object):
+    def __init__(self, literal):
+        self.literal = literal
+
+
+class _Parser(object):
+    """Compiles JS code, read from a token stream, to a tree of Python closures.
+
+    Expressions compile to functions of the local scope returning a value;
+    statements compile to functions of the local scope returning None or a
+    (control, value) tuple for return, break and continue.
+    """
+
+    _KEYWORDS = {
+        'var': '_parse_var', 'let': '_parse_var', 'const': '_parse_var',
+        'return': '_parse_return', 'break': '_parse_break', 'continue': '_parse_continue',
+        'if': '_parse_if', 'while': '_parse_while', 'for': '_parse_for', 'try': '_parse_try',
+        'function': '_parse_function',
+    }
+
+    def __init__(self, interpreter, code, pos=0):
+        self._interpreter = interpreter
+        self._tokens = _tokenize(code, pos)
+        self.token = None
+        self._next()
+
+    def _next(self):
+        token = self.token
+        self.token = next(self._tokens)
+        return token
+
+    def _is(self, value, kind='punct'):
+        return self.token[0] == kind and self.token[1] == value
+
+    def _expect(self, value, kind='punct'):
+        if not self._is(value, kind):
+            raise ExtractorError('Expected %r but found %r in JS code at %d' % (value, self.token[1], self.token[2]))
+        return self._next()
+
+    def _accept(self, value, kind='punct'):
+        if self._is(value, kind):
+            self._next()
+            return True
+        return False
+
+    # statements
+
+    def parse_block(self):
+        self._expect('{')
+        statements = []
+        while not self._accept('}'):
+            statements.append(self.parse_statement())
+        return self._sequence(statements)
+
+    @staticmethod
+    def _sequence(statements):
+        if len(statements) == 1:
+            return statements[0]
+
+        def run(scope):
+            for statement in statements:
+                control = statement(scope)
+                if control is not None:
+                    return control
+        return run
+
+    def _end_statement(self):
+        if not self._accept(';') and not self._is('}') and self.token[0] != 'end':
+            raise ExtractorError('Unexpected %r in JS code at %d' % (self.token[1], self.token[2]))
+
+    def parse_statement(self):
+        kind, value, _ = self.token
+        if kind == 'punct' and value == '{':
+            return self.parse_block()
+        if kind == 'punct' and value == ';':
+            self._next()
+            return lambda scope: None
+        if kind == 'name' and value in self._KEYWORDS:
+            return getattr(self, self._KEYWORDS[value])()
+        expr = self.parse_expression()
+        self._end_statement()
+
+        def run(scope):
+            expr(scope)
+        return run
+
+    def _parse_var(self):
+        self._next()
+        declarations = []
+        while True:
+            name = self._next()[1]
+            expr = self.parse_assignment() if self._accept('=') else (lambda scope: None)
+            declarations.append((name, expr))
+            if not self._accept(','):
+                break
+        self._end_statement()
+
+        def run(scope):
+            for name, expr in declarations:
+                scope[name] = expr(scope)
+        return run
+
+    def _parse_return(self):
+        self._next()
+        if self._accept(';') or self._is('}'):
+            return lambda scope: ('return', None)
+        expr = self.parse_expression()
+        self._end_statement()
+        return lambda scope: ('return', expr(scope))
+
+    def _parse_break(self):
+        self._next()
+        self._end_statement()
+        return lambda scope: ('break', None)
+
+    def _parse_continue(self):
+        self._next()
+        self._end_statement()
+        return lambda scope: ('continue', None)
+
+    def _parse_if(self):
+        self._next()
+        self._expect('(')
+        condition = self.parse_expression()
+        self._expect(')')
+        then = self.parse_statement()
+        otherwise = self.parse_statement() if self._accept('else', 'name') else None
+
+        def run(scope):
+            if condition(scope):
+                return then(scope)
+            if otherwise is not None:
+                return otherwise(scope)
+        return run
+
+    def _loop(self, condition, body, update=None):
+        def run(scope):
+            while condition is None or condition(scope):
+                control = body(scope)
+                if control is not None:
+                    if control[0] == 'break':
+                        break
+                    if control[0] == 'return':
+                        return control
+                if update is not None:
+                    update(scope)
+        return run
+
+    def _parse_while(self):
+        self._next()
+        self._expect('(')
+        condition = self.parse_expression()
+        self._expect(')')
+        return self._loop(condition, self.parse_statement())
+
+    def _parse_for(self):
+        self._next()
+        self._expect('(')
+        if self._accept(';'):
+            init = None
+        elif self._is('var', 'name'):
+            init = self._parse_var()
+        else:
+            init = self.parse_expression()
+            self._expect(';')
+        condition = None if self._is(';') else self.parse_expression()
+        self._expect(';')
+        update = None if self._is(')') else self.parse_expression()
+        self._expect(')')
+        loop = self._loop(condition, self.parse_statement(), update)
+
+        def run(scope):
+            if init is not None:
+                init(scope)
+            return loop(scope)
+        return run
+
+    def _parse_try(self):
+        self._next()
+        body = self.parse_block()
+        handler = name = final = None
+        if self._accept('catch', 'name'):
+            self._expect('(')
+            name = self._next()[1]
+            self._expect(')')
+            handler = self.parse_block()
+        if self._accept('finally', 'name'):
+            final = self.parse_block()
+
+        def run(scope):
+            try:
+                return body(scope)
+            except Exception as e:
+                if handler is None:
+                    raise
+                scope[name] = e
+                return handler(scope)
+            finally:
+                if final is not None:
+                    final(scope)
+        return run
+
+    def _parse_function(self):
+        # function declaration
+        self._next()
+        name = self._next()[1]
+        function = self.parse_function_rest()
+
+        def run(scope):
+            scope[name] = function(scope)
+        return run
+
+    # expressions
+
+    def parse_expression(self):
+        expr = self.parse_assignment()
+        if not self._is(','):
+            return expr
+        exprs = [expr]
+        while self._accept(','):
+            exprs.append(self.parse_assignment())
+
+        def run(scope):
+            for expr in exprs:
+                value = expr(scope)
+            return value
+        return run
+
+    def parse_assignment(self):
+        target = self.parse_conditional()
+        if self.token[0] != 'punct' or self.token[1] not in _ASSIGN_OPERATORS:
+            return target
+        op = self._next()[1]
+        right = self.parse_assignment()
+        opfunc = _OPERATORS[op[:-1]] if op != '=' else None
+        reference = getattr(target, 'reference', None)
+        if reference is None:
+            raise ExtractorError('Invalid assignment target in JS code')
+
+        if reference[0] == 'name':
+            name = reference[1]
+
+            def run(scope):
+                owner = scope
+                while owner is not None and name not in owner:
+                    owner = getattr(owner, 'parent', None)
+                if owner is None:
+                    owner = scope
+                value = right(scope) if opfunc is None else opfunc(owner.get(name), right(scope))
+                owner[name] = value
+                return value
+        else:
+            obj, key = reference[1], reference[2]
+
+            def run(scope):
+                container, index = obj(scope), key(scope)
+                value = right(scope) if opfunc is None else opfunc(_get_item(container, index), right(scope))
+                _set_item(container, index, value)
+                return value
+        return run
+
+    def parse_conditional(self):
+        condition = self.parse_binary(0)
+        if not self._accept('?'):
+            return condition
+        then = self.parse_assignment()
+        self._expect(':')
+        otherwise = self.parse_assignment()
+        return lambda scope: then(scope) if condition(scope) else otherwise(scope)
+
+    def parse_binary(self, level):
+        if level >= len(_BINARY_OPERATORS):
+            return self.parse_unary()
+        left = self.parse_binary(level + 1)
+        while self.token[0] in ('punct', 'name') and _PRECEDENCE.get(self.token[1]) == level:
+            op = self._next()[1]
+            right = self.parse_binary(level + 1)
+            if op == '&&':
+                left = (lambda x, y: lambda scope: x(scope) and y(scope))(left, right)
+            elif op == '||':
+                left = (lambda x, y: lambda scope: x(scope) or y(scope))(left, right)
+            elif op == 'instanceof':
+                raise ExtractorError('Unsupported JS operator instanceof')
+            else:
+                opfunc = _OPERATORS[op]
+                left = (lambda x, y, f: lambda scope: f(x(scope), y(scope)))(left, right, opfunc)
+        return left
+
+    def parse_unary(self):
+        kind, value, _ = self.token
+        if kind == 'punct' and value in ('!', '-', '+', '~'):
+            self._next()
+            operand = self.parse_unary()
+            if value == '!':
+                return lambda scope: not operand(scope)
+            if value == '-':
+                return lambda scope: -_js_number(operand(scope))
+            if value == '+':
+                return lambda scope: _js_number(operand(scope))
+            return lambda scope: ~_int32(operand(scope))
+        if kind == 'punct' and value in ('++', '--'):
+            self._next()
+            return self._increment(self.parse_unary(), 1 if value == '++' else -1, True)
+        if kind == 'name' and value in ('typeof', 'void'):
+            self._next()
+            operand = self.parse_unary()
+            if value == 'void':
+                return lambda scope: (operand(scope), None)[1]
+            return lambda scope: self._typeof(operand(scope))
+        expr = self.parse_postfix()
+        if self.token[0] == 'punct' and self.token[1] in ('++', '--'):
+            return self._increment(expr, 1 if self._next()[1] == '++' else -1, False)
+        return expr
+
+    @staticmethod
+    def _typeof(value):
+        if value is None:
+            return 'undefined'
+        if isinstance(value, bool):
+            return 'boolean'
+        if isinstance(value, (int, float)):
+            return 'number'
+        if isinstance(value, compat_str):
+            return 'string'
+        return 'function' if callable(value) else 'object'
+
+    def _increment(self, target, delta, prefix):
+        reference = getattr(target, 'reference', None)
+        if reference is None:
+            raise ExtractorError('Invalid increment target in JS code')
+        if reference[0] == 'name':
+            name = reference[1]
+
+            def run(scope):
+                old = _js_number(target(scope))
+                owner = scope
+                while owner is not None and name not in owner:
+                    owner = getattr(owner, 'parent', None)
+                (owner if owner is not None else scope)[name] = old + delta
+                return old + delta if prefix else old
+        else:
+            obj, key = reference[1], reference[2]
+
+            def run(scope):
+                container, index = obj(scope), key(scope)
+                old = _js_number(_get_item(container, index))
+                _set_item(container, index, old + delta)
+                return old + delta if prefix else old
+        return run
+
+    def parse_postfix(self):
+        expr = self.parse_primary()
+        while True:
+            if self._accept('.'):
+                member = self._next()[1]
+                expr = self._member(expr, lambda scope, member=member: member)
+            elif self._accept('['):
+                key = self.parse_expression()
+                self._expect(']')
+                expr = self._member(expr, key)
+            elif self._is('('):
+                expr = self._call(expr, self._parse_arguments())
+            else:
+                return expr
+
+    def _parse_arguments(self):
+        self._expect('(')
+        args = []
+        while not self._accept(')'):
+            args.append(self.parse_assignment())
+            if not self._is(')'):
+                self._expect(',')
+        return args
+
+    @staticmethod
+    def _member(obj, key):
+        def run(scope):
+            return _get_item(obj(scope), key(scope))
+        run.reference = ('member', obj, key)
+        return run
+
+    @staticmethod
+    def _call(callee, args):
+        reference = getattr(callee, 'reference', None)
+        if reference is not None and reference[0] == 'member':
+            obj, key = reference[1], reference[2]
+
+            def run(scope):
+                target, member = obj(scope), key(scope)
+                argvals = [arg(scope) for arg in args]
+                if isinstance(target, dict):
+                    function = target.get(member)
+                elif member in _METHODS and isinstance(target, (list, compat_str)):
+                    return _METHODS[member](target, *argvals)
+                else:
+                    function = None
+                if not callable(function):
+                    raise ExtractorError('Unsupported JS method call %r' % (member, ))
+                return function(argvals)
+            return run
+
+        def run(scope):
+            function = callee(scope)
+            if not callable(function):
+                raise ExtractorError('JS value is not a function')
+            return function([arg(scope) for arg in args])
+        return run
+
+    def parse_primary(self):
+        kind, value, pos = self._next()
+        if kind == 'number':
+            number = int(value, 16) if value[:2] in ('0x', '0X') else (
+                float(value) if re.search(r'[.eE]', value) else int(value))
+            return lambda scope: number
+        if kind == 'string':
+            string = _unescape(value)
+            return lambda scope: string
+        if kind == 'regex':
+            regex = _Regex(value)
+            return lambda scope: regex
+        if kind == 'name':
+            if value in _CONSTANTS:
+                constant = _CONSTANTS[value]
+                return lambda scope: constant
+            if value == 'function':
+                if self.token[0] == 'name':
+                    self._next()
+                return self.parse_function_rest()
+            return self._name(value)
+        if kind == 'punct':
+            if value == '(':
+                expr = self.parse_expression()
+                self._expect(')')
+                return expr
+            if value == '[':
+                items = []
+                while not self._accept(']'):
+                    items.append(self.parse_assignment())
+                    if not self._is(']'):
+                        self._expect(',')
+                return lambda scope: [item(scope) for item in items]
+            if value == '{':
+                return self._parse_object()
+        raise ExtractorError('Unexpected %r in JS code at %d' % (value, pos))
+
+    def _parse_object(self):
+        fields = []
+        while not self._accept('}'):
+            key = self._next()[1]
+            if key[:1] in ('"', "'"):
+                key = _unescape(key)
+            self._expect(':')
+            fields.append((key, self.parse_assignment()))
+            if not self._is('}'):
+                self._expect(',')
+        return lambda scope: dict((key, value(scope)) for key, value in fields)
+
+    def _name(self, name):
+        interpreter = self._interpreter
+
+        def run(scope):
+            try:
+                return scope[name]
+            except KeyError:
+                return interpreter._get_global(name)
+        run.reference = ('name', name)
+        return run
+
+    def parse_function_rest(self):
+        """Parses argument names and body; returns a closure creating the function in a scope"""
+        self._expect('(')
+        argnames = []
+        while not self._accept(')'):
+            argnames.append(self._next()[1])
+            self._accept(',')
+        body = self.parse_block()
+
+        def make(parent):
+            def function(args):
+                control = body(_Scope.bind(argnames, args, parent))
+                return control[1] if control is not None and control[0] == 'return' else None
+            return function
+        return make
 
 
 class JSInterpreter(object):
-    def __init__(self, code, objects=None):
+    """Interpreter of the JS code of a player.
+
+    Functions are compiled once, when they are first extracted, to trees of
+    Python closures; calling them does not parse JS code anymore. With a
+    cache_id (e.g. the player id) compiled functions are shared by the
+    interpreters of the process.
+    """
+
+    def __init__(self, code, objects=None, cache_id=None):
         if objects is None:
             objects = {}
         self.code = code
         self._functions = {}
         self._objects = objects
+        self._cache_id = cache_id
+        self._compiled = {}
+
+    def _get_global(self, name):
+        if name in self._objects:
+            return self._objects[name]
+        if name in _BUILTINS:
+            return _BUILTINS[name]
+        try:
+            value = self.extract_function(name)
+        except ExtractorError:
+            var_m = re.search(
+                r'(?:(?<![.\w$])%s\s*=\s*(?={)|\bvar\s+%s\s*=(?!=)\s*)' % (re.escape(name), re.escape(name)),
+                self.code)
+            if var_m is None:
+                raise ExtractorError('Could not find JS variable %r' % name)
+            value = _Parser(self, self.code, var_m.end()).parse_assignment()(_Scope({}))
+        self._objects[name] = value
+        return value
 
     def interpret_statement(self, stmt, local_vars, allow_recursion=100):
-        if allow_recursion < 0:
-            raise ExtractorError('Recursion limit reached')
-
         should_abort = False
         stmt = stmt.lstrip()
         stmt_m = re.match(r'var\s', stmt)
@@ -56,207 +834,52 @@ class JSInterpreter(object):
         v = self.interpret_expression(expr, local_vars, allow_recursion)
         return v, should_abort
 
-    def interpret_expression(self, expr, local_vars, allow_recursion):
+    def interpret_expression(self, expr, local_vars, allow_recursion=100):
         expr = expr.strip()
         if expr == '':  # Empty expression
             return None
-
-        if expr.startswith('('):
-            parens_count = 0
-            for m in re.finditer(r'[()]', expr):
-                if m.group(0) == '(':
-                    parens_count += 1
-                else:
-                    parens_count -= 1
-                    if parens_count == 0:
-                        sub_expr = expr[1:m.start()]
-                        sub_result = self.interpret_expression(
-                            sub_expr, local_vars, allow_recursion)
-                        remaining_expr = expr[m.end():].strip()
-                        if not remaining_expr:
-                            return sub_result
-                        else:
-                            expr = json.dumps(sub_result) + remaining_expr
-                        break
-            else:
-                raise ExtractorError('Premature end of parens in %r' % expr)
-
-        for op, opfunc in _ASSIGN_OPERATORS:
-            m = re.match(r'''(?x)
-                (?P<out>%s)(?:\[(?P<index>[^\]]+?)\])?
-                \s*%s
-                (?P<expr>.*)$''' % (_NAME_RE, re.escape(op)), expr)
-            if not m:
-                continue
-            right_val = self.interpret_expression(
-                m.group('expr'), local_vars, allow_recursion - 1)
-
-            if m.groupdict().get('index'):
-                lvar = local_vars[m.group('out')]
-                idx = self.interpret_expression(
-                    m.group('index'), local_vars, allow_recursion)
-                assert isinstance(idx, int)
-                cur = lvar[idx]
-                val = opfunc(cur, right_val)
-                lvar[idx] = val
-                return val
-            else:
-                cur = local_vars.get(m.group('out'))
-                val = opfunc(cur, right_val)
-                local_vars[m.group('out')] = val
-                return val
-
-        if expr.isdigit():
-            return int(expr)
-
-        var_m = re.match(
-            r'(?!if|return|true|false)(?P<name>%s)$' % _NAME_RE,
-            expr)
-        if var_m:
-            return local_vars[var_m.group('name')]
-
-        try:
-            return json.loads(expr)
-        except ValueError:
-            pass
-
-        m = re.match(
-            r'(?P<in>%s)\[(?P<idx>.+)\]$' % _NAME_RE, expr)
-        if m:
-            val = local_vars[m.group('in')]
-            idx = self.interpret_expression(
-                m.group('idx'), local_vars, allow_recursion - 1)
-            return val[idx]
-
-        m = re.match(
-            r'(?P<var>%s)(?:\.(?P<member>[^(]+)|\[(?P<member2>[^]]+)\])\s*(?:\(+(?P<args>[^()]*)\))?$' % _NAME_RE,
-            expr)
-        if m:
-            variable = m.group('var')
-            member = remove_quotes(m.group('member') or m.group('member2'))
-            arg_str = m.group('args')
-
-            if variable in local_vars:
-                obj = local_vars[variable]
-            else:
-                if variable not in self._objects:
-                    self._objects[variable] = self.extract_object(variable)
-                obj = self._objects[variable]
-
-            if arg_str is None:
-                # Member access
-                if member == 'length':
-                    return len(obj)
-                return obj[member]
-
-            assert expr.endswith(')')
-            # Function call
-            if arg_str == '':
-                argvals = tuple()
-            else:
-                argvals = tuple([
-                    self.interpret_expression(v, local_vars, allow_recursion)
-                    for v in arg_str.split(',')])
-
-            if member == 'split':
-                assert argvals == ('',)
-                return list(obj)
-            if member == 'join':
-                assert len(argvals) == 1
-                return argvals[0].join(obj)
-            if member == 'reverse':
-                assert len(argvals) == 0
-                obj.reverse()
-                return obj
-            if member == 'slice':
-                assert len(argvals) == 1
-                return obj[argvals[0]:]
-            if member == 'splice':
-                assert isinstance(obj, list)
-                index, howMany = argvals
-                res = []
-                for i in range(index, min(index + howMany, len(obj))):
-                    res.append(obj.pop(index))
-                return res
-
-            return obj[member](argvals)
-
-        for op, opfunc in _OPERATORS:
-            m = re.match(r'(?P<x>.+?)%s(?P<y>.+)' % re.escape(op), expr)
-            if not m:
-                continue
-            x, abort = self.interpret_statement(
-                m.group('x'), local_vars, allow_recursion - 1)
-            if abort:
-                raise ExtractorError(
-                    'Premature left-side return of %s in %r' % (op, expr))
-            y, abort = self.interpret_statement(
-                m.group('y'), local_vars, allow_recursion - 1)
-            if abort:
-                raise ExtractorError(
-                    'Premature right-side return of %s in %r' % (op, expr))
-            return opfunc(x, y)
-
-        m = re.match(
-            r'^(?P<func>%s)\((?P<args>[a-zA-Z0-9_$,]*)\)$' % _NAME_RE, expr)
-        if m:
-            fname = m.group('func')
-            argvals = tuple([
-                int(v) if v.isdigit() else local_vars[v]
-                for v in m.group('args').split(',')]) if len(m.group('args')) > 0 else tuple()
-            if fname not in self._functions:
-                self._functions[fname] = self.extract_function(fname)
-            return self._functions[fname](argvals)
-
-        raise ExtractorError('Unsupported JS expression %r' % expr)
+        if expr not in self._compiled:
+            parser = _Parser(self, expr)
+            self._compiled[expr] = parser.parse_expression()
+            if parser.token[0] != 'end':
+                raise ExtractorError('Unsupported JS expression %r' % expr)
+        return self._compiled[expr](local_vars)
 
     def extract_object(self, objname):
-        _FUNC_NAME_RE = r'''(?:[a-zA-Z$0-9]+|"[a-zA-Z$0-9]+"|'[a-zA-Z$0-9]+')'''
-        obj = {}
         obj_m = re.search(
-            r'''(?x)
-                (?<!this\.)%s\s*=\s*{\s*
-                    (?P<fields>(%s\s*:\s*function\s*\(.*?\)\s*{.*?}(?:,\s*)?)*)
-                }\s*;
-            ''' % (re.escape(objname), _FUNC_NAME_RE),
-            self.code)
-        fields = obj_m.group('fields')
-        # Currently, it only supports function definitions
-        fields_m = re.finditer(
-            r'''(?x)
-                (?P<key>%s)\s*:\s*function\s*\((?P<args>[a-z,]+)\){(?P<code>[^}]+)}
-            ''' % _FUNC_NAME_RE,
-            fields)
-        for f in fields_m:
-            argnames = f.group('args').split(',')
-            obj[remove_quotes(f.group('key'))] = self.build_function(argnames, f.group('code'))
-
-        return obj
+            r'(?<![.\w$])%s\s*=\s*(?={)' % re.escape(objname), self.code)
+        if obj_m is None:
+            raise ExtractorError('Could not find JS object %r' % objname)
+        return _Parser(self, self.code, obj_m.end()).parse_primary()(_Scope({}))
 
     def extract_function(self, funcname):
+        key = (self._cache_id, funcname)
+        if self._cache_id is not None and key in _COMPILED:
+            return _COMPILED[key]
         func_m = re.search(
             r'''(?x)
                 (?:function\s+%s|[{;,]\s*%s\s*=\s*function|var\s+%s\s*=\s*function)\s*
-                \((?P<args>[^)]*)\)\s*
-                \{(?P<code>[^}]+)\}''' % (
+                (?=\()''' % (
                 re.escape(funcname), re.escape(funcname), re.escape(funcname)),
             self.code)
         if func_m is None:
             raise ExtractorError('Could not find JS function %r' % funcname)
-        argnames = func_m.group('args').split(',')
-
-        return self.build_function(argnames, func_m.group('code'))
+        function = _Parser(self, self.code, func_m.end()).parse_function_rest()(None)
+        if self._cache_id is not None:
+            with _compiled_lock:
+                if len(_COMPILED) >= _COMPILED_SIZE:
+                    _COMPILED.clear()
+                _COMPILED[key] = function
+        return function
 
     def call_function(self, funcname, *args):
         f = self.extract_function(funcname)
         return f(args)
 
     def build_function(self, argnames, code):
+        body = _Parser(self, '{%s}' % code).parse_block()
+
         def resf(args):
-            local_vars = dict(zip(argnames, args))
-            for stmt in code.split(';'):
-                res, abort = self.interpret_statement(stmt, local_vars)
-                if abort:
-                    break
-            return res
+            control = body(_Scope.bind(argnames, args))
+            return control[1] if control is not None and control[0] == 'return' else None
         return resf
@@ -344,6 +344,14 @@ def parseOpts(overrideArguments=None):
         '--download-archive', metavar='FILE',
         dest='download_archive',
         help='Download only videos not listed in the archive file. Record the IDs of all downloaded videos in it.')
+    selection.add_option(
+        '--download-archive-index',
+        dest='download_archive_index', metavar='INDEX', type='choice', choices=['memory', 'sqlite'], default='memory',
+        help='Index of the archive file IDs: memory (loaded once per run, default) or sqlite (database kept next to the archive file, for very large archives)')
+    selection.add_option(
+        '--concurrent-extractions',
+        dest='concurrent_extractions', metavar='N', type=int, default=1,
+        help='Number of playlist entries extracted concurrently (default is %default); they are still processed and downloaded in order')
     selection.add_option(
         '--include-ads',
         dest='include_ads', action='store_true',
@@ -414,6 +422,14 @@ def parseOpts(overrideArguments=None):
         '--youtube-skip-dash-manifest',
         action='store_false', dest='youtube_include_dash_manifest',
         help='Do not download the DASH manifests and related data on YouTube videos')
+    video_format.add_option(
+        '--youtube-concurrent-requests',
+        dest='youtube_concurrent_requests', metavar='N', type=int, default=1,
+        help='Number of video info and DASH manifest requests issued concurrently while extracting a YouTube video (default is %default)')
+    video_format.add_option(
+        '--youtube-page-read-ahead',
+        dest='youtube_page_read_ahead', metavar='N', type=int, default=0,
+        help='Number of pages of YouTube playlists, channels, feeds and searches downloaded ahead while the previous pages are processed (default is %default)')
     video_format.add_option(
         '--merge-output-format',
         action='store', dest='merge_output_format', metavar='FORMAT', default=None,
@@ -474,6 +490,15 @@ def parseOpts(overrideArguments=None):
         '--keep-fragments',
         action='store_true', dest='keep_fragments', default=False,
         help='Keep downloaded fragments on disk after downloading is finished; fragments are erased by default')
+    downloader.add_option(
+        '--concurrent-fragments',
+        dest='concurrent_fragments', metavar='N', type=int, default=1,
+        help='Number of fragments downloaded concurrently, still written in order (DASH, hlsnative and ISM only) (default is %default)')
+    downloader.add_option(
+        '--fragment-buffer-size',
+        dest='fragment_buffer_size', metavar='SIZE', default=None,
+        help='Memory for the fragments being downloaded (e.g. 16M), beyond which they are written to disk; '
+             '0 always writes them to disk (default is 32M)')
     downloader.add_option(
         '--buffer-size',
         dest='buffersize', metavar='SIZE', default='1024',
@@ -487,6 +512,16 @@ def parseOpts(overrideArguments=None):
         dest='http_chunk_size', metavar='SIZE', default=None,
         help='Size of a chunk for chunk-based HTTP downloading (e.g. 10485760 or 10M) (default is disabled). '
              'May be useful for bypassing bandwidth throttling imposed by a webserver (experimental)')
+    downloader.add_option(
+        '--http-connections',
+        dest='http_connections', metavar='N', type=int, default=1,
+        help='Number of connections downloading ranges of a file over HTTP at once, '
+             'for webservers limiting the speed of each connection (default is %default)')
+    downloader.add_option(
+        '--progress-interval',
+        dest='progress_interval', metavar='SECONDS', type=float, default=None,
+        help='Minimum time between progress updates of a download, in seconds '
+             '(default is 0: an update for every block received)')
     downloader.add_option(
         '--test',
         action='store_true', dest='test', default=False,
@@ -759,6 +794,26 @@ def parseOpts(overrideArguments=None):
     filesystem.add_option(
         '--no-cache-dir', action='store_const', const=False, dest='cachedir',
         help='Disable filesystem caching')
+    filesystem.add_option(
+        '--cache-backend',
+        dest='cache_backend', metavar='BACKEND', type='choice', choices=['file', 'sqlite', 'memory'], default='file',
+        help='Storage of the cache: file (one file per entry, default), sqlite (single database, entries expire and the least recently used are evicted) or memory (not persisted)')
+    filesystem.add_option(
+        '--cache-size',
+        dest='cache_size', metavar='N', type=int, default=None,
+        help='Maximum number of entries of the sqlite cache (default 1000)')
+    filesystem.add_option(
+        '--info-cache',
+        action='store_true', dest='info_cache', default=False,
+        help='Reuse the results of recent extractions of the same URLs, kept in the cache (expiring after a time depending on the site)')
+    filesystem.add_option(
+        '--no-info-cache',
+        action='store_false', dest='info_cache',
+        help='Do not reuse cached extraction results (default)')
+    filesystem.add_option(
+        '--refresh-info-cache',
+        action='store_true', dest='info_cache_refresh', default=False,
+        help='Extract again and update the cached extraction results')
     filesystem.add_option(
         '--rm-cache-dir',
         action='store_true', dest='rm_cachedir',
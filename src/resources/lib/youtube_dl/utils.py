@@ -7,6 +7,7 @@ import base64
 import binascii
 import calendar
 import codecs
+import collections
 import contextlib
 import ctypes
 import datetime
@@ -30,6 +31,7 @@ import ssl
 import subprocess
 import sys
 import tempfile
+import threading
 import traceback
 import xml.etree.ElementTree
 import zlib
@@ -3182,12 +3184,12 @@ else:
 
 class locked_file(object):
     def __init__(self, filename, mode, encoding=None):
-        assert mode in ['r', 'a', 'w']
+        assert mode in ['r', 'rb', 'a', 'w']
         self.f = io.open(filename, mode, encoding=encoding)
         self.mode = mode
 
     def __enter__(self):
-        exclusive = self.mode != 'r'
+        exclusive = self.mode not in ('r', 'rb')
         try:
             _lock_file(self.f, exclusive)
         except IOError:
@@ -3448,6 +3450,36 @@ def setproctitle(title):
         return  # Strange libc, just skip this
 
 
+def _load_fallocate():
+    # Elsewhere the space is allocated as the file is written
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        fallocate = ctypes.cdll.LoadLibrary('libc.so.6').fallocate64
+    except (OSError, TypeError, AttributeError):
+        return None
+    fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+    return fallocate
+
+
+_fallocate = _load_fallocate()
+
+
+def preallocate_file(stream, size):
+    """
+    Reserve the disk space of the first size bytes of the file of stream,
+    keeping its size (Linux only). Return whether it was reserved.
+    """
+    if _fallocate is None:
+        return False
+    try:
+        fd = stream.fileno()
+    except (AttributeError, ValueError, IOError, OSError):
+        return False
+    FALLOC_FL_KEEP_SIZE = 1
+    return _fallocate(fd, FALLOC_FL_KEEP_SIZE, 0, size) == 0
+
+
 def remove_start(s, start):
     return s[len(start):] if s is not None and s.startswith(start) else s
 
@@ -5610,3 +5642,129 @@ def random_birthday(year_field, month_field, day_field):
         month_field: str(random_date.month),
         day_field: str(random_date.day),
     }
+
+
+def ordered_concurrent_map(function, iterable, workers, reorder=None):
+    """
+    Apply function to the items of iterable on up to workers threads and
+    yield the results in the order of the items.
+
+    A worker starts the next item as soon as it is done, whichever item is
+    due, results completed ahead of it being held until they are; at most
+    workers + reorder (default workers) items are started and not yet
+    yielded. Closing the generator (e.g. breaking out of the loop) leaves the
+    remaining items unprocessed; tasks already running complete in the
+    background. An exception raised by function is raised again when its
+    result is due.
+    """
+    if workers is None or workers <= 1:
+        for item in iterable:
+            yield function(item)
+        return
+
+    ahead = workers + (workers if reorder is None else reorder)
+    condition = threading.Condition()
+    completed = {}
+
+    def start(index, item):
+        def run():
+            try:
+                outcome = True, function(item)
+            except BaseException as e:
+                outcome = False, e
+            with condition:
+                completed[index] = outcome
+                condition.notify_all()
+        thread = threading.Thread(target=run)
+        thread.daemon = True
+        thread.start()
+
+    items = enumerate(iterable)
+    started = due = 0
+    exhausted = False
+    while True:
+        with condition:
+            while True:
+                running = started - due - len(completed)
+                while not exhausted and running < workers and started - due < ahead:
+                    for index, item in items:
+                        start(index, item)
+                        started += 1
+                        running += 1
+                        break
+                    else:
+                        exhausted = True
+                if due in completed or due == started:
+                    break
+                # a timeout keeps the wait interruptible (KeyboardInterrupt) on Python 2
+                condition.wait(1)
+            if due == started:
+                return
+            success, result = completed.pop(due)
+        due += 1
+        if not success:
+            raise result
+        yield result
+
+
+def read_ahead_chain(first, get_next, depth):
+    """
+    Yield first and the items following it, get_next(item, index) returning
+    the item after item (index being the 1-based position of item), or None
+    after the last one.
+
+    With depth, the following items are obtained by a worker thread up to
+    depth items ahead of the consumer, the worker stopping when the generator
+    is closed (e.g. the consumer breaks out of the loop). An exception raised
+    by get_next is raised again when its item is due.
+    """
+    if not depth or depth <= 0:
+        item, index = first, 1
+        while item is not None:
+            yield item
+            item = get_next(item, index)
+            index += 1
+        return
+
+    buffered = collections.deque()
+    condition = threading.Condition()
+    state = {'closed': False}
+
+    def produce():
+        item, index = first, 1
+        while item is not None:
+            with condition:
+                while len(buffered) >= depth and not state['closed']:
+                    condition.wait(1)
+                if state['closed']:
+                    return
+            error = None
+            try:
+                item = get_next(item, index)
+            except BaseException as e:
+                item, error = None, e
+            with condition:
+                buffered.append((item, error))
+                condition.notify_all()
+            index += 1
+
+    thread = threading.Thread(target=produce)
+    thread.daemon = True
+    thread.start()
+    try:
+        yield first
+        while True:
+            with condition:
+                while not buffered:
+                    condition.wait(1)
+                item, error = buffered.popleft()
+                condition.notify_all()
+            if error is not None:
+                raise error
+            if item is None:
+                return
+            yield item
+    finally:
+        with condition:
+            state['closed'] = True
+            condition.notify_all()
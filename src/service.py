@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+import xbmc
+import xbmcaddon
+import commons
+from resources.lib import engine
+from resources.lib import wrapper
+
+
+# Run YouTube extraction engine as long as Kodi is running
+addon = xbmcaddon.Addon()
+if addon.getSetting("engine.enabled") != "false":
+	port = int(addon.getSetting("engine.port") or engine.PORT)
+	server = engine.EngineServer(engine.Engine(wrapper.Logger()), port)
+	server.start()
+	commons.debug("YouTube extraction engine started on port %d" %port)
+	server.engine.warmup(wrapper.getdefaults(addon.getSetting("youtube.video_quality") or "best",
+			addon.getSetting("youtube.nocheck_certificate") != "false"))
+	monitor = xbmc.Monitor()
+	while not monitor.abortRequested():
+		if monitor.waitForAbort(10):
+			break
+	server.stop()
+	commons.debug("YouTube extraction engine stopped")
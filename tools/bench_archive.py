@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""
+Checks and benchmarks the download archive lookups (youtube_dl/archive.py) of YoutubeDL:
+entries of a playlist are checked against a large archive file, with the memory and the
+sqlite index, and with the former implementation scanning the file for every entry (timed
+on a sample of the entries and extrapolated). All implementations must give the same answers.
+
+Usage: python tools/bench_archive.py [-l LINES] [-e ENTRIES] [-s SAMPLE]
+"""
+from __future__ import unicode_literals, print_function
+
+import io
+import os
+import sys
+import time
+import shutil
+import random
+import argparse
+import tempfile
+
+LIBRARY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'resources', 'lib')
+
+sys.path.insert(0, LIBRARY)
+
+from youtube_dl import YoutubeDL  # noqa: E402
+from youtube_dl.utils import locked_file  # noqa: E402
+
+ALPHABET = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_'
+
+
+def video_id(rnd):
+    return ''.join(rnd.choice(ALPHABET) for _ in range(11))
+
+
+def scan(fn, vid_id):
+    # the former YoutubeDL.in_download_archive
+    with locked_file(fn, 'r', encoding='utf-8') as archive_file:
+        for line in archive_file:
+            if line.strip() == vid_id:
+                return True
+    return False
+
+
+def check(ydl, entries):
+    start = time.time()
+    results = [ydl.in_download_archive(entry) for entry in entries]
+    return time.time() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the download archive lookups')
+    parser.add_argument('-l', '--lines', type=int, default=500000, help='lines of the archive file')
+    parser.add_argument('-e', '--entries', type=int, default=10000, help='playlist entries checked')
+    parser.add_argument('-s', '--sample', type=int, default=20, help='entries checked by scanning the file')
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    archived = [video_id(rnd) for _ in range(args.lines)]
+    # half of the entries are in the archive
+    ids = rnd.sample(archived, args.entries // 2) + [video_id(rnd) for _ in range(args.entries - args.entries // 2)]
+    rnd.shuffle(ids)
+    entries = [{'id': vid_id, 'extractor_key': 'Youtube'} for vid_id in ids]
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        fn = os.path.join(tmpdir, 'archive.txt')
+        with io.open(fn, 'w', encoding='utf-8') as f:
+            f.write(''.join('youtube %s\n' % vid_id for vid_id in archived))
+        print('%d entries checked against a %d lines archive' % (args.entries, args.lines))
+
+        sample = entries[:args.sample]
+        start = time.time()
+        expected = [scan(fn, 'youtube ' + entry['id']) for entry in sample]
+        elapsed = (time.time() - start) * len(entries) / len(sample)
+        print('  file scan:    %8.2f s (extrapolated from %d entries)' % (elapsed, len(sample)))
+
+        failures = 0
+        for index in ('memory', 'sqlite'):
+            ydl = YoutubeDL({'quiet': True, 'download_archive': fn, 'download_archive_index': index})
+            first, results = check(ydl, entries)
+            again, _ = check(ydl, entries)
+            print('  %-6s index: %8.2f s (%.2f s once loaded)' % (index, first, again))
+            if results[:len(sample)] != expected or sum(results) != len(entries) // 2:
+                failures += 1
+                print('  %s index: wrong results' % index)
+            # lines appended by another process are seen
+            appended = {'id': video_id(rnd), 'extractor_key': 'Youtube'}
+            with io.open(fn, 'a', encoding='utf-8') as f:
+                f.write('youtube %s\n' % appended['id'])
+            if not ydl.in_download_archive(appended):
+                failures += 1
+                print('  %s index: appended line not seen' % index)
+        start = time.time()
+        YoutubeDL({'quiet': True, 'download_archive': fn, 'download_archive_index': 'sqlite'}).in_download_archive(entries[0])
+        print('  sqlite index reopened in %.2f s' % (time.time() - start))
+    finally:
+        shutil.rmtree(tmpdir)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Checks and benchmarks the host indexed extractor dispatch (youtube_dl/extractor/dispatch.py).
+
+The URL corpus is made of the test URLs of every extractor plus a few URLs no specific
+extractor handles. For each URL the first suitable extractor found through the index
+must be the one found by the linear scan of the extractor list; the script fails
+otherwise. This is checked for the real extractor classes and for the lazy registry.
+
+Usage: python tools/bench_dispatch.py [-n RUNS]
+"""
+from __future__ import unicode_literals, print_function
+
+import os
+import sys
+import time
+import argparse
+import importlib
+
+LIBRARY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'resources', 'lib')
+
+sys.path.insert(0, LIBRARY)
+# the corpus is built from the test cases of the real extractor classes
+sys.modules['youtube_dl.extractor.lazy_extractors'] = None
+
+from youtube_dl.extractor import _ALL_CLASSES  # noqa: E402
+from youtube_dl.extractor import dispatch  # noqa: E402
+from youtube_dl.extractor.dispatch import ExtractorIndex  # noqa: E402
+
+EXTRA = [
+    'http://example.com/video.mp4',
+    'https://www.EXAMPLE.org/watch?v=abc',
+    'https://vídeo.example.com/été',
+    'ytsearch5:kodi',
+    'youtube-dl test video',
+    '',
+]
+
+
+def get_corpus():
+    urls = []
+    for klass in _ALL_CLASSES:
+        for tc in klass().get_testcases(include_onlymatching=True):
+            if tc.get('url'):
+                urls.append(tc['url'])
+    return urls + EXTRA
+
+
+def linear(classes, url):
+    for ie in classes:
+        if ie.suitable(url):
+            return ie
+    return None
+
+
+def indexed(index, url):
+    return linear(index.candidates(url), url)
+
+
+def check(name, classes, corpus):
+    index = ExtractorIndex(classes)
+    failures = 0
+    candidates = 0
+    for url in corpus:
+        expected, actual = linear(classes, url), indexed(index, url)
+        candidates += len(index.candidates(url))
+        if expected is not actual:
+            failures += 1
+            print('%s: mismatch for %r: %s instead of %s' % (
+                name, url, getattr(actual, '__name__', None), getattr(expected, '__name__', None)))
+    print('%-5s registry: %d URLs checked, %d mismatches, %.1f candidates per URL (of %d extractors)' % (
+        name, len(corpus), failures, float(candidates) / len(corpus), len(classes)))
+    return failures
+
+
+def measure(function, corpus, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.time()
+        for url in corpus:
+            function(url)
+        timings.append(time.time() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check and benchmark the extractor dispatch index')
+    parser.add_argument('-n', '--runs', type=int, default=3, help='passes over the corpus')
+    args = parser.parse_args()
+
+    corpus = get_corpus()
+    del sys.modules['youtube_dl.extractor.lazy_extractors']
+    lazy = importlib.import_module('youtube_dl.extractor.lazy_extractors')
+
+    failures = check('eager', _ALL_CLASSES, corpus)
+    failures += check('lazy', lazy._ALL_CLASSES, corpus)
+
+    dispatch._REQUIREMENTS.clear()
+    start = time.time()
+    index = ExtractorIndex(_ALL_CLASSES)
+    build = time.time() - start
+    start = time.time()
+    ExtractorIndex(lazy._ALL_CLASSES)
+    build_lazy = time.time() - start
+    scan = measure(lambda url: linear(_ALL_CLASSES, url), corpus, args.runs)
+    lookup = measure(lambda url: indexed(index, url), corpus, args.runs)
+    print('index built in %.0f ms (%.0f ms from the lazy registry)' % (build * 1000, build_lazy * 1000))
+    print('linear scan: %.1f us per URL' % (scan * 1e6 / len(corpus)))
+    print('indexed:     %.1f us per URL (%.1fx)' % (lookup * 1e6 / len(corpus), scan / lookup))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+"""
+Measures the I/O of the fragment downloads of FragmentFD (youtube_dl/downloader/fragment.py):
+a DASH download of fragments served by a local HTTP server (in a separate process), with the
+fragments written to disk and read again (fragment_buffer_size 0, as the former implementation)
+and with the in-memory fragment buffers. The read/write system calls and the bytes read and
+written by the downloading process (from /proc/self/io, Linux only, socket receives not being
+counted) are reported per GB downloaded. All downloads must give the same file.
+
+Usage: python tools/bench_fragments.py [-n FRAGMENTS] [-s SIZE] [-c CONCURRENT]
+"""
+from __future__ import unicode_literals, print_function, division
+
+import os
+import sys
+import time
+import shutil
+import hashlib
+import argparse
+import tempfile
+import threading
+import subprocess
+
+LIBRARY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'resources', 'lib')
+
+sys.path.insert(0, LIBRARY)
+
+from youtube_dl import YoutubeDL  # noqa: E402
+from youtube_dl.compat import compat_http_server  # noqa: E402
+from youtube_dl.downloader.dash import DashSegmentsFD  # noqa: E402
+
+GB = 1024 ** 3
+
+
+def fragment(index, size):
+    return (('%08d' % index).encode('ascii') * (size // 8 + 1))[:size]
+
+
+def serve(size):
+    class Handler(compat_http_server.BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            body = fragment(int(self.path.rsplit('/', 1)[1]), size)
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    class Server(compat_http_server.HTTPServer):
+        def process_request(self, request, client_address):
+            thread = threading.Thread(target=self._process, args=(request, client_address))
+            thread.daemon = True
+            thread.start()
+
+        def _process(self, request, client_address):
+            try:
+                self.finish_request(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    server = Server(('127.0.0.1', 0), Handler)
+    print(server.server_address[1])
+    sys.stdout.flush()
+    server.serve_forever()
+
+
+def io_counters():
+    counters = {}
+    try:
+        with open('/proc/self/io') as f:
+            for line in f:
+                name, value = line.split(':')
+                counters[name] = int(value)
+    except (IOError, OSError):
+        pass
+    return counters
+
+
+def download(tmpdir, port, fragments, params):
+    ydl = YoutubeDL(dict(params, quiet=True, noprogress=True))
+    filename = os.path.join(tmpdir, 'video.mp4')
+    before, start = io_counters(), time.time()
+    success = DashSegmentsFD(ydl, ydl.params).real_download(filename, {
+        'fragments': [{'url': 'http://127.0.0.1:%d/%d' % (port, i)} for i in range(fragments)],
+    })
+    elapsed, after = time.time() - start, io_counters()
+    with open(filename, 'rb') as f:
+        digest = hashlib.md5(f.read()).hexdigest()
+    os.remove(filename)
+    return success, elapsed, dict((k, after[k] - before[k]) for k in after), digest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the I/O of fragment downloads')
+    parser.add_argument('-n', '--fragments', type=int, default=200, help='number of fragments')
+    parser.add_argument('-s', '--size', type=int, default=1024 * 1024, help='size of a fragment in bytes')
+    parser.add_argument('-c', '--concurrent', type=int, default=1, help='fragments downloaded concurrently')
+    parser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.serve:
+        return serve(args.size)
+
+    server = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), '--serve', '-s', str(args.size)], stdout=subprocess.PIPE)
+    tmpdir = tempfile.mkdtemp()
+    failures = 0
+    try:
+        port = int(server.stdout.readline())
+        total = args.fragments * args.size
+        scale = GB / total
+        expected = hashlib.md5(b''.join(fragment(i, args.size) for i in range(args.fragments))).hexdigest()
+        print('%d fragments of %d bytes, %d downloaded concurrently (per GB downloaded)' % (
+            args.fragments, args.size, args.concurrent))
+        for name, buffer_size in (('fragment files', 0), ('memory buffers', None)):
+            success, elapsed, counters, digest = download(tmpdir, port, args.fragments, {
+                'concurrent_fragments': args.concurrent,
+                'fragment_buffer_size': buffer_size,
+            })
+            if counters:
+                print('  %s: %8.2f s  %9d read calls  %9d write calls  %7.2f GB read  %7.2f GB written' % (
+                    name, elapsed * scale, counters['syscr'] * scale, counters['syscw'] * scale,
+                    counters['rchar'] * scale / GB, counters['wchar'] * scale / GB))
+            else:
+                print('  %s: %8.2f s' % (name, elapsed * scale))
+            if not success or digest != expected:
+                failures += 1
+                print('  %s: wrong download' % name)
+    finally:
+        server.kill()
+        shutil.rmtree(tmpdir)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+"""
+Measures the throughput of HttpFD (youtube_dl/downloader/http.py) against a local HTTP server
+(in a separate process) limiting the speed of each connection, as googlevideo does, for a
+number of connections (the http_connections option). Every few connections the server is
+much slower, so the other connections have to take over its range. All downloads must give
+the same file.
+
+Usage: python tools/bench_http.py [-s SIZE] [-r RATE] [-c CONNECTIONS...]
+"""
+from __future__ import unicode_literals, print_function, division
+
+import os
+import re
+import sys
+import time
+import shutil
+import hashlib
+import argparse
+import tempfile
+import threading
+import itertools
+import subprocess
+
+LIBRARY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'resources', 'lib')
+
+sys.path.insert(0, LIBRARY)
+
+from youtube_dl import YoutubeDL  # noqa: E402
+from youtube_dl.compat import compat_http_server  # noqa: E402
+from youtube_dl.downloader.http import HttpFD  # noqa: E402
+
+MB = 1024 * 1024
+
+
+def content(size):
+    return b''.join(('%015d\n' % i).encode('ascii') for i in range(size // 16 + 1))[:size]
+
+
+def serve(size, rate, slow):
+    body = content(size)
+    connections = itertools.count()
+
+    class Handler(compat_http_server.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            start, end = 0, size - 1
+            byte_range = re.match(r'bytes=(\d+)-(\d*)', self.headers.get('Range') or '')
+            if byte_range:
+                start = int(byte_range.group(1))
+                end = min(int(byte_range.group(2) or end), end)
+                self.send_response(206)
+                self.send_header('Content-Range', 'bytes %d-%d/%d' % (start, end, size))
+            else:
+                self.send_response(200)
+            self.send_header('Content-Length', str(end - start + 1))
+            self.end_headers()
+            # one connection in slow is 10 times slower
+            connection_rate = rate / 10 if slow and next(connections) % slow == slow - 1 else rate
+            began, sent = time.time(), 0
+            try:
+                while start + sent <= end:
+                    chunk = body[start + sent:min(start + sent + 65536, end + 1)]
+                    self.wfile.write(chunk)
+                    sent += len(chunk)
+                    delay = sent / connection_rate - (time.time() - began)
+                    if delay > 0:
+                        time.sleep(delay)
+            except (IOError, OSError):
+                # connection closed by the client
+                pass
+
+    class Server(compat_http_server.HTTPServer):
+        def process_request(self, request, client_address):
+            thread = threading.Thread(target=self._process, args=(request, client_address))
+            thread.daemon = True
+            thread.start()
+
+        def _process(self, request, client_address):
+            try:
+                self.finish_request(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    server = Server(('127.0.0.1', 0), Handler)
+    print(server.server_address[1])
+    sys.stdout.flush()
+    server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark HttpFD over several connections')
+    parser.add_argument('-s', '--size', type=int, default=32, help='size of the file in MB')
+    parser.add_argument('-r', '--rate', type=float, default=2, help='speed limit of a connection in MB/s')
+    parser.add_argument('--slow', type=int, default=4, help='one connection in SLOW is 10 times slower (0: none)')
+    parser.add_argument('-c', '--connections', type=int, nargs='+', default=[1, 2, 4, 8], help='connections')
+    parser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    size = args.size * MB
+    if args.serve:
+        return serve(size, args.rate * MB, args.slow)
+
+    tmpdir = tempfile.mkdtemp()
+    failures = 0
+    try:
+        expected = hashlib.md5(content(size)).hexdigest()
+        print('%d MB file, connections limited to %g MB/s%s' % (
+            args.size, args.rate, ', one in %d to %g MB/s' % (args.slow, args.rate / 10) if args.slow else ''))
+        for connections in args.connections:
+            # a new server each time, for the same slow connections
+            server = subprocess.Popen([
+                sys.executable, os.path.abspath(__file__), '--serve',
+                '-s', str(args.size), '-r', str(args.rate), '--slow', str(args.slow)], stdout=subprocess.PIPE)
+            try:
+                port = int(server.stdout.readline())
+                ydl = YoutubeDL({'quiet': True, 'noprogress': True, 'http_connections': connections})
+                filename = os.path.join(tmpdir, 'video.mp4')
+                start = time.time()
+                success = HttpFD(ydl, ydl.params).download(filename, {'url': 'http://127.0.0.1:%d/video' % port})
+                elapsed = time.time() - start
+            finally:
+                server.kill()
+            with open(filename, 'rb') as f:
+                digest = hashlib.md5(f.read()).hexdigest()
+            os.remove(filename)
+            print('  %2d connections: %6.2f s  %6.2f MB/s' % (connections, elapsed, args.size / elapsed))
+            if not success or digest != expected:
+                failures += 1
+                print('  %d connections: wrong download' % connections)
+    finally:
+        shutil.rmtree(tmpdir)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+Measures the CPU time spent by HttpFD (youtube_dl/downloader/http.py) per MB received from a
+local HTTP server (the one of tools/bench_http.py, in a separate process) sending at 1 Gbit/s,
+for the current downloader and for a baseline revision of youtube_dl/downloader/http.py read
+from git (by default the revision before the last change of the file). The progress hooks
+called are counted too. A fixed buffer size (noresizebuffer) shows the cost of each block
+received. All downloads must give the same file.
+
+Usage: python tools/bench_http_cpu.py [-s SIZE] [-r RATE] [-n RUNS] [-b BUFFERSIZE] [-p INTERVAL] [--baseline REV]
+"""
+from __future__ import unicode_literals, print_function, division
+
+import os
+import sys
+import time
+import shutil
+import hashlib
+import argparse
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIBRARY = os.path.join(ROOT, 'src', 'resources', 'lib')
+SOURCE = 'src/resources/lib/youtube_dl/downloader/http.py'
+
+sys.path.insert(0, LIBRARY)
+
+from youtube_dl import YoutubeDL  # noqa: E402
+from youtube_dl.downloader.http import HttpFD  # noqa: E402
+
+MB = 1024 * 1024
+BENCH_HTTP = os.path.join(ROOT, 'tools', 'bench_http.py')
+
+
+def git(*args):
+    return subprocess.check_output(('git', ) + args, cwd=ROOT).decode('utf-8')
+
+
+def load_baseline(rev):
+    if rev is None:
+        rev = git('log', '-1', '--format=%H', '--', SOURCE).strip()
+        if not git('diff', rev, '--', SOURCE).strip():
+            rev += '^'
+    module = type(sys)(str('youtube_dl.downloader._http_baseline'))
+    module.__package__ = str('youtube_dl.downloader')
+    # Python 2 clears the globals of a module once it is collected
+    sys.modules[module.__name__] = module
+    exec(compile(git('show', '%s:%s' % (rev, SOURCE)), SOURCE, 'exec'), module.__dict__)
+    return rev, module.HttpFD
+
+
+def download(downloader_class, filename, size, rate, params):
+    server = subprocess.Popen([
+        sys.executable, BENCH_HTTP, '--serve', '-s', str(size), '-r', str(rate), '--slow', '0'],
+        stdout=subprocess.PIPE)
+    try:
+        port = int(server.stdout.readline())
+        ydl = YoutubeDL(dict(params, quiet=True, noprogress=True))
+        downloader = downloader_class(ydl, ydl.params)
+        hooks = []
+        downloader.add_progress_hook(hooks.append)
+        before, start = os.times(), time.time()
+        success = downloader.download(filename, {'url': 'http://127.0.0.1:%d/video' % port})
+        elapsed, after = time.time() - start, os.times()
+    finally:
+        server.kill()
+    cpu = (after[0] - before[0]) + (after[1] - before[1])
+    with open(filename, 'rb') as f:
+        digest = hashlib.md5(f.read()).hexdigest()
+    os.remove(filename)
+    return success, elapsed, cpu, len(hooks), digest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the CPU time of HttpFD downloads')
+    parser.add_argument('-s', '--size', type=int, default=256, help='size of the file in MB')
+    parser.add_argument('-r', '--rate', type=float, default=119.2, help='speed of the server in MB/s')
+    parser.add_argument('-n', '--runs', type=int, default=3, help='downloads by each downloader')
+    parser.add_argument('-b', '--buffersize', type=int, help='fixed size of the blocks received')
+    parser.add_argument('-p', '--progress-interval', type=float, help='minimum seconds between progress hooks')
+    parser.add_argument('--baseline', help='git revision of the baseline downloader')
+    args = parser.parse_args()
+
+    rev, baseline = load_baseline(args.baseline)
+    sys.path.insert(0, os.path.join(ROOT, 'tools'))
+    from bench_http import content
+    expected = hashlib.md5(content(args.size * MB)).hexdigest()
+    params = {'progress_interval': args.progress_interval}
+    if args.buffersize:
+        params.update({'buffersize': args.buffersize, 'noresizebuffer': True})
+    tmpdir = tempfile.mkdtemp()
+    failures = 0
+    try:
+        print('%d MB file, server sending at %g MB/s, %s blocks (best of %d)' % (
+            args.size, args.rate, '%d bytes' % args.buffersize if args.buffersize else 'resized', args.runs))
+        for name, downloader_class in (('baseline %s' % rev[:10], baseline), ('current', HttpFD)):
+            results = []
+            for _ in range(args.runs):
+                success, elapsed, cpu, hooks, digest = download(
+                    downloader_class, os.path.join(tmpdir, 'video.mp4'), args.size, args.rate, params)
+                if not success or digest != expected:
+                    failures += 1
+                    print('  %s: wrong download' % name)
+                results.append((cpu, elapsed, hooks))
+            cpu, elapsed, hooks = min(results)
+            print('  %-20s %6.2f ms CPU/MB  %6.2f MB/s  %7d progress hooks' % (
+                name + ':', cpu * 1000 / args.size, args.size / elapsed, hooks))
+    finally:
+        shutil.rmtree(tmpdir)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
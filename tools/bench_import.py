@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""
+Compares the import time of youtube_dl with the lazy extractor registry and with the
+eager registry (extractor/extractors.py). Every measurement runs in a fresh interpreter.
+
+Usage: python tools/bench_import.py [-n RUNS]
+"""
+from __future__ import unicode_literals, print_function
+
+import os
+import sys
+import argparse
+import subprocess
+
+LIBRARY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'resources', 'lib')
+
+CODE = '''
+import sys, time
+if %(eager)r:
+    sys.modules['youtube_dl.extractor.lazy_extractors'] = None
+start = time.time()
+import youtube_dl
+from youtube_dl.extractor import _LAZY_LOADER
+assert _LAZY_LOADER is not %(eager)r
+sys.stdout.write('%%f %%d' %% (time.time() - start, len(sys.modules)))
+'''
+
+
+def measure(eager, runs):
+    timings = []
+    modules = 0
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, '-c', CODE % {'eager': eager}], cwd=LIBRARY)
+        duration, modules = output.decode('ascii').split()
+        timings.append(float(duration))
+    return min(timings), sum(timings) / len(timings), int(modules)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark youtube_dl import time')
+    parser.add_argument('-n', '--runs', type=int, default=5, help='imports per mode')
+    args = parser.parse_args()
+    for name, eager in (('eager', True), ('lazy', False)):
+        best, mean, modules = measure(eager, args.runs)
+        print('%-5s import: best %.0f ms, mean %.0f ms, %d modules loaded' % (name, best * 1000, mean * 1000, modules))
+
+
+if __name__ == '__main__':
+    main()
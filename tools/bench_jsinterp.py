@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Measures the signature decipher throughput of youtube_dl.jsinterp against the player JS
+fixtures (tools/fixtures/*.js), for the current interpreter and for a baseline revision
+of youtube_dl/jsinterp.py read from git (by default the revision before the last change
+of the file). Results of both interpreters must be identical.
+
+Usage: python tools/bench_jsinterp.py [-n SIGNATURES] [--baseline REV]
+"""
+from __future__ import unicode_literals, print_function
+
+import io
+import os
+import sys
+import glob
+import time
+import random
+import string
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIBRARY = os.path.join(ROOT, 'src', 'resources', 'lib')
+SOURCE = 'src/resources/lib/youtube_dl/jsinterp.py'
+
+sys.path.insert(0, LIBRARY)
+
+from youtube_dl import YoutubeDL  # noqa: E402
+from youtube_dl.extractor import youtube  # noqa: E402
+
+
+def git(*args):
+    return subprocess.check_output(('git', ) + args, cwd=ROOT).decode('utf-8')
+
+
+def load_baseline(rev):
+    if rev is None:
+        rev = git('log', '-1', '--format=%H', '--', SOURCE).strip()
+        if not git('diff', rev, '--', SOURCE).strip():
+            rev += '^'
+    module = type(sys)(str('youtube_dl._jsinterp_baseline'))
+    module.__package__ = str('youtube_dl')
+    exec(compile(git('show', '%s:%s' % (rev, SOURCE)), SOURCE, 'exec'), module.__dict__)
+    # older interpreters don't take a cache id
+    return rev, lambda code, objects=None, cache_id=None: module.JSInterpreter(code, objects)
+
+
+def decipher(ie, interpreter, code, signatures):
+    youtube.JSInterpreter = interpreter
+    start = time.time()
+    function = ie._parse_sig_js(code)
+    results = [function(s) for s in signatures]
+    return time.time() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the JS signature decipher')
+    parser.add_argument('-n', '--signatures', type=int, default=2000, help='signatures per fixture')
+    parser.add_argument('--baseline', help='git revision of the baseline interpreter')
+    args = parser.parse_args()
+
+    rev, baseline = load_baseline(args.baseline)
+    current = youtube.JSInterpreter
+    ie = youtube.YoutubeIE(YoutubeDL({'quiet': True}))
+    alphabet = string.ascii_letters + string.digits + '-_'
+    signatures = [''.join(random.choice(alphabet) for _ in range(86)) for _ in range(args.signatures)]
+    failures = 0
+    for fixture in sorted(glob.glob(os.path.join(ROOT, 'tools', 'fixtures', '*.js'))):
+        with io.open(fixture, 'rt', encoding='utf-8') as f:
+            code = f.read()
+        print('%s (%d signatures)' % (os.path.basename(fixture), len(signatures)))
+        try:
+            before, expected = decipher(ie, baseline, code, signatures)
+            print('  baseline %s: %8.0f signatures/s' % (rev[:10], len(signatures) / before))
+        except Exception as e:
+            before, expected = None, None
+            print('  baseline %s: failed (%s)' % (rev[:10], str(e).split(';')[0]))
+        after, results = decipher(ie, current, code, signatures)
+        print('  current:            %8.0f signatures/s' % (len(signatures) / after))
+        if expected is not None:
+            if results != expected:
+                failures += 1
+                print('  results differ from the baseline')
+            else:
+                print('  identical results, %.1fx faster' % (before / after))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
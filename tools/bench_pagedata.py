@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark comparing the former BeautifulSoup scraping of YouTube pages with the
+streaming page data extractor (resources/lib/pagedata.py).
+
+Usage: python tools/bench_pagedata.py [-n RUNS] [PAGE.html ...]
+
+Pages are saved YouTube search result documents; by default the fixture pages of tools/fixtures
+are used: one embedding the initial data (JSON) and one with classic (server rendered) markup.
+The baseline is the former search page scraper, so it finds no items in pages that only embed
+the initial data, but it still has to parse them. BeautifulSoup (bs4) is needed for the baseline.
+"""
+
+from __future__ import print_function
+
+import io
+import os
+import sys
+import glob
+import time
+import argparse
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'resources', 'lib'))
+
+import pagedata
+
+try:
+	from urlparse import parse_qs, urlparse
+except ImportError:
+	from urllib.parse import parse_qs, urlparse
+
+
+def _soup(html):
+	# former search scraper (wrapper._get_search_html), without the download
+	from bs4 import BeautifulSoup
+	result = []
+	formatter = BeautifulSoup(html, "html.parser")
+	for item in formatter.find_all(attrs={"class": "yt-lockup"}):
+		video = dict()
+		try:
+			data = item.find(attrs={"class": "video-thumb"}).find("img")
+			if data.get("data-thumb") is not None:
+				video["thumb"] = data["data-thumb"]
+			else:
+				video["thumb"] = data["src"]
+			data = item.find(attrs={"class": "yt-lockup-title"}).find("a")
+			video["title"] = data.text.strip()
+			video["url"] = 'https://www.youtube.com%s' %data["href"]
+			if data["href"].startswith("/watch") and data["href"].find("list=") < 0:
+				video["type"] = "video"
+				video["id"] = parse_qs(urlparse(data["href"]).query)['v'][0]
+			elif data["href"].startswith("/user") or data["href"].startswith("/channel"):
+				video["type"] = data["href"].split("/")[1]
+				video["id"] = data["href"].split("/")[2]
+			elif data["href"].startswith("/playlist") or data["href"].find("list=") >= 0:
+				video["type"] = "playlist"
+				video["id"] = parse_qs(urlparse(data["href"]).query)['list'][0]
+			data = item.find(attrs={"class": "video-time"})
+			if data:
+				video["time"] = data.text
+			if video.get('type') is not None and video['type'] == "user":
+				data = formatter.find(attrs={"class": "yt-uix-subscription-button"})
+				video['id'] = data["data-channel-external-id"]
+				video["type"] = "channel"
+			result.append(video)
+		except BaseException:
+			pass
+	return len(result)
+
+
+def _pagedata(html):
+	return len(list(pagedata.records(html)))
+
+
+def _measure(function, html, runs):
+	count = function(html)
+	start = time.time()
+	for _ in range(runs):
+		function(html)
+	return (time.time() - start) / runs, count
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Benchmark YouTube page data extraction")
+	parser.add_argument("-n", "--runs", type=int, default=10, help="runs per page and method")
+	parser.add_argument("pages", nargs="*", help="saved YouTube pages (default: the fixture pages)")
+	args = parser.parse_args()
+	try:
+		import bs4
+	except ImportError:
+		bs4 = None
+		print("BeautifulSoup (bs4) is not installed, the baseline is not measured")
+	for page in args.pages or sorted(glob.glob(os.path.join(FIXTURES, "*.html"))):
+		with io.open(page, encoding="utf-8") as stream:
+			html = stream.read()
+		fast, items = _measure(_pagedata, html, args.runs)
+		line = "%s (%d KB): pagedata %.2f ms, %d items" %(os.path.basename(page), len(html) // 1024, fast * 1000, items)
+		if bs4 is not None:
+			slow, count = _measure(_soup, html, args.runs)
+			line += "; BeautifulSoup %.2f ms, %d items; speed-up x%.1f" %(slow * 1000, count, slow / fast if fast > 0 else 0)
+		print(line)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,13 @@
+var _yt_player={};(function(g){var window=this;/*
+ Reduced player fixture: the signature code is kept as it is laid out in
+ base.js, unrelated code is replaced by a few statements of the same kind.
+*/
+var ba,ea,ka=/[{}]/g,la="{}".length;ba=function(a){var b=0;return function(){return b<a.length?{done:!1,value:a[b++]}:{done:!0}}};
+ea=function(a,b){if(b)a:{var c=ka;a=a.split(".");for(var d=0;d<a.length-1;d++){var e=a[d];if(!(e in c))break a;c=c[e]}}};
+var kM={Gn:function(a){a.reverse()},
+Nj:function(a,b){a.splice(0,b)},
+mv:function(a,b){var c=a[0];a[0]=a[b%a.length];a[b%a.length]=c}};
+lM=function(a){a=a.split("");kM.mv(a,37);kM.Nj(a,2);kM.Gn(a,1);kM.mv(a,50);kM.Nj(a,1);kM.mv(a,20);kM.Gn(a,78);kM.mv(a,62);kM.Nj(a,3);return a.join("")};
+var mM=function(a){var b=a.split(""),c=[-1286604389,/,,[/,913,/](,)}/,function(d,e){e=(e%d.length+d.length)%d.length;d.splice(-e).reverse().forEach(function(f){d.unshift(f)})},"{",b,null];try{c[3]=c[0]>>>3^c[0]<<7}catch(d){c[5]=d}for(var e=0;e<b.length;e++)b[e]=String.fromCharCode(b[e].charCodeAt(0)^e&15);return b.join("")};
+g.Cz=function(a,b,c){c&&d.set(b,encodeURIComponent(lM(c)))};
+})(_yt_player);
@@ -0,0 +1,45 @@
+# coding: utf-8
+from __future__ import unicode_literals
+
+import re
+
+
+class LazyLoadExtractor(object):
+    _module = None
+    _WORKING = True
+    _AGE_LIMIT = 0
+    IE_DESC = None
+
+    @classmethod
+    def ie_key(cls):
+        return cls.__name__[:-2]
+
+    @classmethod
+    def suitable(cls, url):
+        """Receives a URL and returns True if suitable for this IE."""
+
+        # This does not use has/getattr intentionally - we want to know whether
+        # we have cached the regexp for *this* class, whereas getattr would also
+        # match the superclass
+        if '_VALID_URL_RE' not in cls.__dict__:
+            cls._VALID_URL_RE = re.compile(cls._VALID_URL)
+        return cls._VALID_URL_RE.match(url) is not None
+
+    @classmethod
+    def working(cls):
+        return cls._WORKING
+
+    @classmethod
+    def is_suitable(cls, age_limit):
+        return age_limit is None or cls._AGE_LIMIT <= age_limit
+
+    @classmethod
+    def real_class(cls):
+        mod = __import__(cls._module, fromlist=(cls.__name__,))
+        return getattr(mod, cls.__name__)
+
+    def __new__(cls, *args, **kwargs):
+        real_cls = cls.real_class()
+        instance = real_cls.__new__(real_cls)
+        instance.__init__(*args, **kwargs)
+        return instance
@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+"""
+Generates the lazy extractor registry (youtube_dl/extractor/lazy_extractors.py).
+
+Every extractor class is replaced by a lightweight stub carrying _VALID_URL, IE_NAME,
+IE_DESC, _WORKING, the minimum age limit of its test cases, the URL literals used by the
+extractor dispatch index and (when it is overridden) the suitable() method, so importing youtube_dl no longer imports every extractor module.
+The real module is imported when the extractor is instantiated, right before extraction.
+
+Usage: python tools/make_lazy_extractors.py [--check]
+
+With --check nothing is written; the script fails when the registry is missing or stale.
+The registry must be generated with Python 3 (string literal representation).
+"""
+from __future__ import unicode_literals, print_function
+
+import io
+import os
+import re
+import sys
+import textwrap
+from inspect import getsource
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIBRARY = os.path.join(ROOT, 'src', 'resources', 'lib')
+TEMPLATE = os.path.join(ROOT, 'tools', 'lazy_load_template.py')
+TARGET = os.path.join(LIBRARY, 'youtube_dl', 'extractor', 'lazy_extractors.py')
+
+sys.path.insert(0, LIBRARY)
+# the registry is always built from the real extractor classes
+sys.modules['youtube_dl.extractor.lazy_extractors'] = None
+
+from youtube_dl import compat, utils  # noqa: E402
+from youtube_dl.extractor import _ALL_CLASSES  # noqa: E402
+from youtube_dl.extractor.common import InfoExtractor, SearchInfoExtractor  # noqa: E402
+from youtube_dl.extractor.dispatch import url_requirement  # noqa: E402
+
+IE_TEMPLATE = '''
+class {name}({bases}):
+    _VALID_URL = {valid_url!r}
+    _module = {module!r}
+    IE_NAME = {ie_name!r}
+'''
+
+MAKE_VALID_TEMPLATE = '''
+    @classmethod
+    def _make_valid_url(cls):
+        return {valid_url!r}
+'''
+
+
+def get_base_name(base):
+    if base is InfoExtractor:
+        return 'LazyLoadExtractor'
+    elif base is SearchInfoExtractor:
+        return 'LazyLoadSearchExtractor'
+    else:
+        return base.__name__
+
+
+def get_age_limit(ie):
+    # minimum age limit of the test cases; see InfoExtractor.is_suitable
+    limits = []
+    for tc in ie().get_testcases(include_onlymatching=False):
+        if tc.get('playlist', []):
+            tc = tc['playlist'][0]
+        limits.append(tc.get('info_dict', {}).get('age_limit') or 0)
+    return min(limits) if limits else 0
+
+
+def get_literal(value):
+    # raw \uXXXX escapes are resolved by the Python 3 regex engine only, so the
+    # character itself is written in order to keep the registry valid for Python 2
+    if isinstance(value, compat.compat_str):
+        value = re.sub(r'(?<!\\)\\u([0-9a-fA-F]{4})', lambda m: chr(int(m.group(1), 16)), value)
+    return value
+
+
+def get_names(source):
+    code = compile(textwrap.dedent(source), '<suitable>', 'exec')
+    names = set()
+    stack = [code]
+    while stack:
+        code = stack.pop()
+        names.update(code.co_names)
+        stack.extend(const for const in code.co_consts if hasattr(const, 'co_names'))
+    return names
+
+
+def build_lazy_ie(ie, name, imports):
+    ie_name = ie.IE_NAME if isinstance(ie.IE_NAME, compat.compat_str) else name[:-2]
+    s = IE_TEMPLATE.format(
+        name=name,
+        bases=', '.join(map(get_base_name, ie.__bases__)),
+        valid_url=get_literal(getattr(ie, '_VALID_URL', None)),
+        module=ie.__module__,
+        ie_name=ie_name)
+    if getattr(ie, 'IE_DESC', None) is not None:
+        s += '    IE_DESC = %r\n' % ie.IE_DESC
+    if not ie._WORKING:
+        s += '    _WORKING = False\n'
+    age_limit = get_age_limit(ie)
+    if age_limit:
+        s += '    _AGE_LIMIT = %d\n' % age_limit
+    requirement = url_requirement(ie)
+    s += '    _URL_LITERALS = %r\n' % (tuple(sorted(requirement)) if requirement is not None else None, )
+    if ie.suitable.__func__ is not InfoExtractor.suitable.__func__:
+        source = getsource(ie.suitable)
+        s += '\n' + source
+        # helpers used by suitable() are imported from compat and utils modules
+        for helper in get_names(source):
+            for module, mod in (('compat', compat), ('utils', utils)):
+                if helper.startswith(('compat_', 'int_', 'str_', 'url_')) and hasattr(mod, helper):
+                    imports.setdefault(module, set()).add(helper)
+                    break
+    if hasattr(ie, '_make_valid_url'):
+        # search extractors
+        s += MAKE_VALID_TEMPLATE.format(valid_url=ie._make_valid_url())
+    return s
+
+
+def order_classes():
+    # find the correct sorting and add the required base classes so that
+    # subclasses can be correctly created
+    classes = _ALL_CLASSES[:-1]
+    ordered_cls = []
+    while classes:
+        for c in classes[:]:
+            bases = set(c.__bases__) - set((object, InfoExtractor, SearchInfoExtractor))
+            stop = False
+            for b in bases:
+                if b not in classes and b not in ordered_cls:
+                    if b.__name__ == 'GenericIE':
+                        sys.exit('GenericIE can not be used as base class')
+                    classes.insert(0, b)
+                    stop = True
+            if stop:
+                break
+            if all(b in ordered_cls for b in bases):
+                ordered_cls.append(c)
+                classes.remove(c)
+                break
+    ordered_cls.append(_ALL_CLASSES[-1])
+    return ordered_cls
+
+
+def build():
+    with io.open(TEMPLATE, 'rt', encoding='utf-8') as f:
+        module_template = f.read()
+    imports = {}
+    names = []
+    classes = []
+    for ie in order_classes():
+        name = ie.__name__
+        classes.append(build_lazy_ie(ie, name, imports))
+        if ie in _ALL_CLASSES:
+            names.append(name)
+    helpers = ''.join('from ..%s import (\n%s)\n' % (
+        module, ''.join('    %s,\n' % helper for helper in sorted(imports[module])))
+        for module in sorted(imports))
+    module_contents = [
+        '# This file is generated by tools/make_lazy_extractors.py, do not edit it.\n'
+        + module_template.replace('import re\n', 'import re\n\n' + helpers, 1) + '\n',
+        'class LazyLoadSearchExtractor(LazyLoadExtractor):\n    pass\n']
+    module_contents.extend(classes)
+    module_contents.append(
+        '_ALL_CLASSES = [{0}]'.format(', '.join(names)))
+    return '\n'.join(module_contents) + '\n'
+
+
+def main():
+    if sys.version_info < (3, 0):
+        sys.exit('The lazy extractor registry must be generated with Python 3')
+    source = build()
+    if '--check' in sys.argv[1:]:
+        current = None
+        if os.path.exists(TARGET):
+            with io.open(TARGET, 'rt', encoding='utf-8') as f:
+                current = f.read()
+        if current != source:
+            sys.exit('%s is stale, run tools/make_lazy_extractors.py' % os.path.relpath(TARGET, ROOT))
+        print('%s is up to date' % os.path.relpath(TARGET, ROOT))
+        return
+    with io.open(TARGET, 'wt', encoding='utf-8') as f:
+        f.write(source)
+    print('%s generated (%d extractors)' % (os.path.relpath(TARGET, ROOT), source.count('\nclass ') - 1))
+
+
+if __name__ == '__main__':
+    main()